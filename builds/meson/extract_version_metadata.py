@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+#
+# Copyright (C) 2020-2023 by
+# David Turner, Robert Wilhelm, and Werner Lemberg.
+#
+# This file is part of the FreeType project, and may only be used, modified,
+# and distributed under the terms of the FreeType project license,
+# LICENSE.TXT.  By continuing to use, modify, or distribute this file you
+# indicate that you have read the license and understand and accept it
+# fully.
+
+"""Extract all version numbers from `freetype.h` and `configure.raw`.
+
+This script combines `extract_freetype_version.py` and
+`extract_libtool_version.py`: it parses both files once and prints a JSON
+record with the FreeType version, its components, the libtool
+`version_info` triple, the library suffix (`soversion`), and the version
+used in `freetype2.pc` (`pkgconfig_version`).  `--format=lines` prints the
+same record as lines `NAME: VALUE`, and `--field=NAME` a single value.
+
+The record is cached in a JSON file together with the SHA-256 hashes of the
+input files and reused as long as they don't change.  The cache file is
+given with `--cache`; if the script is run by Meson, it defaults to
+`version-metadata.json` in the build directory.
+"""
+
+from __future__ import print_function
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+from extract_freetype_version import parse_freetype_header
+from extract_libtool_version import parse_configure_raw
+
+
+def file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def version_metadata(freetype_h, configure_raw):
+    """Return a dictionary with the version numbers of the input files."""
+    with open(freetype_h) as f:
+        major, minor, patch = parse_freetype_header(f.read())
+
+    with open(configure_raw) as f:
+        current, revision, age = parse_configure_raw(f.read())
+
+    return {
+        "version": "%s.%s.%s" % (major, minor, patch),
+        "major": major,
+        "minor": minor,
+        "patch": patch,
+        "libtool": "%s:%s:%s" % (current, revision, age),
+        # (current, revision, age) -> (current - age, age, revision)
+        "soversion": "%d.%s.%s" % (int(current) - int(age), age, revision),
+        "pkgconfig_version": "%s.%s.%s" % (current, revision, age),
+    }
+
+
+def cached_version_metadata(freetype_h, configure_raw, cache):
+    """Return the version metadata, using and updating a cache file."""
+    hashes = {
+        os.path.abspath(path): file_hash(path)
+        for path in (freetype_h, configure_raw)
+    }
+
+    try:
+        with open(cache) as f:
+            entry = json.load(f)
+        if entry["hashes"] == hashes:
+            return entry["metadata"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    metadata = version_metadata(freetype_h, configure_raw)
+
+    # Write to a temporary file first so that concurrent runs never see a
+    # partial cache file.
+    temp = "%s.%d" % (cache, os.getpid())
+    with open(temp, "w") as f:
+        json.dump({"hashes": hashes, "metadata": metadata}, f, indent=2)
+        f.write("\n")
+    os.replace(temp, cache)
+
+    return metadata
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+
+    parser.add_argument(
+        "freetype_h",
+        metavar="FREETYPE_H",
+        help="The input freetype.h header to parse.",
+    )
+
+    parser.add_argument(
+        "configure_raw",
+        metavar="CONFIGURE_RAW",
+        help="The input configure.raw file to parse.",
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=("json", "lines"),
+        default="json",
+        help="Select output format [json].",
+    )
+
+    parser.add_argument(
+        "--field",
+        help="Only print this value (e.g. soversion).",
+    )
+
+    parser.add_argument(
+        "--cache",
+        help="Cache file [version-metadata.json in the Meson build"
+        " directory].",
+    )
+
+    args = parser.parse_args()
+
+    cache = args.cache
+    if not cache and os.environ.get("MESON_BUILD_ROOT"):
+        cache = os.path.join(
+            os.environ["MESON_BUILD_ROOT"], "version-metadata.json"
+        )
+
+    if cache:
+        metadata = cached_version_metadata(
+            args.freetype_h, args.configure_raw, cache
+        )
+    else:
+        metadata = version_metadata(args.freetype_h, args.configure_raw)
+
+    if args.field:
+        if args.field not in metadata:
+            parser.error("unknown field " + args.field)
+        print(metadata[args.field])
+    elif args.format == "lines":
+        for name, value in metadata.items():
+            print("%s: %s" % (name, value))
+    else:
+        print(json.dumps(metadata, indent=2))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
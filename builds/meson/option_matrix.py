@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+#
+# Copyright (C) 2020-2023 by
+# David Turner, Robert Wilhelm, and Werner Lemberg.
+#
+# This file is part of the FreeType project, and may only be used, modified,
+# and distributed under the terms of the FreeType project license,
+# LICENSE.TXT.  By continuing to use, modify, or distribute this file you
+# indicate that you have read the license and understand and accept it
+# fully.
+
+"""Build and benchmark FreeType for a matrix of `ftoption.h` settings.
+
+Each configuration is a set of options to enable and to disable, given
+either with `--config=NAME:+OPTION,-OPTION,...` or in a JSON file like
+
+    {
+      "no-inline-mulfix": {"disable": ["FT_CONFIG_OPTION_INLINE_MULFIX"]},
+      "no-subpixel": {"disable": ["TT_CONFIG_OPTION_SUBPIXEL_HINTING"]}
+    }
+
+A configuration named `default` with the unchanged `ftoption.h` is always
+added.  For each configuration, this script writes an `ftoption.h` with
+the rewriting logic of `process_ftoption_h.py`, then configures and
+compiles it with Meson in `OUTPUT_DIR/NAME` (using the `ftoption` Meson
+option), several configurations in parallel.  Finally, it records the
+size of the library and, if font files are given, runs the `glyph-load`
+benchmark of each build one after another.
+
+Note that Meson still enables or disables the options that depend on
+external libraries (like `FT_CONFIG_OPTION_USE_ZLIB`) according to the
+libraries found; pass `--meson-arg=-Dzlib=none` etc. to control them.
+"""
+
+import argparse
+import concurrent.futures
+import json
+import os
+import re
+import subprocess
+import sys
+
+from process_ftoption_h import process_options
+
+
+def parse_config(text):
+    """Parse `NAME:+OPTION,-OPTION,...` into a configuration tuple."""
+    name, _, items = text.partition(":")
+    enable = []
+    disable = []
+
+    for item in filter(None, items.split(",")):
+        if item[0] == "+":
+            enable.append(item[1:])
+        elif item[0] == "-":
+            disable.append(item[1:])
+        else:
+            raise ValueError("option `%s` needs a `+` or `-` prefix" % item)
+
+    return name, enable, disable
+
+
+def read_matrix(filename):
+    """Return the configurations of a JSON matrix file."""
+    with open(filename) as f:
+        matrix = json.load(f)
+
+    return [
+        (name, entry.get("enable", []), entry.get("disable", []))
+        for name, entry in matrix.items()
+    ]
+
+
+def write_ftoption(template, build_dir, enable, disable):
+    """Write the `ftoption.h` of a configuration; return its path."""
+    result, options_seen = process_options(template, enable, disable)
+
+    missing = (set(enable) | set(disable)) - options_seen
+    if missing:
+        raise ValueError(
+            "Could not find options in input file: "
+            + ", ".join(sorted(missing))
+        )
+
+    os.makedirs(build_dir, exist_ok=True)
+    path = os.path.join(build_dir, "ftoption.h")
+
+    # Keep the time stamp if nothing changes, avoiding a full rebuild.
+    if os.path.exists(path):
+        with open(path) as f:
+            if f.read() == result:
+                return path
+
+    with open(path, "w") as f:
+        f.write(result)
+
+    return path
+
+
+def build(meson, source_dir, build_dir, ftoption_h, meson_args, jobs):
+    """Configure and compile one configuration; return an error message or
+    None."""
+    log_path = os.path.join(build_dir, "build.log")
+    ninja_dir = os.path.join(build_dir, "build")
+
+    commands = []
+    if not os.path.exists(os.path.join(ninja_dir, "build.ninja")):
+        commands.append(
+            meson
+            + [
+                "setup",
+                "--buildtype=release",
+                "-Dtests=enabled",
+                "-Dftoption=" + os.path.abspath(ftoption_h),
+            ]
+            + meson_args
+            + [ninja_dir, source_dir]
+        )
+    commands.append(meson + ["compile", "-C", ninja_dir, "-j", str(jobs)])
+
+    with open(log_path, "w") as log:
+        for command in commands:
+            log.write("$ %s\n" % " ".join(command))
+            log.flush()
+            if subprocess.call(command, stdout=log, stderr=log) != 0:
+                return "build failed, see %s" % log_path
+
+    return None
+
+
+def library_size(build_dir):
+    """Return the size of the largest FreeType library file in a build."""
+    ninja_dir = os.path.join(build_dir, "build")
+    sizes = [
+        os.path.getsize(os.path.join(ninja_dir, f))
+        for f in os.listdir(ninja_dir)
+        if re.match(r"(lib)?freetype.*\.(so[.0-9]*|a|dylib|dll|lib)$", f)
+        and not os.path.islink(os.path.join(ninja_dir, f))
+    ]
+
+    return max(sizes) if sizes else None
+
+
+def glyph_load_benchmark(build_dir, iterations, fonts):
+    """Run the `glyph-load` benchmark; return the total glyphs per second."""
+    program = os.path.join(build_dir, "build", "tests", "glyph-load")
+    output = subprocess.run(
+        [program, "-n", str(iterations)] + fonts,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    ).stdout
+
+    m = re.search(r"^total\s+([0-9.]+) glyphs/s", output, re.MULTILINE)
+    return float(m.group(1)) if m else None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+    parser.add_argument(
+        "fonts", nargs="*", help="Font files for the glyph-load benchmark."
+    )
+
+    parser.add_argument(
+        "--matrix", help="JSON file with the configurations to build."
+    )
+
+    parser.add_argument(
+        "--config",
+        action="append",
+        default=[],
+        help="A configuration as NAME:+OPTION,-OPTION,...",
+    )
+
+    parser.add_argument(
+        "--output-dir",
+        default="option-matrix",
+        help="Directory for the build directories [option-matrix].",
+    )
+
+    parser.add_argument(
+        "--source-dir",
+        default=os.path.join(os.path.dirname(__file__), "..", ".."),
+        help="FreeType source directory.",
+    )
+
+    parser.add_argument(
+        "--meson",
+        default="meson",
+        help="Meson command, split at spaces [meson].",
+    )
+
+    parser.add_argument(
+        "--meson-arg",
+        action="append",
+        default=[],
+        help="Additional argument for `meson setup`.",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of parallel compiler processes [number of CPUs].",
+    )
+
+    parser.add_argument(
+        "--parallel-builds",
+        type=int,
+        default=2,
+        help="Number of configurations built at the same time [2].",
+    )
+
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=10,
+        help="Iterations of the glyph-load benchmark [10].",
+    )
+
+    parser.add_argument("--json", help="Write the results to a JSON file.")
+
+    args = parser.parse_args()
+
+    try:
+        configs = [("default", [], [])]
+        if args.matrix:
+            configs += read_matrix(args.matrix)
+        configs += [parse_config(c) for c in args.config]
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    names = [name for name, _, _ in configs]
+    if len(set(names)) != len(names) or not all(names):
+        parser.error("configuration names must be unique and non-empty")
+
+    template_path = os.path.join(
+        args.source_dir, "include", "freetype", "config", "ftoption.h"
+    )
+    with open(template_path) as f:
+        template = f.read()
+
+    ftoption_hs = {}
+    for name, enable, disable in configs:
+        build_dir = os.path.join(args.output_dir, name)
+        try:
+            ftoption_hs[name] = write_ftoption(
+                template, build_dir, enable, disable
+            )
+        except ValueError as e:
+            parser.error("%s: %s" % (name, e))
+
+    # Split the compiler processes among the concurrent builds.
+    parallel_builds = max(1, min(args.parallel_builds, len(configs)))
+    jobs = max(1, args.jobs // parallel_builds)
+    meson = args.meson.split()
+
+    with concurrent.futures.ThreadPoolExecutor(parallel_builds) as executor:
+        errors = dict(
+            zip(
+                names,
+                executor.map(
+                    lambda name: build(
+                        meson,
+                        os.path.abspath(args.source_dir),
+                        os.path.join(args.output_dir, name),
+                        ftoption_hs[name],
+                        args.meson_arg,
+                        jobs,
+                    ),
+                    names,
+                ),
+            )
+        )
+
+    # Benchmarks run one at a time so that they don't disturb each other.
+    results = []
+    for name, enable, disable in configs:
+        build_dir = os.path.join(args.output_dir, name)
+        result = {
+            "name": name,
+            "enable": enable,
+            "disable": disable,
+            "error": errors[name],
+            "library_size": None,
+            "glyphs_per_second": None,
+        }
+
+        if not errors[name]:
+            result["library_size"] = library_size(build_dir)
+            if args.fonts:
+                result["glyphs_per_second"] = glyph_load_benchmark(
+                    build_dir, args.iterations, args.fonts
+                )
+
+        results.append(result)
+
+    width = max(len(name) for name in names)
+    print("%-*s  %10s  %12s" % (width, "config", "size", "glyphs/s"))
+    for result in results:
+        if result["error"]:
+            print("%-*s  %s" % (width, result["name"], result["error"]))
+            continue
+
+        print(
+            "%-*s  %10s  %12s"
+            % (
+                width,
+                result["name"],
+                result["library_size"] or "-",
+                "%.0f" % result["glyphs_per_second"]
+                if result["glyphs_per_second"]
+                else "-",
+            )
+        )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+
+    return 1 if any(errors.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
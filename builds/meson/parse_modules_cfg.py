@@ -11,14 +11,54 @@
 
 """Parse modules.cfg and dump its output either as ftmodule.h or a list of
 base extensions.
+
+To parse `modules.cfg` only once, `--format=json` emits all formats as one
+JSON object, `--format=lists` emits the module and base extension lists as
+lines `NAME: ITEM ITEM ...` (easy to split in Meson), and
+`--output-dir=DIR` writes each format to a file of its name in DIR; files
+whose contents do not change keep their time stamps.
+
+With `--corpus=MANIFEST`, the module lists are first reduced to the modules
+that a font corpus needs.  The manifest is a JSON file like
+
+    {
+      "formats": ["truetype", "opentype", "woff2"],
+      "hinting": ["auto"],
+      "rendering": ["gray", "sdf"],
+      "compression": [],
+      "glyph_names": false,
+      "cache": true
+    }
+
+where `formats` are keys of `FORMAT_MODULES`, `hinting` is a subset of
+`native` and `auto`, `rendering` a subset of `gray`, `mono`, and `sdf`, and
+`compression` a subset of `gzip`, `lzw`, and `bzip2` (for compressed PCF
+fonts, for example).  Modules that the selected ones call directly
+(`MODULE_DEPENDENCIES`) are kept as well, and a manifest without a font
+format is rejected.  The `corpus-report` output format lists the modules
+kept and removed and estimates the savings.  Sizes are taken from the
+object files of an existing build given with `--build-dir`; the startup
+time of the modules is measured with the library given with `--library`,
+which must have all modules of `modules.cfg`.
+
+`FT_Open_Face` tries the font drivers in the order of `FONT_MODULES` until
+one of them accepts the file.  With `--histogram=FILE`, the drivers are
+reordered by the number of files of each format in a corpus, most frequent
+first.  FILE is either a JSON object mapping driver names (`cff`) or font
+formats as returned by `FT_Get_Font_Format` (`CFF`) to counts, or the
+output of the `face-open` benchmark in `tests`.
 """
 
 from __future__ import print_function
 
 import argparse
+import ctypes
+import json
 import os
 import re
+import struct
 import sys
+import timeit
 
 # Expected input:
 #
@@ -109,6 +149,375 @@ def generate_ftmodule(lists):
     return result
 
 
+# The modules needed by each font format.  The `cff` driver always needs
+# `sfnt`, even for bare CFF files.  WOFF, WOFF2, and OT-SVG fonts wrap
+# TrueType or CFF outlines, so they need both outline drivers.
+OUTLINE_MODULES = ("truetype", "cff", "sfnt", "psaux", "psnames")
+
+FORMAT_MODULES = {
+    "truetype": ("truetype", "sfnt"),
+    "opentype": ("cff", "sfnt", "psaux", "psnames"),  # CFF-based OpenType
+    "cff": ("cff", "sfnt", "psaux", "psnames"),
+    "woff": OUTLINE_MODULES + ("gzip",),
+    # needs `FT_CONFIG_OPTION_USE_BROTLI`
+    "woff2": OUTLINE_MODULES,
+    "svg": OUTLINE_MODULES + ("svg", "gzip"),  # OT-SVG glyphs
+    "type1": ("type1", "psaux", "psnames"),
+    "cid": ("cid", "psaux", "psnames"),
+    "type42": ("type42", "truetype", "sfnt", "psaux", "psnames"),
+    "pfr": ("pfr",),
+    "winfonts": ("winfonts",),
+    "pcf": ("pcf",),
+    "bdf": ("bdf",),
+}
+
+# Modules that other modules call directly, so they must be linked in with
+# the default `ftoption.h` settings (`FT_CONFIG_OPTION_USE_ZLIB` and
+# `FT_CONFIG_OPTION_USE_LZW`): `sfnt` uncompresses WOFF and SVG data with
+# the `gzip` module, and `pcf` tries the compressed stream modules.
+MODULE_DEPENDENCIES = {
+    "sfnt": ("gzip",),
+    "pcf": ("gzip", "lzw"),
+}
+
+# Font modules that use the `pshinter` module for native hinting.
+POSTSCRIPT_MODULES = ("type1", "cff", "cid")
+
+RENDERING_MODULES = {
+    "gray": "smooth",
+    "mono": "raster",
+    "sdf": "sdf",
+}
+
+# The names under which the modules are registered in `FT_Library`;
+# modules not listed here are not registered.
+REGISTERED_NAMES = {
+    "truetype": ("truetype",),
+    "type1": ("type1",),
+    "cff": ("cff",),
+    "cid": ("t1cid",),
+    "pfr": ("pfr",),
+    "type42": ("type42",),
+    "winfonts": ("winfonts",),
+    "pcf": ("pcf",),
+    "bdf": ("bdf",),
+    "sfnt": ("sfnt",),
+    "autofit": ("autofitter",),
+    "pshinter": ("pshinter",),
+    "smooth": ("smooth",),
+    "raster": ("raster1",),
+    "svg": ("ot-svg",),
+    "sdf": ("sdf", "bsdf"),
+    "psaux": ("psaux",),
+    "psnames": ("psnames",),
+}
+
+MODULE_LISTS = (
+    "FONT_MODULES",
+    "HINTING_MODULES",
+    "RASTER_MODULES",
+    "AUX_MODULES",
+)
+
+
+# Font formats as returned by `FT_Get_Font_Format` and their drivers.
+FONT_FORMAT_DRIVERS = {
+    "TrueType": "truetype",
+    "Type 1": "type1",
+    "CFF": "cff",
+    "CID Type 1": "cid",
+    "PFR": "pfr",
+    "Type 42": "type42",
+    "Windows FNT": "winfonts",
+    "PCF": "pcf",
+    "BDF": "bdf",
+}
+
+# Drivers that stay at the end of the list, in their original order: the
+# `pcf` driver retries every file it doesn't recognize as a compressed
+# stream, which is expensive for files of other formats, and `bdf` comes
+# after it as in `modules.cfg`.
+FALLBACK_DRIVERS = ("pcf", "bdf")
+
+
+def read_histogram(filename):
+    """Return a dictionary mapping driver names to file counts."""
+    with open(filename) as f:
+        data = f.read()
+
+    if data.lstrip().startswith("{"):
+        counts = json.loads(data)
+    else:
+        counts = {}
+        for m in re.finditer(
+            r"^format (.+?) +[0-9.]+ us/open +([0-9]+) files$",
+            data,
+            re.MULTILINE,
+        ):
+            counts[m.group(1)] = int(m.group(2))
+
+    histogram = {}
+    for name, count in counts.items():
+        driver = FONT_FORMAT_DRIVERS.get(name, name)
+        if driver not in FONT_FORMAT_DRIVERS.values():
+            raise ValueError("Unknown font driver or format " + name)
+        histogram[driver] = histogram.get(driver, 0) + count
+
+    return histogram
+
+
+def order_font_modules(font_modules, histogram):
+    """Reorder font drivers by decreasing count in a histogram.
+
+    Modules that are not drivers (`sfnt`) keep their positions, the
+    fallback drivers stay last, and drivers with equal counts keep their
+    relative order."""
+    drivers = [m for m in font_modules if m in FONT_FORMAT_DRIVERS.values()]
+    ordered = sorted(
+        (m for m in drivers if m not in FALLBACK_DRIVERS),
+        key=lambda m: -histogram.get(m, 0),
+    )
+    ordered += [m for m in drivers if m in FALLBACK_DRIVERS]
+
+    ordered = iter(ordered)
+    return [
+        next(ordered) if m in FONT_FORMAT_DRIVERS.values() else m
+        for m in font_modules
+    ]
+
+
+def corpus_modules(corpus):
+    """Return the set of modules needed by a corpus manifest."""
+    needed = set()
+
+    for font_format in corpus.get("formats", []):
+        if font_format not in FORMAT_MODULES:
+            raise ValueError("Unknown font format " + font_format)
+        needed.update(FORMAT_MODULES[font_format])
+
+    if not needed.intersection(FONT_FORMAT_DRIVERS.values()):
+        raise ValueError("The corpus needs at least one font format")
+
+    for module in list(needed):
+        needed.update(MODULE_DEPENDENCIES.get(module, ()))
+
+    hinting = corpus.get("hinting", [])
+    if "native" in hinting and needed.intersection(POSTSCRIPT_MODULES):
+        needed.add("pshinter")
+    if "auto" in hinting:
+        needed.add("autofit")
+
+    for rendering in corpus.get("rendering", ["gray"]):
+        if rendering not in RENDERING_MODULES:
+            raise ValueError("Unknown rendering mode " + rendering)
+        needed.add(RENDERING_MODULES[rendering])
+
+    for compression in corpus.get("compression", []):
+        if compression not in ("gzip", "lzw", "bzip2"):
+            raise ValueError("Unknown compression " + compression)
+        needed.add(compression)
+
+    if corpus.get("glyph_names"):
+        needed.add("psnames")
+    if corpus.get("cache"):
+        needed.add("cache")
+
+    return needed
+
+
+def minimal_modules(lists, corpus):
+    """Reduce the module lists to the modules needed by a corpus manifest.
+
+    Return the new lists, the removed modules, and the needed modules
+    missing from `lists`."""
+    needed = corpus_modules(corpus)
+
+    new_lists = dict(lists)
+    removed = []
+    for name in MODULE_LISTS:
+        new_lists[name] = [m for m in lists[name] if m in needed]
+        removed += [m for m in lists[name] if m not in needed]
+
+    configured = set()
+    for name in MODULE_LISTS:
+        configured.update(lists[name])
+
+    return new_lists, removed, sorted(needed - configured)
+
+
+def elf_alloc_size(path):
+    """Return the size of the loaded sections of an ELF object file, or
+    the file size for other formats."""
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if data[:4] != b"\x7fELF":
+        return len(data)
+
+    endian = "<" if data[5] == 1 else ">"
+    if data[4] == 2:
+        shoff = struct.unpack_from(endian + "Q", data, 0x28)[0]
+        shentsize, shnum = struct.unpack_from(endian + "HH", data, 0x3A)
+        flags_format, size_offset = "IQ", 32
+    else:
+        shoff = struct.unpack_from(endian + "I", data, 0x20)[0]
+        shentsize, shnum = struct.unpack_from(endian + "HH", data, 0x2E)
+        flags_format, size_offset = "II", 20
+
+    size = 0
+    for i in range(shnum):
+        offset = shoff + i * shentsize
+        sh_type, sh_flags = struct.unpack_from(
+            endian + flags_format, data, offset + 4
+        )
+        sh_size = struct.unpack_from(
+            endian + flags_format[1], data, offset + size_offset
+        )[0]
+        # Count `SHF_ALLOC` sections except `SHT_NOBITS` (like `.bss`).
+        if sh_flags & 2 and sh_type != 8:
+            size += sh_size
+
+    return size
+
+
+def module_sizes(build_dir):
+    """Return the object code size of each module in a build directory.
+
+    Object files are assigned to modules by their path, which contains
+    `src/<module>/` (CMake) or `src_<module>_` (Meson)."""
+    sizes = {}
+    for root, _, files in os.walk(build_dir):
+        for filename in files:
+            if not filename.endswith((".o", ".obj")):
+                continue
+
+            path = os.path.join(root, filename)
+            name = os.path.relpath(path, build_dir).replace(os.sep, "_")
+            m = re.search(r"(?:^|_)src_([a-z0-9]+)_", name)
+            if m:
+                sizes[m.group(1)] = sizes.get(m.group(1), 0) + (
+                    elf_alloc_size(path)
+                )
+
+    return sizes
+
+
+def startup_costs(library_path, modules, iterations=1000):
+    """Measure the startup cost of modules in a FreeType library.
+
+    Return the time of `FT_Init_FreeType` plus `FT_Done_FreeType` and, for
+    each module, the time of `FT_Add_Module` plus `FT_Remove_Module`
+    together with the size of its module object (in seconds and bytes).
+    Times are the best of several repetitions."""
+    ft = ctypes.CDLL(library_path)
+    ft.FT_Get_Module.restype = ctypes.c_void_p
+    ft.FT_Get_Module.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+    ft.FT_Add_Module.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    ft.FT_Remove_Module.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    ft.FT_Done_FreeType.argtypes = [ctypes.c_void_p]
+
+    library = ctypes.c_void_p()
+
+    def measure(function):
+        return min(timeit.repeat(function, number=iterations, repeat=5)) / (
+            iterations
+        )
+
+    def init_done():
+        ft.FT_Init_FreeType(ctypes.byref(library))
+        ft.FT_Done_FreeType(library)
+
+    init_time = measure(init_done)
+
+    if ft.FT_Init_FreeType(ctypes.byref(library)):
+        raise OSError("Could not initialize " + library_path)
+
+    costs = {}
+    for module in modules:
+        elapsed = 0.0
+        size = 0
+        for registered_name in REGISTERED_NAMES.get(module, ()):
+            name = registered_name.encode("ascii")
+            instance = ft.FT_Get_Module(library, name)
+            if not instance:
+                continue
+
+            # `FT_ModuleRec` starts with the class pointer, and the class
+            # with the `module_flags` and `module_size` fields.
+            clazz = ctypes.c_void_p.from_address(instance).value
+            size += ctypes.c_long.from_address(
+                clazz + ctypes.sizeof(ctypes.c_ulong)
+            ).value
+
+            def remove_add():
+                ft.FT_Remove_Module(library, ft.FT_Get_Module(library, name))
+                ft.FT_Add_Module(library, clazz)
+
+            # The same calls fail immediately with null arguments; subtract
+            # their overhead.
+            def calls_only():
+                ft.FT_Get_Module(library, name)
+                ft.FT_Remove_Module(library, None)
+                ft.FT_Add_Module(library, None)
+
+            elapsed += max(0.0, measure(remove_add) - measure(calls_only))
+
+        costs[module] = (elapsed, size)
+
+    ft.FT_Done_FreeType(library)
+    return init_time, costs
+
+
+def generate_corpus_report(lists, new_lists, removed, missing, sizes, costs):
+    result = ""
+    for name in MODULE_LISTS:
+        for module in new_lists[name]:
+            result += "%s += %s\n" % (name, module)
+
+    result += "\n# removed: %s\n" % (" ".join(removed) or "none")
+    if missing:
+        result += "# missing from modules.cfg: %s\n" % " ".join(missing)
+
+    if sizes:
+        total = sum(
+            sizes.get(m, 0) for name in MODULE_LISTS for m in lists[name]
+        )
+        saved = sum(sizes.get(m, 0) for m in removed)
+        result += "# object code: %d of %d bytes saved (%.1f%%)\n" % (
+            saved,
+            total,
+            100.0 * saved / total if total else 0.0,
+        )
+
+    if costs:
+        init_time, module_costs = costs
+        registered = [m for m in module_costs if module_costs[m][1]]
+        # Split the startup time in proportion to the module costs.
+        total_time = sum(cost for cost, _ in module_costs.values())
+        saved_time = sum(
+            module_costs[m][0] for m in removed if m in module_costs
+        )
+        if total_time:
+            saved_time = init_time * saved_time / total_time
+        saved_size = sum(
+            module_costs[m][1] for m in removed if m in module_costs
+        )
+        result += (
+            "# startup: %d of %d registered modules removed,"
+            " about %.1f of %.1f us per FT_Init_FreeType/FT_Done_FreeType,"
+            " %d bytes of module objects saved\n"
+            % (
+                len([m for m in removed if m in registered]),
+                len(registered),
+                saved_time * 1e6,
+                init_time * 1e6,
+                saved_size,
+            )
+        )
+
+    return result
+
+
 def generate_main_modules(lists):
     return "\n".join(
         lists["FONT_MODULES"]
@@ -125,18 +534,56 @@ def generate_base_extensions(lists):
     return "\n".join(lists["BASE_EXTENSIONS"])
 
 
+# The formats written by `--output-dir` and bundled by `json` and `lists`.
+OUTPUT_FORMATS = {
+    "ftmodule.h": generate_ftmodule,
+    "main-modules": generate_main_modules,
+    "aux-modules": generate_aux_modules,
+    "base-extensions-list": generate_base_extensions,
+}
+
+
+def generate_json(lists):
+    bundle = {}
+    for name, generate in OUTPUT_FORMATS.items():
+        result = generate(lists)
+        bundle[name] = result if name == "ftmodule.h" else result.split()
+
+    return json.dumps(bundle, indent=2)
+
+
+def generate_lists(lists):
+    return "\n".join(
+        "%s: %s" % (name, " ".join(generate(lists).split()))
+        for name, generate in OUTPUT_FORMATS.items()
+        if name != "ftmodule.h"
+    )
+
+
+def write_output_dir(output_dir, lists):
+    """Write all formats to files in `output_dir`, keeping the time stamps
+    of unchanged files."""
+    if not os.path.isdir(output_dir):
+        os.makedirs(output_dir)
+
+    for name, generate in OUTPUT_FORMATS.items():
+        result = generate(lists).rstrip("\n") + "\n"
+        path = os.path.join(output_dir, name)
+        if os.path.exists(path):
+            with open(path) as f:
+                if f.read() == result:
+                    continue
+
+        with open(path, "w") as f:
+            f.write(result)
+
+
 def main():
     parser = argparse.ArgumentParser(description=__doc__)
 
     parser.add_argument(
         "--format",
-        required=True,
-        choices=(
-            "ftmodule.h",
-            "main-modules",
-            "aux-modules",
-            "base-extensions-list",
-        ),
+        choices=tuple(OUTPUT_FORMATS) + ("json", "lists", "corpus-report"),
         help="Select output format.",
     )
 
@@ -148,20 +595,84 @@ def main():
 
     parser.add_argument("--output", help="Output file (default is stdout).")
 
+    parser.add_argument(
+        "--output-dir",
+        help="Write all formats to files in this directory.",
+    )
+
+    parser.add_argument(
+        "--corpus",
+        metavar="MANIFEST",
+        help="Keep only the modules needed by a font corpus manifest.",
+    )
+
+    parser.add_argument(
+        "--histogram",
+        metavar="FILE",
+        help="Order the font drivers by a histogram of font formats.",
+    )
+
+    parser.add_argument(
+        "--build-dir",
+        help="Build directory with module object files for size estimates.",
+    )
+
+    parser.add_argument(
+        "--library",
+        help="FreeType shared library for startup time estimates.",
+    )
+
     args = parser.parse_args()
+    if not args.format and not args.output_dir:
+        parser.error("--format or --output-dir is required")
+
     with open(args.input) as f:
         input_data = f.read()
 
     lists = parse_modules_cfg(input_data)
 
-    if args.format == "ftmodule.h":
-        result = generate_ftmodule(lists)
-    elif args.format == "main-modules":
-        result = generate_main_modules(lists)
-    elif args.format == "aux-modules":
-        result = generate_aux_modules(lists)
-    elif args.format == "base-extensions-list":
-        result = generate_base_extensions(lists)
+    if args.corpus:
+        with open(args.corpus) as f:
+            corpus = json.load(f)
+        try:
+            new_lists, removed, missing = minimal_modules(lists, corpus)
+        except ValueError as e:
+            parser.error(str(e))
+        all_lists, lists = lists, new_lists
+    elif args.format == "corpus-report":
+        parser.error("corpus-report needs --corpus")
+
+    if args.histogram:
+        try:
+            histogram = read_histogram(args.histogram)
+        except ValueError as e:
+            parser.error(str(e))
+        lists["FONT_MODULES"] = order_font_modules(
+            lists["FONT_MODULES"], histogram
+        )
+
+    if args.output_dir:
+        write_output_dir(args.output_dir, lists)
+        if not args.format:
+            return 0
+
+    if args.format in OUTPUT_FORMATS:
+        result = OUTPUT_FORMATS[args.format](lists)
+    elif args.format == "json":
+        result = generate_json(lists)
+    elif args.format == "lists":
+        result = generate_lists(lists)
+    elif args.format == "corpus-report":
+        sizes = module_sizes(args.build_dir) if args.build_dir else None
+        costs = None
+        if args.library:
+            costs = startup_costs(
+                args.library,
+                [m for name in MODULE_LISTS for m in all_lists[name]],
+            )
+        result = generate_corpus_report(
+            all_lists, lists, removed, missing, sizes, costs
+        )
     else:
         assert False, "Invalid output format!"
 
@@ -15,7 +15,21 @@ This script takes an `ftoption.h` file as input and rewrites
 `#define`/`#undef` lines in it based on `--enable=CONFIG_VARNAME` or
 `--disable=CONFIG_VARNAME` arguments passed to it, where `CONFIG_VARNAME` is
 configuration variable name, such as `FT_CONFIG_OPTION_USE_LZW`, that may
-appear in the file.
+appear in the file.  Macros with a value, such as
+`TT_CONFIG_OPTION_MAX_RUNNABLE_OPCODES`, can be changed with
+`--set=CONFIG_VARNAME=VALUE`.
+
+`--profile=NAME` applies a set of such changes from a profile file, either
+given by its path or by the name of a file `NAME.profile` in the
+`profiles` directory next to this script.  Each line of a profile is one of
+
+    +CONFIG_VARNAME          (enable)
+    -CONFIG_VARNAME          (disable)
+    CONFIG_VARNAME = VALUE   (set)
+
+and `#` starts a comment.  Options given on the command line override the
+profile; `--enable` restores the value of the input file for a macro whose
+value the profile sets.
 
 Note that if one of `CONFIG_VARNAME` is not found in the input file, this
 script exits with an error message listing the missing variable names.
@@ -26,9 +40,123 @@ import os
 import re
 import sys
 
+PROFILES_DIR = os.path.join(os.path.dirname(__file__), "profiles")
+
+# Expected formats:
+#   #define <CONFIG_VAR>
+#   #define <CONFIG_VAR>  <VALUE>
+#   /* #define <CONFIG_VAR> */
+#   /* #define <CONFIG_VAR>  <VALUE> */
+#   #undef <CONFIG_VAR>
+OPTION_LINE = re.compile(
+    r"(?P<comment>/\* )?#(?P<directive>define|undef) +(?P<name>\w+)"
+    r"(?P<space>\s*)(?P<value>.*?)(?(comment) \*/)$"
+)
+
+
+class Options:
+    """The changes to apply to `ftoption.h`, as sets and a dictionary."""
+
+    def __init__(self):
+        self.enable = set()
+        self.disable = set()
+        self.values = {}
+
+    # Each change replaces any earlier one for the same name; in
+    # particular, enabling a macro drops a value set before, so it gets the
+    # value from the input file.
+
+    def add_enable(self, name):
+        self.disable.discard(name)
+        self.values.pop(name, None)
+        self.enable.add(name)
+
+    def add_disable(self, name):
+        self.enable.discard(name)
+        self.values.pop(name, None)
+        self.disable.add(name)
+
+    def add_value(self, name, value):
+        self.enable.discard(name)
+        self.disable.discard(name)
+        self.values[name] = value
+
+    def names(self):
+        return self.enable | self.disable | set(self.values)
+
+
+def find_profile(profile):
+    """Return the path of a profile given by name or path."""
+    if os.path.exists(profile):
+        return profile
+
+    return os.path.join(PROFILES_DIR, profile + ".profile")
+
+
+def read_profile(path, options):
+    """Add the changes of a profile file to an `Options` object."""
+    with open(path) as f:
+        for line_num, line in enumerate(f, 1):
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+
+            name, equal, value = line.partition("=")
+            if equal:
+                options.add_value(name.strip(), value.strip())
+            elif line[0] == "+":
+                options.add_enable(line[1:].strip())
+            elif line[0] == "-":
+                options.add_disable(line[1:].strip())
+            else:
+                raise ValueError("%s:%d: invalid line" % (path, line_num))
+
+
+def process_options(input_file, enable, disable, values=None):
+    """Rewrite the `#define`/`#undef` lines of `ftoption.h` contents.
+
+    `enable` and `disable` are sets of option names, and `values` maps
+    option names to new values.  Return the new contents and the set of
+    option names found."""
+    values = values or {}
+    options_seen = set()
+
+    new_lines = []
+    for line in input_file.splitlines():
+        line = line.rstrip()
+        m = OPTION_LINE.match(line)
+        if not m:
+            new_lines.append(line)
+            continue
+
+        option_name = m.group("name")
+        option_enabled = not m.group("comment") and (
+            m.group("directive") == "define"
+        )
+
+        options_seen.add(option_name)
+        if option_name in values:
+            line = "#define %s%s%s" % (
+                option_name,
+                m.group("space") if m.group("value") else "  ",
+                values[option_name],
+            )
+        elif option_enabled and option_name in disable:
+            line = "#undef " + option_name
+        elif not option_enabled and option_name in enable:
+            line = "#define " + option_name
+            if m.group("value"):
+                line += m.group("space") + m.group("value")
+        new_lines.append(line)
+
+    return "\n".join(new_lines) + "\n", options_seen
+
 
 def main():
-    parser = argparse.ArgumentParser(description=__doc__)
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
 
     parser.add_argument(
         "input", metavar="FTOPTION_H", help="Path to input ftoption.h file."
@@ -36,6 +164,13 @@ def main():
 
     parser.add_argument("--output", help="Output to file instead of stdout.")
 
+    parser.add_argument(
+        "--profile",
+        action="append",
+        default=[],
+        help="Apply a profile (e.g. minimal-embedded).",
+    )
+
     parser.add_argument(
         "--enable",
         action="append",
@@ -50,6 +185,14 @@ def main():
         help="Disable a given build option.",
     )
 
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        metavar="OPTION=VALUE",
+        help="Set the value of a given build option.",
+    )
+
     args = parser.parse_args()
 
     common_options = set(args.enable) & set(args.disable)
@@ -60,42 +203,32 @@ def main():
         )
         return 1
 
+    options = Options()
+    for profile in args.profile:
+        try:
+            read_profile(find_profile(profile), options)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+
+    for name in args.enable:
+        options.add_enable(name)
+    for name in args.disable:
+        options.add_disable(name)
+    for item in args.set:
+        name, equal, value = item.partition("=")
+        if not equal:
+            parser.error("--set needs OPTION=VALUE, not `%s`" % item)
+        options.add_value(name, value)
+
     with open(args.input) as f:
         input_file = f.read()
 
-    options_seen = set()
-
-    new_lines = []
-    for line in input_file.splitlines():
-        # Expected formats:
-        #   #define <CONFIG_VAR>
-        #   /* #define <CONFIG_VAR> */
-        #   #undef <CONFIG_VAR>
-        line = line.rstrip()
-        if line.startswith("/* #define ") and line.endswith(" */"):
-            option_name = line[11:-3].strip()
-            option_enabled = False
-        elif line.startswith("#define "):
-            option_name = line[8:].strip()
-            option_enabled = True
-        elif line.startswith("#undef "):
-            option_name = line[7:].strip()
-            option_enabled = False
-        else:
-            new_lines.append(line)
-            continue
-
-        options_seen.add(option_name)
-        if option_enabled and option_name in args.disable:
-            line = "#undef " + option_name
-        elif not option_enabled and option_name in args.enable:
-            line = "#define " + option_name
-        new_lines.append(line)
-
-    result = "\n".join(new_lines) + "\n"
+    result, options_seen = process_options(
+        input_file, options.enable, options.disable, options.values
+    )
 
     # Sanity check that all command-line options were actually processed.
-    cmdline_options = set(args.enable) | set(args.disable)
+    cmdline_options = options.names()
     assert cmdline_options.issubset(
         options_seen
     ), "Could not find options in input file: " + ", ".join(
@@ -0,0 +1,22 @@
+# Fastest glyph loading and rendering with unchanged output of the
+# rasterizers.
+
++FT_CONFIG_OPTION_INLINE_MULFIX
+
+# table-driven `FT_Sin', `FT_Cos', `FT_Tan', and `FT_Vector_Unit'
+# (within one unit of the CORDIC results)
++FT_CONFIG_OPTION_TRIG_TABLE
+
+# fewer bands in the anti-aliasing rasterizer for large glyphs
+FT_RENDER_POOL_SIZE = 65536L
+
+# the CFF stem darkening curve of the defaults, made explicit so that a
+# tuned curve can be reviewed
+CFF_CONFIG_OPTION_DARKENING_PARAMETER_X1 = 500
+CFF_CONFIG_OPTION_DARKENING_PARAMETER_Y1 = 400
+CFF_CONFIG_OPTION_DARKENING_PARAMETER_X2 = 1000
+CFF_CONFIG_OPTION_DARKENING_PARAMETER_Y2 = 275
+CFF_CONFIG_OPTION_DARKENING_PARAMETER_X3 = 1667
+CFF_CONFIG_OPTION_DARKENING_PARAMETER_Y3 = 275
+CFF_CONFIG_OPTION_DARKENING_PARAMETER_X4 = 2333
+CFF_CONFIG_OPTION_DARKENING_PARAMETER_Y4 = 0
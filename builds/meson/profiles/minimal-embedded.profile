@@ -0,0 +1,29 @@
+# Small library for devices that render a known set of TrueType or
+# OpenType fonts, trading format coverage for size.
+
+# no compressed, Mac, or incrementally loaded fonts; the options for
+# external libraries follow the Meson options (`-Dzlib=none` etc.)
+-FT_CONFIG_OPTION_USE_LZW
+-FT_CONFIG_OPTION_MAC_FONTS
+-FT_CONFIG_OPTION_GUESSING_EMBEDDED_RFORK
+-FT_CONFIG_OPTION_INCREMENTAL
+-FT_CONFIG_OPTION_SVG
+
+# glyph names are only needed for Type 1 and CFF encodings
+-FT_CONFIG_OPTION_ADOBE_GLYPH_LIST
+
+# only the cmap formats of current fonts
+-TT_CONFIG_CMAP_FORMAT_0
+-TT_CONFIG_CMAP_FORMAT_2
+-TT_CONFIG_CMAP_FORMAT_6
+-TT_CONFIG_CMAP_FORMAT_8
+-TT_CONFIG_CMAP_FORMAT_10
+-TT_CONFIG_CMAP_FORMAT_13
+
+-TT_CONFIG_OPTION_BDF
+-AF_CONFIG_OPTION_CJK
+-AF_CONFIG_OPTION_INDIC
++T1_CONFIG_OPTION_NO_AFM
+
+# a smaller stack buffer for the anti-aliasing rasterizer
+FT_RENDER_POOL_SIZE = 8192L
@@ -0,0 +1,12 @@
+# Batch rendering of untrusted fonts on servers: all formats, output
+# independent of the environment, and tighter limits for malicious
+# bytecode.
+
++FT_CONFIG_OPTION_INLINE_MULFIX
+-FT_CONFIG_OPTION_ENVIRONMENT_PROPERTIES
+
+# stop runaway TrueType bytecode earlier (the default is 1000000L)
+TT_CONFIG_OPTION_MAX_RUNNABLE_OPCODES = 250000L
+
+# limit the nesting of Type 1 subroutine calls (the default is 16)
+T1_MAX_SUBRS_CALLS = 8
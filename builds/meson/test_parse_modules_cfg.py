@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""Tests for `parse_modules_cfg.py`.
+
+Run with
+
+    python3 -m unittest test_parse_modules_cfg
+
+in this directory.
+
+For each key of `FORMAT_MODULES`, the `ftmodule.h` proposed for a corpus
+of only that format is built into a small program with a C compiler, which
+must then open a font of the format.  Fonts are taken from the directory
+given by `FREETYPE_TESTS_DATA_DIR` (`tests/data` by default) and recognized
+by their contents; a BDF font is generated.  Formats without a font are
+skipped, and so is WOFF2 without the `libbrotlidec` library.
+"""
+
+import concurrent.futures
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from parse_modules_cfg import (
+    FORMAT_MODULES,
+    MODULE_LISTS,
+    generate_ftmodule,
+    minimal_modules,
+    parse_modules_cfg,
+)
+
+TOP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+# The source file of each module, if not `src/<module>/<module>.c`.
+MODULE_SOURCES = {
+    "winfonts": "winfnt",
+    "cid": "type1cid",
+    "cache": "ftcache",
+    "gzip": "ftgzip",
+    "lzw": "ftlzw",
+    "bzip2": "ftbzip2",
+}
+
+OPEN_FONT_C = """\
+#include <ft2build.h>
+#include FT_FREETYPE_H
+
+int
+main( int     argc,
+      char**  argv )
+{
+  FT_Library  library;
+  FT_Face     face;
+  int         status = 0;
+
+
+  if ( argc != 2 || FT_Init_FreeType( &library ) )
+    return 2;
+
+  if ( FT_New_Face( library, argv[1], 0, &face ) )
+    status = 1;
+  else
+  {
+    if ( FT_Load_Glyph( face, 0, FT_LOAD_DEFAULT ) )
+      status = 1;
+    FT_Done_Face( face );
+  }
+
+  FT_Done_FreeType( library );
+  return status;
+}
+"""
+
+
+def font_format(path):
+    """Return the `FORMAT_MODULES` key of a font file, or None."""
+    with open(path, "rb") as f:
+        head = f.read(4096)
+
+    tag = head[:4]
+    if tag == b"wOFF":
+        return "woff"
+    if tag == b"wOF2":
+        return "woff2"
+    if tag in (b"\0\1\0\0", b"true", b"OTTO") and len(head) >= 12:
+        num_tables = struct.unpack_from(">H", head, 4)[0]
+        tags = [head[12 + 16 * i:16 + 16 * i] for i in range(num_tables)]
+        if b"SVG " in tags:
+            return "svg"
+        return "opentype" if tag == b"OTTO" else "truetype"
+    if head[:3] == b"\1\0\4":
+        return "cff"
+    if head.startswith(b"%!PS-Adobe-3.0 Resource-CIDFont"):
+        return "cid"
+    if head.startswith(b"%!PS-TrueTypeFont"):
+        return "type42"
+    if head.startswith((b"%!PS-AdobeFont", b"%!FontType1", b"\x80\x01")):
+        return "type1"
+    if tag == b"PFR0":
+        return "pfr"
+    if head[:2] == b"MZ":
+        return "winfonts"
+    if tag == b"\1fcp":
+        return "pcf"
+    if head.startswith(b"STARTFONT"):
+        return "bdf"
+    return None
+
+
+def module_source(module):
+    return os.path.join(
+        TOP_DIR, "src", module, MODULE_SOURCES.get(module, module) + ".c"
+    )
+
+
+class MinimalModulesTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.cc = os.environ.get("CC", "cc")
+        if not shutil.which(cls.cc):
+            raise unittest.SkipTest("no C compiler")
+
+        cls.work_dir = tempfile.mkdtemp(prefix="freetype-modules-")
+
+        with open(os.path.join(TOP_DIR, "modules.cfg")) as f:
+            cls.lists = parse_modules_cfg(f.read())
+
+        cls.cflags = [
+            "-DFT2_BUILD_LIBRARY",
+            "-DFT_CONFIG_OPTION_USE_ZLIB",
+            "-I" + os.path.join(TOP_DIR, "include"),
+        ]
+        cls.libs = []
+        if subprocess.call(
+            ["pkg-config", "--exists", "libbrotlidec"],
+            stderr=subprocess.DEVNULL,
+        ) == 0:
+            cls.cflags.append("-DFT_CONFIG_OPTION_USE_BROTLI")
+            cls.libs += subprocess.check_output(
+                ["pkg-config", "--libs", "libbrotlidec"], text=True
+            ).split()
+        cls.has_brotli = bool(cls.libs)
+        cls.libs.append("-lm")
+
+        cls.fonts = cls.find_fonts()
+
+        # Everything but `ftinit.c` is independent of `ftmodule.h`, so
+        # compile all modules and the base files only once.
+        sources = {
+            module: module_source(module)
+            for name in MODULE_LISTS
+            for module in cls.lists[name]
+            if module != "bzip2"
+        }
+        for base in ["ftbase.c", "ftsystem.c", "ftdebug.c"] + cls.lists[
+            "BASE_EXTENSIONS"
+        ]:
+            sources[base] = os.path.join(TOP_DIR, "src", "base", base)
+        open_font_c = os.path.join(cls.work_dir, "open_font.c")
+        with open(open_font_c, "w") as f:
+            f.write(OPEN_FONT_C)
+        sources["open_font"] = open_font_c
+
+        with concurrent.futures.ThreadPoolExecutor(os.cpu_count()) as pool:
+            cls.objects = dict(
+                zip(sources, pool.map(cls.compile, sources.values()))
+            )
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.work_dir)
+
+    @classmethod
+    def compile(cls, source, extra_flags=()):
+        obj = os.path.join(
+            cls.work_dir, os.path.basename(source).replace(".c", ".o")
+        )
+        subprocess.check_call(
+            [cls.cc, "-c", "-o", obj, source] + cls.cflags + list(extra_flags)
+        )
+        return obj
+
+    @classmethod
+    def find_fonts(cls):
+        """Return a dictionary mapping formats to a font file."""
+        fonts = {}
+
+        data_dir = os.environ.get(
+            "FREETYPE_TESTS_DATA_DIR", os.path.join(TOP_DIR, "tests", "data")
+        )
+        if os.path.isdir(data_dir):
+            for root, _, files in os.walk(data_dir):
+                for name in sorted(files):
+                    path = os.path.join(root, name)
+                    fonts.setdefault(font_format(path), path)
+
+        bdf_dir = os.path.join(cls.work_dir, "bdf-fonts")
+        subprocess.check_call(
+            [
+                sys.executable,
+                os.path.join(TOP_DIR, "tests", "scripts", "make-bdf-corpus.py"),
+                "--count",
+                "1",
+                bdf_dir,
+            ],
+            stdout=subprocess.DEVNULL,
+        )
+        fonts.setdefault("bdf", os.path.join(bdf_dir, os.listdir(bdf_dir)[0]))
+
+        return fonts
+
+    def build(self, font_format):
+        """Build the font opener with the modules proposed for a corpus of
+        `font_format` fonts and return its path."""
+        lists, _, missing = minimal_modules(
+            self.lists, {"formats": [font_format]}
+        )
+        self.assertEqual(missing, [])
+
+        config_dir = os.path.join(self.work_dir, font_format)
+        os.makedirs(config_dir)
+        with open(os.path.join(config_dir, "ftmodule.h"), "w") as f:
+            f.write(generate_ftmodule(lists))
+
+        ftinit = self.compile(
+            os.path.join(TOP_DIR, "src", "base", "ftinit.c"),
+            ["-I" + config_dir, "-DFT_CONFIG_MODULES_H=<ftmodule.h>"],
+        )
+        os.rename(ftinit, os.path.join(config_dir, "ftinit.o"))
+
+        objects = [os.path.join(config_dir, "ftinit.o")]
+        objects += [
+            self.objects[m] for name in MODULE_LISTS for m in lists[name]
+        ]
+        objects += [
+            self.objects[base]
+            for base in ["ftbase.c", "ftsystem.c", "ftdebug.c"]
+            + lists["BASE_EXTENSIONS"]
+        ]
+
+        program = os.path.join(config_dir, "open_font")
+        subprocess.check_call(
+            [self.cc, "-o", program, self.objects["open_font"]]
+            + objects
+            + self.libs
+        )
+        return program
+
+    def test_formats_open(self):
+        for font_format in FORMAT_MODULES:
+            with self.subTest(font_format=font_format):
+                if font_format not in self.fonts:
+                    self.skipTest("no %s font" % font_format)
+                if font_format == "woff2" and not self.has_brotli:
+                    self.skipTest("no libbrotlidec")
+
+                program = self.build(font_format)
+                status = subprocess.call([program, self.fonts[font_format]])
+                self.assertEqual(
+                    status,
+                    0,
+                    "%s: cannot open %s"
+                    % (font_format, self.fonts[font_format]),
+                )
+
+    def test_needs_font_driver(self):
+        with self.assertRaises(ValueError):
+            minimal_modules(self.lists, {"formats": []})
+
+
+if __name__ == "__main__":
+    unittest.main()
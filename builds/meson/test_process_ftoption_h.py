@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Tests for `process_ftoption_h.py`.
+
+Run with
+
+    python3 -m unittest test_process_ftoption_h
+
+in this directory.
+"""
+
+import os
+import tempfile
+import unittest
+
+from process_ftoption_h import Options, process_options, read_profile
+
+FTOPTION_H = """\
+#define FT_CONFIG_OPTION_USE_LZW
+/* #define FT_CONFIG_OPTION_USE_PNG */
+#define TT_CONFIG_OPTION_MAX_RUNNABLE_OPCODES  1000000L
+"""
+
+
+class OptionsTest(unittest.TestCase):
+    def process(self, options):
+        result, _ = process_options(
+            FTOPTION_H, options.enable, options.disable, options.values
+        )
+        return result.splitlines()
+
+    def profile_options(self, text):
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".profile", delete=False
+        ) as f:
+            f.write(text)
+        self.addCleanup(os.remove, f.name)
+
+        options = Options()
+        read_profile(f.name, options)
+        return options
+
+    def test_profile(self):
+        options = self.profile_options(
+            "-FT_CONFIG_OPTION_USE_LZW\n"
+            "+FT_CONFIG_OPTION_USE_PNG  # comment\n"
+            "TT_CONFIG_OPTION_MAX_RUNNABLE_OPCODES = 250000L\n"
+        )
+        self.assertEqual(
+            self.process(options),
+            [
+                "#undef FT_CONFIG_OPTION_USE_LZW",
+                "#define FT_CONFIG_OPTION_USE_PNG",
+                "#define TT_CONFIG_OPTION_MAX_RUNNABLE_OPCODES  250000L",
+            ],
+        )
+
+    def test_disable_overrides_profile_value(self):
+        options = self.profile_options(
+            "TT_CONFIG_OPTION_MAX_RUNNABLE_OPCODES = 250000L\n"
+        )
+        options.add_disable("TT_CONFIG_OPTION_MAX_RUNNABLE_OPCODES")
+        self.assertIn(
+            "#undef TT_CONFIG_OPTION_MAX_RUNNABLE_OPCODES",
+            self.process(options),
+        )
+
+    def test_enable_restores_input_value(self):
+        options = self.profile_options(
+            "TT_CONFIG_OPTION_MAX_RUNNABLE_OPCODES = 250000L\n"
+        )
+        options.add_enable("TT_CONFIG_OPTION_MAX_RUNNABLE_OPCODES")
+        self.assertIn(
+            "#define TT_CONFIG_OPTION_MAX_RUNNABLE_OPCODES  1000000L",
+            self.process(options),
+        )
+
+    def test_set_overrides_profile_disable(self):
+        options = self.profile_options(
+            "-TT_CONFIG_OPTION_MAX_RUNNABLE_OPCODES\n"
+        )
+        options.add_value("TT_CONFIG_OPTION_MAX_RUNNABLE_OPCODES", "5000L")
+        self.assertIn(
+            "#define TT_CONFIG_OPTION_MAX_RUNNABLE_OPCODES  5000L",
+            self.process(options),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -169,6 +169,20 @@ FT_BEGIN_HEADER
 #define FT_CONFIG_OPTION_INLINE_MULFIX
 
 
+  /**************************************************************************
+   *
+   * If this macro is defined, @FT_Sin, @FT_Cos, @FT_Tan, and
+   * @FT_Vector_Unit interpolate linearly in a 1KByte sine table instead of
+   * running the CORDIC iterations, which makes them an order of magnitude
+   * faster.  The maximum error of @FT_Sin and @FT_Cos grows from 0.6 to
+   * 0.8 units of 16.16 values.  The other functions in `fttrigon.h` are
+   * not affected.
+   *
+   * The table is generated with `src/tools/cordic.py`.
+   */
+/* #define FT_CONFIG_OPTION_TRIG_TABLE */
+
+
   /**************************************************************************
    *
    * LZW-compressed file support.
@@ -454,6 +468,22 @@ FT_BEGIN_HEADER
 /* #define FT_DEBUG_LOGGING */
 
 
+  /**************************************************************************
+   *
+   * Trace level limits
+   *
+   *   In trace mode, each `FT_TRACEn` call compares `n` with the level of
+   *   its component, as set at runtime with the `FT2_DEBUG` environment
+   *   variable.  If `FT_CONFIG_TRACE_LEVELS_H` names a header generated
+   *   with `src/tools/chktrcmp.py --trace-levels`, calls above the maximum
+   *   level given there for a component are removed at compile time.
+   *
+   *   Do not `#undef` this macro here since the build system might define
+   *   it for certain configurations only.
+   */
+/* #define FT_CONFIG_TRACE_LEVELS_H  <fttrlvl.h> */
+
+
   /**************************************************************************
    *
    * Autofitter debugging
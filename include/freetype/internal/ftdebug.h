@@ -156,8 +156,29 @@ FT_BEGIN_HEADER
 #define FT_TRACE_COMP( x )   FT_TRACE_COMP_( x )
 #define FT_TRACE_COMP_( x )  trace_ ## x
 
+#ifdef FT_CONFIG_TRACE_LEVELS_H
+
+  /* this header defines `ft_trace_max_level_<component>` for all */
+  /* components; see `FT_CONFIG_TRACE_LEVELS_H` in `ftoption.h`    */
+#include FT_CONFIG_TRACE_LEVELS_H
+
+#define FT_TRACE_MAX_LEVEL( x )   FT_TRACE_MAX_LEVEL_( x )
+#define FT_TRACE_MAX_LEVEL_( x )  ft_trace_max_level_ ## x
+
+  /* the compiler removes calls above the maximum level as dead code */
+#define FT_TRACE( level, varformat )                                 \
+          do                                                         \
+          {                                                          \
+            if ( ( level ) <= FT_TRACE_MAX_LEVEL( FT_COMPONENT ) )   \
+              FT_LOG( level, varformat );                            \
+          } while ( 0 )
+
+#else /* !FT_CONFIG_TRACE_LEVELS_H */
+
 #define FT_TRACE( level, varformat )  FT_LOG( level, varformat )
 
+#endif /* !FT_CONFIG_TRACE_LEVELS_H */
+
 #else /* !FT_DEBUG_LEVEL_TRACE */
 
 #define FT_TRACE( level, varformat )  do { } while ( 0 )      /* nothing */
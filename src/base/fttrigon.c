@@ -48,11 +48,126 @@
   ft_trig_arctan_table[] =
   {
     1740967L, 919879L, 466945L, 234379L, 117304L, 58666L, 29335L,
-    14668L, 7334L, 3667L, 1833L, 917L, 458L, 229L, 115L,
-    57L, 29L, 14L, 7L, 4L, 2L, 1L
+    14668L, 7334L, 3667L, 1833L, 917L, 458L, 229L, 115L, 57L, 29L, 14L,
+    7L, 4L, 2L, 1L
   };
 
 
+#ifdef FT_CONFIG_OPTION_TRIG_TABLE
+
+  /* sin(n * FT_TRIG_SIN_STEP) * 2^FT_TRIG_SIN_BITS */
+#define FT_TRIG_SIN_ENTRIES  256
+#define FT_TRIG_SIN_STEP     23040UL
+#define FT_TRIG_SIN_BITS     24
+
+  static const FT_UInt32
+  ft_trig_sin_table[FT_TRIG_SIN_ENTRIES + 1] =
+  {
+    0UL, 102943UL, 205882UL, 308814UL, 411733UL, 514638UL, 617523UL,
+    720384UL, 823219UL, 926023UL, 1028791UL, 1131521UL, 1234209UL,
+    1336849UL, 1439440UL, 1541976UL, 1644455UL, 1746871UL, 1849222UL,
+    1951503UL, 2053710UL, 2155841UL, 2257890UL, 2359854UL, 2461729UL,
+    2563511UL, 2665197UL, 2766783UL, 2868265UL, 2969638UL, 3070900UL,
+    3172046UL, 3273072UL, 3373976UL, 3474752UL, 3575398UL, 3675909UL,
+    3776281UL, 3876512UL, 3976596UL, 4076531UL, 4176312UL, 4275936UL,
+    4375399UL, 4474698UL, 4573827UL, 4672785UL, 4771567UL, 4870169UL,
+    4968587UL, 5066819UL, 5164860UL, 5262706UL, 5360355UL, 5457801UL,
+    5555042UL, 5652074UL, 5748893UL, 5845495UL, 5941878UL, 6038037UL,
+    6133968UL, 6229669UL, 6325135UL, 6420363UL, 6515349UL, 6610090UL,
+    6704582UL, 6798821UL, 6892805UL, 6986529UL, 7079990UL, 7173184UL,
+    7266109UL, 7358759UL, 7451133UL, 7543226UL, 7635036UL, 7726557UL,
+    7817788UL, 7908725UL, 7999364UL, 8089701UL, 8179734UL, 8269459UL,
+    8358873UL, 8447972UL, 8536753UL, 8625213UL, 8713348UL, 8801154UL,
+    8888630UL, 8975771UL, 9062573UL, 9149035UL, 9235152UL, 9320922UL,
+    9406340UL, 9491405UL, 9576112UL, 9660458UL, 9744441UL, 9828057UL,
+    9911303UL, 9994176UL, 10076672UL, 10158790UL, 10240524UL,
+    10321873UL, 10402834UL, 10483403UL, 10563577UL, 10643353UL,
+    10722729UL, 10801701UL, 10880266UL, 10958422UL, 11036165UL,
+    11113493UL, 11190402UL, 11266890UL, 11342953UL, 11418590UL,
+    11493797UL, 11568571UL, 11642909UL, 11716809UL, 11790268UL,
+    11863283UL, 11935852UL, 12007971UL, 12079638UL, 12150850UL,
+    12221604UL, 12291899UL, 12361731UL, 12431097UL, 12499995UL,
+    12568423UL, 12636378UL, 12703856UL, 12770857UL, 12837376UL,
+    12903413UL, 12968963UL, 13034026UL, 13098597UL, 13162675UL,
+    13226258UL, 13289343UL, 13351928UL, 13414009UL, 13475586UL,
+    13536656UL, 13597215UL, 13657263UL, 13716797UL, 13775814UL,
+    13834313UL, 13892291UL, 13949745UL, 14006675UL, 14063077UL,
+    14118950UL, 14174291UL, 14229098UL, 14283370UL, 14337104UL,
+    14390298UL, 14442951UL, 14495059UL, 14546622UL, 14597637UL,
+    14648103UL, 14698017UL, 14747378UL, 14796184UL, 14844432UL,
+    14892122UL, 14939251UL, 14985817UL, 15031819UL, 15077256UL,
+    15122124UL, 15166424UL, 15210152UL, 15253308UL, 15295889UL,
+    15337895UL, 15379323UL, 15420172UL, 15460440UL, 15500126UL,
+    15539229UL, 15577747UL, 15615678UL, 15653022UL, 15689776UL,
+    15725939UL, 15761510UL, 15796488UL, 15830871UL, 15864658UL,
+    15897848UL, 15930439UL, 15962431UL, 15993821UL, 16024610UL,
+    16054795UL, 16084375UL, 16113350UL, 16141719UL, 16169479UL,
+    16196631UL, 16223173UL, 16249104UL, 16274424UL, 16299131UL,
+    16323224UL, 16346702UL, 16369565UL, 16391812UL, 16413442UL,
+    16434454UL, 16454846UL, 16474620UL, 16493773UL, 16512305UL,
+    16530216UL, 16547504UL, 16564169UL, 16580211UL, 16595628UL,
+    16610420UL, 16624588UL, 16638129UL, 16651044UL, 16663331UL,
+    16674992UL, 16686025UL, 16696429UL, 16706205UL, 16715352UL,
+    16723869UL, 16731757UL, 16739015UL, 16745643UL, 16751640UL,
+    16757007UL, 16761743UL, 16765847UL, 16769321UL, 16772163UL,
+    16774374UL, 16775953UL, 16776900UL, 16777216UL
+  };
+
+
+  /* Return the sine of `angle' with FT_TRIG_SIN_BITS fractional bits, */
+  /* interpolated linearly between the entries of the first quadrant.  */
+  static FT_Fixed
+  ft_trig_sin_table_lookup( FT_Angle  angle )
+  {
+    FT_Bool    negative = 0;
+    FT_UInt32  n, frac, s;
+
+
+    angle %= FT_ANGLE_2PI;
+    if ( angle < 0 )
+      angle += FT_ANGLE_2PI;
+
+    if ( angle >= FT_ANGLE_PI )
+    {
+      angle   -= FT_ANGLE_PI;
+      negative = 1;
+    }
+
+    if ( angle > FT_ANGLE_PI2 )
+      angle = FT_ANGLE_PI - angle;
+
+    n    = (FT_UInt32)( (FT_UInt32)angle / FT_TRIG_SIN_STEP );
+    frac = (FT_UInt32)( (FT_UInt32)angle % FT_TRIG_SIN_STEP );
+    s    = ft_trig_sin_table[n];
+
+    /* the table precision keeps this product within 32 bits */
+    if ( frac )
+      s += (FT_UInt32)( ( ( ft_trig_sin_table[n + 1] - s ) * frac +
+                          FT_TRIG_SIN_STEP / 2 ) / FT_TRIG_SIN_STEP );
+
+    return negative ? -(FT_Fixed)s : (FT_Fixed)s;
+  }
+
+
+  /* round a value from `ft_trig_sin_table_lookup' to 16.16 format */
+  static FT_Fixed
+  ft_trig_sin_round( FT_Fixed  s )
+  {
+    FT_Fixed  half = 1L << ( FT_TRIG_SIN_BITS - 17 );
+
+
+    if ( s < 0 )
+      return -( ( -s + half ) >> ( FT_TRIG_SIN_BITS - 16 ) );
+
+    return ( s + half ) >> ( FT_TRIG_SIN_BITS - 16 );
+  }
+
+
+  /* the sine argument for the cosine of `angle', avoiding overflow */
+#define FT_TRIG_COS_ANGLE( angle )  ( FT_ANGLE_PI2 - (angle) % FT_ANGLE_2PI )
+
+#endif /* FT_CONFIG_OPTION_TRIG_TABLE */
+
 #ifdef FT_INT64
 
   /* multiply a given value by the CORDIC shrink factor */
@@ -296,12 +411,21 @@
   FT_EXPORT_DEF( FT_Fixed )
   FT_Cos( FT_Angle  angle )
   {
+#ifdef FT_CONFIG_OPTION_TRIG_TABLE
+
+    return ft_trig_sin_round(
+             ft_trig_sin_table_lookup( FT_TRIG_COS_ANGLE( angle ) ) );
+
+#else
+
     FT_Vector  v;
 
 
     FT_Vector_Unit( &v, angle );
 
     return v.x;
+
+#endif
   }
 
 
@@ -310,12 +434,20 @@
   FT_EXPORT_DEF( FT_Fixed )
   FT_Sin( FT_Angle  angle )
   {
+#ifdef FT_CONFIG_OPTION_TRIG_TABLE
+
+    return ft_trig_sin_round( ft_trig_sin_table_lookup( angle ) );
+
+#else
+
     FT_Vector  v;
 
 
     FT_Vector_Unit( &v, angle );
 
     return v.y;
+
+#endif
   }
 
 
@@ -324,12 +456,22 @@
   FT_EXPORT_DEF( FT_Fixed )
   FT_Tan( FT_Angle  angle )
   {
+#ifdef FT_CONFIG_OPTION_TRIG_TABLE
+
+    return FT_DivFix( ft_trig_sin_table_lookup( angle ),
+                      ft_trig_sin_table_lookup(
+                        FT_TRIG_COS_ANGLE( angle ) ) );
+
+#else
+
     FT_Vector  v = { 1 << 24, 0 };
 
 
     ft_trig_pseudo_rotate( &v, angle );
 
     return FT_DivFix( v.y, v.x );
+
+#endif
   }
 
 
@@ -363,11 +505,21 @@
     if ( !vec )
       return;
 
+#ifdef FT_CONFIG_OPTION_TRIG_TABLE
+
+    vec->x = ft_trig_sin_round(
+               ft_trig_sin_table_lookup( FT_TRIG_COS_ANGLE( angle ) ) );
+    vec->y = ft_trig_sin_round( ft_trig_sin_table_lookup( angle ) );
+
+#else
+
     vec->x = FT_TRIG_SCALE >> 8;
     vec->y = 0;
     ft_trig_pseudo_rotate( vec, angle );
     vec->x = ( vec->x + 0x80L ) >> 8;
     vec->y = ( vec->y + 0x80L ) >> 8;
+
+#endif
   }
 
 
@@ -76,95 +76,9 @@
    *
    */
 
-  /* List of most properties that might appear in a font.  Doesn't include */
-  /* the RAW_* and AXIS_* properties in X11R6 polymorphic fonts.           */
-
-  static const bdf_property_t  bdf_properties_[] =
-  {
-    { "ADD_STYLE_NAME",          BDF_ATOM,     1, { 0 } },
-    { "AVERAGE_WIDTH",           BDF_INTEGER,  1, { 0 } },
-    { "AVG_CAPITAL_WIDTH",       BDF_INTEGER,  1, { 0 } },
-    { "AVG_LOWERCASE_WIDTH",     BDF_INTEGER,  1, { 0 } },
-    { "CAP_HEIGHT",              BDF_INTEGER,  1, { 0 } },
-    { "CHARSET_COLLECTIONS",     BDF_ATOM,     1, { 0 } },
-    { "CHARSET_ENCODING",        BDF_ATOM,     1, { 0 } },
-    { "CHARSET_REGISTRY",        BDF_ATOM,     1, { 0 } },
-    { "COMMENT",                 BDF_ATOM,     1, { 0 } },
-    { "COPYRIGHT",               BDF_ATOM,     1, { 0 } },
-    { "DEFAULT_CHAR",            BDF_CARDINAL, 1, { 0 } },
-    { "DESTINATION",             BDF_CARDINAL, 1, { 0 } },
-    { "DEVICE_FONT_NAME",        BDF_ATOM,     1, { 0 } },
-    { "END_SPACE",               BDF_INTEGER,  1, { 0 } },
-    { "FACE_NAME",               BDF_ATOM,     1, { 0 } },
-    { "FAMILY_NAME",             BDF_ATOM,     1, { 0 } },
-    { "FIGURE_WIDTH",            BDF_INTEGER,  1, { 0 } },
-    { "FONT",                    BDF_ATOM,     1, { 0 } },
-    { "FONTNAME_REGISTRY",       BDF_ATOM,     1, { 0 } },
-    { "FONT_ASCENT",             BDF_INTEGER,  1, { 0 } },
-    { "FONT_DESCENT",            BDF_INTEGER,  1, { 0 } },
-    { "FOUNDRY",                 BDF_ATOM,     1, { 0 } },
-    { "FULL_NAME",               BDF_ATOM,     1, { 0 } },
-    { "ITALIC_ANGLE",            BDF_INTEGER,  1, { 0 } },
-    { "MAX_SPACE",               BDF_INTEGER,  1, { 0 } },
-    { "MIN_SPACE",               BDF_INTEGER,  1, { 0 } },
-    { "NORM_SPACE",              BDF_INTEGER,  1, { 0 } },
-    { "NOTICE",                  BDF_ATOM,     1, { 0 } },
-    { "PIXEL_SIZE",              BDF_INTEGER,  1, { 0 } },
-    { "POINT_SIZE",              BDF_INTEGER,  1, { 0 } },
-    { "QUAD_WIDTH",              BDF_INTEGER,  1, { 0 } },
-    { "RAW_ASCENT",              BDF_INTEGER,  1, { 0 } },
-    { "RAW_AVERAGE_WIDTH",       BDF_INTEGER,  1, { 0 } },
-    { "RAW_AVG_CAPITAL_WIDTH",   BDF_INTEGER,  1, { 0 } },
-    { "RAW_AVG_LOWERCASE_WIDTH", BDF_INTEGER,  1, { 0 } },
-    { "RAW_CAP_HEIGHT",          BDF_INTEGER,  1, { 0 } },
-    { "RAW_DESCENT",             BDF_INTEGER,  1, { 0 } },
-    { "RAW_END_SPACE",           BDF_INTEGER,  1, { 0 } },
-    { "RAW_FIGURE_WIDTH",        BDF_INTEGER,  1, { 0 } },
-    { "RAW_MAX_SPACE",           BDF_INTEGER,  1, { 0 } },
-    { "RAW_MIN_SPACE",           BDF_INTEGER,  1, { 0 } },
-    { "RAW_NORM_SPACE",          BDF_INTEGER,  1, { 0 } },
-    { "RAW_PIXEL_SIZE",          BDF_INTEGER,  1, { 0 } },
-    { "RAW_POINT_SIZE",          BDF_INTEGER,  1, { 0 } },
-    { "RAW_PIXELSIZE",           BDF_INTEGER,  1, { 0 } },
-    { "RAW_POINTSIZE",           BDF_INTEGER,  1, { 0 } },
-    { "RAW_QUAD_WIDTH",          BDF_INTEGER,  1, { 0 } },
-    { "RAW_SMALL_CAP_SIZE",      BDF_INTEGER,  1, { 0 } },
-    { "RAW_STRIKEOUT_ASCENT",    BDF_INTEGER,  1, { 0 } },
-    { "RAW_STRIKEOUT_DESCENT",   BDF_INTEGER,  1, { 0 } },
-    { "RAW_SUBSCRIPT_SIZE",      BDF_INTEGER,  1, { 0 } },
-    { "RAW_SUBSCRIPT_X",         BDF_INTEGER,  1, { 0 } },
-    { "RAW_SUBSCRIPT_Y",         BDF_INTEGER,  1, { 0 } },
-    { "RAW_SUPERSCRIPT_SIZE",    BDF_INTEGER,  1, { 0 } },
-    { "RAW_SUPERSCRIPT_X",       BDF_INTEGER,  1, { 0 } },
-    { "RAW_SUPERSCRIPT_Y",       BDF_INTEGER,  1, { 0 } },
-    { "RAW_UNDERLINE_POSITION",  BDF_INTEGER,  1, { 0 } },
-    { "RAW_UNDERLINE_THICKNESS", BDF_INTEGER,  1, { 0 } },
-    { "RAW_X_HEIGHT",            BDF_INTEGER,  1, { 0 } },
-    { "RELATIVE_SETWIDTH",       BDF_CARDINAL, 1, { 0 } },
-    { "RELATIVE_WEIGHT",         BDF_CARDINAL, 1, { 0 } },
-    { "RESOLUTION",              BDF_INTEGER,  1, { 0 } },
-    { "RESOLUTION_X",            BDF_CARDINAL, 1, { 0 } },
-    { "RESOLUTION_Y",            BDF_CARDINAL, 1, { 0 } },
-    { "SETWIDTH_NAME",           BDF_ATOM,     1, { 0 } },
-    { "SLANT",                   BDF_ATOM,     1, { 0 } },
-    { "SMALL_CAP_SIZE",          BDF_INTEGER,  1, { 0 } },
-    { "SPACING",                 BDF_ATOM,     1, { 0 } },
-    { "STRIKEOUT_ASCENT",        BDF_INTEGER,  1, { 0 } },
-    { "STRIKEOUT_DESCENT",       BDF_INTEGER,  1, { 0 } },
-    { "SUBSCRIPT_SIZE",          BDF_INTEGER,  1, { 0 } },
-    { "SUBSCRIPT_X",             BDF_INTEGER,  1, { 0 } },
-    { "SUBSCRIPT_Y",             BDF_INTEGER,  1, { 0 } },
-    { "SUPERSCRIPT_SIZE",        BDF_INTEGER,  1, { 0 } },
-    { "SUPERSCRIPT_X",           BDF_INTEGER,  1, { 0 } },
-    { "SUPERSCRIPT_Y",           BDF_INTEGER,  1, { 0 } },
-    { "UNDERLINE_POSITION",      BDF_INTEGER,  1, { 0 } },
-    { "UNDERLINE_THICKNESS",     BDF_INTEGER,  1, { 0 } },
-    { "WEIGHT",                  BDF_CARDINAL, 1, { 0 } },
-    { "WEIGHT_NAME",             BDF_ATOM,     1, { 0 } },
-    { "X_HEIGHT",                BDF_INTEGER,  1, { 0 } },
-    { "_MULE_BASELINE_OFFSET",   BDF_INTEGER,  1, { 0 } },
-    { "_MULE_RELATIVE_COMPOSE",  BDF_INTEGER,  1, { 0 } },
-  };
+  /* The table `bdf_properties_' and a perfect hash to look up its */
+  /* entries are generated by `src/tools/bdfprops.py'.              */
+#include "bdfprops.h"
 
   static const unsigned long
   num_bdf_properties_ = sizeof ( bdf_properties_ ) /
@@ -840,6 +754,28 @@
   }
 
 
+  /* Return the property ID of `name'; builtin properties come first, */
+  /* followed by the user properties.  Return -1 if `name' is unknown. */
+  static long
+  bdf_get_property_id( const char*  name,
+                       bdf_font_t*  font )
+  {
+    long     id;
+    size_t*  propid;
+
+
+    id = bdf_builtin_property_index_( name );
+    if ( id >= 0 )
+      return id;
+
+    propid = ft_hash_str_lookup( name, &(font->proptbl) );
+    if ( propid )
+      return (long)*propid;
+
+    return -1;
+  }
+
+
   static FT_Error
   bdf_create_property( const char*  name,
                        int          format,
@@ -854,7 +790,7 @@
     /* First check whether the property has        */
     /* already been added or not.  If it has, then */
     /* simply ignore it.                           */
-    if ( ft_hash_str_lookup( name, &(font->proptbl) ) )
+    if ( bdf_get_property_id( name, font ) >= 0 )
       goto Exit;
 
     if ( FT_QRENEW_ARRAY( font->user_props,
@@ -894,19 +830,19 @@
   bdf_get_property( const char*  name,
                     bdf_font_t*  font )
   {
-    size_t*  propid;
+    long  propid;
 
 
     if ( name == NULL || *name == 0 )
       return NULL;
 
-    if ( ( propid = ft_hash_str_lookup( name, &(font->proptbl) ) ) == NULL )
+    if ( ( propid = bdf_get_property_id( name, font ) ) < 0 )
       return NULL;
 
-    if ( *propid >= num_bdf_properties_ )
-      return font->user_props + ( *propid - num_bdf_properties_ );
+    if ( (size_t)propid >= num_bdf_properties_ )
+      return font->user_props + ( (size_t)propid - num_bdf_properties_ );
 
-    return (bdf_property_t*)bdf_properties_ + *propid;
+    return (bdf_property_t*)bdf_properties_ + propid;
   }
 
 
@@ -1113,6 +1049,7 @@
                      unsigned long  lineno )
   {
     size_t*         propid;
+    long            id;
     bdf_property_t  *prop, *fp;
     FT_Memory       memory = font->memory;
     FT_Error        error  = FT_Err_Ok;
@@ -1158,13 +1095,13 @@
 
     /* See whether this property type exists yet or not. */
     /* If not, create it.                                */
-    propid = ft_hash_str_lookup( name, &(font->proptbl) );
-    if ( !propid )
+    id = bdf_get_property_id( name, font );
+    if ( id < 0 )
     {
       error = bdf_create_property( name, BDF_ATOM, font );
       if ( error )
         goto Exit;
-      propid = ft_hash_str_lookup( name, &(font->proptbl) );
+      id = bdf_get_property_id( name, font );
     }
 
     /* Allocate another property if this is overflowing. */
@@ -1178,10 +1115,10 @@
       font->props_size++;
     }
 
-    if ( *propid >= num_bdf_properties_ )
-      prop = font->user_props + ( *propid - num_bdf_properties_ );
+    if ( (size_t)id >= num_bdf_properties_ )
+      prop = font->user_props + ( (size_t)id - num_bdf_properties_ );
     else
-      prop = (bdf_property_t*)bdf_properties_ + *propid;
+      prop = (bdf_property_t*)bdf_properties_ + id;
 
     fp = font->props + font->props_used;
 
@@ -1932,23 +1869,11 @@
 
       font->memory = p->memory;
 
-      { /* setup */
-        size_t           i;
-        bdf_property_t*  prop;
-
-
-        error = ft_hash_str_init( &(font->proptbl), memory );
-        if ( error )
-          goto Exit;
-        for ( i = 0, prop = (bdf_property_t*)bdf_properties_;
-              i < num_bdf_properties_; i++, prop++ )
-        {
-          error = ft_hash_str_insert( prop->name, i,
-                                      &(font->proptbl), memory );
-          if ( error )
-            goto Exit;
-        }
-      }
+      /* the hash table only holds user properties; */
+      /* builtin ones are found with a perfect hash  */
+      error = ft_hash_str_init( &(font->proptbl), memory );
+      if ( error )
+        goto Exit;
 
       if ( FT_QALLOC( p->font->internal, sizeof ( FT_HashRec ) ) )
         goto Exit;
@@ -48,7 +48,8 @@ BDF_DRV_SRC := $(BDF_DIR)/bdflib.c \
 #
 BDF_DRV_H := $(BDF_DIR)/bdf.h \
              $(BDF_DIR)/bdfdrivr.h \
-             $(BDF_DIR)/bdferror.h
+             $(BDF_DIR)/bdferror.h \
+             $(BDF_DIR)/bdfprops.h
 
 # bdf driver object(s)
 #
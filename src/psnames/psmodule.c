@@ -32,7 +32,9 @@
    *
    * For this reason, we use `DEFINE_PS_TABLES' to guard the function
    * definitions, and `DEFINE_PS_TABLES_DATA' to provide both proper array
-   * declarations and definitions.
+   * declarations and definitions.  Projects that look up many names at
+   * once can additionally define `DEFINE_PS_TABLES_BULK' to get
+   * `ft_get_adobe_glyph_indices'.
    */
 #include "pstables.h"
 #define  DEFINE_PS_TABLES
@@ -308,6 +310,104 @@
   }
 
 
+  /* Check whether `gname' is a standard glyph name as returned by     */
+  /* `ps_get_standard_strings' or `ps_get_macintosh_name'.  If so, set */
+  /* `*rank' to its position in `ft_standard_unicodes', or to          */
+  /* FT_NUM_STANDARD_UNICODES if the name has no Unicode value.        */
+  static FT_Bool
+  ps_standard_name_rank( const char*  gname,
+                         FT_UInt     *rank )
+  {
+    /* `gname' usually points into another object, and subtracting */
+    /* such pointers is undefined; we thus compare the addresses as */
+    /* integers (names before the pool wrap around to large values) */
+    FT_Offset  offset = (FT_Offset)gname -
+                        (FT_Offset)ft_standard_glyph_names;
+    FT_UInt    min    = 0;
+    FT_UInt    max    = FT_NUM_STANDARD_UNICODES;
+
+
+    if ( offset >= sizeof ( ft_standard_glyph_names ) )
+      return 0;
+
+    while ( min < max )
+    {
+      FT_UInt    mid = ( min + max ) >> 1;
+      FT_UInt    r   = ft_standard_name_ranks[mid];
+      FT_Offset  o   = (FT_Offset)ft_standard_unicode_names[r];
+
+
+      if ( o == offset )
+      {
+        *rank = r;
+        return 1;
+      }
+
+      if ( o < offset )
+        min = mid + 1;
+      else
+        max = mid;
+    }
+
+    *rank = FT_NUM_STANDARD_UNICODES;
+    return 1;
+  }
+
+
+  /* Append the glyphs collected in `slots' to `map', in increasing */
+  /* order of Unicode values.                                        */
+  static PS_UniMap*
+  ps_unicodes_flush_slots( const FT_UInt*  slots,
+                           PS_UniMap*      map )
+  {
+    FT_UInt  rank;
+
+
+    for ( rank = 0; rank < FT_NUM_STANDARD_UNICODES; rank++ )
+    {
+      if ( slots[rank] )
+      {
+        map->unicode     = ft_standard_unicodes[rank];
+        map->glyph_index = slots[rank] - 1;
+        map++;
+      }
+    }
+
+    return map;
+  }
+
+
+  /* Move the `num_dups' entries stored backwards before `dups_end' */
+  /* to `map' and restore their glyph order.                        */
+  static PS_UniMap*
+  ps_unicodes_flush_dups( PS_UniMap*  map,
+                          PS_UniMap*  dups_end,
+                          FT_UInt     num_dups )
+  {
+    PS_UniMap*  first = map;
+    PS_UniMap*  last  = map + num_dups;
+
+
+    FT_ARRAY_MOVE( map, dups_end - num_dups, num_dups );
+
+    while ( first + 1 < last )
+    {
+      PS_UniMap  tmp = *first;
+
+
+      *first++ = *--last;
+      *last    = tmp;
+    }
+
+    return map + num_dups;
+  }
+
+
+  /* If more entries than this must be inserted into the sorted part */
+  /* of the table, it is sorted with `ft_qsort' instead.              */
+#define PS_MAX_INSERTED_MAPS  64
+
+
   /* Build a table that maps Unicode values to glyph indices. */
   FT_CALLBACK_DEF( FT_Error )
   ps_unicodes_init( FT_Memory             memory,
@@ -322,6 +422,14 @@
     FT_UInt  extra_glyph_list_states[] = { 0, 0, 0, 0, 0, 0, 0, 0, 0, 0 };
     FT_UInt  extra_glyphs[EXTRA_GLYPH_LIST_SIZE];
 
+    /* As long as all glyph names are standard names, we collect the   */
+    /* first glyph for each entry of `ft_standard_unicodes' in `slots' */
+    /* (offset by one); the resulting map is then already sorted.      */
+    /* Further glyphs with the same name are stored backwards at the   */
+    /* end of the table and inserted later, like the extra glyphs.     */
+    FT_UInt*  slots    = NULL;
+    FT_UInt   num_dups = 0;
+
 
     /* we first allocate the table */
     table->num_maps = 0;
@@ -330,11 +438,21 @@
     {
       FT_UInt     n;
       FT_UInt     count;
+      FT_UInt     num_sorted = 0;
       PS_UniMap*  map;
+      PS_UniMap*  dups_end;
       FT_UInt32   uni_char;
 
 
-      map = table->maps;
+      /* not fatal; we simply sort the table at the end */
+      if ( FT_NEW_ARRAY( slots, FT_NUM_STANDARD_UNICODES ) )
+      {
+        slots = NULL;
+        error = FT_Err_Ok;
+      }
+
+      map      = table->maps;
+      dups_end = table->maps + num_glyphs + EXTRA_GLYPH_LIST_SIZE;
 
       for ( n = 0; n < num_glyphs; n++ )
       {
@@ -343,8 +461,44 @@
 
         if ( gname && *gname )
         {
+          FT_UInt  rank;
+
+
           ps_check_extra_glyph_name( gname, n,
                                      extra_glyphs, extra_glyph_list_states );
+
+          if ( slots && ps_standard_name_rank( gname, &rank ) )
+          {
+            if ( rank < FT_NUM_STANDARD_UNICODES )
+            {
+              ps_check_extra_glyph_unicode( ft_standard_unicodes[rank],
+                                            extra_glyph_list_states );
+              if ( !slots[rank] )
+                slots[rank] = n + 1;
+              else
+              {
+                PS_UniMap*  dup = dups_end - ++num_dups;
+
+
+                dup->unicode     = ft_standard_unicodes[rank];
+                dup->glyph_index = n;
+              }
+            }
+
+            if ( free_glyph_name )
+              free_glyph_name( glyph_data, gname );
+
+            continue;
+          }
+
+          if ( slots )
+          {
+            /* not a standard name; continue with an unsorted table */
+            map = ps_unicodes_flush_slots( slots, map );
+            map = ps_unicodes_flush_dups( map, dups_end, num_dups );
+            FT_FREE( slots );
+          }
+
           uni_char = ps_unicode_value( gname );
 
           if ( BASE_GLYPH( uni_char ) != 0 )
@@ -361,6 +515,14 @@
         }
       }
 
+      if ( slots )
+      {
+        map        = ps_unicodes_flush_slots( slots, map );
+        num_sorted = (FT_UInt)( map - table->maps );
+        map        = ps_unicodes_flush_dups( map, dups_end, num_dups );
+        FT_FREE( slots );
+      }
+
       for ( n = 0; n < EXTRA_GLYPH_LIST_SIZE; n++ )
       {
         if ( extra_glyph_list_states[n] == 1 )
@@ -397,8 +559,29 @@
 
         /* Sort the table in increasing order of unicode values, */
         /* taking care of glyph variants.                        */
-        ft_qsort( table->maps, count, sizeof ( PS_UniMap ),
-                  compare_uni_maps );
+        if ( num_sorted && count - num_sorted <= PS_MAX_INSERTED_MAPS )
+        {
+          /* only the few extra and duplicate glyphs must be inserted */
+          for ( n = num_sorted; n < count; n++ )
+          {
+            PS_UniMap  tmp = table->maps[n];
+            FT_UInt    m   = n;
+
+
+            for ( ; m > 0; m-- )
+            {
+              if ( compare_uni_maps( &table->maps[m - 1], &tmp ) <= 0 )
+                break;
+
+              table->maps[m] = table->maps[m - 1];
+            }
+
+            table->maps[m] = tmp;
+          }
+        }
+        else
+          ft_qsort( table->maps, count, sizeof ( PS_UniMap ),
+                    compare_uni_maps );
       }
 
       table->num_maps = count;
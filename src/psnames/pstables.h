@@ -26,7 +26,7 @@
   extern
 #endif
 #endif
-  const char  ft_standard_glyph_names[3696]
+  const char  ft_standard_glyph_names[3443]
 #ifdef  DEFINE_PS_TABLES_DATA
   =
   {
@@ -60,7 +60,6 @@
     'c','c','a','r','o','n', 0,
     'd','c','r','o','a','t', 0,
     '.','n','o','t','d','e','f', 0,
-    's','p','a','c','e', 0,
     'e','x','c','l','a','m', 0,
     'q','u','o','t','e','d','b','l', 0,
     'n','u','m','b','e','r','s','i','g','n', 0,
@@ -75,7 +74,6 @@
     'c','o','m','m','a', 0,
     'h','y','p','h','e','n', 0,
     'p','e','r','i','o','d', 0,
-    's','l','a','s','h', 0,
     'z','e','r','o', 0,
     'o','n','e', 0,
     't','w','o', 0,
@@ -85,19 +83,14 @@
     's','i','x', 0,
     's','e','v','e','n', 0,
     'e','i','g','h','t', 0,
-    'n','i','n','e', 0,
-    'c','o','l','o','n', 0,
     's','e','m','i','c','o','l','o','n', 0,
     'l','e','s','s', 0,
-    'e','q','u','a','l', 0,
     'g','r','e','a','t','e','r', 0,
     'q','u','e','s','t','i','o','n', 0,
-    'a','t', 0,
     'A', 0,
     'B', 0,
     'C', 0,
     'D', 0,
-    'E', 0,
     'F', 0,
     'G', 0,
     'H', 0,
@@ -125,38 +118,17 @@
     'a','s','c','i','i','c','i','r','c','u','m', 0,
     'u','n','d','e','r','s','c','o','r','e', 0,
     'q','u','o','t','e','l','e','f','t', 0,
-    'a', 0,
     'b', 0,
-    'c', 0,
-    'd', 0,
-    'e', 0,
-    'f', 0,
-    'g', 0,
-    'h', 0,
-    'i', 0,
     'j', 0,
-    'k', 0,
-    'l', 0,
-    'm', 0,
-    'n', 0,
-    'o', 0,
     'p', 0,
     'q', 0,
-    'r', 0,
-    's', 0,
-    't', 0,
-    'u', 0,
     'v', 0,
     'w', 0,
-    'x', 0,
-    'y', 0,
     'z', 0,
     'b','r','a','c','e','l','e','f','t', 0,
-    'b','a','r', 0,
     'b','r','a','c','e','r','i','g','h','t', 0,
     'a','s','c','i','i','t','i','l','d','e', 0,
     'e','x','c','l','a','m','d','o','w','n', 0,
-    'c','e','n','t', 0,
     's','t','e','r','l','i','n','g', 0,
     'f','r','a','c','t','i','o','n', 0,
     'y','e','n', 0,
@@ -168,8 +140,6 @@
     'g','u','i','l','l','e','m','o','t','l','e','f','t', 0,
     'g','u','i','l','s','i','n','g','l','l','e','f','t', 0,
     'g','u','i','l','s','i','n','g','l','r','i','g','h','t', 0,
-    'f','i', 0,
-    'f','l', 0,
     'e','n','d','a','s','h', 0,
     'd','a','g','g','e','r', 0,
     'd','a','g','g','e','r','d','b','l', 0,
@@ -183,20 +153,9 @@
     'e','l','l','i','p','s','i','s', 0,
     'p','e','r','t','h','o','u','s','a','n','d', 0,
     'q','u','e','s','t','i','o','n','d','o','w','n', 0,
-    'g','r','a','v','e', 0,
-    'a','c','u','t','e', 0,
-    'c','i','r','c','u','m','f','l','e','x', 0,
-    't','i','l','d','e', 0,
     'm','a','c','r','o','n', 0,
-    'b','r','e','v','e', 0,
-    'd','o','t','a','c','c','e','n','t', 0,
-    'd','i','e','r','e','s','i','s', 0,
-    'r','i','n','g', 0,
-    'c','e','d','i','l','l','a', 0,
     'h','u','n','g','a','r','u','m','l','a','u','t', 0,
     'o','g','o','n','e','k', 0,
-    'c','a','r','o','n', 0,
-    'e','m','d','a','s','h', 0,
     'A','E', 0,
     'o','r','d','f','e','m','i','n','i','n','e', 0,
     'L','s','l','a','s','h', 0,
@@ -225,7 +184,6 @@
     't','h','r','e','e','q','u','a','r','t','e','r','s', 0,
     't','w','o','s','u','p','e','r','i','o','r', 0,
     'r','e','g','i','s','t','e','r','e','d', 0,
-    'm','i','n','u','s', 0,
     'e','t','h', 0,
     'm','u','l','t','i','p','l','y', 0,
     't','h','r','e','e','s','u','p','e','r','i','o','r', 0,
@@ -312,20 +270,12 @@
     't','h','r','e','e','q','u','a','r','t','e','r','s','e','m','d','a','s','h', 0,
     'p','e','r','i','o','d','s','u','p','e','r','i','o','r', 0,
     'q','u','e','s','t','i','o','n','s','m','a','l','l', 0,
-    'a','s','u','p','e','r','i','o','r', 0,
     'b','s','u','p','e','r','i','o','r', 0,
     'c','e','n','t','s','u','p','e','r','i','o','r', 0,
-    'd','s','u','p','e','r','i','o','r', 0,
-    'e','s','u','p','e','r','i','o','r', 0,
     'i','s','u','p','e','r','i','o','r', 0,
     'l','s','u','p','e','r','i','o','r', 0,
     'm','s','u','p','e','r','i','o','r', 0,
-    'n','s','u','p','e','r','i','o','r', 0,
-    'o','s','u','p','e','r','i','o','r', 0,
-    'r','s','u','p','e','r','i','o','r', 0,
     's','s','u','p','e','r','i','o','r', 0,
-    't','s','u','p','e','r','i','o','r', 0,
-    'f','f', 0,
     'f','f','i', 0,
     'f','f','l', 0,
     'p','a','r','e','n','l','e','f','t','i','n','f','e','r','i','o','r', 0,
@@ -337,7 +287,6 @@
     'B','s','m','a','l','l', 0,
     'C','s','m','a','l','l', 0,
     'D','s','m','a','l','l', 0,
-    'E','s','m','a','l','l', 0,
     'F','s','m','a','l','l', 0,
     'G','s','m','a','l','l', 0,
     'H','s','m','a','l','l', 0,
@@ -470,24 +419,24 @@
 #ifdef  DEFINE_PS_TABLES_DATA
   =
   {
-     253,   0,   6, 261, 267, 274, 283, 294, 301, 309, 758, 330, 340, 351,
-     360, 365, 371, 378, 385, 391, 396, 400, 404, 410, 415, 420, 424, 430,
-     436, 441, 447, 457, 462, 468, 476, 485, 488, 490, 492, 494, 496, 498,
-     500, 502, 504, 506, 508, 510, 512, 514, 516, 518, 520, 522, 524, 526,
-     528, 530, 532, 534, 536, 538, 540, 552, 562, 575, 587, 979, 608, 610,
-     612, 614, 616, 618, 620, 622, 624, 626, 628, 630, 632, 634, 636, 638,
-     640, 642, 644, 646, 648, 650, 652, 654, 656, 658, 660, 670, 674, 685,
-    1375,1392,1405,1414,1486,1512,1562,1603,1632,1610,1622,1645,1639,1652,
-    1661,1690,1668,1680,1697,1726,1704,1716,1733,1740,1769,1747,1759,1776,
-    1790,1819,1797,1809, 839,1263, 707, 712, 741, 881, 871,1160,1302,1346,
-    1197, 985,1031,  23,1086,1108,  32,1219,  41,  51, 730,1194,  64,  76,
-      86,  94,  97,1089,1118, 106,1131,1150, 966, 696,1183, 112, 734, 120,
-     132, 783, 930, 945, 138,1385,1398,1529,1115,1157, 832,1079, 770, 916,
-     598, 319,1246, 155,1833,1586, 721, 749, 797, 811, 826, 829, 846, 856,
-     888, 903, 954,1363,1421,1356,1433,1443,1450,1457,1469,1479,1493,1500,
-     163,1522,1543,1550,1572,1134, 991,1002,1008,1015,1021,1040,1045,1053,
-    1066,1073,1101,1143,1536,1783,1596,1843,1253,1207,1319,1579,1826,1229,
-    1270,1313,1323,1171,1290,1332,1211,1235,1276, 169, 175, 182, 189, 200,
+     253,   0,   6, 149, 261, 268, 277, 288, 295, 303, 677, 324, 334, 345,
+     354, 359, 365, 372, 935, 379, 384, 388, 392, 398, 403, 408, 412, 418,
+     929, 428, 424, 434,  58, 439, 447, 250, 456, 458, 460, 462, 920, 464,
+     466, 468, 470, 472, 474, 476, 478, 480, 482, 484, 486, 488, 490, 492,
+     494, 496, 498, 500, 502, 504, 506, 518, 528, 541, 553,1213, 110, 574,
+     173, 782, 965, 259, 638,2377,2088, 576,3395, 118, 266,3432, 382, 578,
+     580,1094,2662, 251,1028, 582, 584,1200, 675, 586, 588,1092, 598, 609,
+    1202,1219,1232,1241,1313,1339,1389,1430,1459,1437,1449,1472,1466,1479,
+    1488,1517,1495,1507,1524,1553,1531,1543,1560,1567,1596,1574,1586,1603,
+    1617,1646,1624,1636, 752,1096, 195, 631, 660, 794, 784, 993,1135,1173,
+    1030,1184,1203,  23, 919, 941,  32,1052,  41,  51, 649,1027,  64,  76,
+      86,  94,  97, 922, 951, 106, 964, 983, 879, 620,1016, 112, 653, 120,
+     132, 702, 843, 858, 138,1212,1225,1356, 948, 990, 745,1987, 689, 829,
+     564, 313,1079, 155,1660,1413, 640, 668, 716, 730,2087,2091, 759, 769,
+     801, 816, 867,1190,1248,1183,1260,1270,1277,1284,1296,1306,1320,1327,
+     163,1349,1370,1377,1399, 967,1191,1226, 892, 176, 190,1220,1233, 899,
+     912, 233, 934, 976,1363,1610,1423,1670,1086,1040,1146,1406,1653,1062,
+    1103,1056,1150,1004,1123,1159,1044,1068,1109, 169, 175, 182, 189, 200,
      209, 218, 225, 232, 239, 246
   }
 #endif /* DEFINE_PS_TABLES_DATA */
@@ -509,34 +458,34 @@
 #ifdef  DEFINE_PS_TABLES_DATA
   =
   {
-     253, 261, 267, 274, 283, 294, 301, 309, 319, 330, 340, 351, 360, 365,
-     371, 378, 385, 391, 396, 400, 404, 410, 415, 420, 424, 430, 436, 441,
-     447, 457, 462, 468, 476, 485, 488, 490, 492, 494, 496, 498, 500, 502,
-     504, 506, 508, 510, 512, 514, 516, 518, 520, 522, 524, 526, 528, 530,
-     532, 534, 536, 538, 540, 552, 562, 575, 587, 598, 608, 610, 612, 614,
-     616, 618, 620, 622, 624, 626, 628, 630, 632, 634, 636, 638, 640, 642,
-     644, 646, 648, 650, 652, 654, 656, 658, 660, 670, 674, 685, 696, 707,
-     712, 721, 730, 734, 741, 749, 758, 770, 783, 797, 811, 826, 829, 832,
-     839, 846, 856, 871, 881, 888, 903, 916, 930, 945, 954, 966, 979, 985,
-     991,1002,1008,1015,1021,1031,1040,1045,1053,1066,1073,1079,1086,1089,
-    1101,1108,1115,1118,1131,1134,1143,1150,1157,1160,1171,1183,1194,1197,
-    1207,1211,1219,1229,1235,1246,1253,1263,1270,1276,1290,1302,1313,1319,
-    1323,1332,1346,1356,1363,1375,1385,1392,1398,1405,1414,1421,1433,1443,
-    1450,1457,1469,1479,1486,1493,1500,1512,1522,1529,1536,1543,1550,1562,
-    1572,1579,1586,1596,1603,1610,1622,1632,1639,1645,1652,1661,1668,1680,
-    1690,1697,1704,1716,1726,1733,1740,1747,1759,1769,1776,1783,1790,1797,
-    1809,1819,1826,1833,1843,1850,1862,1880,1895,1910,1925,1936,1954,1973,
-    1988,2003,2016,2028,2040,2054,2067,2080,2092,2106,2120,2133,2147,2167,
-    2182,2196,2206,2216,2229,2239,2249,2259,2269,2279,2289,2299,2309,2319,
-    2329,2332,2336,2340,2358,2377,2393,2408,2419,2426,2433,2440,2447,2454,
-    2461,2468,2475,2482,2489,2496,2503,2510,2517,2524,2531,2538,2545,2552,
-    2559,2566,2573,2580,2587,2594,2601,2615,2625,2632,2643,2659,2672,2684,
-    2696,2708,2722,2733,2744,2759,2771,2782,2797,2809,2819,2832,2850,2860,
-    2873,2885,2898,2907,2917,2930,2943,2956,2968,2982,2996,3009,3022,3034,
-    3046,3060,3073,3086,3098,3112,3126,3139,3152,3167,3182,3196,3208,3220,
-    3237,3249,3264,3275,3283,3297,3309,3321,3338,3353,3365,3377,3394,3409,
-    3418,3430,3442,3454,3471,3483,3498,3506,3518,3530,3542,3559,3574,3586,
-    3597,3612,3620,3628,3636,3644,3650,3655,3660,3666,3673,3681,3687
+     253, 149, 261, 268, 277, 288, 295, 303, 313, 324, 334, 345, 354, 359,
+     365, 372, 935, 379, 384, 388, 392, 398, 403, 408, 412, 418, 929, 428,
+     424, 434,  58, 439, 447, 250, 456, 458, 460, 462, 920, 464, 466, 468,
+     470, 472, 474, 476, 478, 480, 482, 484, 486, 488, 490, 492, 494, 496,
+     498, 500, 502, 504, 506, 518, 528, 541, 553, 564, 110, 574, 173, 782,
+     965, 259, 638,2377,2088, 576,3395, 118, 266,3432, 382, 578, 580,1094,
+    2662, 251,1028, 582, 584,1200, 675, 586, 588,1092, 598, 609, 620, 195,
+     631, 640, 649, 653, 660, 668, 677, 689, 702, 716, 730,2087,2091, 745,
+     752, 759, 769, 784, 794, 801, 816, 829, 843, 858, 867, 879,1213,1184,
+    1191,1226, 892, 176, 190,1203,1220,1233, 899, 912, 233,1987, 919, 922,
+     934, 941, 948, 951, 964, 967, 976, 983, 990, 993,1004,1016,1027,1030,
+    1040,1044,1052,1062,1068,1079,1086,1096,1103,1109,1123,1135,1056,1146,
+    1150,1159,1173,1183,1190,1202,1212,1219,1225,1232,1241,1248,1260,1270,
+    1277,1284,1296,1306,1313,1320,1327,1339,1349,1356,1363,1370,1377,1389,
+    1399,1406,1413,1423,1430,1437,1449,1459,1466,1472,1479,1488,1495,1507,
+    1517,1524,1531,1543,1553,1560,1567,1574,1586,1596,1603,1610,1617,1624,
+    1636,1646,1653,1660,1670,1677,1689,1707,1722,1737,1752,1763,1781,1800,
+    1815,1830,1843,1855,1867,1881,1894,1907,1919,1933,1947,1960,1974,1994,
+    2009,1964,2023,2033,1999,1163,2046,2056,2066,2152,2667,1727,2076,1771,
+      73,2086,2090,2094,2112,2131,2147,2162,2173,2180,2187,2194,3023,2201,
+    2208,2215,2222,2229,2236,2243,2250,2257,2264,2271,2278,2285,2292,2299,
+    2306,2313,2320,2327,2334,2341,2348,2362,2372,2379,2390,2406,2419,2431,
+    2443,2455,2469,2480,2491,2506,2518,2529,2544,2556,2566,2579,2597,2607,
+    2620,2632,2645,2654,2664,2677,2690,2703,2715,2729,2743,2756,2769,2781,
+    2793,2807,2820,2833,2845,2859,2873,2886,2899,2914,2929,2943,2955,2967,
+    2984,2996,3011,3022,3030,3044,3056,3068,3085,3100,3112,3124,3141,3156,
+    3165,3177,3189,3201,3218,3230,3245,3253,3265,3277,3289,3306,3321,3333,
+    3344,3359,3367,3375,3383,3391,3397,3402,3407,3413,3420,3428,3434
   }
 #endif /* DEFINE_PS_TABLES_DATA */
   ;
@@ -626,17 +575,17 @@
   extern
 #endif
 #endif
-  const unsigned char  ft_adobe_glyph_list[55997L]
+  const unsigned char  ft_adobe_glyph_list[57001L]
 #ifdef  DEFINE_PS_TABLES_DATA
   =
   {
       0, 52,  0,106,  2,167,  3, 63,  4,220,  6,125,  9,143, 10, 23,
      11,137, 12,199, 14,246, 15, 87, 16,233, 17,219, 18,104, 19, 88,
      22,110, 23, 32, 23, 71, 24, 77, 27,156, 29, 73, 31,247, 32,107,
-     32,222, 33, 55, 34,154, 35,218, 58, 10, 64,122, 72,188, 80,109,
-     88,104, 93, 61, 98,168,106, 91,114,111,115,237,122,180,127,255,
-    135,164,143,132,149,213,158,108,161,115,168,175,183,147,197,199,
-    202, 25,204,166,208,209,209, 81,215, 26, 65,143,  0, 65,  0,140,
+     32,222, 33, 55, 34,154, 35,218, 58, 10, 64,122, 72,188, 81, 77,
+     89, 72, 94, 72, 99,179,107,220,115,240,117,110,124, 53,129,217,
+    137,126,145,115,151,196,160, 91,164, 66,172,115,187,104,201,179,
+    206,  5,208,146,212,189,213, 61,219,  6, 65,143,  0, 65,  0,140,
       0,175,  0,193,  1, 15,  1,147,  1,233,  1,251,  2,  7,  2, 40,
       2, 57,  2, 82,  2, 91,  2,128,  2,136,  2,154, 69,131,  0,198,
       0,150,  0,158,  0,167,225,227,245,244,101,128,  1,252,237,225,
@@ -1794,10 +1743,10 @@
     128,  0,164,249,114,  4, 72,158, 72,166, 72,173, 72,181,194,242,
     229,246,101,128,246,209,198,236,229,120,128,246,210,226,242,229,
     246,101,128,246,212,230,236,229,120,128,246,213,100,146,  0,100,
-     72,228, 74,110, 75,134, 75,194, 76,114, 77, 68, 77,130, 78, 59,
-     78, 72, 78, 81, 78,107, 78,132, 78,141, 79,208, 79,216, 79,227,
-     79,247, 80, 19, 97, 11, 72,252, 73,  7, 73, 17, 73, 89, 73,152,
-     73,163, 73,174, 73,243, 74, 49, 74, 55, 74, 85,225,242,237,229,
+     72,228, 75, 78, 76,102, 76,162, 77, 82, 78, 36, 78, 98, 79, 27,
+     79, 40, 79, 49, 79, 75, 79,100, 79,109, 80,176, 80,184, 80,195,
+     80,215, 80,243, 97, 11, 72,252, 73,  7, 73, 17, 73, 89, 73,152,
+     73,163, 73,174, 74,211, 75, 17, 75, 23, 75, 53,225,242,237,229,
     238,233,225,110,128,  5,100,226,229,238,231,225,236,105,128,  9,
     166,100,  5, 73, 29, 73, 38, 73, 44, 73, 58, 73, 74,225,242,225,
     226,233, 99,128,  6, 54,229,246, 97,128,  9, 38,230,233,238,225,
@@ -1809,2339 +1758,2616 @@
     117,  2, 73,134, 73,143,234,225,242,225,244,105,128, 10,166,242,
     237,245,235,232,105,128, 10, 38,232,233,242,225,231,225,238, 97,
     128, 48, 96,235,225,244,225,235,225,238, 97,128, 48,192,108,  3,
-     73,182, 73,191, 73,229,225,242,225,226,233, 99,128,  6, 47,229,
-    116,130,  5,211, 73,200, 73,220,228,225,231,229,243,104,129,251,
-     51, 73,211,232,229,226,242,229,119,128,251, 51,232,229,226,242,
-    229,119,128,  5,211,230,233,238,225,236,225,242,225,226,233, 99,
-    128,254,170,237,237, 97,  3, 73,253, 74,  6, 74, 18,225,242,225,
+     73,182, 73,191, 74,197,225,242,225,226,233, 99,128,  6, 47,229,
+    116,134,  5,211, 73,208, 73,228, 74, 73, 74, 92, 74,136, 74,178,
+    228,225,231,229,243,104,129,251, 51, 73,219,232,229,226,242,229,
+    119,128,251, 51,104,  4, 73,238, 74, 29, 74, 37, 74, 55,225,244,
+    225,102,  2, 73,247, 74, 10,240,225,244,225,104,129,216,  0, 74,
+      1,232,229,226,242,229,119,128,216,  0,243,229,231,239,108,129,
+    216,  3, 74, 20,232,229,226,242,229,119,128,216,  3,229,226,242,
+    229,119,128,  5,211,233,242,233,113,129,216,  6, 74, 46,232,229,
+    226,242,229,119,128,216,  6,239,236,225,109,129,216,  9, 74, 64,
+    232,229,226,242,229,119,128,216,  9,240,225,244,225,104,129,216,
+     12, 74, 83,232,229,226,242,229,119,128,216, 12,113,  2, 74, 98,
+     74,117,225,237,225,244,115,129,216, 15, 74,108,232,229,226,242,
+    229,119,128,216, 15,245,226,245,244,115,129,216, 18, 74,127,232,
+    229,226,242,229,119,128,216, 18,115,  2, 74,142, 74,160,229,231,
+    239,108,129,216, 21, 74,151,232,229,226,242,229,119,128,216, 21,
+    232,229,246, 97,129,216, 24, 74,169,232,229,226,242,229,119,128,
+    216, 24,244,243,229,242,101,129,216, 27, 74,188,232,229,226,242,
+    229,119,128,216, 27,230,233,238,225,236,225,242,225,226,233, 99,
+    128,254,170,237,237, 97,  3, 74,221, 74,230, 74,242,225,242,225,
     226,233, 99,128,  6, 79,236,239,247,225,242,225,226,233, 99,128,
-      6, 79,244,225,238, 97,  2, 74, 27, 74, 41,236,244,239,238,229,
+      6, 79,244,225,238, 97,  2, 74,251, 75,  9,236,244,239,238,229,
     225,242,225,226,233, 99,128,  6, 76,242,225,226,233, 99,128,  6,
-     76,238,228, 97,128,  9,100,242,231, 97,  2, 74, 63, 74, 72,232,
+     76,238,228, 97,128,  9,100,242,231, 97,  2, 75, 31, 75, 40,232,
     229,226,242,229,119,128,  5,167,236,229,230,244,232,229,226,242,
     229,119,128,  5,167,243,233,225,240,238,229,245,237,225,244,225,
     227,249,242,233,236,236,233,227,227,237, 98,128,  4,133, 98,  3,
-     74,118, 75,115, 75,125,108,  9, 74,138, 74,146, 75,  3, 75, 11,
-     75, 27, 75, 38, 75, 56, 75, 70, 75, 81,199,242,225,246,101,128,
-    246,211, 97,  2, 74,152, 74,209,238,231,236,229,226,242,225,227,
-    235,229,116,  2, 74,168, 74,188,236,229,230,116,129, 48, 10, 74,
-    177,246,229,242,244,233,227,225,108,128,254, 61,242,233,231,232,
-    116,129, 48, 11, 74,198,246,229,242,244,233,227,225,108,128,254,
-     62,114,  2, 74,215, 74,236,227,232,233,238,246,229,242,244,229,
+     75, 86, 76, 83, 76, 93,108,  9, 75,106, 75,114, 75,227, 75,235,
+     75,251, 76,  6, 76, 24, 76, 38, 76, 49,199,242,225,246,101,128,
+    246,211, 97,  2, 75,120, 75,177,238,231,236,229,226,242,225,227,
+    235,229,116,  2, 75,136, 75,156,236,229,230,116,129, 48, 10, 75,
+    145,246,229,242,244,233,227,225,108,128,254, 61,242,233,231,232,
+    116,129, 48, 11, 75,166,246,229,242,244,233,227,225,108,128,254,
+     62,114,  2, 75,183, 75,204,227,232,233,238,246,229,242,244,229,
     228,226,229,236,239,247,227,237, 98,128,  3, 43,242,239,119,  2,
-     74,244, 74,251,236,229,230,116,128, 33,212,242,233,231,232,116,
+     75,212, 75,219,236,229,230,116,128, 33,212,242,233,231,232,116,
     128, 33,210,228,225,238,228, 97,128,  9,101,231,242,225,246,101,
-    129,246,214, 75, 21,227,237, 98,128,  3, 15,233,238,244,229,231,
+    129,246,214, 75,245,227,237, 98,128,  3, 15,233,238,244,229,231,
     242,225,108,128, 34, 44,236,239,247,236,233,238,101,129, 32, 23,
-     75, 50,227,237, 98,128,  3, 51,239,246,229,242,236,233,238,229,
+     76, 18,227,237, 98,128,  3, 51,239,246,229,242,236,233,238,229,
     227,237, 98,128,  3, 63,240,242,233,237,229,237,239,100,128,  2,
-    186,246,229,242,244,233,227,225,108,  2, 75, 94, 75,100,226,225,
+    186,246,229,242,244,233,227,225,108,  2, 76, 62, 76, 68,226,225,
     114,128, 32, 22,236,233,238,229,225,226,239,246,229,227,237, 98,
     128,  3, 14,239,240,239,237,239,230,111,128, 49,  9,243,241,245,
-    225,242,101,128, 51,200, 99,  4, 75,144, 75,151, 75,160, 75,187,
+    225,242,101,128, 51,200, 99,  4, 76,112, 76,119, 76,128, 76,155,
     225,242,239,110,128,  1, 15,229,228,233,236,236, 97,128, 30, 17,
-    233,242, 99,  2, 75,168, 75,173,236,101,128, 36,211,245,237,230,
+    233,242, 99,  2, 76,136, 76,141,236,101,128, 36,211,245,237,230,
     236,229,248,226,229,236,239,119,128, 30, 19,242,239,225,116,128,
-      1, 17,100,  4, 75,204, 76, 29, 76, 39, 76, 90, 97,  4, 75,214,
-     75,224, 75,231, 76,  0,226,229,238,231,225,236,105,128,  9,161,
-    228,229,246, 97,128,  9, 33,231,117,  2, 75,238, 75,247,234,225,
+      1, 17,100,  4, 76,172, 76,253, 77,  7, 77, 58, 97,  4, 76,182,
+     76,192, 76,199, 76,224,226,229,238,231,225,236,105,128,  9,161,
+    228,229,246, 97,128,  9, 33,231,117,  2, 76,206, 76,215,234,225,
     242,225,244,105,128, 10,161,242,237,245,235,232,105,128, 10, 33,
-    108,  2, 76,  6, 76, 15,225,242,225,226,233, 99,128,  6,136,230,
+    108,  2, 76,230, 76,239,225,242,225,226,233, 99,128,  6,136,230,
     233,238,225,236,225,242,225,226,233, 99,128,251,137,228,232,225,
-    228,229,246, 97,128,  9, 92,232, 97,  3, 76, 48, 76, 58, 76, 65,
+    228,229,246, 97,128,  9, 92,232, 97,  3, 77, 16, 77, 26, 77, 33,
     226,229,238,231,225,236,105,128,  9,162,228,229,246, 97,128,  9,
-     34,231,117,  2, 76, 72, 76, 81,234,225,242,225,244,105,128, 10,
-    162,242,237,245,235,232,105,128, 10, 34,239,116,  2, 76, 97, 76,
-    106,225,227,227,229,238,116,128, 30, 11,226,229,236,239,119,128,
-     30, 13,101,  8, 76,132, 76,185, 76,192, 76,217, 76,227, 76,238,
-     77, 27, 77, 63, 99,  2, 76,138, 76,175,233,237,225,236,243,229,
-    240,225,242,225,244,239,114,  2, 76,156, 76,165,225,242,225,226,
+     34,231,117,  2, 77, 40, 77, 49,234,225,242,225,244,105,128, 10,
+    162,242,237,245,235,232,105,128, 10, 34,239,116,  2, 77, 65, 77,
+     74,225,227,227,229,238,116,128, 30, 11,226,229,236,239,119,128,
+     30, 13,101,  8, 77,100, 77,153, 77,160, 77,185, 77,195, 77,206,
+     77,251, 78, 31, 99,  2, 77,106, 77,143,233,237,225,236,243,229,
+    240,225,242,225,244,239,114,  2, 77,124, 77,133,225,242,225,226,
     233, 99,128,  6,107,240,229,242,243,233,225,110,128,  6,107,249,
     242,233,236,236,233, 99,128,  4, 52,231,242,229,101,128,  0,176,
-    232,105,  2, 76,199, 76,208,232,229,226,242,229,119,128,  5,173,
+    232,105,  2, 77,167, 77,176,232,229,226,242,229,119,128,  5,173,
     242,225,231,225,238, 97,128, 48,103,233,227,239,240,244,233, 99,
     128,  3,239,235,225,244,225,235,225,238, 97,128, 48,199,108,  2,
-     76,244, 77, 11,229,244,101,  2, 76,252, 77,  3,236,229,230,116,
+     77,212, 77,235,229,244,101,  2, 77,220, 77,227,236,229,230,116,
     128, 35, 43,242,233,231,232,116,128, 35, 38,244, 97,129,  3,180,
-     77, 18,244,245,242,238,229,100,128,  1,141,238,239,237,233,238,
+     77,242,244,245,242,238,229,100,128,  1,141,238,239,237,233,238,
     225,244,239,242,237,233,238,245,243,239,238,229,238,245,237,229,
     242,225,244,239,242,226,229,238,231,225,236,105,128,  9,248,250,
-    104,128,  2,164,104,  2, 77, 74, 77,124, 97,  3, 77, 82, 77, 92,
-     77, 99,226,229,238,231,225,236,105,128,  9,167,228,229,246, 97,
-    128,  9, 39,231,117,  2, 77,106, 77,115,234,225,242,225,244,105,
+    104,128,  2,164,104,  2, 78, 42, 78, 92, 97,  3, 78, 50, 78, 60,
+     78, 67,226,229,238,231,225,236,105,128,  9,167,228,229,246, 97,
+    128,  9, 39,231,117,  2, 78, 74, 78, 83,234,225,242,225,244,105,
     128, 10,167,242,237,245,235,232,105,128, 10, 39,239,239,107,128,
-      2, 87,105,  6, 77,144, 77,193, 77,253, 78,  8, 78, 19, 78, 29,
-     97,  2, 77,150, 77,172,236,249,244,233,235,225,244,239,238,239,
-    115,129,  3,133, 77,166,227,237, 98,128,  3, 68,237,239,238,100,
-    129, 38,102, 77,181,243,245,233,244,247,232,233,244,101,128, 38,
-     98,229,242,229,243,233,115,133,  0,168, 77,212, 77,220, 77,231,
-     77,237, 77,245,225,227,245,244,101,128,246,215,226,229,236,239,
+      2, 87,105,  6, 78,112, 78,161, 78,221, 78,232, 78,243, 78,253,
+     97,  2, 78,118, 78,140,236,249,244,233,235,225,244,239,238,239,
+    115,129,  3,133, 78,134,227,237, 98,128,  3, 68,237,239,238,100,
+    129, 38,102, 78,149,243,245,233,244,247,232,233,244,101,128, 38,
+     98,229,242,229,243,233,115,133,  0,168, 78,180, 78,188, 78,199,
+     78,205, 78,213,225,227,245,244,101,128,246,215,226,229,236,239,
     247,227,237, 98,128,  3, 36,227,237, 98,128,  3,  8,231,242,225,
     246,101,128,246,216,244,239,238,239,115,128,  3,133,232,233,242,
     225,231,225,238, 97,128, 48, 98,235,225,244,225,235,225,238, 97,
     128, 48,194,244,244,239,237,225,242,107,128, 48,  3,246,105,  2,
-     78, 36, 78, 47,228,101,129,  0,247, 78, 43,115,128, 34, 35,243,
+     79,  4, 79, 15,228,101,129,  0,247, 79, 11,115,128, 34, 35,243,
     233,239,238,243,236,225,243,104,128, 34, 21,234,229,227,249,242,
     233,236,236,233, 99,128,  4, 82,235,243,232,225,228,101,128, 37,
-    147,108,  2, 78, 87, 78, 98,233,238,229,226,229,236,239,119,128,
-     30, 15,243,241,245,225,242,101,128, 51,151,109,  2, 78,113, 78,
-    121,225,227,242,239,110,128,  1, 17,239,238,239,243,240,225,227,
-    101,128,255, 68,238,226,236,239,227,107,128, 37,132,111, 10, 78,
-    163, 78,175, 78,185, 78,196, 78,207, 79, 23, 79, 28, 79, 39, 79,
-    154, 79,180,227,232,225,228,225,244,232,225,105,128, 14, 14,228,
+    147,108,  2, 79, 55, 79, 66,233,238,229,226,229,236,239,119,128,
+     30, 15,243,241,245,225,242,101,128, 51,151,109,  2, 79, 81, 79,
+     89,225,227,242,239,110,128,  1, 17,239,238,239,243,240,225,227,
+    101,128,255, 68,238,226,236,239,227,107,128, 37,132,111, 10, 79,
+    131, 79,143, 79,153, 79,164, 79,175, 79,247, 79,252, 80,  7, 80,
+    122, 80,148,227,232,225,228,225,244,232,225,105,128, 14, 14,228,
     229,235,244,232,225,105,128, 14, 20,232,233,242,225,231,225,238,
      97,128, 48,105,235,225,244,225,235,225,238, 97,128, 48,201,236,
-    236,225,114,132,  0, 36, 78,222, 78,233, 78,245, 79,  0,233,238,
+    236,225,114,132,  0, 36, 79,190, 79,201, 79,213, 79,224,233,238,
     230,229,242,233,239,114,128,246,227,237,239,238,239,243,240,225,
     227,101,128,255,  4,239,236,228,243,244,249,236,101,128,247, 36,
-    115,  2, 79,  6, 79, 13,237,225,236,108,128,254,105,245,240,229,
+    115,  2, 79,230, 79,237,237,225,236,108,128,254,105,245,240,229,
     242,233,239,114,128,246,228,238,103,128, 32,171,242,245,243,241,
-    245,225,242,101,128, 51, 38,116,  6, 79, 53, 79, 70, 79, 92, 79,
-    103, 79,135, 79,142,225,227,227,229,238,116,129,  2,217, 79, 64,
-    227,237, 98,128,  3,  7,226,229,236,239,247, 99,  2, 79, 81, 79,
-     86,237, 98,128,  3, 35,239,237, 98,128,  3, 35,235,225,244,225,
-    235,225,238, 97,128, 48,251,236,229,243,115,  2, 79,112, 79,116,
-    105,128,  1, 49,106,129,246,190, 79,122,243,244,242,239,235,229,
+    245,225,242,101,128, 51, 38,116,  6, 80, 21, 80, 38, 80, 60, 80,
+     71, 80,103, 80,110,225,227,227,229,238,116,129,  2,217, 80, 32,
+    227,237, 98,128,  3,  7,226,229,236,239,247, 99,  2, 80, 49, 80,
+     54,237, 98,128,  3, 35,239,237, 98,128,  3, 35,235,225,244,225,
+    235,225,238, 97,128, 48,251,236,229,243,115,  2, 80, 80, 80, 84,
+    105,128,  1, 49,106,129,246,190, 80, 90,243,244,242,239,235,229,
     232,239,239,107,128,  2,132,237,225,244,104,128, 34,197,244,229,
     228,227,233,242,227,236,101,128, 37,204,245,226,236,229,249,239,
-    228,240,225,244,225,104,129,251, 31, 79,171,232,229,226,242,229,
-    119,128,251, 31,247,238,244,225,227,107,  2, 79,191, 79,202,226,
+    228,240,225,244,225,104,129,251, 31, 80,139,232,229,226,242,229,
+    119,128,251, 31,247,238,244,225,227,107,  2, 80,159, 80,170,226,
     229,236,239,247,227,237, 98,128,  3, 30,237,239,100,128,  2,213,
     240,225,242,229,110,128, 36,159,243,245,240,229,242,233,239,114,
-    128,246,235,116,  2, 79,233, 79,239,225,233,108,128,  2, 86,239,
-    240,226,225,114,128,  1,140,117,  2, 79,253, 80,  8,232,233,242,
+    128,246,235,116,  2, 80,201, 80,207,225,233,108,128,  2, 86,239,
+    240,226,225,114,128,  1,140,117,  2, 80,221, 80,232,232,233,242,
     225,231,225,238, 97,128, 48,101,235,225,244,225,235,225,238, 97,
-    128, 48,197,122,132,  1,243, 80, 31, 80, 40, 80, 59, 80, 96,225,
-    236,244,239,238,101,128,  2,163, 99,  2, 80, 46, 80, 53,225,242,
-    239,110,128,  1,198,245,242,108,128,  2,165,101,  2, 80, 65, 80,
-     85,225,226,235,232,225,243,233,225,238,227,249,242,233,236,236,
+    128, 48,197,122,132,  1,243, 80,255, 81,  8, 81, 27, 81, 64,225,
+    236,244,239,238,101,128,  2,163, 99,  2, 81, 14, 81, 21,225,242,
+    239,110,128,  1,198,245,242,108,128,  2,165,101,  2, 81, 33, 81,
+     53,225,226,235,232,225,243,233,225,238,227,249,242,233,236,236,
     233, 99,128,  4,225,227,249,242,233,236,236,233, 99,128,  4, 85,
     232,229,227,249,242,233,236,236,233, 99,128,  4, 95,101,151,  0,
-    101, 80,159, 80,178, 80,212, 81,186, 81,248, 82, 25, 82, 37, 82,
-     60, 82,113, 83,225, 84, 27, 84,129, 84,245, 85,124, 85,199, 85,
-    230, 86, 36, 86, 89, 87, 24, 87,157, 87,177, 87,221, 88, 56, 97,
-      2, 80,165, 80,172,227,245,244,101,128,  0,233,242,244,104,128,
-     38, 65, 98,  3, 80,186, 80,195, 80,205,229,238,231,225,236,105,
+    101, 81,127, 81,146, 81,180, 82,154, 82,216, 82,249, 83,  5, 83,
+     28, 83, 81, 84,193, 84,251, 85, 97, 85,213, 86, 92, 86,167, 86,
+    198, 87,  4, 87, 57, 87,248, 88,125, 88,145, 88,189, 89, 24, 97,
+      2, 81,133, 81,140,227,245,244,101,128,  0,233,242,244,104,128,
+     38, 65, 98,  3, 81,154, 81,163, 81,173,229,238,231,225,236,105,
     128,  9,143,239,240,239,237,239,230,111,128, 49, 28,242,229,246,
-    101,128,  1, 21, 99,  5, 80,224, 81, 41, 81, 55, 81, 87, 81,176,
-     97,  2, 80,230, 81, 35,238,228,242, 97,  3, 80,241, 80,248, 81,
-      3,228,229,246, 97,128,  9, 13,231,245,234,225,242,225,244,105,
-    128, 10,141,246,239,247,229,236,243,233,231,110,  2, 81, 17, 81,
-     24,228,229,246, 97,128,  9, 69,231,245,234,225,242,225,244,105,
+    101,128,  1, 21, 99,  5, 81,192, 82,  9, 82, 23, 82, 55, 82,144,
+     97,  2, 81,198, 82,  3,238,228,242, 97,  3, 81,209, 81,216, 81,
+    227,228,229,246, 97,128,  9, 13,231,245,234,225,242,225,244,105,
+    128, 10,141,246,239,247,229,236,243,233,231,110,  2, 81,241, 81,
+    248,228,229,246, 97,128,  9, 69,231,245,234,225,242,225,244,105,
     128, 10,197,242,239,110,128,  1, 27,229,228,233,236,236,225,226,
-    242,229,246,101,128, 30, 29,104,  2, 81, 61, 81, 72,225,242,237,
+    242,229,246,101,128, 30, 29,104,  2, 82, 29, 82, 40,225,242,237,
     229,238,233,225,110,128,  5,101,249,233,247,238,225,242,237,229,
-    238,233,225,110,128,  5,135,233,242, 99,  2, 81, 95, 81,100,236,
-    101,128, 36,212,245,237,230,236,229,120,134,  0,234, 81,121, 81,
-    129, 81,137, 81,148, 81,156, 81,168,225,227,245,244,101,128, 30,
+    238,233,225,110,128,  5,135,233,242, 99,  2, 82, 63, 82, 68,236,
+    101,128, 36,212,245,237,230,236,229,120,134,  0,234, 82, 89, 82,
+     97, 82,105, 82,116, 82,124, 82,136,225,227,245,244,101,128, 30,
     191,226,229,236,239,119,128, 30, 25,228,239,244,226,229,236,239,
     119,128, 30,199,231,242,225,246,101,128, 30,193,232,239,239,235,
     225,226,239,246,101,128, 30,195,244,233,236,228,101,128, 30,197,
-    249,242,233,236,236,233, 99,128,  4, 84,100,  4, 81,196, 81,206,
-     81,212, 81,222,226,236,231,242,225,246,101,128,  2,  5,229,246,
+    249,242,233,236,236,233, 99,128,  4, 84,100,  4, 82,164, 82,174,
+     82,180, 82,190,226,236,231,242,225,246,101,128,  2,  5,229,246,
      97,128,  9, 15,233,229,242,229,243,233,115,128,  0,235,239,116,
-    130,  1, 23, 81,231, 81,240,225,227,227,229,238,116,128,  1, 23,
-    226,229,236,239,119,128, 30,185,101,  2, 81,254, 82,  9,231,245,
+    130,  1, 23, 82,199, 82,208,225,227,227,229,238,116,128,  1, 23,
+    226,229,236,239,119,128, 30,185,101,  2, 82,222, 82,233,231,245,
     242,237,245,235,232,105,128, 10, 15,237,225,244,242,225,231,245,
     242,237,245,235,232,105,128, 10, 71,230,227,249,242,233,236,236,
-    233, 99,128,  4, 68,103,  2, 82, 43, 82, 50,242,225,246,101,128,
-      0,232,245,234,225,242,225,244,105,128, 10,143,104,  4, 82, 70,
-     82, 81, 82, 92, 82,102,225,242,237,229,238,233,225,110,128,  5,
+    233, 99,128,  4, 68,103,  2, 83, 11, 83, 18,242,225,246,101,128,
+      0,232,245,234,225,242,225,244,105,128, 10,143,104,  4, 83, 38,
+     83, 49, 83, 60, 83, 70,225,242,237,229,238,233,225,110,128,  5,
     103,226,239,240,239,237,239,230,111,128, 49, 29,233,242,225,231,
     225,238, 97,128, 48, 72,239,239,235,225,226,239,246,101,128, 30,
-    187,105,  4, 82,123, 82,134, 83,192, 83,207,226,239,240,239,237,
-    239,230,111,128, 49, 31,231,232,116,142,  0, 56, 82,168, 82,177,
-     82,187, 82,217, 82,224, 83,  6, 83, 31, 83, 76, 83,110, 83,122,
-     83,133, 83,166, 83,174, 83,185,225,242,225,226,233, 99,128,  6,
+    187,105,  4, 83, 91, 83,102, 84,160, 84,175,226,239,240,239,237,
+    239,230,111,128, 49, 31,231,232,116,142,  0, 56, 83,136, 83,145,
+     83,155, 83,185, 83,192, 83,230, 83,255, 84, 44, 84, 78, 84, 90,
+     84,101, 84,134, 84,142, 84,153,225,242,225,226,233, 99,128,  6,
     104,226,229,238,231,225,236,105,128,  9,238,227,233,242,227,236,
-    101,129, 36,103, 82,198,233,238,246,229,242,243,229,243,225,238,
+    101,129, 36,103, 83,166,233,238,246,229,242,243,229,243,225,238,
     243,243,229,242,233,102,128, 39,145,228,229,246, 97,128,  9,110,
-    229,229,110,  2, 82,232, 82,241,227,233,242,227,236,101,128, 36,
-    113,112,  2, 82,247, 82,254,225,242,229,110,128, 36,133,229,242,
-    233,239,100,128, 36,153,231,117,  2, 83, 13, 83, 22,234,225,242,
+    229,229,110,  2, 83,200, 83,209,227,233,242,227,236,101,128, 36,
+    113,112,  2, 83,215, 83,222,225,242,229,110,128, 36,133,229,242,
+    233,239,100,128, 36,153,231,117,  2, 83,237, 83,246,234,225,242,
     225,244,105,128, 10,238,242,237,245,235,232,105,128, 10,110,104,
-      2, 83, 37, 83, 63, 97,  2, 83, 43, 83, 54,227,235,225,242,225,
+      2, 84,  5, 84, 31, 97,  2, 84, 11, 84, 22,227,235,225,242,225,
     226,233, 99,128,  6,104,238,231,250,232,239,117,128, 48, 40,238,
-    239,244,229,226,229,225,237,229,100,128, 38,107,105,  2, 83, 82,
-     83,100,228,229,239,231,242,225,240,232,233,227,240,225,242,229,
+    239,244,229,226,229,225,237,229,100,128, 38,107,105,  2, 84, 50,
+     84, 68,228,229,239,231,242,225,240,232,233,227,240,225,242,229,
     110,128, 50, 39,238,230,229,242,233,239,114,128, 32,136,237,239,
     238,239,243,240,225,227,101,128,255, 24,239,236,228,243,244,249,
-    236,101,128,247, 56,112,  2, 83,139, 83,146,225,242,229,110,128,
-     36,123,229,114,  2, 83,153, 83,159,233,239,100,128, 36,143,243,
+    236,101,128,247, 56,112,  2, 84,107, 84,114,225,242,229,110,128,
+     36,123,229,114,  2, 84,121, 84,127,233,239,100,128, 36,143,243,
     233,225,110,128,  6,248,242,239,237,225,110,128, 33,119,243,245,
     240,229,242,233,239,114,128, 32,120,244,232,225,105,128, 14, 88,
     238,246,229,242,244,229,228,226,242,229,246,101,128,  2,  7,239,
     244,233,230,233,229,228,227,249,242,233,236,236,233, 99,128,  4,
-    101,107,  2, 83,231, 83,255,225,244,225,235,225,238, 97,129, 48,
-    168, 83,243,232,225,236,230,247,233,228,244,104,128,255,116,111,
-      2, 84,  5, 84, 20,238,235,225,242,231,245,242,237,245,235,232,
-    105,128, 10,116,242,229,225,110,128, 49, 84,108,  3, 84, 35, 84,
-     46, 84,107,227,249,242,233,236,236,233, 99,128,  4, 59,101,  2,
-     84, 52, 84, 59,237,229,238,116,128, 34,  8,246,229,110,  3, 84,
-     69, 84, 78, 84, 99,227,233,242,227,236,101,128, 36,106,112,  2,
-     84, 84, 84, 91,225,242,229,110,128, 36,126,229,242,233,239,100,
+    101,107,  2, 84,199, 84,223,225,244,225,235,225,238, 97,129, 48,
+    168, 84,211,232,225,236,230,247,233,228,244,104,128,255,116,111,
+      2, 84,229, 84,244,238,235,225,242,231,245,242,237,245,235,232,
+    105,128, 10,116,242,229,225,110,128, 49, 84,108,  3, 85,  3, 85,
+     14, 85, 75,227,249,242,233,236,236,233, 99,128,  4, 59,101,  2,
+     85, 20, 85, 27,237,229,238,116,128, 34,  8,246,229,110,  3, 85,
+     37, 85, 46, 85, 67,227,233,242,227,236,101,128, 36,106,112,  2,
+     85, 52, 85, 59,225,242,229,110,128, 36,126,229,242,233,239,100,
     128, 36,146,242,239,237,225,110,128, 33,122,236,233,240,243,233,
-    115,129, 32, 38, 84,118,246,229,242,244,233,227,225,108,128, 34,
-    238,109,  5, 84,141, 84,169, 84,180, 84,200, 84,211,225,227,242,
-    239,110,130,  1, 19, 84,153, 84,161,225,227,245,244,101,128, 30,
+    115,129, 32, 38, 85, 86,246,229,242,244,233,227,225,108,128, 34,
+    238,109,  5, 85,109, 85,137, 85,148, 85,168, 85,179,225,227,242,
+    239,110,130,  1, 19, 85,121, 85,129,225,227,245,244,101,128, 30,
      23,231,242,225,246,101,128, 30, 21,227,249,242,233,236,236,233,
-     99,128,  4, 60,228,225,243,104,129, 32, 20, 84,189,246,229,242,
+     99,128,  4, 60,228,225,243,104,129, 32, 20, 85,157,246,229,242,
     244,233,227,225,108,128,254, 49,239,238,239,243,240,225,227,101,
-    128,255, 69,112,  2, 84,217, 84,237,232,225,243,233,243,237,225,
+    128,255, 69,112,  2, 85,185, 85,205,232,225,243,233,243,237,225,
     242,235,225,242,237,229,238,233,225,110,128,  5, 91,244,249,243,
-    229,116,128, 34,  5,110,  6, 85,  3, 85, 14, 85, 25, 85, 69, 85,
-    101, 85,116,226,239,240,239,237,239,230,111,128, 49, 35,227,249,
-    242,233,236,236,233, 99,128,  4, 61,100,  2, 85, 31, 85, 50,225,
-    243,104,129, 32, 19, 85, 39,246,229,242,244,233,227,225,108,128,
+    229,116,128, 34,  5,110,  6, 85,227, 85,238, 85,249, 86, 37, 86,
+     69, 86, 84,226,239,240,239,237,239,230,111,128, 49, 35,227,249,
+    242,233,236,236,233, 99,128,  4, 61,100,  2, 85,255, 86, 18,225,
+    243,104,129, 32, 19, 86,  7,246,229,242,244,233,227,225,108,128,
     254, 50,229,243,227,229,238,228,229,242,227,249,242,233,236,236,
-    233, 99,128,  4,163,103,130,  1, 75, 85, 77, 85, 88,226,239,240,
+    233, 99,128,  4,163,103,130,  1, 75, 86, 45, 86, 56,226,239,240,
     239,237,239,230,111,128, 49, 37,232,229,227,249,242,233,236,236,
     233, 99,128,  4,165,232,239,239,235,227,249,242,233,236,236,233,
-     99,128,  4,200,243,240,225,227,101,128, 32,  2,111,  3, 85,132,
-     85,140, 85,149,231,239,238,229,107,128,  1, 25,235,239,242,229,
-    225,110,128, 49, 83,240,229,110,130,  2, 91, 85,159, 85,168,227,
+     99,128,  4,200,243,240,225,227,101,128, 32,  2,111,  3, 86,100,
+     86,108, 86,117,231,239,238,229,107,128,  1, 25,235,239,242,229,
+    225,110,128, 49, 83,240,229,110,130,  2, 91, 86,127, 86,136,227,
     236,239,243,229,100,128,  2,154,242,229,246,229,242,243,229,100,
-    130,  2, 92, 85,183, 85,192,227,236,239,243,229,100,128,  2, 94,
-    232,239,239,107,128,  2, 93,112,  2, 85,205, 85,212,225,242,229,
-    110,128, 36,160,243,233,236,239,110,129,  3,181, 85,222,244,239,
-    238,239,115,128,  3,173,241,117,  2, 85,237, 86, 25,225,108,130,
-      0, 61, 85,246, 86,  2,237,239,238,239,243,240,225,227,101,128,
-    255, 29,115,  2, 86,  8, 86, 15,237,225,236,108,128,254,102,245,
+    130,  2, 92, 86,151, 86,160,227,236,239,243,229,100,128,  2, 94,
+    232,239,239,107,128,  2, 93,112,  2, 86,173, 86,180,225,242,229,
+    110,128, 36,160,243,233,236,239,110,129,  3,181, 86,190,244,239,
+    238,239,115,128,  3,173,241,117,  2, 86,205, 86,249,225,108,130,
+      0, 61, 86,214, 86,226,237,239,238,239,243,240,225,227,101,128,
+    255, 29,115,  2, 86,232, 86,239,237,225,236,108,128,254,102,245,
     240,229,242,233,239,114,128, 32,124,233,246,225,236,229,238,227,
-    101,128, 34, 97,114,  3, 86, 44, 86, 55, 86, 66,226,239,240,239,
+    101,128, 34, 97,114,  3, 87, 12, 87, 23, 87, 34,226,239,240,239,
     237,239,230,111,128, 49, 38,227,249,242,233,236,236,233, 99,128,
-      4, 64,229,246,229,242,243,229,100,129,  2, 88, 86, 78,227,249,
-    242,233,236,236,233, 99,128,  4, 77,115,  6, 86,103, 86,114, 86,
-    134, 86,215, 87,  4, 87, 14,227,249,242,233,236,236,233, 99,128,
+      4, 64,229,246,229,242,243,229,100,129,  2, 88, 87, 46,227,249,
+    242,233,236,236,233, 99,128,  4, 77,115,  6, 87, 71, 87, 82, 87,
+    102, 87,183, 87,228, 87,238,227,249,242,233,236,236,233, 99,128,
       4, 65,228,229,243,227,229,238,228,229,242,227,249,242,233,236,
-    236,233, 99,128,  4,171,104,132,  2,131, 86,146, 86,153, 86,184,
-     86,199,227,245,242,108,128,  2,134,239,242,116,  2, 86,161, 86,
-    168,228,229,246, 97,128,  9, 14,246,239,247,229,236,243,233,231,
+    236,233, 99,128,  4,171,104,132,  2,131, 87,114, 87,121, 87,152,
+     87,167,227,245,242,108,128,  2,134,239,242,116,  2, 87,129, 87,
+    136,228,229,246, 97,128,  9, 14,246,239,247,229,236,243,233,231,
     238,228,229,246, 97,128,  9, 70,242,229,246,229,242,243,229,228,
     236,239,239,112,128,  1,170,243,241,245,225,244,242,229,246,229,
-    242,243,229,100,128,  2,133,237,225,236,108,  2, 86,224, 86,235,
+    242,243,229,100,128,  2,133,237,225,236,108,  2, 87,192, 87,203,
     232,233,242,225,231,225,238, 97,128, 48, 71,235,225,244,225,235,
-    225,238, 97,129, 48,167, 86,248,232,225,236,230,247,233,228,244,
+    225,238, 97,129, 48,167, 87,216,232,225,236,230,247,233,228,244,
     104,128,255,106,244,233,237,225,244,229,100,128, 33, 46,245,240,
-    229,242,233,239,114,128,246,236,116,  5, 87, 36, 87, 62, 87, 66,
-     87, 83, 87,149, 97,130,  3,183, 87, 44, 87, 54,242,237,229,238,
+    229,242,233,239,114,128,246,236,116,  5, 88,  4, 88, 30, 88, 34,
+     88, 51, 88,117, 97,130,  3,183, 88, 12, 88, 22,242,237,229,238,
     233,225,110,128,  5,104,244,239,238,239,115,128,  3,174,104,128,
-      0,240,233,236,228,101,129, 30,189, 87, 75,226,229,236,239,119,
-    128, 30, 27,238,225,232,244, 97,  3, 87, 95, 87,127, 87,136,230,
-    239,245,235,104,  2, 87,105, 87,114,232,229,226,242,229,119,128,
+      0,240,233,236,228,101,129, 30,189, 88, 43,226,229,236,239,119,
+    128, 30, 27,238,225,232,244, 97,  3, 88, 63, 88, 95, 88,104,230,
+    239,245,235,104,  2, 88, 73, 88, 82,232,229,226,242,229,119,128,
       5,145,236,229,230,244,232,229,226,242,229,119,128,  5,145,232,
     229,226,242,229,119,128,  5,145,236,229,230,244,232,229,226,242,
-    229,119,128,  5,145,245,242,238,229,100,128,  1,221,117,  2, 87,
-    163, 87,172,235,239,242,229,225,110,128, 49, 97,242,111,128, 32,
-    172,246,239,247,229,236,243,233,231,110,  3, 87,193, 87,203, 87,
-    210,226,229,238,231,225,236,105,128,  9,199,228,229,246, 97,128,
-      9, 71,231,245,234,225,242,225,244,105,128, 10,199,120,  2, 87,
-    227, 88, 44,227,236,225,109,132,  0, 33, 87,242, 87,253, 88, 24,
-     88, 36,225,242,237,229,238,233,225,110,128,  5, 92,100,  2, 88,
-      3, 88,  8,226,108,128, 32, 60,239,247,110,129,  0,161, 88, 16,
+    229,119,128,  5,145,245,242,238,229,100,128,  1,221,117,  2, 88,
+    131, 88,140,235,239,242,229,225,110,128, 49, 97,242,111,128, 32,
+    172,246,239,247,229,236,243,233,231,110,  3, 88,161, 88,171, 88,
+    178,226,229,238,231,225,236,105,128,  9,199,228,229,246, 97,128,
+      9, 71,231,245,234,225,242,225,244,105,128, 10,199,120,  2, 88,
+    195, 89, 12,227,236,225,109,132,  0, 33, 88,210, 88,221, 88,248,
+     89,  4,225,242,237,229,238,233,225,110,128,  5, 92,100,  2, 88,
+    227, 88,232,226,108,128, 32, 60,239,247,110,129,  0,161, 88,240,
     243,237,225,236,108,128,247,161,237,239,238,239,243,240,225,227,
     101,128,255,  1,243,237,225,236,108,128,247, 33,233,243,244,229,
-    238,244,233,225,108,128, 34,  3,250,104,131,  2,146, 88, 67, 88,
-     86, 88, 97, 99,  2, 88, 73, 88, 80,225,242,239,110,128,  1,239,
+    238,244,233,225,108,128, 34,  3,250,104,131,  2,146, 89, 35, 89,
+     54, 89, 65, 99,  2, 89, 41, 89, 48,225,242,239,110,128,  1,239,
     245,242,108,128,  2,147,242,229,246,229,242,243,229,100,128,  1,
-    185,244,225,233,108,128,  1,186,102,140,  0,102, 88,132, 88,214,
-     88,225, 88,234, 88,246, 89, 93, 89,109, 91,117, 91,130, 91,156,
-     93, 33, 93, 41, 97,  4, 88,142, 88,149, 88,160, 88,171,228,229,
+    185,244,225,233,108,128,  1,186,102,140,  0,102, 89,100, 89,182,
+     89,193, 89,202, 89,214, 90, 61, 90, 77, 92,128, 92,141, 92,167,
+     94, 44, 94, 52, 97,  4, 89,110, 89,117, 89,128, 89,139,228,229,
     246, 97,128,  9, 94,231,245,242,237,245,235,232,105,128, 10, 94,
-    232,242,229,238,232,229,233,116,128, 33,  9,244,232, 97,  3, 88,
-    181, 88,190, 88,202,225,242,225,226,233, 99,128,  6, 78,236,239,
+    232,242,229,238,232,229,233,116,128, 33,  9,244,232, 97,  3, 89,
+    149, 89,158, 89,170,225,242,225,226,233, 99,128,  6, 78,236,239,
     247,225,242,225,226,233, 99,128,  6, 78,244,225,238,225,242,225,
     226,233, 99,128,  6, 75,226,239,240,239,237,239,230,111,128, 49,
       8,227,233,242,227,236,101,128, 36,213,228,239,244,225,227,227,
-    229,238,116,128, 30, 31,101,  3, 88,254, 89, 76, 89, 86,104,  4,
-     89,  8, 89, 31, 89, 45, 89, 61,225,114,  2, 89, 15, 89, 22,225,
+    229,238,116,128, 30, 31,101,  3, 89,222, 90, 44, 90, 54,104,  4,
+     89,232, 89,255, 90, 13, 90, 29,225,114,  2, 89,239, 89,246,225,
     226,233, 99,128,  6, 65,237,229,238,233,225,110,128,  5,134,230,
     233,238,225,236,225,242,225,226,233, 99,128,254,210,233,238,233,
     244,233,225,236,225,242,225,226,233, 99,128,254,211,237,229,228,
     233,225,236,225,242,225,226,233, 99,128,254,212,233,227,239,240,
     244,233, 99,128,  3,229,237,225,236,101,128, 38, 64,102,130,251,
-      0, 89,101, 89,105,105,128,251,  3,108,128,251,  4,105,136,251,
-      1, 89,129, 89,169, 89,180, 89,202, 90, 68, 90, 85, 90, 93, 90,
-    106,230,244,229,229,110,  2, 89,139, 89,148,227,233,242,227,236,
-    101,128, 36,110,112,  2, 89,154, 89,161,225,242,229,110,128, 36,
+      0, 90, 69, 90, 73,105,128,251,  3,108,128,251,  4,105,136,251,
+      1, 90, 97, 90,137, 90,148, 90,170, 91, 79, 91, 96, 91,104, 91,
+    117,230,244,229,229,110,  2, 90,107, 90,116,227,233,242,227,236,
+    101,128, 36,110,112,  2, 90,122, 90,129,225,242,229,110,128, 36,
     130,229,242,233,239,100,128, 36,150,231,245,242,229,228,225,243,
-    104,128, 32, 18,236,236,229,100,  2, 89,189, 89,195,226,239,120,
-    128, 37,160,242,229,227,116,128, 37,172,238,225,108,  5, 89,216,
-     89,255, 90, 16, 90, 33, 90, 49,235,225,102,130,  5,218, 89,226,
-     89,246,228,225,231,229,243,104,129,251, 58, 89,237,232,229,226,
-    242,229,119,128,251, 58,232,229,226,242,229,119,128,  5,218,237,
-    229,109,129,  5,221, 90,  7,232,229,226,242,229,119,128,  5,221,
-    238,245,110,129,  5,223, 90, 24,232,229,226,242,229,119,128,  5,
-    223,240,101,129,  5,227, 90, 40,232,229,226,242,229,119,128,  5,
-    227,244,243,225,228,105,129,  5,229, 90, 59,232,229,226,242,229,
-    119,128,  5,229,242,243,244,244,239,238,229,227,232,233,238,229,
-    243,101,128,  2,201,243,232,229,249,101,128, 37,201,244,225,227,
-    249,242,233,236,236,233, 99,128,  4,115,246,101,142,  0, 53, 90,
-    139, 90,148, 90,158, 90,188, 90,195, 90,205, 90,230, 91,  1, 91,
-     35, 91, 47, 91, 58, 91, 91, 91, 99, 91,110,225,242,225,226,233,
-     99,128,  6,101,226,229,238,231,225,236,105,128,  9,235,227,233,
-    242,227,236,101,129, 36,100, 90,169,233,238,246,229,242,243,229,
-    243,225,238,243,243,229,242,233,102,128, 39,142,228,229,246, 97,
-    128,  9,107,229,233,231,232,244,232,115,128, 33, 93,231,117,  2,
-     90,212, 90,221,234,225,242,225,244,105,128, 10,235,242,237,245,
-    235,232,105,128, 10,107,232, 97,  2, 90,237, 90,248,227,235,225,
-    242,225,226,233, 99,128,  6,101,238,231,250,232,239,117,128, 48,
-     37,105,  2, 91,  7, 91, 25,228,229,239,231,242,225,240,232,233,
-    227,240,225,242,229,110,128, 50, 36,238,230,229,242,233,239,114,
-    128, 32,133,237,239,238,239,243,240,225,227,101,128,255, 21,239,
-    236,228,243,244,249,236,101,128,247, 53,112,  2, 91, 64, 91, 71,
-    225,242,229,110,128, 36,120,229,114,  2, 91, 78, 91, 84,233,239,
-    100,128, 36,140,243,233,225,110,128,  6,245,242,239,237,225,110,
-    128, 33,116,243,245,240,229,242,233,239,114,128, 32,117,244,232,
-    225,105,128, 14, 85,108,129,251,  2, 91,123,239,242,233,110,128,
-      1,146,109,  2, 91,136, 91,147,239,238,239,243,240,225,227,101,
-    128,255, 70,243,241,245,225,242,101,128, 51,153,111,  4, 91,166,
-     91,188, 91,200, 91,207,230, 97,  2, 91,173, 91,181,238,244,232,
-    225,105,128, 14, 31,244,232,225,105,128, 14, 29,238,231,237,225,
-    238,244,232,225,105,128, 14, 79,242,225,236,108,128, 34,  0,245,
-    114,142,  0, 52, 91,240, 91,249, 92,  3, 92, 33, 92, 40, 92, 65,
-     92, 92, 92,126, 92,138, 92,157, 92,168, 92,201, 92,209, 92,220,
-    225,242,225,226,233, 99,128,  6,100,226,229,238,231,225,236,105,
-    128,  9,234,227,233,242,227,236,101,129, 36, 99, 92, 14,233,238,
+    104,128, 32, 18,236,236,229,100,  2, 90,157, 90,163,226,239,120,
+    128, 37,160,242,229,227,116,128, 37,172,238,225,108,  5, 90,184,
+     91, 10, 91, 27, 91, 44, 91, 60,235,225,102,132,  5,218, 90,198,
+     90,218, 90,227, 90,247,228,225,231,229,243,104,129,251, 58, 90,
+    209,232,229,226,242,229,119,128,251, 58,232,229,226,242,229,119,
+    128,  5,218,241,225,237,225,244,115,129,216, 30, 90,238,232,229,
+    226,242,229,119,128,216, 30,243,232,229,246, 97,129,216, 33, 91,
+      1,232,229,226,242,229,119,128,216, 33,237,229,109,129,  5,221,
+     91, 18,232,229,226,242,229,119,128,  5,221,238,245,110,129,  5,
+    223, 91, 35,232,229,226,242,229,119,128,  5,223,240,101,129,  5,
+    227, 91, 51,232,229,226,242,229,119,128,  5,227,244,243,225,228,
+    105,129,  5,229, 91, 70,232,229,226,242,229,119,128,  5,229,242,
+    243,244,244,239,238,229,227,232,233,238,229,243,101,128,  2,201,
+    243,232,229,249,101,128, 37,201,244,225,227,249,242,233,236,236,
+    233, 99,128,  4,115,246,101,142,  0, 53, 91,150, 91,159, 91,169,
+     91,199, 91,206, 91,216, 91,241, 92, 12, 92, 46, 92, 58, 92, 69,
+     92,102, 92,110, 92,121,225,242,225,226,233, 99,128,  6,101,226,
+    229,238,231,225,236,105,128,  9,235,227,233,242,227,236,101,129,
+     36,100, 91,180,233,238,246,229,242,243,229,243,225,238,243,243,
+    229,242,233,102,128, 39,142,228,229,246, 97,128,  9,107,229,233,
+    231,232,244,232,115,128, 33, 93,231,117,  2, 91,223, 91,232,234,
+    225,242,225,244,105,128, 10,235,242,237,245,235,232,105,128, 10,
+    107,232, 97,  2, 91,248, 92,  3,227,235,225,242,225,226,233, 99,
+    128,  6,101,238,231,250,232,239,117,128, 48, 37,105,  2, 92, 18,
+     92, 36,228,229,239,231,242,225,240,232,233,227,240,225,242,229,
+    110,128, 50, 36,238,230,229,242,233,239,114,128, 32,133,237,239,
+    238,239,243,240,225,227,101,128,255, 21,239,236,228,243,244,249,
+    236,101,128,247, 53,112,  2, 92, 75, 92, 82,225,242,229,110,128,
+     36,120,229,114,  2, 92, 89, 92, 95,233,239,100,128, 36,140,243,
+    233,225,110,128,  6,245,242,239,237,225,110,128, 33,116,243,245,
+    240,229,242,233,239,114,128, 32,117,244,232,225,105,128, 14, 85,
+    108,129,251,  2, 92,134,239,242,233,110,128,  1,146,109,  2, 92,
+    147, 92,158,239,238,239,243,240,225,227,101,128,255, 70,243,241,
+    245,225,242,101,128, 51,153,111,  4, 92,177, 92,199, 92,211, 92,
+    218,230, 97,  2, 92,184, 92,192,238,244,232,225,105,128, 14, 31,
+    244,232,225,105,128, 14, 29,238,231,237,225,238,244,232,225,105,
+    128, 14, 79,242,225,236,108,128, 34,  0,245,114,142,  0, 52, 92,
+    251, 93,  4, 93, 14, 93, 44, 93, 51, 93, 76, 93,103, 93,137, 93,
+    149, 93,168, 93,179, 93,212, 93,220, 93,231,225,242,225,226,233,
+     99,128,  6,100,226,229,238,231,225,236,105,128,  9,234,227,233,
+    242,227,236,101,129, 36, 99, 93, 25,233,238,246,229,242,243,229,
+    243,225,238,243,243,229,242,233,102,128, 39,141,228,229,246, 97,
+    128,  9,106,231,117,  2, 93, 58, 93, 67,234,225,242,225,244,105,
+    128, 10,234,242,237,245,235,232,105,128, 10,106,232, 97,  2, 93,
+     83, 93, 94,227,235,225,242,225,226,233, 99,128,  6,100,238,231,
+    250,232,239,117,128, 48, 36,105,  2, 93,109, 93,127,228,229,239,
+    231,242,225,240,232,233,227,240,225,242,229,110,128, 50, 35,238,
+    230,229,242,233,239,114,128, 32,132,237,239,238,239,243,240,225,
+    227,101,128,255, 20,238,245,237,229,242,225,244,239,242,226,229,
+    238,231,225,236,105,128,  9,247,239,236,228,243,244,249,236,101,
+    128,247, 52,112,  2, 93,185, 93,192,225,242,229,110,128, 36,119,
+    229,114,  2, 93,199, 93,205,233,239,100,128, 36,139,243,233,225,
+    110,128,  6,244,242,239,237,225,110,128, 33,115,243,245,240,229,
+    242,233,239,114,128, 32,116,116,  2, 93,237, 94, 19,229,229,110,
+      2, 93,245, 93,254,227,233,242,227,236,101,128, 36,109,112,  2,
+     94,  4, 94, 11,225,242,229,110,128, 36,129,229,242,233,239,100,
+    128, 36,149,104,  2, 94, 25, 94, 30,225,105,128, 14, 84,244,239,
+    238,229,227,232,233,238,229,243,101,128,  2,203,240,225,242,229,
+    110,128, 36,161,242, 97,  2, 94, 59, 94, 67,227,244,233,239,110,
+    128, 32, 68,238, 99,128, 32,163,103,144,  0,103, 94,108, 95, 54,
+     95, 77, 95,138, 95,155, 96, 76, 97, 69, 97,154, 97,167, 98, 25,
+     98, 50, 98, 78, 98,100, 99, 45, 99, 67, 99,169, 97,  9, 94,128,
+     94,138, 94,145, 94,152, 94,216, 94,241, 94,252, 95,  7, 95, 41,
+    226,229,238,231,225,236,105,128,  9,151,227,245,244,101,128,  1,
+    245,228,229,246, 97,128,  9, 23,102,  4, 94,162, 94,171, 94,185,
+     94,201,225,242,225,226,233, 99,128,  6,175,230,233,238,225,236,
+    225,242,225,226,233, 99,128,251,147,233,238,233,244,233,225,236,
+    225,242,225,226,233, 99,128,251,148,237,229,228,233,225,236,225,
+    242,225,226,233, 99,128,251,149,231,117,  2, 94,223, 94,232,234,
+    225,242,225,244,105,128, 10,151,242,237,245,235,232,105,128, 10,
+     23,232,233,242,225,231,225,238, 97,128, 48, 76,235,225,244,225,
+    235,225,238, 97,128, 48,172,237,237, 97,130,  3,179, 95, 17, 95,
+     30,236,225,244,233,238,243,237,225,236,108,128,  2, 99,243,245,
+    240,229,242,233,239,114,128,  2,224,238,231,233,225,227,239,240,
+    244,233, 99,128,  3,235, 98,  2, 95, 60, 95, 70,239,240,239,237,
+    239,230,111,128, 49, 13,242,229,246,101,128,  1, 31, 99,  4, 95,
+     87, 95, 94, 95,103, 95,125,225,242,239,110,128,  1,231,229,228,
+    233,236,236, 97,128,  1, 35,233,242, 99,  2, 95,111, 95,116,236,
+    101,128, 36,214,245,237,230,236,229,120,128,  1, 29,239,237,237,
+    225,225,227,227,229,238,116,128,  1, 35,228,239,116,129,  1, 33,
+     95,146,225,227,227,229,238,116,128,  1, 33,101,  6, 95,169, 95,
+    180, 95,191, 95,202, 95,221, 96, 67,227,249,242,233,236,236,233,
+     99,128,  4, 51,232,233,242,225,231,225,238, 97,128, 48, 82,235,
+    225,244,225,235,225,238, 97,128, 48,178,239,237,229,244,242,233,
+    227,225,236,236,249,229,241,245,225,108,128, 34, 81,114,  3, 95,
+    229, 96, 22, 96, 32,229,243,104,  3, 95,239, 95,254, 96,  7,225,
+    227,227,229,238,244,232,229,226,242,229,119,128,  5,156,232,229,
+    226,242,229,119,128,  5,243,237,245,241,228,225,237,232,229,226,
+    242,229,119,128,  5,157,237,225,238,228,226,236,115,128,  0,223,
+    243,232,225,249,233,109,  2, 96, 43, 96, 58,225,227,227,229,238,
+    244,232,229,226,242,229,119,128,  5,158,232,229,226,242,229,119,
+    128,  5,244,244,225,237,225,242,107,128, 48, 19,104,  5, 96, 88,
+     96,221, 97, 28, 97, 53, 97, 59, 97,  4, 96, 98, 96,108, 96,131,
+     96,156,226,229,238,231,225,236,105,128,  9,152,100,  2, 96,114,
+     96,125,225,242,237,229,238,233,225,110,128,  5,114,229,246, 97,
+    128,  9, 24,231,117,  2, 96,138, 96,147,234,225,242,225,244,105,
+    128, 10,152,242,237,245,235,232,105,128, 10, 24,233,110,  4, 96,
+    167, 96,176, 96,190, 96,206,225,242,225,226,233, 99,128,  6, 58,
+    230,233,238,225,236,225,242,225,226,233, 99,128,254,206,233,238,
+    233,244,233,225,236,225,242,225,226,233, 99,128,254,207,237,229,
+    228,233,225,236,225,242,225,226,233, 99,128,254,208,101,  3, 96,
+    229, 96,250, 97, 11,237,233,228,228,236,229,232,239,239,235,227,
+    249,242,233,236,236,233, 99,128,  4,149,243,244,242,239,235,229,
+    227,249,242,233,236,236,233, 99,128,  4,147,245,240,244,245,242,
+    238,227,249,242,233,236,236,233, 99,128,  4,145,232, 97,  2, 97,
+     35, 97, 42,228,229,246, 97,128,  9, 90,231,245,242,237,245,235,
+    232,105,128, 10, 90,239,239,107,128,  2, 96,250,243,241,245,225,
+    242,101,128, 51,147,105,  3, 97, 77, 97, 88, 97, 99,232,233,242,
+    225,231,225,238, 97,128, 48, 78,235,225,244,225,235,225,238, 97,
+    128, 48,174,109,  2, 97,105, 97,116,225,242,237,229,238,233,225,
+    110,128,  5, 99,229,108,130,  5,210, 97,125, 97,145,228,225,231,
+    229,243,104,129,251, 50, 97,136,232,229,226,242,229,119,128,251,
+     50,232,229,226,242,229,119,128,  5,210,234,229,227,249,242,233,
+    236,236,233, 99,128,  4, 83,236,239,244,244,225,108,  2, 97,178,
+     97,195,233,238,246,229,242,244,229,228,243,244,242,239,235,101,
+    128,  1,190,243,244,239,112,132,  2,148, 97,210, 97,221, 97,227,
+     98,  3,233,238,246,229,242,244,229,100,128,  2,150,237,239,100,
+    128,  2,192,242,229,246,229,242,243,229,100,130,  2,149, 97,242,
+     97,248,237,239,100,128,  2,193,243,245,240,229,242,233,239,114,
+    128,  2,228,243,244,242,239,235,101,129,  2,161, 98, 14,242,229,
+    246,229,242,243,229,100,128,  2,162,109,  2, 98, 31, 98, 39,225,
+    227,242,239,110,128, 30, 33,239,238,239,243,240,225,227,101,128,
+    255, 71,111,  2, 98, 56, 98, 67,232,233,242,225,231,225,238, 97,
+    128, 48, 84,235,225,244,225,235,225,238, 97,128, 48,180,240, 97,
+      2, 98, 85, 98, 91,242,229,110,128, 36,162,243,241,245,225,242,
+    101,128, 51,172,114,  2, 98,106, 98,203, 97,  2, 98,112, 98,120,
+    228,233,229,238,116,128, 34,  7,246,101,134,  0, 96, 98,137, 98,
+    148, 98,165, 98,172, 98,181, 98,193,226,229,236,239,247,227,237,
+     98,128,  3, 22, 99,  2, 98,154, 98,159,237, 98,128,  3,  0,239,
+    237, 98,128,  3,  0,228,229,246, 97,128,  9, 83,236,239,247,237,
+    239,100,128,  2,206,237,239,238,239,243,240,225,227,101,128,255,
+     64,244,239,238,229,227,237, 98,128,  3, 64,229,225,244,229,114,
+    132,  0, 62, 98,219, 98,238, 98,250, 99, 37,229,241,245,225,108,
+    129, 34,101, 98,229,239,242,236,229,243,115,128, 34,219,237,239,
+    238,239,243,240,225,227,101,128,255, 30,111,  2, 99,  0, 99, 26,
+    114,  2, 99,  6, 99, 19,229,241,245,233,246,225,236,229,238,116,
+    128, 34,115,236,229,243,115,128, 34,119,246,229,242,229,241,245,
+    225,108,128, 34,103,243,237,225,236,108,128,254,101,115,  2, 99,
+     51, 99, 59,227,242,233,240,116,128,  2, 97,244,242,239,235,101,
+    128,  1,229,117,  4, 99, 77, 99, 88, 99,145, 99,156,232,233,242,
+    225,231,225,238, 97,128, 48, 80,233,108,  2, 99, 95, 99,120,236,
+    229,237,239,116,  2, 99,105, 99,112,236,229,230,116,128,  0,171,
+    242,233,231,232,116,128,  0,187,243,233,238,231,108,  2, 99,130,
+     99,137,236,229,230,116,128, 32, 57,242,233,231,232,116,128, 32,
+     58,235,225,244,225,235,225,238, 97,128, 48,176,242,225,237,245,
+    243,241,245,225,242,101,128, 51, 24,249,243,241,245,225,242,101,
+    128, 51,201,104,144,  0,104, 99,215,102,219,102,254,103, 35,103,
+     75,104,219,104,239,105,204,105,216,105,228,107, 40,107, 48,107,
+     59,107, 68,107,148,107,152, 97, 13, 99,243,100, 26,100, 36,100,
+     66,100, 91,100,169,100,181,100,206,100,221,101,112,101,125,101,
+    183,101,192, 97,  2, 99,249,100, 12,226,235,232,225,243,233,225,
+    238,227,249,242,233,236,236,233, 99,128,  4,169,236,244,239,238,
+    229,225,242,225,226,233, 99,128,  6,193,226,229,238,231,225,236,
+    105,128,  9,185,228,101,  2,100, 43,100, 61,243,227,229,238,228,
+    229,242,227,249,242,233,236,236,233, 99,128,  4,179,246, 97,128,
+      9, 57,231,117,  2,100, 73,100, 82,234,225,242,225,244,105,128,
+     10,185,242,237,245,235,232,105,128, 10, 57,104,  4,100,101,100,
+    110,100,124,100,154,225,242,225,226,233, 99,128,  6, 45,230,233,
+    238,225,236,225,242,225,226,233, 99,128,254,162,105,  2,100,130,
+    100,145,238,233,244,233,225,236,225,242,225,226,233, 99,128,254,
+    163,242,225,231,225,238, 97,128, 48,111,237,229,228,233,225,236,
+    225,242,225,226,233, 99,128,254,164,233,244,245,243,241,245,225,
+    242,101,128, 51, 42,235,225,244,225,235,225,238, 97,129, 48,207,
+    100,194,232,225,236,230,247,233,228,244,104,128,255,138,236,225,
+    238,244,231,245,242,237,245,235,232,105,128, 10, 77,237,250, 97,
+      5,100,235,100,244,101, 19,101, 50,101, 98,225,242,225,226,233,
+     99,128,  6, 33,228,225,237,237, 97,  2,100,254,101,  7,225,242,
+    225,226,233, 99,128,216, 36,244,225,238,225,242,225,226,233, 99,
+    128,216, 39,230,225,244,232, 97,  2,101, 29,101, 38,225,242,225,
+    226,233, 99,128,216, 42,244,225,238,225,242,225,226,233, 99,128,
+    216, 45,236,239,119,  2,101, 58,101, 67,225,242,225,226,233, 99,
+    128,  6, 33,235,225,243,242, 97,  2,101, 77,101, 86,225,242,225,
+    226,233, 99,128,216, 48,244,225,238,225,242,225,226,233, 99,128,
+    216, 51,243,245,235,245,238,225,242,225,226,233, 99,128,216, 54,
+    238,231,245,236,230,233,236,236,229,114,128, 49,100,114,  2,101,
+    131,101,147,228,243,233,231,238,227,249,242,233,236,236,233, 99,
+    128,  4, 74,240,239,239,110,  2,101,156,101,169,236,229,230,244,
+    226,225,242,226,245,112,128, 33,188,242,233,231,232,244,226,225,
+    242,226,245,112,128, 33,192,243,241,245,225,242,101,128, 51,202,
+    244,225,102,  3,101,202,102, 38,102,129,240,225,244,225,104,134,
+      5,178,101,222,101,227,101,241,101,250,102,  9,102, 25,177, 54,
+    128,  5,178, 50,  2,101,233,101,237, 51,128,  5,178,102,128,  5,
+    178,232,229,226,242,229,119,128,  5,178,238,225,242,242,239,247,
+    232,229,226,242,229,119,128,  5,178,241,245,225,242,244,229,242,
+    232,229,226,242,229,119,128,  5,178,247,233,228,229,232,229,226,
+    242,229,119,128,  5,178,241,225,237,225,244,115,135,  5,179,102,
+     61,102, 66,102, 71,102, 76,102, 85,102,100,102,116,177, 98,128,
+      5,179,178, 56,128,  5,179,179, 52,128,  5,179,232,229,226,242,
+    229,119,128,  5,179,238,225,242,242,239,247,232,229,226,242,229,
+    119,128,  5,179,241,245,225,242,244,229,242,232,229,226,242,229,
+    119,128,  5,179,247,233,228,229,232,229,226,242,229,119,128,  5,
+    179,243,229,231,239,108,135,  5,177,102,151,102,156,102,161,102,
+    166,102,175,102,190,102,206,177, 55,128,  5,177,178, 52,128,  5,
+    177,179, 48,128,  5,177,232,229,226,242,229,119,128,  5,177,238,
+    225,242,242,239,247,232,229,226,242,229,119,128,  5,177,241,245,
+    225,242,244,229,242,232,229,226,242,229,119,128,  5,177,247,233,
+    228,229,232,229,226,242,229,119,128,  5,177, 98,  3,102,227,102,
+    232,102,242,225,114,128,  1, 39,239,240,239,237,239,230,111,128,
+     49, 15,242,229,246,229,226,229,236,239,119,128, 30, 43, 99,  2,
+    103,  4,103, 13,229,228,233,236,236, 97,128, 30, 41,233,242, 99,
+      2,103, 21,103, 26,236,101,128, 36,215,245,237,230,236,229,120,
+    128,  1, 37,100,  2,103, 41,103, 51,233,229,242,229,243,233,115,
+    128, 30, 39,239,116,  2,103, 58,103, 67,225,227,227,229,238,116,
+    128, 30, 35,226,229,236,239,119,128, 30, 37,101,136,  5,212,103,
+     95,103,128,103,148,104,121,104,137,104,182,104,191,104,204,225,
+    242,116,129, 38,101,103,103,243,245,233,116,  2,103,112,103,120,
+    226,236,225,227,107,128, 38,101,247,232,233,244,101,128, 38, 97,
+    228,225,231,229,243,104,129,251, 52,103,139,232,229,226,242,229,
+    119,128,251, 52,104,  6,103,162,103,190,103,198,103,248,104, 38,
+    104, 87, 97,  2,103,168,103,182,236,244,239,238,229,225,242,225,
+    226,233, 99,128,  6,193,242,225,226,233, 99,128,  6, 71,229,226,
+    242,229,119,128,  5,212,230,233,238,225,236, 97,  2,103,209,103,
+    240,236,116,  2,103,216,103,228,239,238,229,225,242,225,226,233,
+     99,128,251,167,244,247,239,225,242,225,226,233, 99,128,254,234,
+    242,225,226,233, 99,128,254,234,232,225,237,250,225,225,226,239,
+    246,101,  2,104,  7,104, 21,230,233,238,225,236,225,242,225,226,
+    233, 99,128,251,165,233,243,239,236,225,244,229,228,225,242,225,
+    226,233, 99,128,251,164,105,  2,104, 44,104, 78,238,233,244,233,
+    225,236, 97,  2,104, 56,104, 70,236,244,239,238,229,225,242,225,
+    226,233, 99,128,251,168,242,225,226,233, 99,128,254,235,242,225,
+    231,225,238, 97,128, 48,120,237,229,228,233,225,236, 97,  2,104,
+     99,104,113,236,244,239,238,229,225,242,225,226,233, 99,128,251,
+    169,242,225,226,233, 99,128,254,236,233,243,229,233,229,242,225,
+    243,241,245,225,242,101,128, 51,123,107,  2,104,143,104,167,225,
+    244,225,235,225,238, 97,129, 48,216,104,155,232,225,236,230,247,
+    233,228,244,104,128,255,141,245,244,225,225,242,245,243,241,245,
+    225,242,101,128, 51, 54,238,231,232,239,239,107,128,  2,103,242,
+    245,244,245,243,241,245,225,242,101,128, 51, 57,116,129,  5,215,
+    104,210,232,229,226,242,229,119,128,  5,215,232,239,239,107,129,
+      2,102,104,228,243,245,240,229,242,233,239,114,128,  2,177,105,
+      4,104,249,105, 78,105, 89,105,114,229,245,104,  4,105,  5,105,
+     40,105, 55,105, 64, 97,  2,105, 11,105, 26,227,233,242,227,236,
+    229,235,239,242,229,225,110,128, 50,123,240,225,242,229,238,235,
+    239,242,229,225,110,128, 50, 27,227,233,242,227,236,229,235,239,
+    242,229,225,110,128, 50,109,235,239,242,229,225,110,128, 49, 78,
+    240,225,242,229,238,235,239,242,229,225,110,128, 50, 13,232,233,
+    242,225,231,225,238, 97,128, 48,114,235,225,244,225,235,225,238,
+     97,129, 48,210,105,102,232,225,236,230,247,233,228,244,104,128,
+    255,139,242,233,113,134,  5,180,105,132,105,137,105,151,105,160,
+    105,175,105,191,177, 52,128,  5,180, 50,  2,105,143,105,147, 49,
+    128,  5,180,100,128,  5,180,232,229,226,242,229,119,128,  5,180,
+    238,225,242,242,239,247,232,229,226,242,229,119,128,  5,180,241,
+    245,225,242,244,229,242,232,229,226,242,229,119,128,  5,180,247,
+    233,228,229,232,229,226,242,229,119,128,  5,180,236,233,238,229,
+    226,229,236,239,119,128, 30,150,237,239,238,239,243,240,225,227,
+    101,128,255, 72,111,  9,105,248,106,  3,106, 27,106, 52,106,140,
+    106,153,106,239,107, 23,107, 34,225,242,237,229,238,233,225,110,
+    128,  5,112,232,105,  2,106, 10,106, 18,240,244,232,225,105,128,
+     14, 43,242,225,231,225,238, 97,128, 48,123,235,225,244,225,235,
+    225,238, 97,129, 48,219,106, 40,232,225,236,230,247,233,228,244,
+    104,128,255,142,236,225,109,135,  5,185,106, 72,106, 77,106, 82,
+    106, 87,106, 96,106,111,106,127,177, 57,128,  5,185,178, 54,128,
+      5,185,179, 50,128,  5,185,232,229,226,242,229,119,128,  5,185,
+    238,225,242,242,239,247,232,229,226,242,229,119,128,  5,185,241,
+    245,225,242,244,229,242,232,229,226,242,229,119,128,  5,185,247,
+    233,228,229,232,229,226,242,229,119,128,  5,185,238,239,235,232,
+    245,235,244,232,225,105,128, 14, 46,111,  2,106,159,106,229,107,
+      4,106,169,106,181,106,187,106,209,225,226,239,246,229,227,239,
+    237, 98,128,  3,  9,227,237, 98,128,  3,  9,240,225,236,225,244,
+    225,236,233,250,229,228,226,229,236,239,247,227,237, 98,128,  3,
+     33,242,229,244,242,239,230,236,229,248,226,229,236,239,247,227,
+    237, 98,128,  3, 34,238,243,241,245,225,242,101,128, 51, 66,114,
+      2,106,245,107, 16,105,  2,106,251,107,  4,227,239,240,244,233,
+     99,128,  3,233,250,239,238,244,225,236,226,225,114,128, 32, 21,
+    238,227,237, 98,128,  3, 27,244,243,240,242,233,238,231,115,128,
+     38,104,245,243,101,128, 35,  2,240,225,242,229,110,128, 36,163,
+    243,245,240,229,242,233,239,114,128,  2,176,244,245,242,238,229,
+    100,128,  2,101,117,  4,107, 78,107, 89,107,102,107,127,232,233,
+    242,225,231,225,238, 97,128, 48,117,233,233,244,239,243,241,245,
+    225,242,101,128, 51, 51,235,225,244,225,235,225,238, 97,129, 48,
+    213,107,115,232,225,236,230,247,233,228,244,104,128,255,140,238,
+    231,225,242,245,237,236,225,245,116,129,  2,221,107,142,227,237,
+     98,128,  3, 11,118,128,  1,149,249,240,232,229,110,132,  0, 45,
+    107,168,107,179,107,191,107,214,233,238,230,229,242,233,239,114,
+    128,246,229,237,239,238,239,243,240,225,227,101,128,255, 13,115,
+      2,107,197,107,204,237,225,236,108,128,254, 99,245,240,229,242,
+    233,239,114,128,246,230,244,247,111,128, 32, 16,105,149,  0,105,
+    108, 10,108, 33,108, 67,108,114,111,252,112,116,112,153,112,180,
+    113, 86,113, 90,113,128,113,150,113,234,114,143,114,218,114,226,
+    114,239,115, 70,115,127,115,155,115,199,225, 99,  2,108, 17,108,
+     23,245,244,101,128,  0,237,249,242,233,236,236,233, 99,128,  4,
+     79, 98,  3,108, 41,108, 50,108, 60,229,238,231,225,236,105,128,
+      9,135,239,240,239,237,239,230,111,128, 49, 39,242,229,246,101,
+    128,  1, 45, 99,  3,108, 75,108, 82,108,104,225,242,239,110,128,
+      1,208,233,242, 99,  2,108, 90,108, 95,236,101,128, 36,216,245,
+    237,230,236,229,120,128,  0,238,249,242,233,236,236,233, 99,128,
+      4, 86,100,  4,108,124,108,134,111,209,111,242,226,236,231,242,
+    225,246,101,128,  2,  9,101,  2,108,140,111,204,239,231,242,225,
+    240,104,  7,108,161,108,175,108,188,111,117,111,148,111,161,111,
+    173,229,225,242,244,232,227,233,242,227,236,101,128, 50,143,230,
+    233,242,229,227,233,242,227,236,101,128, 50,139,233, 99, 14,108,
+    219,108,235,109, 78,109,132,109,198,109,227,109,243,110, 44,110,
+     93,110,105,110,132,110,199,111, 81,111,110,225,236,236,233,225,
+    238,227,229,240,225,242,229,110,128, 50, 63, 99,  4,108,245,109,
+      0,109, 14,109, 21,225,236,236,240,225,242,229,110,128, 50, 58,
+    229,238,244,242,229,227,233,242,227,236,101,128, 50,165,236,239,
+    243,101,128, 48,  6,111,  3,109, 29,109, 44,109, 64,237,237, 97,
+    129, 48,  1,109, 37,236,229,230,116,128,255,100,238,231,242,225,
+    244,245,236,225,244,233,239,238,240,225,242,229,110,128, 50, 55,
+    242,242,229,227,244,227,233,242,227,236,101,128, 50,163,101,  3,
+    109, 86,109, 98,109,115,225,242,244,232,240,225,242,229,110,128,
+     50, 47,238,244,229,242,240,242,233,243,229,240,225,242,229,110,
+    128, 50, 61,248,227,229,236,236,229,238,244,227,233,242,227,236,
+    101,128, 50,157,102,  2,109,138,109,153,229,243,244,233,246,225,
+    236,240,225,242,229,110,128, 50, 64,105,  2,109,159,109,188,238,
+    225,238,227,233,225,108,  2,109,171,109,180,227,233,242,227,236,
+    101,128, 50,150,240,225,242,229,110,128, 50, 54,242,229,240,225,
+    242,229,110,128, 50, 43,104,  2,109,204,109,215,225,246,229,240,
+    225,242,229,110,128, 50, 50,233,231,232,227,233,242,227,236,101,
+    128, 50,164,233,244,229,242,225,244,233,239,238,237,225,242,107,
+    128, 48,  5,108,  3,109,251,110, 21,110, 33,225,226,239,114,  2,
+    110,  4,110, 13,227,233,242,227,236,101,128, 50,152,240,225,242,
+    229,110,128, 50, 56,229,230,244,227,233,242,227,236,101,128, 50,
+    167,239,247,227,233,242,227,236,101,128, 50,166,109,  2,110, 50,
+    110, 82,101,  2,110, 56,110, 71,228,233,227,233,238,229,227,233,
+    242,227,236,101,128, 50,169,244,225,236,240,225,242,229,110,128,
+     50, 46,239,239,238,240,225,242,229,110,128, 50, 42,238,225,237,
+    229,240,225,242,229,110,128, 50, 52,112,  2,110,111,110,119,229,
+    242,233,239,100,128, 48,  2,242,233,238,244,227,233,242,227,236,
+    101,128, 50,158,114,  2,110,138,110,186,101,  3,110,146,110,157,
+    110,172,225,227,232,240,225,242,229,110,128, 50, 67,240,242,229,
+    243,229,238,244,240,225,242,229,110,128, 50, 57,243,239,245,242,
+    227,229,240,225,242,229,110,128, 50, 62,233,231,232,244,227,233,
+    242,227,236,101,128, 50,168,115,  5,110,211,110,240,110,254,111,
+     23,111, 51,101,  2,110,217,110,230,227,242,229,244,227,233,242,
+    227,236,101,128, 50,153,236,230,240,225,242,229,110,128, 50, 66,
+    239,227,233,229,244,249,240,225,242,229,110,128, 50, 51,112,  2,
+    111,  4,111, 10,225,227,101,128, 48,  0,229,227,233,225,236,240,
+    225,242,229,110,128, 50, 53,116,  2,111, 29,111, 40,239,227,235,
+    240,225,242,229,110,128, 50, 49,245,228,249,240,225,242,229,110,
+    128, 50, 59,117,  2,111, 57,111, 66,238,240,225,242,229,110,128,
+     50, 48,240,229,242,246,233,243,229,240,225,242,229,110,128, 50,
+     60,119,  2,111, 87,111, 99,225,244,229,242,240,225,242,229,110,
+    128, 50, 44,239,239,228,240,225,242,229,110,128, 50, 45,250,229,
+    242,111,128, 48,  7,109,  2,111,123,111,136,229,244,225,236,227,
+    233,242,227,236,101,128, 50,142,239,239,238,227,233,242,227,236,
+    101,128, 50,138,238,225,237,229,227,233,242,227,236,101,128, 50,
+    148,243,245,238,227,233,242,227,236,101,128, 50,144,119,  2,111,
+    179,111,192,225,244,229,242,227,233,242,227,236,101,128, 50,140,
+    239,239,228,227,233,242,227,236,101,128, 50,141,246, 97,128,  9,
+      7,233,229,242,229,243,233,115,130,  0,239,111,223,111,231,225,
+    227,245,244,101,128, 30, 47,227,249,242,233,236,236,233, 99,128,
+      4,229,239,244,226,229,236,239,119,128, 30,203,101,  3,112,  4,
+    112, 20,112, 31,226,242,229,246,229,227,249,242,233,236,236,233,
+     99,128,  4,215,227,249,242,233,236,236,233, 99,128,  4, 53,245,
+    238,103,  4,112, 43,112, 78,112, 93,112,102, 97,  2,112, 49,112,
+     64,227,233,242,227,236,229,235,239,242,229,225,110,128, 50,117,
+    240,225,242,229,238,235,239,242,229,225,110,128, 50, 21,227,233,
+    242,227,236,229,235,239,242,229,225,110,128, 50,103,235,239,242,
+    229,225,110,128, 49, 71,240,225,242,229,238,235,239,242,229,225,
+    110,128, 50,  7,103,  2,112,122,112,129,242,225,246,101,128,  0,
+    236,117,  2,112,135,112,144,234,225,242,225,244,105,128, 10,135,
+    242,237,245,235,232,105,128, 10,  7,104,  2,112,159,112,169,233,
+    242,225,231,225,238, 97,128, 48, 68,239,239,235,225,226,239,246,
+    101,128, 30,201,105,  8,112,198,112,208,112,219,112,226,112,251,
+    113, 11,113, 26,113, 42,226,229,238,231,225,236,105,128,  9,136,
+    227,249,242,233,236,236,233, 99,128,  4, 56,228,229,246, 97,128,
+      9,  8,231,117,  2,112,233,112,242,234,225,242,225,244,105,128,
+     10,136,242,237,245,235,232,105,128, 10,  8,237,225,244,242,225,
+    231,245,242,237,245,235,232,105,128, 10, 64,238,246,229,242,244,
+    229,228,226,242,229,246,101,128,  2, 11,243,232,239,242,244,227,
+    249,242,233,236,236,233, 99,128,  4, 57,246,239,247,229,236,243,
+    233,231,110,  3,113, 58,113, 68,113, 75,226,229,238,231,225,236,
+    105,128,  9,192,228,229,246, 97,128,  9, 64,231,245,234,225,242,
+    225,244,105,128, 10,192,106,128,  1, 51,107,  2,113, 96,113,120,
+    225,244,225,235,225,238, 97,129, 48,164,113,108,232,225,236,230,
+    247,233,228,244,104,128,255,114,239,242,229,225,110,128, 49, 99,
+    108,  2,113,134,113,139,228,101,128,  2,220,245,249,232,229,226,
+    242,229,119,128,  5,172,109,  2,113,156,113,223, 97,  3,113,164,
+    113,184,113,209,227,242,239,110,129,  1, 43,113,173,227,249,242,
+    233,236,236,233, 99,128,  4,227,231,229,239,242,225,240,240,242,
+    239,248,233,237,225,244,229,236,249,229,241,245,225,108,128, 34,
+     83,244,242,225,231,245,242,237,245,235,232,105,128, 10, 63,239,
+    238,239,243,240,225,227,101,128,255, 73,110,  5,113,246,114,  0,
+    114,  9,114, 21,114,105,227,242,229,237,229,238,116,128, 34,  6,
+    230,233,238,233,244,121,128, 34, 30,233,225,242,237,229,238,233,
+    225,110,128,  5,107,116,  2,114, 27,114, 95,101,  2,114, 33,114,
+     84,231,242,225,108,131, 34, 43,114, 46,114, 64,114, 69, 98,  2,
+    114, 52,114, 60,239,244,244,239,109,128, 35, 33,116,128, 35, 33,
+    229,120,128,248,245,116,  2,114, 75,114, 80,239,112,128, 35, 32,
+    112,128, 35, 32,242,243,229,227,244,233,239,110,128, 34, 41,233,
+    243,241,245,225,242,101,128, 51,  5,118,  3,114,113,114,122,114,
+    131,226,245,236,236,229,116,128, 37,216,227,233,242,227,236,101,
+    128, 37,217,243,237,233,236,229,230,225,227,101,128, 38, 59,111,
+      3,114,151,114,162,114,170,227,249,242,233,236,236,233, 99,128,
+      4, 81,231,239,238,229,107,128,  1, 47,244, 97,131,  3,185,114,
+    181,114,202,114,210,228,233,229,242,229,243,233,115,129,  3,202,
+    114,194,244,239,238,239,115,128,  3,144,236,225,244,233,110,128,
+      2,105,244,239,238,239,115,128,  3,175,240,225,242,229,110,128,
+     36,164,242,233,231,245,242,237,245,235,232,105,128, 10,114,115,
+      4,114,249,115, 38,115, 52,115, 60,237,225,236,108,  2,115,  2,
+    115, 13,232,233,242,225,231,225,238, 97,128, 48, 67,235,225,244,
+    225,235,225,238, 97,129, 48,163,115, 26,232,225,236,230,247,233,
+    228,244,104,128,255,104,243,232,225,242,226,229,238,231,225,236,
+    105,128,  9,250,244,242,239,235,101,128,  2,104,245,240,229,242,
+    233,239,114,128,246,237,116,  2,115, 76,115,110,229,242,225,244,
+    233,239,110,  2,115, 88,115, 99,232,233,242,225,231,225,238, 97,
+    128, 48,157,235,225,244,225,235,225,238, 97,128, 48,253,233,236,
+    228,101,129,  1, 41,115,119,226,229,236,239,119,128, 30, 45,117,
+      2,115,133,115,144,226,239,240,239,237,239,230,111,128, 49, 41,
+    227,249,242,233,236,236,233, 99,128,  4, 78,246,239,247,229,236,
+    243,233,231,110,  3,115,171,115,181,115,188,226,229,238,231,225,
+    236,105,128,  9,191,228,229,246, 97,128,  9, 63,231,245,234,225,
+    242,225,244,105,128, 10,191,250,232,233,244,243, 97,  2,115,210,
+    115,221,227,249,242,233,236,236,233, 99,128,  4,117,228,226,236,
+    231,242,225,246,229,227,249,242,233,236,236,233, 99,128,  4,119,
+    106,138,  0,106,116,  8,116, 71,116, 82,116,132,116,148,117,  5,
+    117, 74,117, 79,117, 91,117, 99, 97,  4,116, 18,116, 29,116, 39,
+    116, 46,225,242,237,229,238,233,225,110,128,  5,113,226,229,238,
+    231,225,236,105,128,  9,156,228,229,246, 97,128,  9, 28,231,117,
+      2,116, 53,116, 62,234,225,242,225,244,105,128, 10,156,242,237,
+    245,235,232,105,128, 10, 28,226,239,240,239,237,239,230,111,128,
+     49, 16, 99,  3,116, 90,116, 97,116,119,225,242,239,110,128,  1,
+    240,233,242, 99,  2,116,105,116,110,236,101,128, 36,217,245,237,
+    230,236,229,120,128,  1, 53,242,239,243,243,229,228,244,225,233,
+    108,128,  2,157,228,239,244,236,229,243,243,243,244,242,239,235,
+    101,128,  2, 95,101,  3,116,156,116,167,116,232,227,249,242,233,
+    236,236,233, 99,128,  4, 88,229,109,  4,116,178,116,187,116,201,
+    116,217,225,242,225,226,233, 99,128,  6, 44,230,233,238,225,236,
+    225,242,225,226,233, 99,128,254,158,233,238,233,244,233,225,236,
+    225,242,225,226,233, 99,128,254,159,237,229,228,233,225,236,225,
+    242,225,226,233, 99,128,254,160,104,  2,116,238,116,247,225,242,
+    225,226,233, 99,128,  6,152,230,233,238,225,236,225,242,225,226,
+    233, 99,128,251,139,104,  2,117, 11,117, 61, 97,  3,117, 19,117,
+     29,117, 36,226,229,238,231,225,236,105,128,  9,157,228,229,246,
+     97,128,  9, 29,231,117,  2,117, 43,117, 52,234,225,242,225,244,
+    105,128, 10,157,242,237,245,235,232,105,128, 10, 29,229,232,225,
+    242,237,229,238,233,225,110,128,  5,123,233,115,128, 48,  4,237,
+    239,238,239,243,240,225,227,101,128,255, 74,240,225,242,229,110,
+    128, 36,165,243,245,240,229,242,233,239,114,128,  2,178,107,146,
+      0,107,117,150,119,239,119,250,120, 56,120, 67,120,157,120,171,
+    122, 23,122,219,122,232,123,  2,123, 51,123,189,123,211,123,224,
+    123,247,124, 33,124, 43, 97, 12,117,176,117,208,117,230,118,  4,
+    118,118,118,143,118,173,118,198,119, 48,119, 62,119,185,119,214,
+     98,  2,117,182,117,199,225,243,232,235,233,242,227,249,242,233,
+    236,236,233, 99,128,  4,161,229,238,231,225,236,105,128,  9,149,
+     99,  2,117,214,117,220,245,244,101,128, 30, 49,249,242,233,236,
+    236,233, 99,128,  4, 58,228,101,  2,117,237,117,255,243,227,229,
+    238,228,229,242,227,249,242,233,236,236,233, 99,128,  4,155,246,
+     97,128,  9, 21,102,135,  5,219,118, 22,118, 31,118, 51,118, 65,
+    118, 74,118, 90,118,105,225,242,225,226,233, 99,128,  6, 67,228,
+    225,231,229,243,104,129,251, 59,118, 42,232,229,226,242,229,119,
+    128,251, 59,230,233,238,225,236,225,242,225,226,233, 99,128,254,
+    218,232,229,226,242,229,119,128,  5,219,233,238,233,244,233,225,
+    236,225,242,225,226,233, 99,128,254,219,237,229,228,233,225,236,
+    225,242,225,226,233, 99,128,254,220,242,225,230,229,232,229,226,
+    242,229,119,128,251, 77,231,117,  2,118,125,118,134,234,225,242,
+    225,244,105,128, 10,149,242,237,245,235,232,105,128, 10, 21,104,
+      2,118,149,118,159,233,242,225,231,225,238, 97,128, 48, 75,239,
+    239,235,227,249,242,233,236,236,233, 99,128,  4,196,235,225,244,
+    225,235,225,238, 97,129, 48,171,118,186,232,225,236,230,247,233,
+    228,244,104,128,255,118,112,  2,118,204,118,225,240, 97,129,  3,
+    186,118,211,243,249,237,226,239,236,231,242,229,229,107,128,  3,
+    240,249,229,239,245,110,  3,118,237,118,251,119, 29,237,233,229,
+    245,237,235,239,242,229,225,110,128, 49,113,112,  2,119,  1,119,
+     16,232,233,229,245,240,232,235,239,242,229,225,110,128, 49,132,
+    233,229,245,240,235,239,242,229,225,110,128, 49,120,243,243,225,
+    238,231,240,233,229,245,240,235,239,242,229,225,110,128, 49,121,
+    242,239,242,233,233,243,241,245,225,242,101,128, 51, 13,115,  5,
+    119, 74,119,118,119,133,119,141,119,169,232,233,228,225,225,245,
+    244,111,  2,119, 87,119, 96,225,242,225,226,233, 99,128,  6, 64,
+    238,239,243,233,228,229,226,229,225,242,233,238,231,225,242,225,
+    226,233, 99,128,  6, 64,237,225,236,236,235,225,244,225,235,225,
+    238, 97,128, 48,245,241,245,225,242,101,128, 51,132,242, 97,  2,
+    119,148,119,157,225,242,225,226,233, 99,128,  6, 80,244,225,238,
+    225,242,225,226,233, 99,128,  6, 77,244,242,239,235,229,227,249,
+    242,233,236,236,233, 99,128,  4,159,244,225,232,233,242,225,240,
+    242,239,236,239,238,231,237,225,242,235,232,225,236,230,247,233,
+    228,244,104,128,255,112,246,229,242,244,233,227,225,236,243,244,
+    242,239,235,229,227,249,242,233,236,236,233, 99,128,  4,157,226,
+    239,240,239,237,239,230,111,128, 49, 14, 99,  4,120,  4,120, 26,
+    120, 35,120, 43, 97,  2,120, 10,120, 20,236,243,241,245,225,242,
+    101,128, 51,137,242,239,110,128,  1,233,229,228,233,236,236, 97,
+    128,  1, 55,233,242,227,236,101,128, 36,218,239,237,237,225,225,
+    227,227,229,238,116,128,  1, 55,228,239,244,226,229,236,239,119,
+    128, 30, 51,101,  4,120, 77,120,104,120,129,120,141,104,  2,120,
+     83,120, 94,225,242,237,229,238,233,225,110,128,  5,132,233,242,
+    225,231,225,238, 97,128, 48, 81,235,225,244,225,235,225,238, 97,
+    129, 48,177,120,117,232,225,236,230,247,233,228,244,104,128,255,
+    121,238,225,242,237,229,238,233,225,110,128,  5,111,243,237,225,
+    236,236,235,225,244,225,235,225,238, 97,128, 48,246,231,242,229,
+    229,238,236,225,238,228,233, 99,128,  1, 56,104,  6,120,185,121,
+     58,121, 69,121, 94,121,181,122, 13, 97,  5,120,197,120,207,120,
+    218,120,225,120,250,226,229,238,231,225,236,105,128,  9,150,227,
+    249,242,233,236,236,233, 99,128,  4, 69,228,229,246, 97,128,  9,
+     22,231,117,  2,120,232,120,241,234,225,242,225,244,105,128, 10,
+    150,242,237,245,235,232,105,128, 10, 22,104,  4,121,  4,121, 13,
+    121, 27,121, 43,225,242,225,226,233, 99,128,  6, 46,230,233,238,
+    225,236,225,242,225,226,233, 99,128,254,166,233,238,233,244,233,
+    225,236,225,242,225,226,233, 99,128,254,167,237,229,228,233,225,
+    236,225,242,225,226,233, 99,128,254,168,229,233,227,239,240,244,
+    233, 99,128,  3,231,232, 97,  2,121, 76,121, 83,228,229,246, 97,
+    128,  9, 89,231,245,242,237,245,235,232,105,128, 10, 89,233,229,
+    245,235,104,  4,121,108,121,143,121,158,121,167, 97,  2,121,114,
+    121,129,227,233,242,227,236,229,235,239,242,229,225,110,128, 50,
+    120,240,225,242,229,238,235,239,242,229,225,110,128, 50, 24,227,
+    233,242,227,236,229,235,239,242,229,225,110,128, 50,106,235,239,
+    242,229,225,110,128, 49, 75,240,225,242,229,238,235,239,242,229,
+    225,110,128, 50, 10,111,  4,121,191,121,240,121,250,121,255,235,
+    104,  4,121,202,121,211,121,220,121,230,225,233,244,232,225,105,
+    128, 14,  2,239,238,244,232,225,105,128, 14,  5,245,225,244,244,
+    232,225,105,128, 14,  3,247,225,233,244,232,225,105,128, 14,  4,
+    237,245,244,244,232,225,105,128, 14, 91,239,107,128,  1,153,242,
+    225,235,232,225,238,231,244,232,225,105,128, 14,  6,250,243,241,
+    245,225,242,101,128, 51,145,105,  4,122, 33,122, 44,122, 69,122,
+    118,232,233,242,225,231,225,238, 97,128, 48, 77,235,225,244,225,
+    235,225,238, 97,129, 48,173,122, 57,232,225,236,230,247,233,228,
+    244,104,128,255,119,242,111,  3,122, 78,122, 93,122,109,231,245,
+    242,225,237,245,243,241,245,225,242,101,128, 51, 21,237,229,229,
+    244,239,242,245,243,241,245,225,242,101,128, 51, 22,243,241,245,
+    225,242,101,128, 51, 20,249,229,239,107,  5,122,133,122,168,122,
+    183,122,192,122,206, 97,  2,122,139,122,154,227,233,242,227,236,
+    229,235,239,242,229,225,110,128, 50,110,240,225,242,229,238,235,
+    239,242,229,225,110,128, 50, 14,227,233,242,227,236,229,235,239,
+    242,229,225,110,128, 50, 96,235,239,242,229,225,110,128, 49, 49,
+    240,225,242,229,238,235,239,242,229,225,110,128, 50,  0,243,233,
+    239,243,235,239,242,229,225,110,128, 49, 51,234,229,227,249,242,
+    233,236,236,233, 99,128,  4, 92,108,  2,122,238,122,249,233,238,
+    229,226,229,236,239,119,128, 30, 53,243,241,245,225,242,101,128,
+     51,152,109,  3,123, 10,123, 24,123, 35,227,245,226,229,228,243,
+    241,245,225,242,101,128, 51,166,239,238,239,243,240,225,227,101,
+    128,255, 75,243,241,245,225,242,229,228,243,241,245,225,242,101,
+    128, 51,162,111,  5,123, 63,123, 89,123,127,123,139,123,153,104,
+      2,123, 69,123, 79,233,242,225,231,225,238, 97,128, 48, 83,237,
+    243,241,245,225,242,101,128, 51,192,235, 97,  2,123, 96,123,104,
+    233,244,232,225,105,128, 14,  1,244,225,235,225,238, 97,129, 48,
+    179,123,115,232,225,236,230,247,233,228,244,104,128,255,122,239,
+    240,239,243,241,245,225,242,101,128, 51, 30,240,240,225,227,249,
+    242,233,236,236,233, 99,128,  4,129,114,  2,123,159,123,179,229,
+    225,238,243,244,225,238,228,225,242,228,243,249,237,226,239,108,
+    128, 50,127,239,238,233,243,227,237, 98,128,  3, 67,240, 97,  2,
+    123,196,123,202,242,229,110,128, 36,166,243,241,245,225,242,101,
+    128, 51,170,243,233,227,249,242,233,236,236,233, 99,128,  4,111,
+    116,  2,123,230,123,239,243,241,245,225,242,101,128, 51,207,245,
+    242,238,229,100,128,  2,158,117,  2,123,253,124,  8,232,233,242,
+    225,231,225,238, 97,128, 48, 79,235,225,244,225,235,225,238, 97,
+    129, 48,175,124, 21,232,225,236,230,247,233,228,244,104,128,255,
+    120,246,243,241,245,225,242,101,128, 51,184,247,243,241,245,225,
+    242,101,128, 51,190,108,146,  0,108,124, 93,126,209,126,238,127,
+     48,127, 86,127,238,127,247,128,  7,128, 31,128, 49,128,167,128,
+    208,129, 87,129, 95,129,128,129,137,129,145,129,207, 97,  7,124,
+    109,124,119,124,126,124,133,124,158,124,174,126,197,226,229,238,
+    231,225,236,105,128,  9,178,227,245,244,101,128,  1, 58,228,229,
+    246, 97,128,  9, 50,231,117,  2,124,140,124,149,234,225,242,225,
+    244,105,128, 10,178,242,237,245,235,232,105,128, 10, 50,235,235,
+    232,225,238,231,249,225,239,244,232,225,105,128, 14, 69,109, 10,
+    124,196,125,135,125,152,125,235,125,249,126, 12,126, 28,126, 48,
+    126, 68,126, 91, 97,  2,124,202,125,127,236,229,102,  4,124,214,
+    124,228,125, 64,125, 81,230,233,238,225,236,225,242,225,226,233,
+     99,128,254,252,232,225,237,250, 97,  2,124,238,125, 23,225,226,
+    239,246,101,  2,124,248,125,  6,230,233,238,225,236,225,242,225,
+    226,233, 99,128,254,248,233,243,239,236,225,244,229,228,225,242,
+    225,226,233, 99,128,254,247,226,229,236,239,119,  2,125, 33,125,
+     47,230,233,238,225,236,225,242,225,226,233, 99,128,254,250,233,
+    243,239,236,225,244,229,228,225,242,225,226,233, 99,128,254,249,
+    233,243,239,236,225,244,229,228,225,242,225,226,233, 99,128,254,
+    251,237,225,228,228,225,225,226,239,246,101,  2,125, 96,125,110,
+    230,233,238,225,236,225,242,225,226,233, 99,128,254,246,233,243,
+    239,236,225,244,229,228,225,242,225,226,233, 99,128,254,245,242,
+    225,226,233, 99,128,  6, 68,226,228, 97,129,  3,187,125,143,243,
+    244,242,239,235,101,128,  1,155,229,100,130,  5,220,125,161,125,
+    181,228,225,231,229,243,104,129,251, 60,125,172,232,229,226,242,
+    229,119,128,251, 60,104,  2,125,187,125,195,229,226,242,229,119,
+    128,  5,220,239,236,225,109,130,216, 57,125,206,125,226,228,225,
+    231,229,243,104,129,216, 60,125,217,232,229,226,242,229,119,128,
+    216, 60,232,229,226,242,229,119,128,216, 57,230,233,238,225,236,
+    225,242,225,226,233, 99,128,254,222,232,225,232,233,238,233,244,
+    233,225,236,225,242,225,226,233, 99,128,252,202,233,238,233,244,
+    233,225,236,225,242,225,226,233, 99,128,254,223,234,229,229,237,
+    233,238,233,244,233,225,236,225,242,225,226,233, 99,128,252,201,
+    235,232,225,232,233,238,233,244,233,225,236,225,242,225,226,233,
+     99,128,252,203,236,225,237,232,229,232,233,243,239,236,225,244,
+    229,228,225,242,225,226,233, 99,128,253,242,237,101,  2,126, 98,
+    126,111,228,233,225,236,225,242,225,226,233, 99,128,254,224,229,
+    109,  4,126,122,126,141,126,157,126,177,232,225,232,233,238,233,
+    244,233,225,236,225,242,225,226,233, 99,128,253,136,233,238,233,
+    244,233,225,236,225,242,225,226,233, 99,128,252,204,234,229,229,
+    237,233,238,233,244,233,225,236,225,242,225,226,233, 99,128,216,
+     64,235,232,225,232,233,238,233,244,233,225,236,225,242,225,226,
+    233, 99,128,216, 68,242,231,229,227,233,242,227,236,101,128, 37,
+    239, 98,  3,126,217,126,222,126,228,225,114,128,  1,154,229,236,
+    116,128,  2,108,239,240,239,237,239,230,111,128, 49, 12, 99,  4,
+    126,248,126,255,127,  8,127, 35,225,242,239,110,128,  1, 62,229,
+    228,233,236,236, 97,128,  1, 60,233,242, 99,  2,127, 16,127, 21,
+    236,101,128, 36,219,245,237,230,236,229,248,226,229,236,239,119,
+    128, 30, 61,239,237,237,225,225,227,227,229,238,116,128,  1, 60,
+    228,239,116,130,  1, 64,127, 58,127, 67,225,227,227,229,238,116,
+    128,  1, 64,226,229,236,239,119,129, 30, 55,127, 77,237,225,227,
+    242,239,110,128, 30, 57,101,  3,127, 94,127,132,127,233,230,116,
+      2,127,101,127,117,225,238,231,236,229,225,226,239,246,229,227,
+    237, 98,128,  3, 26,244,225,227,235,226,229,236,239,247,227,237,
+     98,128,  3, 24,243,115,132,  0, 60,127,145,127,167,127,179,127,
+    225,229,241,245,225,108,129, 34,100,127,155,239,242,231,242,229,
+    225,244,229,114,128, 34,218,237,239,238,239,243,240,225,227,101,
+    128,255, 28,111,  2,127,185,127,214,114,  2,127,191,127,204,229,
+    241,245,233,246,225,236,229,238,116,128, 34,114,231,242,229,225,
+    244,229,114,128, 34,118,246,229,242,229,241,245,225,108,128, 34,
+    102,243,237,225,236,108,128,254,100,250,104,128,  2,110,230,226,
+    236,239,227,107,128, 37,140,232,239,239,235,242,229,244,242,239,
+    230,236,229,120,128,  2,109,105,  2,128, 13,128, 18,242, 97,128,
+     32,164,247,238,225,242,237,229,238,233,225,110,128,  5,108,106,
+    129,  1,201,128, 37,229,227,249,242,233,236,236,233, 99,128,  4,
+     89,108,132,246,192,128, 61,128, 85,128, 96,128,105, 97,  2,128,
+     67,128, 74,228,229,246, 97,128,  9, 51,231,245,234,225,242,225,
+    244,105,128, 10,179,233,238,229,226,229,236,239,119,128, 30, 59,
+    236,225,228,229,246, 97,128,  9, 52,246,239,227,225,236,233, 99,
+      3,128,119,128,129,128,136,226,229,238,231,225,236,105,128,  9,
+    225,228,229,246, 97,128,  9, 97,246,239,247,229,236,243,233,231,
+    110,  2,128,150,128,160,226,229,238,231,225,236,105,128,  9,227,
+    228,229,246, 97,128,  9, 99,109,  3,128,175,128,188,128,199,233,
+    228,228,236,229,244,233,236,228,101,128,  2,107,239,238,239,243,
+    240,225,227,101,128,255, 76,243,241,245,225,242,101,128, 51,208,
+    111,  6,128,222,128,234,129, 20,129, 31,129, 37,129, 79,227,232,
+    245,236,225,244,232,225,105,128, 14, 44,231,233,227,225,108,  3,
+    128,246,128,252,129, 15,225,238,100,128, 34, 39,238,239,116,129,
+      0,172,129,  4,242,229,246,229,242,243,229,100,128, 35, 16,239,
+    114,128, 34, 40,236,233,238,231,244,232,225,105,128, 14, 37,238,
+    231,115,128,  1,127,247,236,233,238,101,  2,129, 47,129, 70, 99,
+      2,129, 53,129, 65,229,238,244,229,242,236,233,238,101,128,254,
+     78,237, 98,128,  3, 50,228,225,243,232,229,100,128,254, 77,250,
+    229,238,231,101,128, 37,202,240,225,242,229,110,128, 36,167,115,
+      3,129,103,129,110,129,118,236,225,243,104,128,  1, 66,241,245,
+    225,242,101,128, 33, 19,245,240,229,242,233,239,114,128,246,238,
+    244,243,232,225,228,101,128, 37,145,245,244,232,225,105,128, 14,
+     38,246,239,227,225,236,233, 99,  3,129,159,129,169,129,176,226,
+    229,238,231,225,236,105,128,  9,140,228,229,246, 97,128,  9, 12,
+    246,239,247,229,236,243,233,231,110,  2,129,190,129,200,226,229,
+    238,231,225,236,105,128,  9,226,228,229,246, 97,128,  9, 98,248,
+    243,241,245,225,242,101,128, 51,211,109,144,  0,109,129,253,132,
+    106,132,131,132,158,132,183,133,236,134,  2,135, 57,135, 87,135,
+    136,135,243,136,  9,136, 34,136, 43,137, 70,137, 98, 97, 12,130,
+     23,130, 33,130, 97,130,104,130,129,130,177,132, 13,132, 38,132,
+     43,132, 57,132, 69,132, 74,226,229,238,231,225,236,105,128,  9,
+    174, 99,  2,130, 39,130, 91,242,239,110,132,  0,175,130, 53,130,
+     64,130, 70,130, 79,226,229,236,239,247,227,237, 98,128,  3, 49,
+    227,237, 98,128,  3,  4,236,239,247,237,239,100,128,  2,205,237,
+    239,238,239,243,240,225,227,101,128,255,227,245,244,101,128, 30,
+     63,228,229,246, 97,128,  9, 46,231,117,  2,130,111,130,120,234,
+    225,242,225,244,105,128, 10,174,242,237,245,235,232,105,128, 10,
+     46,104,  2,130,135,130,167,225,240,225,235,104,  2,130,145,130,
+    154,232,229,226,242,229,119,128,  5,164,236,229,230,244,232,229,
+    226,242,229,119,128,  5,164,233,242,225,231,225,238, 97,128, 48,
+    126,105,  5,130,189,131,  2,131, 65,131, 95,132,  1,227,232,225,
+    244,244,225,247, 97,  3,130,204,130,235,130,242,236,239,119,  2,
+    130,212,130,223,236,229,230,244,244,232,225,105,128,248,149,242,
+    233,231,232,244,244,232,225,105,128,248,148,244,232,225,105,128,
+     14, 75,245,240,240,229,242,236,229,230,244,244,232,225,105,128,
+    248,147,229,107,  3,131, 11,131, 42,131, 49,236,239,119,  2,131,
+     19,131, 30,236,229,230,244,244,232,225,105,128,248,140,242,233,
+    231,232,244,244,232,225,105,128,248,139,244,232,225,105,128, 14,
+     72,245,240,240,229,242,236,229,230,244,244,232,225,105,128,248,
+    138,232,225,238,225,235,225,116,  2,131, 77,131, 88,236,229,230,
+    244,244,232,225,105,128,248,132,244,232,225,105,128, 14, 49,116,
+      3,131,103,131,131,131,194,225,233,235,232,117,  2,131,113,131,
+    124,236,229,230,244,244,232,225,105,128,248,137,244,232,225,105,
+    128, 14, 71,232,111,  3,131,140,131,171,131,178,236,239,119,  2,
+    131,148,131,159,236,229,230,244,244,232,225,105,128,248,143,242,
+    233,231,232,244,244,232,225,105,128,248,142,244,232,225,105,128,
+     14, 73,245,240,240,229,242,236,229,230,244,244,232,225,105,128,
+    248,141,242,105,  3,131,203,131,234,131,241,236,239,119,  2,131,
+    211,131,222,236,229,230,244,244,232,225,105,128,248,146,242,233,
+    231,232,244,244,232,225,105,128,248,145,244,232,225,105,128, 14,
+     74,245,240,240,229,242,236,229,230,244,244,232,225,105,128,248,
+    144,249,225,237,239,235,244,232,225,105,128, 14, 70,235,225,244,
+    225,235,225,238, 97,129, 48,222,132, 26,232,225,236,230,247,233,
+    228,244,104,128,255,143,236,101,128, 38, 66,238,243,249,239,238,
+    243,241,245,225,242,101,128, 51, 71,241,225,230,232,229,226,242,
+    229,119,128,  5,190,242,115,128, 38, 66,115,  2,132, 80,132, 98,
+    239,242,225,227,233,242,227,236,229,232,229,226,242,229,119,128,
+      5,175,241,245,225,242,101,128, 51,131, 98,  2,132,112,132,122,
+    239,240,239,237,239,230,111,128, 49,  7,243,241,245,225,242,101,
+    128, 51,212, 99,  2,132,137,132,145,233,242,227,236,101,128, 36,
+    220,245,226,229,228,243,241,245,225,242,101,128, 51,165,228,239,
+    116,  2,132,166,132,175,225,227,227,229,238,116,128, 30, 65,226,
+    229,236,239,119,128, 30, 67,101,  7,132,199,133, 70,133, 81,133,
+     96,133,121,133,158,133,170,101,  2,132,205,133, 57,109,  4,132,
+    215,132,224,132,238,132,254,225,242,225,226,233, 99,128,  6, 69,
+    230,233,238,225,236,225,242,225,226,233, 99,128,254,226,233,238,
+    233,244,233,225,236,225,242,225,226,233, 99,128,254,227,237,101,
+      2,133,  5,133, 18,228,233,225,236,225,242,225,226,233, 99,128,
+    254,228,229,237,105,  2,133, 26,133, 41,238,233,244,233,225,236,
+    225,242,225,226,233, 99,128,252,209,243,239,236,225,244,229,228,
+    225,242,225,226,233, 99,128,252, 72,244,239,242,245,243,241,245,
+    225,242,101,128, 51, 77,232,233,242,225,231,225,238, 97,128, 48,
+    129,233,250,233,229,242,225,243,241,245,225,242,101,128, 51,126,
+    235,225,244,225,235,225,238, 97,129, 48,225,133,109,232,225,236,
+    230,247,233,228,244,104,128,255,146,109,130,  5,222,133,129,133,
+    149,228,225,231,229,243,104,129,251, 62,133,140,232,229,226,242,
+    229,119,128,251, 62,232,229,226,242,229,119,128,  5,222,238,225,
+    242,237,229,238,233,225,110,128,  5,116,242,235,232, 97,  3,133,
+    181,133,190,133,223,232,229,226,242,229,119,128,  5,165,235,229,
+    230,245,236, 97,  2,133,201,133,210,232,229,226,242,229,119,128,
+      5,166,236,229,230,244,232,229,226,242,229,119,128,  5,166,236,
+    229,230,244,232,229,226,242,229,119,128,  5,165,104,  2,133,242,
+    133,248,239,239,107,128,  2,113,250,243,241,245,225,242,101,128,
+     51,146,105,  6,134, 16,134, 53,134,190,134,201,134,226,135, 27,
+    228,100,  2,134, 23,134, 48,236,229,228,239,244,235,225,244,225,
+    235,225,238,225,232,225,236,230,247,233,228,244,104,128,255,101,
+    239,116,128,  0,183,229,245,109,  5,134, 67,134,102,134,117,134,
+    126,134,177, 97,  2,134, 73,134, 88,227,233,242,227,236,229,235,
+    239,242,229,225,110,128, 50,114,240,225,242,229,238,235,239,242,
+    229,225,110,128, 50, 18,227,233,242,227,236,229,235,239,242,229,
+    225,110,128, 50,100,235,239,242,229,225,110,128, 49, 65,112,  2,
+    134,132,134,164, 97,  2,134,138,134,152,238,243,233,239,243,235,
+    239,242,229,225,110,128, 49,112,242,229,238,235,239,242,229,225,
+    110,128, 50,  4,233,229,245,240,235,239,242,229,225,110,128, 49,
+    110,243,233,239,243,235,239,242,229,225,110,128, 49,111,232,233,
+    242,225,231,225,238, 97,128, 48,127,235,225,244,225,235,225,238,
+     97,129, 48,223,134,214,232,225,236,230,247,233,228,244,104,128,
+    255,144,238,117,  2,134,233,135, 22,115,132, 34, 18,134,245,135,
+      0,135,  9,135, 15,226,229,236,239,247,227,237, 98,128,  3, 32,
+    227,233,242,227,236,101,128, 34,150,237,239,100,128,  2,215,240,
+    236,245,115,128, 34, 19,244,101,128, 32, 50,242,105,  2,135, 34,
+    135, 48,226,225,225,242,245,243,241,245,225,242,101,128, 51, 74,
+    243,241,245,225,242,101,128, 51, 73,108,  2,135, 63,135, 78,239,
+    238,231,236,229,231,244,245,242,238,229,100,128,  2,112,243,241,
+    245,225,242,101,128, 51,150,109,  3,135, 95,135,109,135,120,227,
+    245,226,229,228,243,241,245,225,242,101,128, 51,163,239,238,239,
+    243,240,225,227,101,128,255, 77,243,241,245,225,242,229,228,243,
+    241,245,225,242,101,128, 51,159,111,  5,135,148,135,174,135,199,
+    135,209,135,218,104,  2,135,154,135,164,233,242,225,231,225,238,
+     97,128, 48,130,237,243,241,245,225,242,101,128, 51,193,235,225,
+    244,225,235,225,238, 97,129, 48,226,135,187,232,225,236,230,247,
+    233,228,244,104,128,255,147,236,243,241,245,225,242,101,128, 51,
+    214,237,225,244,232,225,105,128, 14, 33,246,229,242,243,243,241,
+    245,225,242,101,129, 51,167,135,233,228,243,241,245,225,242,101,
+    128, 51,168,240, 97,  2,135,250,136,  0,242,229,110,128, 36,168,
+    243,241,245,225,242,101,128, 51,171,115,  2,136, 15,136, 24,243,
+    241,245,225,242,101,128, 51,179,245,240,229,242,233,239,114,128,
+    246,239,244,245,242,238,229,100,128,  2,111,117,141,  0,181,136,
+     73,136, 77,136, 87,136,111,136,121,136,143,136,154,136,179,136,
+    202,136,212,136,242,137, 50,137, 60, 49,128,  0,181,225,243,241,
+    245,225,242,101,128, 51,130,227,104,  2,136, 94,136,104,231,242,
+    229,225,244,229,114,128, 34,107,236,229,243,115,128, 34,106,230,
+    243,241,245,225,242,101,128, 51,140,103,  2,136,127,136,134,242,
+    229,229,107,128,  3,188,243,241,245,225,242,101,128, 51,141,232,
+    233,242,225,231,225,238, 97,128, 48,128,235,225,244,225,235,225,
+    238, 97,129, 48,224,136,167,232,225,236,230,247,233,228,244,104,
+    128,255,145,108,  2,136,185,136,194,243,241,245,225,242,101,128,
+     51,149,244,233,240,236,121,128,  0,215,237,243,241,245,225,242,
+    101,128, 51,155,238,225,104,  2,136,220,136,229,232,229,226,242,
+    229,119,128,  5,163,236,229,230,244,232,229,226,242,229,119,128,
+      5,163,115,  2,136,248,137, 41,233, 99,  3,137,  1,137, 18,137,
+     29,225,236,238,239,244,101,129, 38,106,137, 12,228,226,108,128,
+     38,107,230,236,225,244,243,233,231,110,128, 38,109,243,232,225,
+    242,240,243,233,231,110,128, 38,111,243,241,245,225,242,101,128,
+     51,178,246,243,241,245,225,242,101,128, 51,182,247,243,241,245,
+    225,242,101,128, 51,188,118,  2,137, 76,137, 89,237,229,231,225,
+    243,241,245,225,242,101,128, 51,185,243,241,245,225,242,101,128,
+     51,183,119,  2,137,104,137,117,237,229,231,225,243,241,245,225,
+    242,101,128, 51,191,243,241,245,225,242,101,128, 51,189,110,150,
+      0,110,137,174,138, 52,138, 76,138,142,138,167,138,225,138,235,
+    139, 46,139, 89,141,123,141,141,141,166,141,197,141,223,142, 32,
+    144, 35,144, 43,144, 68,144, 76,145, 44,145, 54,145, 64, 97,  8,
+    137,192,137,212,137,219,137,226,137,251,138,  6,138, 31,138, 43,
+     98,  2,137,198,137,207,229,238,231,225,236,105,128,  9,168,236,
+     97,128, 34,  7,227,245,244,101,128,  1, 68,228,229,246, 97,128,
+      9, 40,231,117,  2,137,233,137,242,234,225,242,225,244,105,128,
+     10,168,242,237,245,235,232,105,128, 10, 40,232,233,242,225,231,
+    225,238, 97,128, 48,106,235,225,244,225,235,225,238, 97,129, 48,
+    202,138, 19,232,225,236,230,247,233,228,244,104,128,255,133,240,
+    239,243,244,242,239,240,232,101,128,  1, 73,243,241,245,225,242,
+    101,128, 51,129, 98,  2,138, 58,138, 68,239,240,239,237,239,230,
+    111,128, 49, 11,243,240,225,227,101,128,  0,160, 99,  4,138, 86,
+    138, 93,138,102,138,129,225,242,239,110,128,  1, 72,229,228,233,
+    236,236, 97,128,  1, 70,233,242, 99,  2,138,110,138,115,236,101,
+    128, 36,221,245,237,230,236,229,248,226,229,236,239,119,128, 30,
+     75,239,237,237,225,225,227,227,229,238,116,128,  1, 70,228,239,
+    116,  2,138,150,138,159,225,227,227,229,238,116,128, 30, 69,226,
+    229,236,239,119,128, 30, 71,101,  3,138,175,138,186,138,211,232,
+    233,242,225,231,225,238, 97,128, 48,109,235,225,244,225,235,225,
+    238, 97,129, 48,205,138,199,232,225,236,230,247,233,228,244,104,
+    128,255,136,247,243,232,229,241,229,236,243,233,231,110,128, 32,
+    170,230,243,241,245,225,242,101,128, 51,139,103,  2,138,241,139,
+     35, 97,  3,138,249,139,  3,139, 10,226,229,238,231,225,236,105,
+    128,  9,153,228,229,246, 97,128,  9, 25,231,117,  2,139, 17,139,
+     26,234,225,242,225,244,105,128, 10,153,242,237,245,235,232,105,
+    128, 10, 25,239,238,231,245,244,232,225,105,128, 14,  7,104,  2,
+    139, 52,139, 62,233,242,225,231,225,238, 97,128, 48,147,239,239,
+    107,  2,139, 70,139, 77,236,229,230,116,128,  2,114,242,229,244,
+    242,239,230,236,229,120,128,  2,115,105,  4,139, 99,140, 12,140,
+     23,140, 81,229,245,110,  7,139,117,139,152,139,184,139,198,139,
+    207,139,240,139,253, 97,  2,139,123,139,138,227,233,242,227,236,
+    229,235,239,242,229,225,110,128, 50,111,240,225,242,229,238,235,
+    239,242,229,225,110,128, 50, 15,227,105,  2,139,159,139,171,229,
+    245,227,235,239,242,229,225,110,128, 49, 53,242,227,236,229,235,
+    239,242,229,225,110,128, 50, 97,232,233,229,245,232,235,239,242,
+    229,225,110,128, 49, 54,235,239,242,229,225,110,128, 49, 52,240,
+     97,  2,139,214,139,228,238,243,233,239,243,235,239,242,229,225,
+    110,128, 49,104,242,229,238,235,239,242,229,225,110,128, 50,  1,
+    243,233,239,243,235,239,242,229,225,110,128, 49,103,244,233,235,
+    229,245,244,235,239,242,229,225,110,128, 49,102,232,233,242,225,
+    231,225,238, 97,128, 48,107,107,  2,140, 29,140, 53,225,244,225,
+    235,225,238, 97,129, 48,203,140, 41,232,225,236,230,247,233,228,
+    244,104,128,255,134,232,225,232,233,116,  2,140, 63,140, 74,236,
+    229,230,244,244,232,225,105,128,248,153,244,232,225,105,128, 14,
+     77,238,101,141,  0, 57,140,112,140,121,140,131,140,161,140,168,
+    140,193,140,220,140,254,141, 10,141, 21,141, 54,141, 62,141, 73,
+    225,242,225,226,233, 99,128,  6,105,226,229,238,231,225,236,105,
+    128,  9,239,227,233,242,227,236,101,129, 36,104,140,142,233,238,
     246,229,242,243,229,243,225,238,243,243,229,242,233,102,128, 39,
-    141,228,229,246, 97,128,  9,106,231,117,  2, 92, 47, 92, 56,234,
-    225,242,225,244,105,128, 10,234,242,237,245,235,232,105,128, 10,
-    106,232, 97,  2, 92, 72, 92, 83,227,235,225,242,225,226,233, 99,
-    128,  6,100,238,231,250,232,239,117,128, 48, 36,105,  2, 92, 98,
-     92,116,228,229,239,231,242,225,240,232,233,227,240,225,242,229,
-    110,128, 50, 35,238,230,229,242,233,239,114,128, 32,132,237,239,
-    238,239,243,240,225,227,101,128,255, 20,238,245,237,229,242,225,
-    244,239,242,226,229,238,231,225,236,105,128,  9,247,239,236,228,
-    243,244,249,236,101,128,247, 52,112,  2, 92,174, 92,181,225,242,
-    229,110,128, 36,119,229,114,  2, 92,188, 92,194,233,239,100,128,
-     36,139,243,233,225,110,128,  6,244,242,239,237,225,110,128, 33,
-    115,243,245,240,229,242,233,239,114,128, 32,116,116,  2, 92,226,
-     93,  8,229,229,110,  2, 92,234, 92,243,227,233,242,227,236,101,
-    128, 36,109,112,  2, 92,249, 93,  0,225,242,229,110,128, 36,129,
-    229,242,233,239,100,128, 36,149,104,  2, 93, 14, 93, 19,225,105,
-    128, 14, 84,244,239,238,229,227,232,233,238,229,243,101,128,  2,
-    203,240,225,242,229,110,128, 36,161,242, 97,  2, 93, 48, 93, 56,
-    227,244,233,239,110,128, 32, 68,238, 99,128, 32,163,103,144,  0,
-    103, 93, 97, 94, 43, 94, 66, 94,127, 94,144, 95, 65, 96, 58, 96,
-    143, 96,156, 97, 14, 97, 39, 97, 67, 97, 89, 98, 34, 98, 56, 98,
-    158, 97,  9, 93,117, 93,127, 93,134, 93,141, 93,205, 93,230, 93,
-    241, 93,252, 94, 30,226,229,238,231,225,236,105,128,  9,151,227,
-    245,244,101,128,  1,245,228,229,246, 97,128,  9, 23,102,  4, 93,
-    151, 93,160, 93,174, 93,190,225,242,225,226,233, 99,128,  6,175,
-    230,233,238,225,236,225,242,225,226,233, 99,128,251,147,233,238,
-    233,244,233,225,236,225,242,225,226,233, 99,128,251,148,237,229,
-    228,233,225,236,225,242,225,226,233, 99,128,251,149,231,117,  2,
-     93,212, 93,221,234,225,242,225,244,105,128, 10,151,242,237,245,
-    235,232,105,128, 10, 23,232,233,242,225,231,225,238, 97,128, 48,
-     76,235,225,244,225,235,225,238, 97,128, 48,172,237,237, 97,130,
-      3,179, 94,  6, 94, 19,236,225,244,233,238,243,237,225,236,108,
-    128,  2, 99,243,245,240,229,242,233,239,114,128,  2,224,238,231,
-    233,225,227,239,240,244,233, 99,128,  3,235, 98,  2, 94, 49, 94,
-     59,239,240,239,237,239,230,111,128, 49, 13,242,229,246,101,128,
-      1, 31, 99,  4, 94, 76, 94, 83, 94, 92, 94,114,225,242,239,110,
-    128,  1,231,229,228,233,236,236, 97,128,  1, 35,233,242, 99,  2,
-     94,100, 94,105,236,101,128, 36,214,245,237,230,236,229,120,128,
-      1, 29,239,237,237,225,225,227,227,229,238,116,128,  1, 35,228,
-    239,116,129,  1, 33, 94,135,225,227,227,229,238,116,128,  1, 33,
-    101,  6, 94,158, 94,169, 94,180, 94,191, 94,210, 95, 56,227,249,
-    242,233,236,236,233, 99,128,  4, 51,232,233,242,225,231,225,238,
-     97,128, 48, 82,235,225,244,225,235,225,238, 97,128, 48,178,239,
-    237,229,244,242,233,227,225,236,236,249,229,241,245,225,108,128,
-     34, 81,114,  3, 94,218, 95, 11, 95, 21,229,243,104,  3, 94,228,
-     94,243, 94,252,225,227,227,229,238,244,232,229,226,242,229,119,
-    128,  5,156,232,229,226,242,229,119,128,  5,243,237,245,241,228,
-    225,237,232,229,226,242,229,119,128,  5,157,237,225,238,228,226,
-    236,115,128,  0,223,243,232,225,249,233,109,  2, 95, 32, 95, 47,
-    225,227,227,229,238,244,232,229,226,242,229,119,128,  5,158,232,
-    229,226,242,229,119,128,  5,244,244,225,237,225,242,107,128, 48,
-     19,104,  5, 95, 77, 95,210, 96, 17, 96, 42, 96, 48, 97,  4, 95,
-     87, 95, 97, 95,120, 95,145,226,229,238,231,225,236,105,128,  9,
-    152,100,  2, 95,103, 95,114,225,242,237,229,238,233,225,110,128,
-      5,114,229,246, 97,128,  9, 24,231,117,  2, 95,127, 95,136,234,
-    225,242,225,244,105,128, 10,152,242,237,245,235,232,105,128, 10,
-     24,233,110,  4, 95,156, 95,165, 95,179, 95,195,225,242,225,226,
-    233, 99,128,  6, 58,230,233,238,225,236,225,242,225,226,233, 99,
-    128,254,206,233,238,233,244,233,225,236,225,242,225,226,233, 99,
-    128,254,207,237,229,228,233,225,236,225,242,225,226,233, 99,128,
-    254,208,101,  3, 95,218, 95,239, 96,  0,237,233,228,228,236,229,
-    232,239,239,235,227,249,242,233,236,236,233, 99,128,  4,149,243,
-    244,242,239,235,229,227,249,242,233,236,236,233, 99,128,  4,147,
-    245,240,244,245,242,238,227,249,242,233,236,236,233, 99,128,  4,
-    145,232, 97,  2, 96, 24, 96, 31,228,229,246, 97,128,  9, 90,231,
-    245,242,237,245,235,232,105,128, 10, 90,239,239,107,128,  2, 96,
-    250,243,241,245,225,242,101,128, 51,147,105,  3, 96, 66, 96, 77,
-     96, 88,232,233,242,225,231,225,238, 97,128, 48, 78,235,225,244,
-    225,235,225,238, 97,128, 48,174,109,  2, 96, 94, 96,105,225,242,
-    237,229,238,233,225,110,128,  5, 99,229,108,130,  5,210, 96,114,
-     96,134,228,225,231,229,243,104,129,251, 50, 96,125,232,229,226,
-    242,229,119,128,251, 50,232,229,226,242,229,119,128,  5,210,234,
-    229,227,249,242,233,236,236,233, 99,128,  4, 83,236,239,244,244,
-    225,108,  2, 96,167, 96,184,233,238,246,229,242,244,229,228,243,
-    244,242,239,235,101,128,  1,190,243,244,239,112,132,  2,148, 96,
-    199, 96,210, 96,216, 96,248,233,238,246,229,242,244,229,100,128,
-      2,150,237,239,100,128,  2,192,242,229,246,229,242,243,229,100,
-    130,  2,149, 96,231, 96,237,237,239,100,128,  2,193,243,245,240,
-    229,242,233,239,114,128,  2,228,243,244,242,239,235,101,129,  2,
-    161, 97,  3,242,229,246,229,242,243,229,100,128,  2,162,109,  2,
-     97, 20, 97, 28,225,227,242,239,110,128, 30, 33,239,238,239,243,
-    240,225,227,101,128,255, 71,111,  2, 97, 45, 97, 56,232,233,242,
-    225,231,225,238, 97,128, 48, 84,235,225,244,225,235,225,238, 97,
-    128, 48,180,240, 97,  2, 97, 74, 97, 80,242,229,110,128, 36,162,
-    243,241,245,225,242,101,128, 51,172,114,  2, 97, 95, 97,192, 97,
-      2, 97,101, 97,109,228,233,229,238,116,128, 34,  7,246,101,134,
-      0, 96, 97,126, 97,137, 97,154, 97,161, 97,170, 97,182,226,229,
-    236,239,247,227,237, 98,128,  3, 22, 99,  2, 97,143, 97,148,237,
-     98,128,  3,  0,239,237, 98,128,  3,  0,228,229,246, 97,128,  9,
-     83,236,239,247,237,239,100,128,  2,206,237,239,238,239,243,240,
-    225,227,101,128,255, 64,244,239,238,229,227,237, 98,128,  3, 64,
-    229,225,244,229,114,132,  0, 62, 97,208, 97,227, 97,239, 98, 26,
-    229,241,245,225,108,129, 34,101, 97,218,239,242,236,229,243,115,
-    128, 34,219,237,239,238,239,243,240,225,227,101,128,255, 30,111,
-      2, 97,245, 98, 15,114,  2, 97,251, 98,  8,229,241,245,233,246,
-    225,236,229,238,116,128, 34,115,236,229,243,115,128, 34,119,246,
-    229,242,229,241,245,225,108,128, 34,103,243,237,225,236,108,128,
-    254,101,115,  2, 98, 40, 98, 48,227,242,233,240,116,128,  2, 97,
-    244,242,239,235,101,128,  1,229,117,  4, 98, 66, 98, 77, 98,134,
-     98,145,232,233,242,225,231,225,238, 97,128, 48, 80,233,108,  2,
-     98, 84, 98,109,236,229,237,239,116,  2, 98, 94, 98,101,236,229,
-    230,116,128,  0,171,242,233,231,232,116,128,  0,187,243,233,238,
-    231,108,  2, 98,119, 98,126,236,229,230,116,128, 32, 57,242,233,
-    231,232,116,128, 32, 58,235,225,244,225,235,225,238, 97,128, 48,
-    176,242,225,237,245,243,241,245,225,242,101,128, 51, 24,249,243,
-    241,245,225,242,101,128, 51,201,104,144,  0,104, 98,204,101, 90,
-    101,125,101,162,101,202,103, 90,103,110,104, 75,104, 87,104, 99,
-    105,167,105,175,105,186,105,195,106, 19,106, 23, 97, 13, 98,232,
-     99, 15, 99, 25, 99, 55, 99, 80, 99,158, 99,170, 99,195, 99,210,
-     99,239, 99,252,100, 54,100, 63, 97,  2, 98,238, 99,  1,226,235,
-    232,225,243,233,225,238,227,249,242,233,236,236,233, 99,128,  4,
-    169,236,244,239,238,229,225,242,225,226,233, 99,128,  6,193,226,
-    229,238,231,225,236,105,128,  9,185,228,101,  2, 99, 32, 99, 50,
-    243,227,229,238,228,229,242,227,249,242,233,236,236,233, 99,128,
-      4,179,246, 97,128,  9, 57,231,117,  2, 99, 62, 99, 71,234,225,
-    242,225,244,105,128, 10,185,242,237,245,235,232,105,128, 10, 57,
-    104,  4, 99, 90, 99, 99, 99,113, 99,143,225,242,225,226,233, 99,
-    128,  6, 45,230,233,238,225,236,225,242,225,226,233, 99,128,254,
-    162,105,  2, 99,119, 99,134,238,233,244,233,225,236,225,242,225,
-    226,233, 99,128,254,163,242,225,231,225,238, 97,128, 48,111,237,
-    229,228,233,225,236,225,242,225,226,233, 99,128,254,164,233,244,
-    245,243,241,245,225,242,101,128, 51, 42,235,225,244,225,235,225,
-    238, 97,129, 48,207, 99,183,232,225,236,230,247,233,228,244,104,
-    128,255,138,236,225,238,244,231,245,242,237,245,235,232,105,128,
-     10, 77,237,250, 97,  2, 99,218, 99,227,225,242,225,226,233, 99,
-    128,  6, 33,236,239,247,225,242,225,226,233, 99,128,  6, 33,238,
-    231,245,236,230,233,236,236,229,114,128, 49,100,114,  2,100,  2,
-    100, 18,228,243,233,231,238,227,249,242,233,236,236,233, 99,128,
-      4, 74,240,239,239,110,  2,100, 27,100, 40,236,229,230,244,226,
-    225,242,226,245,112,128, 33,188,242,233,231,232,244,226,225,242,
-    226,245,112,128, 33,192,243,241,245,225,242,101,128, 51,202,244,
-    225,102,  3,100, 73,100,165,101,  0,240,225,244,225,104,134,  5,
-    178,100, 93,100, 98,100,112,100,121,100,136,100,152,177, 54,128,
-      5,178, 50,  2,100,104,100,108, 51,128,  5,178,102,128,  5,178,
-    232,229,226,242,229,119,128,  5,178,238,225,242,242,239,247,232,
-    229,226,242,229,119,128,  5,178,241,245,225,242,244,229,242,232,
-    229,226,242,229,119,128,  5,178,247,233,228,229,232,229,226,242,
-    229,119,128,  5,178,241,225,237,225,244,115,135,  5,179,100,188,
-    100,193,100,198,100,203,100,212,100,227,100,243,177, 98,128,  5,
-    179,178, 56,128,  5,179,179, 52,128,  5,179,232,229,226,242,229,
-    119,128,  5,179,238,225,242,242,239,247,232,229,226,242,229,119,
-    128,  5,179,241,245,225,242,244,229,242,232,229,226,242,229,119,
-    128,  5,179,247,233,228,229,232,229,226,242,229,119,128,  5,179,
-    243,229,231,239,108,135,  5,177,101, 22,101, 27,101, 32,101, 37,
-    101, 46,101, 61,101, 77,177, 55,128,  5,177,178, 52,128,  5,177,
-    179, 48,128,  5,177,232,229,226,242,229,119,128,  5,177,238,225,
-    242,242,239,247,232,229,226,242,229,119,128,  5,177,241,245,225,
-    242,244,229,242,232,229,226,242,229,119,128,  5,177,247,233,228,
-    229,232,229,226,242,229,119,128,  5,177, 98,  3,101, 98,101,103,
-    101,113,225,114,128,  1, 39,239,240,239,237,239,230,111,128, 49,
-     15,242,229,246,229,226,229,236,239,119,128, 30, 43, 99,  2,101,
-    131,101,140,229,228,233,236,236, 97,128, 30, 41,233,242, 99,  2,
-    101,148,101,153,236,101,128, 36,215,245,237,230,236,229,120,128,
-      1, 37,100,  2,101,168,101,178,233,229,242,229,243,233,115,128,
-     30, 39,239,116,  2,101,185,101,194,225,227,227,229,238,116,128,
-     30, 35,226,229,236,239,119,128, 30, 37,101,136,  5,212,101,222,
-    101,255,102, 19,102,248,103,  8,103, 53,103, 62,103, 75,225,242,
-    116,129, 38,101,101,230,243,245,233,116,  2,101,239,101,247,226,
-    236,225,227,107,128, 38,101,247,232,233,244,101,128, 38, 97,228,
-    225,231,229,243,104,129,251, 52,102, 10,232,229,226,242,229,119,
-    128,251, 52,104,  6,102, 33,102, 61,102, 69,102,119,102,165,102,
-    214, 97,  2,102, 39,102, 53,236,244,239,238,229,225,242,225,226,
-    233, 99,128,  6,193,242,225,226,233, 99,128,  6, 71,229,226,242,
-    229,119,128,  5,212,230,233,238,225,236, 97,  2,102, 80,102,111,
-    236,116,  2,102, 87,102, 99,239,238,229,225,242,225,226,233, 99,
-    128,251,167,244,247,239,225,242,225,226,233, 99,128,254,234,242,
-    225,226,233, 99,128,254,234,232,225,237,250,225,225,226,239,246,
-    101,  2,102,134,102,148,230,233,238,225,236,225,242,225,226,233,
-     99,128,251,165,233,243,239,236,225,244,229,228,225,242,225,226,
-    233, 99,128,251,164,105,  2,102,171,102,205,238,233,244,233,225,
-    236, 97,  2,102,183,102,197,236,244,239,238,229,225,242,225,226,
-    233, 99,128,251,168,242,225,226,233, 99,128,254,235,242,225,231,
-    225,238, 97,128, 48,120,237,229,228,233,225,236, 97,  2,102,226,
-    102,240,236,244,239,238,229,225,242,225,226,233, 99,128,251,169,
-    242,225,226,233, 99,128,254,236,233,243,229,233,229,242,225,243,
-    241,245,225,242,101,128, 51,123,107,  2,103, 14,103, 38,225,244,
-    225,235,225,238, 97,129, 48,216,103, 26,232,225,236,230,247,233,
-    228,244,104,128,255,141,245,244,225,225,242,245,243,241,245,225,
-    242,101,128, 51, 54,238,231,232,239,239,107,128,  2,103,242,245,
-    244,245,243,241,245,225,242,101,128, 51, 57,116,129,  5,215,103,
-     81,232,229,226,242,229,119,128,  5,215,232,239,239,107,129,  2,
-    102,103, 99,243,245,240,229,242,233,239,114,128,  2,177,105,  4,
-    103,120,103,205,103,216,103,241,229,245,104,  4,103,132,103,167,
-    103,182,103,191, 97,  2,103,138,103,153,227,233,242,227,236,229,
-    235,239,242,229,225,110,128, 50,123,240,225,242,229,238,235,239,
-    242,229,225,110,128, 50, 27,227,233,242,227,236,229,235,239,242,
-    229,225,110,128, 50,109,235,239,242,229,225,110,128, 49, 78,240,
-    225,242,229,238,235,239,242,229,225,110,128, 50, 13,232,233,242,
-    225,231,225,238, 97,128, 48,114,235,225,244,225,235,225,238, 97,
-    129, 48,210,103,229,232,225,236,230,247,233,228,244,104,128,255,
-    139,242,233,113,134,  5,180,104,  3,104,  8,104, 22,104, 31,104,
-     46,104, 62,177, 52,128,  5,180, 50,  2,104, 14,104, 18, 49,128,
-      5,180,100,128,  5,180,232,229,226,242,229,119,128,  5,180,238,
-    225,242,242,239,247,232,229,226,242,229,119,128,  5,180,241,245,
-    225,242,244,229,242,232,229,226,242,229,119,128,  5,180,247,233,
-    228,229,232,229,226,242,229,119,128,  5,180,236,233,238,229,226,
-    229,236,239,119,128, 30,150,237,239,238,239,243,240,225,227,101,
-    128,255, 72,111,  9,104,119,104,130,104,154,104,179,105, 11,105,
-     24,105,110,105,150,105,161,225,242,237,229,238,233,225,110,128,
-      5,112,232,105,  2,104,137,104,145,240,244,232,225,105,128, 14,
-     43,242,225,231,225,238, 97,128, 48,123,235,225,244,225,235,225,
-    238, 97,129, 48,219,104,167,232,225,236,230,247,233,228,244,104,
-    128,255,142,236,225,109,135,  5,185,104,199,104,204,104,209,104,
-    214,104,223,104,238,104,254,177, 57,128,  5,185,178, 54,128,  5,
-    185,179, 50,128,  5,185,232,229,226,242,229,119,128,  5,185,238,
-    225,242,242,239,247,232,229,226,242,229,119,128,  5,185,241,245,
-    225,242,244,229,242,232,229,226,242,229,119,128,  5,185,247,233,
-    228,229,232,229,226,242,229,119,128,  5,185,238,239,235,232,245,
-    235,244,232,225,105,128, 14, 46,111,  2,105, 30,105,100,107,  4,
-    105, 40,105, 52,105, 58,105, 80,225,226,239,246,229,227,239,237,
-     98,128,  3,  9,227,237, 98,128,  3,  9,240,225,236,225,244,225,
-    236,233,250,229,228,226,229,236,239,247,227,237, 98,128,  3, 33,
-    242,229,244,242,239,230,236,229,248,226,229,236,239,247,227,237,
-     98,128,  3, 34,238,243,241,245,225,242,101,128, 51, 66,114,  2,
-    105,116,105,143,105,  2,105,122,105,131,227,239,240,244,233, 99,
-    128,  3,233,250,239,238,244,225,236,226,225,114,128, 32, 21,238,
-    227,237, 98,128,  3, 27,244,243,240,242,233,238,231,115,128, 38,
-    104,245,243,101,128, 35,  2,240,225,242,229,110,128, 36,163,243,
-    245,240,229,242,233,239,114,128,  2,176,244,245,242,238,229,100,
-    128,  2,101,117,  4,105,205,105,216,105,229,105,254,232,233,242,
-    225,231,225,238, 97,128, 48,117,233,233,244,239,243,241,245,225,
-    242,101,128, 51, 51,235,225,244,225,235,225,238, 97,129, 48,213,
-    105,242,232,225,236,230,247,233,228,244,104,128,255,140,238,231,
-    225,242,245,237,236,225,245,116,129,  2,221,106, 13,227,237, 98,
-    128,  3, 11,118,128,  1,149,249,240,232,229,110,132,  0, 45,106,
-     39,106, 50,106, 62,106, 85,233,238,230,229,242,233,239,114,128,
-    246,229,237,239,238,239,243,240,225,227,101,128,255, 13,115,  2,
-    106, 68,106, 75,237,225,236,108,128,254, 99,245,240,229,242,233,
-    239,114,128,246,230,244,247,111,128, 32, 16,105,149,  0,105,106,
-    137,106,160,106,194,106,241,110,123,110,243,111, 24,111, 51,111,
-    213,111,217,111,255,112, 21,112,105,113, 14,113, 89,113, 97,113,
-    110,113,197,113,254,114, 26,114, 70,225, 99,  2,106,144,106,150,
-    245,244,101,128,  0,237,249,242,233,236,236,233, 99,128,  4, 79,
-     98,  3,106,168,106,177,106,187,229,238,231,225,236,105,128,  9,
-    135,239,240,239,237,239,230,111,128, 49, 39,242,229,246,101,128,
-      1, 45, 99,  3,106,202,106,209,106,231,225,242,239,110,128,  1,
-    208,233,242, 99,  2,106,217,106,222,236,101,128, 36,216,245,237,
-    230,236,229,120,128,  0,238,249,242,233,236,236,233, 99,128,  4,
-     86,100,  4,106,251,107,  5,110, 80,110,113,226,236,231,242,225,
-    246,101,128,  2,  9,101,  2,107, 11,110, 75,239,231,242,225,240,
-    104,  7,107, 32,107, 46,107, 59,109,244,110, 19,110, 32,110, 44,
-    229,225,242,244,232,227,233,242,227,236,101,128, 50,143,230,233,
-    242,229,227,233,242,227,236,101,128, 50,139,233, 99, 14,107, 90,
-    107,106,107,205,108,  3,108, 69,108, 98,108,114,108,171,108,220,
-    108,232,109,  3,109, 70,109,208,109,237,225,236,236,233,225,238,
-    227,229,240,225,242,229,110,128, 50, 63, 99,  4,107,116,107,127,
-    107,141,107,148,225,236,236,240,225,242,229,110,128, 50, 58,229,
-    238,244,242,229,227,233,242,227,236,101,128, 50,165,236,239,243,
-    101,128, 48,  6,111,  3,107,156,107,171,107,191,237,237, 97,129,
-     48,  1,107,164,236,229,230,116,128,255,100,238,231,242,225,244,
-    245,236,225,244,233,239,238,240,225,242,229,110,128, 50, 55,242,
-    242,229,227,244,227,233,242,227,236,101,128, 50,163,101,  3,107,
-    213,107,225,107,242,225,242,244,232,240,225,242,229,110,128, 50,
-     47,238,244,229,242,240,242,233,243,229,240,225,242,229,110,128,
-     50, 61,248,227,229,236,236,229,238,244,227,233,242,227,236,101,
-    128, 50,157,102,  2,108,  9,108, 24,229,243,244,233,246,225,236,
-    240,225,242,229,110,128, 50, 64,105,  2,108, 30,108, 59,238,225,
-    238,227,233,225,108,  2,108, 42,108, 51,227,233,242,227,236,101,
-    128, 50,150,240,225,242,229,110,128, 50, 54,242,229,240,225,242,
-    229,110,128, 50, 43,104,  2,108, 75,108, 86,225,246,229,240,225,
-    242,229,110,128, 50, 50,233,231,232,227,233,242,227,236,101,128,
-     50,164,233,244,229,242,225,244,233,239,238,237,225,242,107,128,
-     48,  5,108,  3,108,122,108,148,108,160,225,226,239,114,  2,108,
-    131,108,140,227,233,242,227,236,101,128, 50,152,240,225,242,229,
-    110,128, 50, 56,229,230,244,227,233,242,227,236,101,128, 50,167,
-    239,247,227,233,242,227,236,101,128, 50,166,109,  2,108,177,108,
-    209,101,  2,108,183,108,198,228,233,227,233,238,229,227,233,242,
-    227,236,101,128, 50,169,244,225,236,240,225,242,229,110,128, 50,
-     46,239,239,238,240,225,242,229,110,128, 50, 42,238,225,237,229,
-    240,225,242,229,110,128, 50, 52,112,  2,108,238,108,246,229,242,
-    233,239,100,128, 48,  2,242,233,238,244,227,233,242,227,236,101,
-    128, 50,158,114,  2,109,  9,109, 57,101,  3,109, 17,109, 28,109,
-     43,225,227,232,240,225,242,229,110,128, 50, 67,240,242,229,243,
-    229,238,244,240,225,242,229,110,128, 50, 57,243,239,245,242,227,
-    229,240,225,242,229,110,128, 50, 62,233,231,232,244,227,233,242,
-    227,236,101,128, 50,168,115,  5,109, 82,109,111,109,125,109,150,
-    109,178,101,  2,109, 88,109,101,227,242,229,244,227,233,242,227,
-    236,101,128, 50,153,236,230,240,225,242,229,110,128, 50, 66,239,
-    227,233,229,244,249,240,225,242,229,110,128, 50, 51,112,  2,109,
-    131,109,137,225,227,101,128, 48,  0,229,227,233,225,236,240,225,
-    242,229,110,128, 50, 53,116,  2,109,156,109,167,239,227,235,240,
-    225,242,229,110,128, 50, 49,245,228,249,240,225,242,229,110,128,
-     50, 59,117,  2,109,184,109,193,238,240,225,242,229,110,128, 50,
-     48,240,229,242,246,233,243,229,240,225,242,229,110,128, 50, 60,
-    119,  2,109,214,109,226,225,244,229,242,240,225,242,229,110,128,
-     50, 44,239,239,228,240,225,242,229,110,128, 50, 45,250,229,242,
-    111,128, 48,  7,109,  2,109,250,110,  7,229,244,225,236,227,233,
-    242,227,236,101,128, 50,142,239,239,238,227,233,242,227,236,101,
-    128, 50,138,238,225,237,229,227,233,242,227,236,101,128, 50,148,
-    243,245,238,227,233,242,227,236,101,128, 50,144,119,  2,110, 50,
-    110, 63,225,244,229,242,227,233,242,227,236,101,128, 50,140,239,
-    239,228,227,233,242,227,236,101,128, 50,141,246, 97,128,  9,  7,
-    233,229,242,229,243,233,115,130,  0,239,110, 94,110,102,225,227,
-    245,244,101,128, 30, 47,227,249,242,233,236,236,233, 99,128,  4,
-    229,239,244,226,229,236,239,119,128, 30,203,101,  3,110,131,110,
-    147,110,158,226,242,229,246,229,227,249,242,233,236,236,233, 99,
-    128,  4,215,227,249,242,233,236,236,233, 99,128,  4, 53,245,238,
-    103,  4,110,170,110,205,110,220,110,229, 97,  2,110,176,110,191,
-    227,233,242,227,236,229,235,239,242,229,225,110,128, 50,117,240,
-    225,242,229,238,235,239,242,229,225,110,128, 50, 21,227,233,242,
-    227,236,229,235,239,242,229,225,110,128, 50,103,235,239,242,229,
-    225,110,128, 49, 71,240,225,242,229,238,235,239,242,229,225,110,
-    128, 50,  7,103,  2,110,249,111,  0,242,225,246,101,128,  0,236,
-    117,  2,111,  6,111, 15,234,225,242,225,244,105,128, 10,135,242,
-    237,245,235,232,105,128, 10,  7,104,  2,111, 30,111, 40,233,242,
-    225,231,225,238, 97,128, 48, 68,239,239,235,225,226,239,246,101,
-    128, 30,201,105,  8,111, 69,111, 79,111, 90,111, 97,111,122,111,
-    138,111,153,111,169,226,229,238,231,225,236,105,128,  9,136,227,
-    249,242,233,236,236,233, 99,128,  4, 56,228,229,246, 97,128,  9,
-      8,231,117,  2,111,104,111,113,234,225,242,225,244,105,128, 10,
-    136,242,237,245,235,232,105,128, 10,  8,237,225,244,242,225,231,
-    245,242,237,245,235,232,105,128, 10, 64,238,246,229,242,244,229,
-    228,226,242,229,246,101,128,  2, 11,243,232,239,242,244,227,249,
-    242,233,236,236,233, 99,128,  4, 57,246,239,247,229,236,243,233,
-    231,110,  3,111,185,111,195,111,202,226,229,238,231,225,236,105,
-    128,  9,192,228,229,246, 97,128,  9, 64,231,245,234,225,242,225,
-    244,105,128, 10,192,106,128,  1, 51,107,  2,111,223,111,247,225,
-    244,225,235,225,238, 97,129, 48,164,111,235,232,225,236,230,247,
-    233,228,244,104,128,255,114,239,242,229,225,110,128, 49, 99,108,
-      2,112,  5,112, 10,228,101,128,  2,220,245,249,232,229,226,242,
-    229,119,128,  5,172,109,  2,112, 27,112, 94, 97,  3,112, 35,112,
-     55,112, 80,227,242,239,110,129,  1, 43,112, 44,227,249,242,233,
-    236,236,233, 99,128,  4,227,231,229,239,242,225,240,240,242,239,
-    248,233,237,225,244,229,236,249,229,241,245,225,108,128, 34, 83,
-    244,242,225,231,245,242,237,245,235,232,105,128, 10, 63,239,238,
-    239,243,240,225,227,101,128,255, 73,110,  5,112,117,112,127,112,
-    136,112,148,112,232,227,242,229,237,229,238,116,128, 34,  6,230,
-    233,238,233,244,121,128, 34, 30,233,225,242,237,229,238,233,225,
-    110,128,  5,107,116,  2,112,154,112,222,101,  2,112,160,112,211,
-    231,242,225,108,131, 34, 43,112,173,112,191,112,196, 98,  2,112,
-    179,112,187,239,244,244,239,109,128, 35, 33,116,128, 35, 33,229,
-    120,128,248,245,116,  2,112,202,112,207,239,112,128, 35, 32,112,
-    128, 35, 32,242,243,229,227,244,233,239,110,128, 34, 41,233,243,
-    241,245,225,242,101,128, 51,  5,118,  3,112,240,112,249,113,  2,
-    226,245,236,236,229,116,128, 37,216,227,233,242,227,236,101,128,
-     37,217,243,237,233,236,229,230,225,227,101,128, 38, 59,111,  3,
-    113, 22,113, 33,113, 41,227,249,242,233,236,236,233, 99,128,  4,
-     81,231,239,238,229,107,128,  1, 47,244, 97,131,  3,185,113, 52,
-    113, 73,113, 81,228,233,229,242,229,243,233,115,129,  3,202,113,
-     65,244,239,238,239,115,128,  3,144,236,225,244,233,110,128,  2,
-    105,244,239,238,239,115,128,  3,175,240,225,242,229,110,128, 36,
-    164,242,233,231,245,242,237,245,235,232,105,128, 10,114,115,  4,
-    113,120,113,165,113,179,113,187,237,225,236,108,  2,113,129,113,
-    140,232,233,242,225,231,225,238, 97,128, 48, 67,235,225,244,225,
-    235,225,238, 97,129, 48,163,113,153,232,225,236,230,247,233,228,
-    244,104,128,255,104,243,232,225,242,226,229,238,231,225,236,105,
-    128,  9,250,244,242,239,235,101,128,  2,104,245,240,229,242,233,
-    239,114,128,246,237,116,  2,113,203,113,237,229,242,225,244,233,
-    239,110,  2,113,215,113,226,232,233,242,225,231,225,238, 97,128,
-     48,157,235,225,244,225,235,225,238, 97,128, 48,253,233,236,228,
-    101,129,  1, 41,113,246,226,229,236,239,119,128, 30, 45,117,  2,
-    114,  4,114, 15,226,239,240,239,237,239,230,111,128, 49, 41,227,
-    249,242,233,236,236,233, 99,128,  4, 78,246,239,247,229,236,243,
-    233,231,110,  3,114, 42,114, 52,114, 59,226,229,238,231,225,236,
-    105,128,  9,191,228,229,246, 97,128,  9, 63,231,245,234,225,242,
-    225,244,105,128, 10,191,250,232,233,244,243, 97,  2,114, 81,114,
-     92,227,249,242,233,236,236,233, 99,128,  4,117,228,226,236,231,
-    242,225,246,229,227,249,242,233,236,236,233, 99,128,  4,119,106,
-    138,  0,106,114,135,114,198,114,209,115,  3,115, 19,115,132,115,
-    201,115,206,115,218,115,226, 97,  4,114,145,114,156,114,166,114,
-    173,225,242,237,229,238,233,225,110,128,  5,113,226,229,238,231,
-    225,236,105,128,  9,156,228,229,246, 97,128,  9, 28,231,117,  2,
-    114,180,114,189,234,225,242,225,244,105,128, 10,156,242,237,245,
-    235,232,105,128, 10, 28,226,239,240,239,237,239,230,111,128, 49,
-     16, 99,  3,114,217,114,224,114,246,225,242,239,110,128,  1,240,
-    233,242, 99,  2,114,232,114,237,236,101,128, 36,217,245,237,230,
-    236,229,120,128,  1, 53,242,239,243,243,229,228,244,225,233,108,
-    128,  2,157,228,239,244,236,229,243,243,243,244,242,239,235,101,
-    128,  2, 95,101,  3,115, 27,115, 38,115,103,227,249,242,233,236,
-    236,233, 99,128,  4, 88,229,109,  4,115, 49,115, 58,115, 72,115,
-     88,225,242,225,226,233, 99,128,  6, 44,230,233,238,225,236,225,
-    242,225,226,233, 99,128,254,158,233,238,233,244,233,225,236,225,
-    242,225,226,233, 99,128,254,159,237,229,228,233,225,236,225,242,
-    225,226,233, 99,128,254,160,104,  2,115,109,115,118,225,242,225,
-    226,233, 99,128,  6,152,230,233,238,225,236,225,242,225,226,233,
-     99,128,251,139,104,  2,115,138,115,188, 97,  3,115,146,115,156,
-    115,163,226,229,238,231,225,236,105,128,  9,157,228,229,246, 97,
-    128,  9, 29,231,117,  2,115,170,115,179,234,225,242,225,244,105,
-    128, 10,157,242,237,245,235,232,105,128, 10, 29,229,232,225,242,
-    237,229,238,233,225,110,128,  5,123,233,115,128, 48,  4,237,239,
-    238,239,243,240,225,227,101,128,255, 74,240,225,242,229,110,128,
-     36,165,243,245,240,229,242,233,239,114,128,  2,178,107,146,  0,
-    107,116, 21,118,110,118,121,118,183,118,194,119, 28,119, 42,120,
-    150,121, 90,121,103,121,129,121,178,122, 60,122, 82,122, 95,122,
-    118,122,160,122,170, 97, 12,116, 47,116, 79,116,101,116,131,116,
-    245,117, 14,117, 44,117, 69,117,175,117,189,118, 56,118, 85, 98,
-      2,116, 53,116, 70,225,243,232,235,233,242,227,249,242,233,236,
-    236,233, 99,128,  4,161,229,238,231,225,236,105,128,  9,149, 99,
-      2,116, 85,116, 91,245,244,101,128, 30, 49,249,242,233,236,236,
-    233, 99,128,  4, 58,228,101,  2,116,108,116,126,243,227,229,238,
-    228,229,242,227,249,242,233,236,236,233, 99,128,  4,155,246, 97,
-    128,  9, 21,102,135,  5,219,116,149,116,158,116,178,116,192,116,
-    201,116,217,116,232,225,242,225,226,233, 99,128,  6, 67,228,225,
-    231,229,243,104,129,251, 59,116,169,232,229,226,242,229,119,128,
-    251, 59,230,233,238,225,236,225,242,225,226,233, 99,128,254,218,
-    232,229,226,242,229,119,128,  5,219,233,238,233,244,233,225,236,
-    225,242,225,226,233, 99,128,254,219,237,229,228,233,225,236,225,
-    242,225,226,233, 99,128,254,220,242,225,230,229,232,229,226,242,
-    229,119,128,251, 77,231,117,  2,116,252,117,  5,234,225,242,225,
-    244,105,128, 10,149,242,237,245,235,232,105,128, 10, 21,104,  2,
-    117, 20,117, 30,233,242,225,231,225,238, 97,128, 48, 75,239,239,
-    235,227,249,242,233,236,236,233, 99,128,  4,196,235,225,244,225,
-    235,225,238, 97,129, 48,171,117, 57,232,225,236,230,247,233,228,
-    244,104,128,255,118,112,  2,117, 75,117, 96,240, 97,129,  3,186,
-    117, 82,243,249,237,226,239,236,231,242,229,229,107,128,  3,240,
-    249,229,239,245,110,  3,117,108,117,122,117,156,237,233,229,245,
-    237,235,239,242,229,225,110,128, 49,113,112,  2,117,128,117,143,
-    232,233,229,245,240,232,235,239,242,229,225,110,128, 49,132,233,
-    229,245,240,235,239,242,229,225,110,128, 49,120,243,243,225,238,
-    231,240,233,229,245,240,235,239,242,229,225,110,128, 49,121,242,
-    239,242,233,233,243,241,245,225,242,101,128, 51, 13,115,  5,117,
-    201,117,245,118,  4,118, 12,118, 40,232,233,228,225,225,245,244,
-    111,  2,117,214,117,223,225,242,225,226,233, 99,128,  6, 64,238,
-    239,243,233,228,229,226,229,225,242,233,238,231,225,242,225,226,
-    233, 99,128,  6, 64,237,225,236,236,235,225,244,225,235,225,238,
-     97,128, 48,245,241,245,225,242,101,128, 51,132,242, 97,  2,118,
-     19,118, 28,225,242,225,226,233, 99,128,  6, 80,244,225,238,225,
-    242,225,226,233, 99,128,  6, 77,244,242,239,235,229,227,249,242,
-    233,236,236,233, 99,128,  4,159,244,225,232,233,242,225,240,242,
-    239,236,239,238,231,237,225,242,235,232,225,236,230,247,233,228,
-    244,104,128,255,112,246,229,242,244,233,227,225,236,243,244,242,
-    239,235,229,227,249,242,233,236,236,233, 99,128,  4,157,226,239,
-    240,239,237,239,230,111,128, 49, 14, 99,  4,118,131,118,153,118,
-    162,118,170, 97,  2,118,137,118,147,236,243,241,245,225,242,101,
-    128, 51,137,242,239,110,128,  1,233,229,228,233,236,236, 97,128,
-      1, 55,233,242,227,236,101,128, 36,218,239,237,237,225,225,227,
-    227,229,238,116,128,  1, 55,228,239,244,226,229,236,239,119,128,
-     30, 51,101,  4,118,204,118,231,119,  0,119, 12,104,  2,118,210,
-    118,221,225,242,237,229,238,233,225,110,128,  5,132,233,242,225,
-    231,225,238, 97,128, 48, 81,235,225,244,225,235,225,238, 97,129,
-     48,177,118,244,232,225,236,230,247,233,228,244,104,128,255,121,
-    238,225,242,237,229,238,233,225,110,128,  5,111,243,237,225,236,
-    236,235,225,244,225,235,225,238, 97,128, 48,246,231,242,229,229,
-    238,236,225,238,228,233, 99,128,  1, 56,104,  6,119, 56,119,185,
-    119,196,119,221,120, 52,120,140, 97,  5,119, 68,119, 78,119, 89,
-    119, 96,119,121,226,229,238,231,225,236,105,128,  9,150,227,249,
-    242,233,236,236,233, 99,128,  4, 69,228,229,246, 97,128,  9, 22,
-    231,117,  2,119,103,119,112,234,225,242,225,244,105,128, 10,150,
-    242,237,245,235,232,105,128, 10, 22,104,  4,119,131,119,140,119,
-    154,119,170,225,242,225,226,233, 99,128,  6, 46,230,233,238,225,
-    236,225,242,225,226,233, 99,128,254,166,233,238,233,244,233,225,
-    236,225,242,225,226,233, 99,128,254,167,237,229,228,233,225,236,
-    225,242,225,226,233, 99,128,254,168,229,233,227,239,240,244,233,
-     99,128,  3,231,232, 97,  2,119,203,119,210,228,229,246, 97,128,
-      9, 89,231,245,242,237,245,235,232,105,128, 10, 89,233,229,245,
-    235,104,  4,119,235,120, 14,120, 29,120, 38, 97,  2,119,241,120,
-      0,227,233,242,227,236,229,235,239,242,229,225,110,128, 50,120,
-    240,225,242,229,238,235,239,242,229,225,110,128, 50, 24,227,233,
-    242,227,236,229,235,239,242,229,225,110,128, 50,106,235,239,242,
-    229,225,110,128, 49, 75,240,225,242,229,238,235,239,242,229,225,
-    110,128, 50, 10,111,  4,120, 62,120,111,120,121,120,126,235,104,
-      4,120, 73,120, 82,120, 91,120,101,225,233,244,232,225,105,128,
-     14,  2,239,238,244,232,225,105,128, 14,  5,245,225,244,244,232,
-    225,105,128, 14,  3,247,225,233,244,232,225,105,128, 14,  4,237,
-    245,244,244,232,225,105,128, 14, 91,239,107,128,  1,153,242,225,
-    235,232,225,238,231,244,232,225,105,128, 14,  6,250,243,241,245,
-    225,242,101,128, 51,145,105,  4,120,160,120,171,120,196,120,245,
-    232,233,242,225,231,225,238, 97,128, 48, 77,235,225,244,225,235,
-    225,238, 97,129, 48,173,120,184,232,225,236,230,247,233,228,244,
-    104,128,255,119,242,111,  3,120,205,120,220,120,236,231,245,242,
-    225,237,245,243,241,245,225,242,101,128, 51, 21,237,229,229,244,
-    239,242,245,243,241,245,225,242,101,128, 51, 22,243,241,245,225,
-    242,101,128, 51, 20,249,229,239,107,  5,121,  4,121, 39,121, 54,
-    121, 63,121, 77, 97,  2,121, 10,121, 25,227,233,242,227,236,229,
-    235,239,242,229,225,110,128, 50,110,240,225,242,229,238,235,239,
-    242,229,225,110,128, 50, 14,227,233,242,227,236,229,235,239,242,
-    229,225,110,128, 50, 96,235,239,242,229,225,110,128, 49, 49,240,
-    225,242,229,238,235,239,242,229,225,110,128, 50,  0,243,233,239,
-    243,235,239,242,229,225,110,128, 49, 51,234,229,227,249,242,233,
-    236,236,233, 99,128,  4, 92,108,  2,121,109,121,120,233,238,229,
-    226,229,236,239,119,128, 30, 53,243,241,245,225,242,101,128, 51,
-    152,109,  3,121,137,121,151,121,162,227,245,226,229,228,243,241,
-    245,225,242,101,128, 51,166,239,238,239,243,240,225,227,101,128,
-    255, 75,243,241,245,225,242,229,228,243,241,245,225,242,101,128,
-     51,162,111,  5,121,190,121,216,121,254,122, 10,122, 24,104,  2,
-    121,196,121,206,233,242,225,231,225,238, 97,128, 48, 83,237,243,
-    241,245,225,242,101,128, 51,192,235, 97,  2,121,223,121,231,233,
-    244,232,225,105,128, 14,  1,244,225,235,225,238, 97,129, 48,179,
-    121,242,232,225,236,230,247,233,228,244,104,128,255,122,239,240,
-    239,243,241,245,225,242,101,128, 51, 30,240,240,225,227,249,242,
-    233,236,236,233, 99,128,  4,129,114,  2,122, 30,122, 50,229,225,
-    238,243,244,225,238,228,225,242,228,243,249,237,226,239,108,128,
-     50,127,239,238,233,243,227,237, 98,128,  3, 67,240, 97,  2,122,
-     67,122, 73,242,229,110,128, 36,166,243,241,245,225,242,101,128,
-     51,170,243,233,227,249,242,233,236,236,233, 99,128,  4,111,116,
-      2,122,101,122,110,243,241,245,225,242,101,128, 51,207,245,242,
-    238,229,100,128,  2,158,117,  2,122,124,122,135,232,233,242,225,
-    231,225,238, 97,128, 48, 79,235,225,244,225,235,225,238, 97,129,
-     48,175,122,148,232,225,236,230,247,233,228,244,104,128,255,120,
-    246,243,241,245,225,242,101,128, 51,184,247,243,241,245,225,242,
-    101,128, 51,190,108,146,  0,108,122,220,124,247,125, 20,125, 86,
-    125,124,126, 20,126, 29,126, 45,126, 69,126, 87,126,205,126,246,
-    127,125,127,133,127,166,127,175,127,183,127,245, 97,  7,122,236,
-    122,246,122,253,123,  4,123, 29,123, 45,124,235,226,229,238,231,
-    225,236,105,128,  9,178,227,245,244,101,128,  1, 58,228,229,246,
-     97,128,  9, 50,231,117,  2,123, 11,123, 20,234,225,242,225,244,
-    105,128, 10,178,242,237,245,235,232,105,128, 10, 50,235,235,232,
-    225,238,231,249,225,239,244,232,225,105,128, 14, 69,109, 10,123,
-     67,124,  6,124, 23,124, 61,124, 75,124, 94,124,110,124,130,124,
-    150,124,173, 97,  2,123, 73,123,254,236,229,102,  4,123, 85,123,
-     99,123,191,123,208,230,233,238,225,236,225,242,225,226,233, 99,
-    128,254,252,232,225,237,250, 97,  2,123,109,123,150,225,226,239,
-    246,101,  2,123,119,123,133,230,233,238,225,236,225,242,225,226,
-    233, 99,128,254,248,233,243,239,236,225,244,229,228,225,242,225,
-    226,233, 99,128,254,247,226,229,236,239,119,  2,123,160,123,174,
-    230,233,238,225,236,225,242,225,226,233, 99,128,254,250,233,243,
-    239,236,225,244,229,228,225,242,225,226,233, 99,128,254,249,233,
-    243,239,236,225,244,229,228,225,242,225,226,233, 99,128,254,251,
-    237,225,228,228,225,225,226,239,246,101,  2,123,223,123,237,230,
-    233,238,225,236,225,242,225,226,233, 99,128,254,246,233,243,239,
-    236,225,244,229,228,225,242,225,226,233, 99,128,254,245,242,225,
-    226,233, 99,128,  6, 68,226,228, 97,129,  3,187,124, 14,243,244,
-    242,239,235,101,128,  1,155,229,100,130,  5,220,124, 32,124, 52,
-    228,225,231,229,243,104,129,251, 60,124, 43,232,229,226,242,229,
-    119,128,251, 60,232,229,226,242,229,119,128,  5,220,230,233,238,
-    225,236,225,242,225,226,233, 99,128,254,222,232,225,232,233,238,
-    233,244,233,225,236,225,242,225,226,233, 99,128,252,202,233,238,
-    233,244,233,225,236,225,242,225,226,233, 99,128,254,223,234,229,
-    229,237,233,238,233,244,233,225,236,225,242,225,226,233, 99,128,
-    252,201,235,232,225,232,233,238,233,244,233,225,236,225,242,225,
-    226,233, 99,128,252,203,236,225,237,232,229,232,233,243,239,236,
-    225,244,229,228,225,242,225,226,233, 99,128,253,242,237,101,  2,
-    124,180,124,193,228,233,225,236,225,242,225,226,233, 99,128,254,
-    224,229,109,  2,124,200,124,219,232,225,232,233,238,233,244,233,
-    225,236,225,242,225,226,233, 99,128,253,136,233,238,233,244,233,
-    225,236,225,242,225,226,233, 99,128,252,204,242,231,229,227,233,
-    242,227,236,101,128, 37,239, 98,  3,124,255,125,  4,125, 10,225,
-    114,128,  1,154,229,236,116,128,  2,108,239,240,239,237,239,230,
-    111,128, 49, 12, 99,  4,125, 30,125, 37,125, 46,125, 73,225,242,
-    239,110,128,  1, 62,229,228,233,236,236, 97,128,  1, 60,233,242,
-     99,  2,125, 54,125, 59,236,101,128, 36,219,245,237,230,236,229,
-    248,226,229,236,239,119,128, 30, 61,239,237,237,225,225,227,227,
-    229,238,116,128,  1, 60,228,239,116,130,  1, 64,125, 96,125,105,
-    225,227,227,229,238,116,128,  1, 64,226,229,236,239,119,129, 30,
-     55,125,115,237,225,227,242,239,110,128, 30, 57,101,  3,125,132,
-    125,170,126, 15,230,116,  2,125,139,125,155,225,238,231,236,229,
-    225,226,239,246,229,227,237, 98,128,  3, 26,244,225,227,235,226,
-    229,236,239,247,227,237, 98,128,  3, 24,243,115,132,  0, 60,125,
-    183,125,205,125,217,126,  7,229,241,245,225,108,129, 34,100,125,
-    193,239,242,231,242,229,225,244,229,114,128, 34,218,237,239,238,
-    239,243,240,225,227,101,128,255, 28,111,  2,125,223,125,252,114,
-      2,125,229,125,242,229,241,245,233,246,225,236,229,238,116,128,
-     34,114,231,242,229,225,244,229,114,128, 34,118,246,229,242,229,
-    241,245,225,108,128, 34,102,243,237,225,236,108,128,254,100,250,
-    104,128,  2,110,230,226,236,239,227,107,128, 37,140,232,239,239,
-    235,242,229,244,242,239,230,236,229,120,128,  2,109,105,  2,126,
-     51,126, 56,242, 97,128, 32,164,247,238,225,242,237,229,238,233,
-    225,110,128,  5,108,106,129,  1,201,126, 75,229,227,249,242,233,
-    236,236,233, 99,128,  4, 89,108,132,246,192,126, 99,126,123,126,
-    134,126,143, 97,  2,126,105,126,112,228,229,246, 97,128,  9, 51,
-    231,245,234,225,242,225,244,105,128, 10,179,233,238,229,226,229,
-    236,239,119,128, 30, 59,236,225,228,229,246, 97,128,  9, 52,246,
-    239,227,225,236,233, 99,  3,126,157,126,167,126,174,226,229,238,
-    231,225,236,105,128,  9,225,228,229,246, 97,128,  9, 97,246,239,
-    247,229,236,243,233,231,110,  2,126,188,126,198,226,229,238,231,
-    225,236,105,128,  9,227,228,229,246, 97,128,  9, 99,109,  3,126,
-    213,126,226,126,237,233,228,228,236,229,244,233,236,228,101,128,
-      2,107,239,238,239,243,240,225,227,101,128,255, 76,243,241,245,
-    225,242,101,128, 51,208,111,  6,127,  4,127, 16,127, 58,127, 69,
-    127, 75,127,117,227,232,245,236,225,244,232,225,105,128, 14, 44,
-    231,233,227,225,108,  3,127, 28,127, 34,127, 53,225,238,100,128,
-     34, 39,238,239,116,129,  0,172,127, 42,242,229,246,229,242,243,
-    229,100,128, 35, 16,239,114,128, 34, 40,236,233,238,231,244,232,
-    225,105,128, 14, 37,238,231,115,128,  1,127,247,236,233,238,101,
-      2,127, 85,127,108, 99,  2,127, 91,127,103,229,238,244,229,242,
-    236,233,238,101,128,254, 78,237, 98,128,  3, 50,228,225,243,232,
-    229,100,128,254, 77,250,229,238,231,101,128, 37,202,240,225,242,
-    229,110,128, 36,167,115,  3,127,141,127,148,127,156,236,225,243,
-    104,128,  1, 66,241,245,225,242,101,128, 33, 19,245,240,229,242,
-    233,239,114,128,246,238,244,243,232,225,228,101,128, 37,145,245,
-    244,232,225,105,128, 14, 38,246,239,227,225,236,233, 99,  3,127,
-    197,127,207,127,214,226,229,238,231,225,236,105,128,  9,140,228,
-    229,246, 97,128,  9, 12,246,239,247,229,236,243,233,231,110,  2,
-    127,228,127,238,226,229,238,231,225,236,105,128,  9,226,228,229,
-    246, 97,128,  9, 98,248,243,241,245,225,242,101,128, 51,211,109,
-    144,  0,109,128, 35,130,144,130,169,130,196,130,221,132, 18,132,
-     40,133, 95,133,125,133,174,134, 25,134, 47,134, 72,134, 81,135,
-    108,135,136, 97, 12,128, 61,128, 71,128,135,128,142,128,167,128,
-    215,130, 51,130, 76,130, 81,130, 95,130,107,130,112,226,229,238,
-    231,225,236,105,128,  9,174, 99,  2,128, 77,128,129,242,239,110,
-    132,  0,175,128, 91,128,102,128,108,128,117,226,229,236,239,247,
-    227,237, 98,128,  3, 49,227,237, 98,128,  3,  4,236,239,247,237,
-    239,100,128,  2,205,237,239,238,239,243,240,225,227,101,128,255,
-    227,245,244,101,128, 30, 63,228,229,246, 97,128,  9, 46,231,117,
-      2,128,149,128,158,234,225,242,225,244,105,128, 10,174,242,237,
-    245,235,232,105,128, 10, 46,104,  2,128,173,128,205,225,240,225,
-    235,104,  2,128,183,128,192,232,229,226,242,229,119,128,  5,164,
-    236,229,230,244,232,229,226,242,229,119,128,  5,164,233,242,225,
-    231,225,238, 97,128, 48,126,105,  5,128,227,129, 40,129,103,129,
-    133,130, 39,227,232,225,244,244,225,247, 97,  3,128,242,129, 17,
-    129, 24,236,239,119,  2,128,250,129,  5,236,229,230,244,244,232,
-    225,105,128,248,149,242,233,231,232,244,244,232,225,105,128,248,
-    148,244,232,225,105,128, 14, 75,245,240,240,229,242,236,229,230,
-    244,244,232,225,105,128,248,147,229,107,  3,129, 49,129, 80,129,
-     87,236,239,119,  2,129, 57,129, 68,236,229,230,244,244,232,225,
-    105,128,248,140,242,233,231,232,244,244,232,225,105,128,248,139,
-    244,232,225,105,128, 14, 72,245,240,240,229,242,236,229,230,244,
-    244,232,225,105,128,248,138,232,225,238,225,235,225,116,  2,129,
-    115,129,126,236,229,230,244,244,232,225,105,128,248,132,244,232,
-    225,105,128, 14, 49,116,  3,129,141,129,169,129,232,225,233,235,
-    232,117,  2,129,151,129,162,236,229,230,244,244,232,225,105,128,
-    248,137,244,232,225,105,128, 14, 71,232,111,  3,129,178,129,209,
-    129,216,236,239,119,  2,129,186,129,197,236,229,230,244,244,232,
-    225,105,128,248,143,242,233,231,232,244,244,232,225,105,128,248,
-    142,244,232,225,105,128, 14, 73,245,240,240,229,242,236,229,230,
-    244,244,232,225,105,128,248,141,242,105,  3,129,241,130, 16,130,
-     23,236,239,119,  2,129,249,130,  4,236,229,230,244,244,232,225,
-    105,128,248,146,242,233,231,232,244,244,232,225,105,128,248,145,
-    244,232,225,105,128, 14, 74,245,240,240,229,242,236,229,230,244,
-    244,232,225,105,128,248,144,249,225,237,239,235,244,232,225,105,
-    128, 14, 70,235,225,244,225,235,225,238, 97,129, 48,222,130, 64,
-    232,225,236,230,247,233,228,244,104,128,255,143,236,101,128, 38,
-     66,238,243,249,239,238,243,241,245,225,242,101,128, 51, 71,241,
-    225,230,232,229,226,242,229,119,128,  5,190,242,115,128, 38, 66,
-    115,  2,130,118,130,136,239,242,225,227,233,242,227,236,229,232,
-    229,226,242,229,119,128,  5,175,241,245,225,242,101,128, 51,131,
-     98,  2,130,150,130,160,239,240,239,237,239,230,111,128, 49,  7,
-    243,241,245,225,242,101,128, 51,212, 99,  2,130,175,130,183,233,
-    242,227,236,101,128, 36,220,245,226,229,228,243,241,245,225,242,
-    101,128, 51,165,228,239,116,  2,130,204,130,213,225,227,227,229,
-    238,116,128, 30, 65,226,229,236,239,119,128, 30, 67,101,  7,130,
-    237,131,108,131,119,131,134,131,159,131,196,131,208,101,  2,130,
-    243,131, 95,109,  4,130,253,131,  6,131, 20,131, 36,225,242,225,
-    226,233, 99,128,  6, 69,230,233,238,225,236,225,242,225,226,233,
-     99,128,254,226,233,238,233,244,233,225,236,225,242,225,226,233,
-     99,128,254,227,237,101,  2,131, 43,131, 56,228,233,225,236,225,
-    242,225,226,233, 99,128,254,228,229,237,105,  2,131, 64,131, 79,
-    238,233,244,233,225,236,225,242,225,226,233, 99,128,252,209,243,
-    239,236,225,244,229,228,225,242,225,226,233, 99,128,252, 72,244,
-    239,242,245,243,241,245,225,242,101,128, 51, 77,232,233,242,225,
-    231,225,238, 97,128, 48,129,233,250,233,229,242,225,243,241,245,
-    225,242,101,128, 51,126,235,225,244,225,235,225,238, 97,129, 48,
-    225,131,147,232,225,236,230,247,233,228,244,104,128,255,146,109,
-    130,  5,222,131,167,131,187,228,225,231,229,243,104,129,251, 62,
-    131,178,232,229,226,242,229,119,128,251, 62,232,229,226,242,229,
-    119,128,  5,222,238,225,242,237,229,238,233,225,110,128,  5,116,
-    242,235,232, 97,  3,131,219,131,228,132,  5,232,229,226,242,229,
-    119,128,  5,165,235,229,230,245,236, 97,  2,131,239,131,248,232,
-    229,226,242,229,119,128,  5,166,236,229,230,244,232,229,226,242,
-    229,119,128,  5,166,236,229,230,244,232,229,226,242,229,119,128,
-      5,165,104,  2,132, 24,132, 30,239,239,107,128,  2,113,250,243,
-    241,245,225,242,101,128, 51,146,105,  6,132, 54,132, 91,132,228,
-    132,239,133,  8,133, 65,228,100,  2,132, 61,132, 86,236,229,228,
-    239,244,235,225,244,225,235,225,238,225,232,225,236,230,247,233,
-    228,244,104,128,255,101,239,116,128,  0,183,229,245,109,  5,132,
-    105,132,140,132,155,132,164,132,215, 97,  2,132,111,132,126,227,
-    233,242,227,236,229,235,239,242,229,225,110,128, 50,114,240,225,
-    242,229,238,235,239,242,229,225,110,128, 50, 18,227,233,242,227,
-    236,229,235,239,242,229,225,110,128, 50,100,235,239,242,229,225,
-    110,128, 49, 65,112,  2,132,170,132,202, 97,  2,132,176,132,190,
-    238,243,233,239,243,235,239,242,229,225,110,128, 49,112,242,229,
-    238,235,239,242,229,225,110,128, 50,  4,233,229,245,240,235,239,
-    242,229,225,110,128, 49,110,243,233,239,243,235,239,242,229,225,
-    110,128, 49,111,232,233,242,225,231,225,238, 97,128, 48,127,235,
-    225,244,225,235,225,238, 97,129, 48,223,132,252,232,225,236,230,
-    247,233,228,244,104,128,255,144,238,117,  2,133, 15,133, 60,115,
-    132, 34, 18,133, 27,133, 38,133, 47,133, 53,226,229,236,239,247,
-    227,237, 98,128,  3, 32,227,233,242,227,236,101,128, 34,150,237,
-    239,100,128,  2,215,240,236,245,115,128, 34, 19,244,101,128, 32,
-     50,242,105,  2,133, 72,133, 86,226,225,225,242,245,243,241,245,
-    225,242,101,128, 51, 74,243,241,245,225,242,101,128, 51, 73,108,
-      2,133,101,133,116,239,238,231,236,229,231,244,245,242,238,229,
-    100,128,  2,112,243,241,245,225,242,101,128, 51,150,109,  3,133,
-    133,133,147,133,158,227,245,226,229,228,243,241,245,225,242,101,
-    128, 51,163,239,238,239,243,240,225,227,101,128,255, 77,243,241,
-    245,225,242,229,228,243,241,245,225,242,101,128, 51,159,111,  5,
-    133,186,133,212,133,237,133,247,134,  0,104,  2,133,192,133,202,
-    233,242,225,231,225,238, 97,128, 48,130,237,243,241,245,225,242,
-    101,128, 51,193,235,225,244,225,235,225,238, 97,129, 48,226,133,
-    225,232,225,236,230,247,233,228,244,104,128,255,147,236,243,241,
-    245,225,242,101,128, 51,214,237,225,244,232,225,105,128, 14, 33,
-    246,229,242,243,243,241,245,225,242,101,129, 51,167,134, 15,228,
-    243,241,245,225,242,101,128, 51,168,240, 97,  2,134, 32,134, 38,
-    242,229,110,128, 36,168,243,241,245,225,242,101,128, 51,171,115,
-      2,134, 53,134, 62,243,241,245,225,242,101,128, 51,179,245,240,
-    229,242,233,239,114,128,246,239,244,245,242,238,229,100,128,  2,
-    111,117,141,  0,181,134,111,134,115,134,125,134,149,134,159,134,
-    181,134,192,134,217,134,240,134,250,135, 24,135, 88,135, 98, 49,
-    128,  0,181,225,243,241,245,225,242,101,128, 51,130,227,104,  2,
-    134,132,134,142,231,242,229,225,244,229,114,128, 34,107,236,229,
-    243,115,128, 34,106,230,243,241,245,225,242,101,128, 51,140,103,
-      2,134,165,134,172,242,229,229,107,128,  3,188,243,241,245,225,
-    242,101,128, 51,141,232,233,242,225,231,225,238, 97,128, 48,128,
-    235,225,244,225,235,225,238, 97,129, 48,224,134,205,232,225,236,
-    230,247,233,228,244,104,128,255,145,108,  2,134,223,134,232,243,
-    241,245,225,242,101,128, 51,149,244,233,240,236,121,128,  0,215,
-    237,243,241,245,225,242,101,128, 51,155,238,225,104,  2,135,  2,
-    135, 11,232,229,226,242,229,119,128,  5,163,236,229,230,244,232,
-    229,226,242,229,119,128,  5,163,115,  2,135, 30,135, 79,233, 99,
-      3,135, 39,135, 56,135, 67,225,236,238,239,244,101,129, 38,106,
-    135, 50,228,226,108,128, 38,107,230,236,225,244,243,233,231,110,
-    128, 38,109,243,232,225,242,240,243,233,231,110,128, 38,111,243,
-    241,245,225,242,101,128, 51,178,246,243,241,245,225,242,101,128,
-     51,182,247,243,241,245,225,242,101,128, 51,188,118,  2,135,114,
-    135,127,237,229,231,225,243,241,245,225,242,101,128, 51,185,243,
-    241,245,225,242,101,128, 51,183,119,  2,135,142,135,155,237,229,
-    231,225,243,241,245,225,242,101,128, 51,191,243,241,245,225,242,
-    101,128, 51,189,110,150,  0,110,135,212,136, 90,136,114,136,180,
-    136,205,137,  7,137, 17,137, 84,137,127,139,161,139,179,139,204,
-    139,235,140,  5,140, 70,142, 52,142, 60,142, 85,142, 93,143, 61,
-    143, 71,143, 81, 97,  8,135,230,135,250,136,  1,136,  8,136, 33,
-    136, 44,136, 69,136, 81, 98,  2,135,236,135,245,229,238,231,225,
-    236,105,128,  9,168,236, 97,128, 34,  7,227,245,244,101,128,  1,
-     68,228,229,246, 97,128,  9, 40,231,117,  2,136, 15,136, 24,234,
-    225,242,225,244,105,128, 10,168,242,237,245,235,232,105,128, 10,
-     40,232,233,242,225,231,225,238, 97,128, 48,106,235,225,244,225,
-    235,225,238, 97,129, 48,202,136, 57,232,225,236,230,247,233,228,
-    244,104,128,255,133,240,239,243,244,242,239,240,232,101,128,  1,
-     73,243,241,245,225,242,101,128, 51,129, 98,  2,136, 96,136,106,
-    239,240,239,237,239,230,111,128, 49, 11,243,240,225,227,101,128,
-      0,160, 99,  4,136,124,136,131,136,140,136,167,225,242,239,110,
-    128,  1, 72,229,228,233,236,236, 97,128,  1, 70,233,242, 99,  2,
-    136,148,136,153,236,101,128, 36,221,245,237,230,236,229,248,226,
-    229,236,239,119,128, 30, 75,239,237,237,225,225,227,227,229,238,
-    116,128,  1, 70,228,239,116,  2,136,188,136,197,225,227,227,229,
-    238,116,128, 30, 69,226,229,236,239,119,128, 30, 71,101,  3,136,
-    213,136,224,136,249,232,233,242,225,231,225,238, 97,128, 48,109,
-    235,225,244,225,235,225,238, 97,129, 48,205,136,237,232,225,236,
-    230,247,233,228,244,104,128,255,136,247,243,232,229,241,229,236,
-    243,233,231,110,128, 32,170,230,243,241,245,225,242,101,128, 51,
-    139,103,  2,137, 23,137, 73, 97,  3,137, 31,137, 41,137, 48,226,
-    229,238,231,225,236,105,128,  9,153,228,229,246, 97,128,  9, 25,
-    231,117,  2,137, 55,137, 64,234,225,242,225,244,105,128, 10,153,
-    242,237,245,235,232,105,128, 10, 25,239,238,231,245,244,232,225,
-    105,128, 14,  7,104,  2,137, 90,137,100,233,242,225,231,225,238,
-     97,128, 48,147,239,239,107,  2,137,108,137,115,236,229,230,116,
-    128,  2,114,242,229,244,242,239,230,236,229,120,128,  2,115,105,
-      4,137,137,138, 50,138, 61,138,119,229,245,110,  7,137,155,137,
-    190,137,222,137,236,137,245,138, 22,138, 35, 97,  2,137,161,137,
-    176,227,233,242,227,236,229,235,239,242,229,225,110,128, 50,111,
-    240,225,242,229,238,235,239,242,229,225,110,128, 50, 15,227,105,
-      2,137,197,137,209,229,245,227,235,239,242,229,225,110,128, 49,
-     53,242,227,236,229,235,239,242,229,225,110,128, 50, 97,232,233,
-    229,245,232,235,239,242,229,225,110,128, 49, 54,235,239,242,229,
-    225,110,128, 49, 52,240, 97,  2,137,252,138, 10,238,243,233,239,
-    243,235,239,242,229,225,110,128, 49,104,242,229,238,235,239,242,
-    229,225,110,128, 50,  1,243,233,239,243,235,239,242,229,225,110,
-    128, 49,103,244,233,235,229,245,244,235,239,242,229,225,110,128,
-     49,102,232,233,242,225,231,225,238, 97,128, 48,107,107,  2,138,
-     67,138, 91,225,244,225,235,225,238, 97,129, 48,203,138, 79,232,
-    225,236,230,247,233,228,244,104,128,255,134,232,225,232,233,116,
-      2,138,101,138,112,236,229,230,244,244,232,225,105,128,248,153,
-    244,232,225,105,128, 14, 77,238,101,141,  0, 57,138,150,138,159,
-    138,169,138,199,138,206,138,231,139,  2,139, 36,139, 48,139, 59,
-    139, 92,139,100,139,111,225,242,225,226,233, 99,128,  6,105,226,
-    229,238,231,225,236,105,128,  9,239,227,233,242,227,236,101,129,
-     36,104,138,180,233,238,246,229,242,243,229,243,225,238,243,243,
-    229,242,233,102,128, 39,146,228,229,246, 97,128,  9,111,231,117,
-      2,138,213,138,222,234,225,242,225,244,105,128, 10,239,242,237,
-    245,235,232,105,128, 10,111,232, 97,  2,138,238,138,249,227,235,
-    225,242,225,226,233, 99,128,  6,105,238,231,250,232,239,117,128,
-     48, 41,105,  2,139,  8,139, 26,228,229,239,231,242,225,240,232,
-    233,227,240,225,242,229,110,128, 50, 40,238,230,229,242,233,239,
-    114,128, 32,137,237,239,238,239,243,240,225,227,101,128,255, 25,
-    239,236,228,243,244,249,236,101,128,247, 57,112,  2,139, 65,139,
-     72,225,242,229,110,128, 36,124,229,114,  2,139, 79,139, 85,233,
-    239,100,128, 36,144,243,233,225,110,128,  6,249,242,239,237,225,
-    110,128, 33,120,243,245,240,229,242,233,239,114,128, 32,121,116,
-      2,139,117,139,155,229,229,110,  2,139,125,139,134,227,233,242,
-    227,236,101,128, 36,114,112,  2,139,140,139,147,225,242,229,110,
-    128, 36,134,229,242,233,239,100,128, 36,154,232,225,105,128, 14,
-     89,106,129,  1,204,139,167,229,227,249,242,233,236,236,233, 99,
-    128,  4, 90,235,225,244,225,235,225,238, 97,129, 48,243,139,192,
-    232,225,236,230,247,233,228,244,104,128,255,157,108,  2,139,210,
-    139,224,229,231,242,233,231,232,244,236,239,238,103,128,  1,158,
-    233,238,229,226,229,236,239,119,128, 30, 73,109,  2,139,241,139,
-    252,239,238,239,243,240,225,227,101,128,255, 78,243,241,245,225,
-    242,101,128, 51,154,110,  2,140, 11,140, 61, 97,  3,140, 19,140,
-     29,140, 36,226,229,238,231,225,236,105,128,  9,163,228,229,246,
-     97,128,  9, 35,231,117,  2,140, 43,140, 52,234,225,242,225,244,
-    105,128, 10,163,242,237,245,235,232,105,128, 10, 35,238,225,228,
-    229,246, 97,128,  9, 41,111,  6,140, 84,140, 95,140,120,140,161,
-    141,113,142, 40,232,233,242,225,231,225,238, 97,128, 48,110,235,
-    225,244,225,235,225,238, 97,129, 48,206,140,108,232,225,236,230,
-    247,233,228,244,104,128,255,137,110,  3,140,128,140,144,140,153,
-    226,242,229,225,235,233,238,231,243,240,225,227,101,128,  0,160,
-    229,238,244,232,225,105,128, 14, 19,245,244,232,225,105,128, 14,
-     25,239,110,  7,140,178,140,187,140,201,140,235,140,251,141, 36,
-    141, 95,225,242,225,226,233, 99,128,  6, 70,230,233,238,225,236,
-    225,242,225,226,233, 99,128,254,230,231,232,245,238,238, 97,  2,
-    140,212,140,221,225,242,225,226,233, 99,128,  6,186,230,233,238,
-    225,236,225,242,225,226,233, 99,128,251,159,233,238,233,244,233,
-    225,236,225,242,225,226,233, 99,128,254,231,234,229,229,237,105,
-      2,141,  5,141, 20,238,233,244,233,225,236,225,242,225,226,233,
-     99,128,252,210,243,239,236,225,244,229,228,225,242,225,226,233,
-     99,128,252, 75,237,101,  2,141, 43,141, 56,228,233,225,236,225,
-    242,225,226,233, 99,128,254,232,229,237,105,  2,141, 64,141, 79,
-    238,233,244,233,225,236,225,242,225,226,233, 99,128,252,213,243,
-    239,236,225,244,229,228,225,242,225,226,233, 99,128,252, 78,238,
-    239,239,238,230,233,238,225,236,225,242,225,226,233, 99,128,252,
-    141,116,  7,141,129,141,140,141,169,141,204,141,216,141,236,142,
-      6,227,239,238,244,225,233,238,115,128, 34, 12,101,  2,141,146,
-    141,162,236,229,237,229,238,116,129, 34,  9,141,157,239,102,128,
-     34,  9,241,245,225,108,128, 34, 96,231,242,229,225,244,229,114,
-    129, 34,111,141,181,238,239,114,  2,141,189,141,197,229,241,245,
-    225,108,128, 34,113,236,229,243,115,128, 34,121,233,228,229,238,
-    244,233,227,225,108,128, 34, 98,236,229,243,115,129, 34,110,141,
-    225,238,239,242,229,241,245,225,108,128, 34,112,112,  2,141,242,
-    141,252,225,242,225,236,236,229,108,128, 34, 38,242,229,227,229,
-    228,229,115,128, 34,128,243,117,  3,142, 15,142, 22,142, 31,226,
-    243,229,116,128, 34,132,227,227,229,229,228,115,128, 34,129,240,
-    229,242,243,229,116,128, 34,133,247,225,242,237,229,238,233,225,
-    110,128,  5,118,240,225,242,229,110,128, 36,169,115,  2,142, 66,
-    142, 75,243,241,245,225,242,101,128, 51,177,245,240,229,242,233,
-    239,114,128, 32,127,244,233,236,228,101,128,  0,241,117,132,  3,
-    189,142,105,142,116,142,197,143, 24,232,233,242,225,231,225,238,
-     97,128, 48,108,107,  2,142,122,142,146,225,244,225,235,225,238,
-     97,129, 48,204,142,134,232,225,236,230,247,233,228,244,104,128,
-    255,135,244, 97,  3,142,155,142,165,142,172,226,229,238,231,225,
-    236,105,128,  9,188,228,229,246, 97,128,  9, 60,231,117,  2,142,
-    179,142,188,234,225,242,225,244,105,128, 10,188,242,237,245,235,
-    232,105,128, 10, 60,109,  2,142,203,142,237,226,229,242,243,233,
-    231,110,130,  0, 35,142,217,142,229,237,239,238,239,243,240,225,
-    227,101,128,255,  3,243,237,225,236,108,128,254, 95,229,114,  2,
-    142,244,143, 20,225,236,243,233,231,110,  2,142,255,143,  7,231,
-    242,229,229,107,128,  3,116,236,239,247,229,242,231,242,229,229,
-    107,128,  3,117,111,128, 33, 22,110,130,  5,224,143, 32,143, 52,
-    228,225,231,229,243,104,129,251, 64,143, 43,232,229,226,242,229,
-    119,128,251, 64,232,229,226,242,229,119,128,  5,224,246,243,241,
-    245,225,242,101,128, 51,181,247,243,241,245,225,242,101,128, 51,
-    187,249, 97,  3,143, 90,143,100,143,107,226,229,238,231,225,236,
-    105,128,  9,158,228,229,246, 97,128,  9, 30,231,117,  2,143,114,
-    143,123,234,225,242,225,244,105,128, 10,158,242,237,245,235,232,
-    105,128, 10, 30,111,147,  0,111,143,174,143,196,144, 18,144,188,
-    145,  4,145, 19,145, 59,145,182,145,203,145,241,145,252,146,174,
-    148,  8,148, 72,148,105,148,151,149, 24,149, 71,149, 83, 97,  2,
-    143,180,143,187,227,245,244,101,128,  0,243,238,231,244,232,225,
-    105,128, 14, 45, 98,  4,143,206,143,248,144,  1,144, 11,225,242,
-    242,229,100,130,  2,117,143,218,143,229,227,249,242,233,236,236,
-    233, 99,128,  4,233,228,233,229,242,229,243,233,243,227,249,242,
-    233,236,236,233, 99,128,  4,235,229,238,231,225,236,105,128,  9,
-    147,239,240,239,237,239,230,111,128, 49, 27,242,229,246,101,128,
-      1, 79, 99,  3,144, 26,144, 99,144,178, 97,  2,144, 32,144, 93,
-    238,228,242, 97,  3,144, 43,144, 50,144, 61,228,229,246, 97,128,
-      9, 17,231,245,234,225,242,225,244,105,128, 10,145,246,239,247,
-    229,236,243,233,231,110,  2,144, 75,144, 82,228,229,246, 97,128,
-      9, 73,231,245,234,225,242,225,244,105,128, 10,201,242,239,110,
-    128,  1,210,233,242, 99,  2,144,107,144,112,236,101,128, 36,222,
-    245,237,230,236,229,120,133,  0,244,144,131,144,139,144,150,144,
-    158,144,170,225,227,245,244,101,128, 30,209,228,239,244,226,229,
-    236,239,119,128, 30,217,231,242,225,246,101,128, 30,211,232,239,
-    239,235,225,226,239,246,101,128, 30,213,244,233,236,228,101,128,
-     30,215,249,242,233,236,236,233, 99,128,  4, 62,100,  4,144,198,
-    144,221,144,227,144,250,226,108,  2,144,205,144,213,225,227,245,
-    244,101,128,  1, 81,231,242,225,246,101,128,  2, 13,229,246, 97,
-    128,  9, 19,233,229,242,229,243,233,115,129,  0,246,144,239,227,
-    249,242,233,236,236,233, 99,128,  4,231,239,244,226,229,236,239,
-    119,128, 30,205,101,129,  1, 83,145, 10,235,239,242,229,225,110,
-    128, 49, 90,103,  3,145, 27,145, 42,145, 49,239,238,229,107,129,
-      2,219,145, 36,227,237, 98,128,  3, 40,242,225,246,101,128,  0,
-    242,245,234,225,242,225,244,105,128, 10,147,104,  4,145, 69,145,
-     80,145, 90,145,168,225,242,237,229,238,233,225,110,128,  5,133,
-    233,242,225,231,225,238, 97,128, 48, 74,111,  2,145, 96,145,106,
-    239,235,225,226,239,246,101,128, 30,207,242,110,133,  1,161,145,
-    121,145,129,145,140,145,148,145,160,225,227,245,244,101,128, 30,
-    219,228,239,244,226,229,236,239,119,128, 30,227,231,242,225,246,
-    101,128, 30,221,232,239,239,235,225,226,239,246,101,128, 30,223,
-    244,233,236,228,101,128, 30,225,245,238,231,225,242,245,237,236,
-    225,245,116,128,  1, 81,105,129,  1,163,145,188,238,246,229,242,
-    244,229,228,226,242,229,246,101,128,  2, 15,107,  2,145,209,145,
-    233,225,244,225,235,225,238, 97,129, 48,170,145,221,232,225,236,
-    230,247,233,228,244,104,128,255,117,239,242,229,225,110,128, 49,
-     87,236,229,232,229,226,242,229,119,128,  5,171,109,  6,146, 10,
-    146, 38,146, 45,146,134,146,145,146,163,225,227,242,239,110,130,
-      1, 77,146, 22,146, 30,225,227,245,244,101,128, 30, 83,231,242,
-    225,246,101,128, 30, 81,228,229,246, 97,128,  9, 80,229,231, 97,
-    133,  3,201,146, 61,146, 65,146, 76,146, 90,146,106, 49,128,  3,
-    214,227,249,242,233,236,236,233, 99,128,  4, 97,236,225,244,233,
-    238,227,236,239,243,229,100,128,  2,119,242,239,245,238,228,227,
-    249,242,233,236,236,233, 99,128,  4,123,116,  2,146,112,146,127,
-    233,244,236,239,227,249,242,233,236,236,233, 99,128,  4,125,239,
-    238,239,115,128,  3,206,231,245,234,225,242,225,244,105,128, 10,
-    208,233,227,242,239,110,129,  3,191,146,155,244,239,238,239,115,
-    128,  3,204,239,238,239,243,240,225,227,101,128,255, 79,238,101,
-    145,  0, 49,146,213,146,222,146,232,147,  6,147, 31,147, 40,147,
-     49,147, 74,147,108,147,142,147,154,147,173,147,184,147,217,147,
-    227,147,235,147,246,225,242,225,226,233, 99,128,  6, 97,226,229,
-    238,231,225,236,105,128,  9,231,227,233,242,227,236,101,129, 36,
-     96,146,243,233,238,246,229,242,243,229,243,225,238,243,243,229,
-    242,233,102,128, 39,138,100,  2,147, 12,147, 18,229,246, 97,128,
-      9,103,239,244,229,238,236,229,225,228,229,114,128, 32, 36,229,
-    233,231,232,244,104,128, 33, 91,230,233,244,244,229,100,128,246,
-    220,231,117,  2,147, 56,147, 65,234,225,242,225,244,105,128, 10,
-    231,242,237,245,235,232,105,128, 10,103,232, 97,  3,147, 83,147,
-     94,147, 99,227,235,225,242,225,226,233, 99,128,  6, 97,236,102,
-    128,  0,189,238,231,250,232,239,117,128, 48, 33,105,  2,147,114,
-    147,132,228,229,239,231,242,225,240,232,233,227,240,225,242,229,
-    110,128, 50, 32,238,230,229,242,233,239,114,128, 32,129,237,239,
-    238,239,243,240,225,227,101,128,255, 17,238,245,237,229,242,225,
-    244,239,242,226,229,238,231,225,236,105,128,  9,244,239,236,228,
-    243,244,249,236,101,128,247, 49,112,  2,147,190,147,197,225,242,
-    229,110,128, 36,116,229,114,  2,147,204,147,210,233,239,100,128,
-     36,136,243,233,225,110,128,  6,241,241,245,225,242,244,229,114,
-    128,  0,188,242,239,237,225,110,128, 33,112,243,245,240,229,242,
-    233,239,114,128,  0,185,244,104,  2,147,253,148,  2,225,105,128,
-     14, 81,233,242,100,128, 33, 83,111,  3,148, 16,148, 50,148, 66,
-    103,  2,148, 22,148, 40,239,238,229,107,129,  1,235,148, 31,237,
-    225,227,242,239,110,128,  1,237,245,242,237,245,235,232,105,128,
-     10, 19,237,225,244,242,225,231,245,242,237,245,235,232,105,128,
-     10, 75,240,229,110,128,  2, 84,112,  3,148, 80,148, 87,148, 98,
-    225,242,229,110,128, 36,170,229,238,226,245,236,236,229,116,128,
-     37,230,244,233,239,110,128, 35, 37,114,  2,148,111,148,140,100,
-      2,148,117,148,128,230,229,237,233,238,233,238,101,128,  0,170,
-    237,225,243,227,245,236,233,238,101,128,  0,186,244,232,239,231,
-    239,238,225,108,128, 34, 31,115,  5,148,163,148,195,148,212,149,
-      1,149, 14,232,239,242,116,  2,148,172,148,179,228,229,246, 97,
-    128,  9, 18,246,239,247,229,236,243,233,231,238,228,229,246, 97,
-    128,  9, 74,236,225,243,104,129,  0,248,148,204,225,227,245,244,
-    101,128,  1,255,237,225,236,108,  2,148,221,148,232,232,233,242,
-    225,231,225,238, 97,128, 48, 73,235,225,244,225,235,225,238, 97,
-    129, 48,169,148,245,232,225,236,230,247,233,228,244,104,128,255,
-    107,244,242,239,235,229,225,227,245,244,101,128,  1,255,245,240,
-    229,242,233,239,114,128,246,240,116,  2,149, 30,149, 41,227,249,
-    242,233,236,236,233, 99,128,  4,127,233,236,228,101,130,  0,245,
-    149, 52,149, 60,225,227,245,244,101,128, 30, 77,228,233,229,242,
-    229,243,233,115,128, 30, 79,245,226,239,240,239,237,239,230,111,
-    128, 49, 33,118,  2,149, 89,149,170,229,114,  2,149, 96,149,162,
-    236,233,238,101,131, 32, 62,149,109,149,132,149,155, 99,  2,149,
-    115,149,127,229,238,244,229,242,236,233,238,101,128,254, 74,237,
-     98,128,  3,  5,100,  2,149,138,149,146,225,243,232,229,100,128,
-    254, 73,226,236,247,225,246,121,128,254, 76,247,225,246,121,128,
-    254, 75,243,227,239,242,101,128,  0,175,239,247,229,236,243,233,
-    231,110,  3,149,185,149,195,149,202,226,229,238,231,225,236,105,
-    128,  9,203,228,229,246, 97,128,  9, 75,231,245,234,225,242,225,
-    244,105,128, 10,203,112,145,  0,112,149,251,152,123,152,134,152,
-    143,152,155,154, 80,154, 90,155, 82,156,101,156,191,156,217,157,
-     92,157,100,158,  2,158, 60,158, 88,158, 98, 97, 14,150, 25,150,
-     57,150, 67,150, 74,150, 81,150,129,150,140,150,154,150,165,150,
-    212,150,226,151,238,152, 21,152,111, 97,  2,150, 31,150, 43,237,
-    240,243,243,241,245,225,242,101,128, 51,128,243,229,238,244,239,
-    243,241,245,225,242,101,128, 51, 43,226,229,238,231,225,236,105,
-    128,  9,170,227,245,244,101,128, 30, 85,228,229,246, 97,128,  9,
-     42,103,  2,150, 87,150,105,101,  2,150, 93,150,100,228,239,247,
-    110,128, 33,223,245,112,128, 33,222,117,  2,150,111,150,120,234,
-    225,242,225,244,105,128, 10,170,242,237,245,235,232,105,128, 10,
-     42,232,233,242,225,231,225,238, 97,128, 48,113,233,249,225,238,
-    238,239,233,244,232,225,105,128, 14, 47,235,225,244,225,235,225,
-    238, 97,128, 48,209,108,  2,150,171,150,196,225,244,225,236,233,
-    250,225,244,233,239,238,227,249,242,233,236,236,233,227,227,237,
-     98,128,  4,132,239,227,232,235,225,227,249,242,233,236,236,233,
-     99,128,  4,192,238,243,233,239,243,235,239,242,229,225,110,128,
-     49,127,114,  3,150,234,150,255,151,227, 97,  2,150,240,150,248,
-    231,242,225,240,104,128,  0,182,236,236,229,108,128, 34, 37,229,
-    110,  2,151,  6,151,116,236,229,230,116,136,  0, 40,151, 29,151,
-     44,151, 49,151, 54,151, 65,151, 77,151,100,151,105,225,236,244,
-    239,238,229,225,242,225,226,233, 99,128,253, 62,226,116,128,248,
-    237,229,120,128,248,236,233,238,230,229,242,233,239,114,128, 32,
-    141,237,239,238,239,243,240,225,227,101,128,255,  8,115,  2,151,
-     83,151, 90,237,225,236,108,128,254, 89,245,240,229,242,233,239,
-    114,128, 32,125,244,112,128,248,235,246,229,242,244,233,227,225,
-    108,128,254, 53,242,233,231,232,116,136,  0, 41,151,140,151,155,
-    151,160,151,165,151,176,151,188,151,211,151,216,225,236,244,239,
-    238,229,225,242,225,226,233, 99,128,253, 63,226,116,128,248,248,
-    229,120,128,248,247,233,238,230,229,242,233,239,114,128, 32,142,
-    237,239,238,239,243,240,225,227,101,128,255,  9,115,  2,151,194,
-    151,201,237,225,236,108,128,254, 90,245,240,229,242,233,239,114,
-    128, 32,126,244,112,128,248,246,246,229,242,244,233,227,225,108,
-    128,254, 54,244,233,225,236,228,233,230,102,128, 34,  2,115,  3,
-    151,246,152,  1,152, 13,229,241,232,229,226,242,229,119,128,  5,
-    192,232,244,225,232,229,226,242,229,119,128,  5,153,241,245,225,
-    242,101,128, 51,169,244,225,104,134,  5,183,152, 39,152, 53,152,
-     58,152, 67,152, 82,152, 98, 49,  2,152, 45,152, 49, 49,128,  5,
-    183,100,128,  5,183,178, 97,128,  5,183,232,229,226,242,229,119,
-    128,  5,183,238,225,242,242,239,247,232,229,226,242,229,119,128,
-      5,183,241,245,225,242,244,229,242,232,229,226,242,229,119,128,
-      5,183,247,233,228,229,232,229,226,242,229,119,128,  5,183,250,
-    229,242,232,229,226,242,229,119,128,  5,161,226,239,240,239,237,
-    239,230,111,128, 49,  6,227,233,242,227,236,101,128, 36,223,228,
-    239,244,225,227,227,229,238,116,128, 30, 87,101,137,  5,228,152,
-    177,152,188,152,208,152,220,152,240,153, 86,153, 97,153,118,154,
-     73,227,249,242,233,236,236,233, 99,128,  4, 63,228,225,231,229,
-    243,104,129,251, 68,152,199,232,229,226,242,229,119,128,251, 68,
-    229,250,233,243,241,245,225,242,101,128, 51, 59,230,233,238,225,
-    236,228,225,231,229,243,232,232,229,226,242,229,119,128,251, 67,
-    104,  5,152,252,153, 19,153, 27,153, 41,153, 71,225,114,  2,153,
-      3,153, 10,225,226,233, 99,128,  6,126,237,229,238,233,225,110,
-    128,  5,122,229,226,242,229,119,128,  5,228,230,233,238,225,236,
-    225,242,225,226,233, 99,128,251, 87,105,  2,153, 47,153, 62,238,
-    233,244,233,225,236,225,242,225,226,233, 99,128,251, 88,242,225,
-    231,225,238, 97,128, 48,122,237,229,228,233,225,236,225,242,225,
-    226,233, 99,128,251, 89,235,225,244,225,235,225,238, 97,128, 48,
-    218,237,233,228,228,236,229,232,239,239,235,227,249,242,233,236,
-    236,233, 99,128,  4,167,114,  5,153,130,153,142,153,184,154, 49,
-    154, 62,225,230,229,232,229,226,242,229,119,128,251, 78,227,229,
-    238,116,131,  0, 37,153,155,153,164,153,176,225,242,225,226,233,
-     99,128,  6,106,237,239,238,239,243,240,225,227,101,128,255,  5,
-    243,237,225,236,108,128,254,106,105,  2,153,190,154, 31,239,100,
-    134,  0, 46,153,207,153,218,153,229,153,241,153,252,154,  8,225,
-    242,237,229,238,233,225,110,128,  5,137,227,229,238,244,229,242,
-    229,100,128,  0,183,232,225,236,230,247,233,228,244,104,128,255,
-     97,233,238,230,229,242,233,239,114,128,246,231,237,239,238,239,
-    243,240,225,227,101,128,255, 14,115,  2,154, 14,154, 21,237,225,
-    236,108,128,254, 82,245,240,229,242,233,239,114,128,246,232,243,
-    240,239,237,229,238,233,231,242,229,229,235,227,237, 98,128,  3,
-     66,240,229,238,228,233,227,245,236,225,114,128, 34,165,244,232,
-    239,245,243,225,238,100,128, 32, 48,243,229,244, 97,128, 32,167,
-    230,243,241,245,225,242,101,128, 51,138,104,  3,154, 98,154,148,
-    155, 29, 97,  3,154,106,154,116,154,123,226,229,238,231,225,236,
-    105,128,  9,171,228,229,246, 97,128,  9, 43,231,117,  2,154,130,
-    154,139,234,225,242,225,244,105,128, 10,171,242,237,245,235,232,
-    105,128, 10, 43,105,133,  3,198,154,162,154,166,154,252,155,  4,
-    155, 15, 49,128,  3,213,229,245,240,104,  4,154,179,154,214,154,
-    229,154,238, 97,  2,154,185,154,200,227,233,242,227,236,229,235,
-    239,242,229,225,110,128, 50,122,240,225,242,229,238,235,239,242,
-    229,225,110,128, 50, 26,227,233,242,227,236,229,235,239,242,229,
-    225,110,128, 50,108,235,239,242,229,225,110,128, 49, 77,240,225,
-    242,229,238,235,239,242,229,225,110,128, 50, 12,236,225,244,233,
-    110,128,  2,120,238,244,232,245,244,232,225,105,128, 14, 58,243,
-    249,237,226,239,236,231,242,229,229,107,128,  3,213,111,  3,155,
-     37,155, 42,155, 68,239,107,128,  1,165,240,104,  2,155, 49,155,
-     58,225,238,244,232,225,105,128, 14, 30,245,238,231,244,232,225,
-    105,128, 14, 28,243,225,237,240,232,225,239,244,232,225,105,128,
-     14, 32,105,133,  3,192,155, 96,156, 52,156, 63,156, 74,156, 88,
-    229,245,112,  6,155,112,155,147,155,179,155,207,155,221,156, 17,
-     97,  2,155,118,155,133,227,233,242,227,236,229,235,239,242,229,
-    225,110,128, 50,115,240,225,242,229,238,235,239,242,229,225,110,
-    128, 50, 19,227,105,  2,155,154,155,166,229,245,227,235,239,242,
-    229,225,110,128, 49,118,242,227,236,229,235,239,242,229,225,110,
-    128, 50,101,107,  2,155,185,155,199,233,249,229,239,235,235,239,
-    242,229,225,110,128, 49,114,239,242,229,225,110,128, 49, 66,240,
-    225,242,229,238,235,239,242,229,225,110,128, 50,  5,243,233,239,
-    115,  2,155,230,156,  2,107,  2,155,236,155,250,233,249,229,239,
-    235,235,239,242,229,225,110,128, 49,116,239,242,229,225,110,128,
-     49, 68,244,233,235,229,245,244,235,239,242,229,225,110,128, 49,
-    117,116,  2,156, 23,156, 38,232,233,229,245,244,232,235,239,242,
-    229,225,110,128, 49,119,233,235,229,245,244,235,239,242,229,225,
-    110,128, 49,115,232,233,242,225,231,225,238, 97,128, 48,116,235,
-    225,244,225,235,225,238, 97,128, 48,212,243,249,237,226,239,236,
-    231,242,229,229,107,128,  3,214,247,242,225,242,237,229,238,233,
-    225,110,128,  5,131,236,245,115,132,  0, 43,156,115,156,126,156,
-    135,156,168,226,229,236,239,247,227,237, 98,128,  3, 31,227,233,
-    242,227,236,101,128, 34,149,109,  2,156,141,156,148,233,238,245,
-    115,128,  0,177,111,  2,156,154,156,158,100,128,  2,214,238,239,
-    243,240,225,227,101,128,255, 11,115,  2,156,174,156,181,237,225,
-    236,108,128,254, 98,245,240,229,242,233,239,114,128, 32,122,109,
-      2,156,197,156,208,239,238,239,243,240,225,227,101,128,255, 80,
-    243,241,245,225,242,101,128, 51,216,111,  5,156,229,156,240,157,
-     51,157, 62,157, 72,232,233,242,225,231,225,238, 97,128, 48,125,
-    233,238,244,233,238,231,233,238,228,229,120,  4,157,  4,157, 16,
-    157, 28,157, 41,228,239,247,238,247,232,233,244,101,128, 38, 31,
-    236,229,230,244,247,232,233,244,101,128, 38, 28,242,233,231,232,
-    244,247,232,233,244,101,128, 38, 30,245,240,247,232,233,244,101,
-    128, 38, 29,235,225,244,225,235,225,238, 97,128, 48,221,240,236,
-    225,244,232,225,105,128, 14, 27,243,244,225,236,237,225,242,107,
-    129, 48, 18,157, 85,230,225,227,101,128, 48, 32,240,225,242,229,
-    110,128, 36,171,114,  3,157,108,157,134,157,159,101,  2,157,114,
-    157,122,227,229,228,229,115,128, 34,122,243,227,242,233,240,244,
-    233,239,110,128, 33, 30,233,237,101,  2,157,142,157,148,237,239,
-    100,128,  2,185,242,229,246,229,242,243,229,100,128, 32, 53,111,
-      4,157,169,157,176,157,186,157,199,228,245,227,116,128, 34, 15,
-    234,229,227,244,233,246,101,128, 35,  5,236,239,238,231,229,228,
-    235,225,238, 97,128, 48,252,112,  2,157,205,157,242,101,  2,157,
-    211,157,218,236,236,239,114,128, 35, 24,242,243,117,  2,157,226,
-    157,233,226,243,229,116,128, 34,130,240,229,242,243,229,116,128,
-     34,131,239,242,244,233,239,110,129, 34, 55,157,253,225,108,128,
-     34, 29,115,  2,158,  8,158, 51,105,130,  3,200,158, 16,158, 27,
-    227,249,242,233,236,236,233, 99,128,  4,113,236,233,240,238,229,
-    245,237,225,244,225,227,249,242,233,236,236,233,227,227,237, 98,
-    128,  4,134,243,241,245,225,242,101,128, 51,176,117,  2,158, 66,
-    158, 77,232,233,242,225,231,225,238, 97,128, 48,119,235,225,244,
-    225,235,225,238, 97,128, 48,215,246,243,241,245,225,242,101,128,
-     51,180,247,243,241,245,225,242,101,128, 51,186,113,136,  0,113,
-    158,128,159,177,159,188,159,197,159,204,159,216,159,254,160,  6,
-     97,  4,158,138,158,161,158,225,159,160,100,  2,158,144,158,150,
-    229,246, 97,128,  9, 88,237,225,232,229,226,242,229,119,128,  5,
-    168,102,  4,158,171,158,180,158,194,158,210,225,242,225,226,233,
-     99,128,  6, 66,230,233,238,225,236,225,242,225,226,233, 99,128,
-    254,214,233,238,233,244,233,225,236,225,242,225,226,233, 99,128,
-    254,215,237,229,228,233,225,236,225,242,225,226,233, 99,128,254,
-    216,237,225,244,115,136,  5,184,158,248,159, 12,159, 26,159, 31,
-    159, 36,159, 45,159, 60,159,147, 49,  3,159,  0,159,  4,159,  8,
-     48,128,  5,184, 97,128,  5,184, 99,128,  5,184, 50,  2,159, 18,
-    159, 22, 55,128,  5,184, 57,128,  5,184,179, 51,128,  5,184,228,
-    101,128,  5,184,232,229,226,242,229,119,128,  5,184,238,225,242,
-    242,239,247,232,229,226,242,229,119,128,  5,184,113,  2,159, 66,
-    159,132,225,244,225,110,  4,159, 79,159, 88,159,103,159,119,232,
-    229,226,242,229,119,128,  5,184,238,225,242,242,239,247,232,229,
-    226,242,229,119,128,  5,184,241,245,225,242,244,229,242,232,229,
-    226,242,229,119,128,  5,184,247,233,228,229,232,229,226,242,229,
-    119,128,  5,184,245,225,242,244,229,242,232,229,226,242,229,119,
-    128,  5,184,247,233,228,229,232,229,226,242,229,119,128,  5,184,
-    242,238,229,249,240,225,242,225,232,229,226,242,229,119,128,  5,
-    159,226,239,240,239,237,239,230,111,128, 49, 17,227,233,242,227,
-    236,101,128, 36,224,232,239,239,107,128,  2,160,237,239,238,239,
-    243,240,225,227,101,128,255, 81,239,102,130,  5,231,159,225,159,
-    245,228,225,231,229,243,104,129,251, 71,159,236,232,229,226,242,
-    229,119,128,251, 71,232,229,226,242,229,119,128,  5,231,240,225,
-    242,229,110,128, 36,172,117,  4,160, 16,160, 28,160,117,160,204,
-    225,242,244,229,242,238,239,244,101,128, 38,105,226,245,244,115,
-    135,  5,187,160, 49,160, 54,160, 59,160, 64,160, 73,160, 88,160,
-    104,177, 56,128,  5,187,178, 53,128,  5,187,179, 49,128,  5,187,
-    232,229,226,242,229,119,128,  5,187,238,225,242,242,239,247,232,
-    229,226,242,229,119,128,  5,187,241,245,225,242,244,229,242,232,
-    229,226,242,229,119,128,  5,187,247,233,228,229,232,229,226,242,
-    229,119,128,  5,187,229,243,244,233,239,110,133,  0, 63,160,136,
-    160,159,160,176,160,184,160,196,225,114,  2,160,143,160,150,225,
-    226,233, 99,128,  6, 31,237,229,238,233,225,110,128,  5, 94,228,
-    239,247,110,129,  0,191,160,168,243,237,225,236,108,128,247,191,
-    231,242,229,229,107,128,  3,126,237,239,238,239,243,240,225,227,
-    101,128,255, 31,243,237,225,236,108,128,247, 63,239,244,101,  4,
-    160,216,161, 31,161, 51,161, 80,228,226,108,133,  0, 34,160,232,
-    160,239,160,246,161,  2,161, 23,226,225,243,101,128, 32, 30,236,
-    229,230,116,128, 32, 28,237,239,238,239,243,240,225,227,101,128,
-    255,  2,240,242,233,237,101,129, 48, 30,161, 12,242,229,246,229,
-    242,243,229,100,128, 48, 29,242,233,231,232,116,128, 32, 29,236,
-    229,230,116,129, 32, 24,161, 40,242,229,246,229,242,243,229,100,
-    128, 32, 27,114,  2,161, 57,161, 67,229,246,229,242,243,229,100,
-    128, 32, 27,233,231,232,116,129, 32, 25,161, 76,110,128,  1, 73,
-    243,233,238,231,108,  2,161, 90,161, 97,226,225,243,101,128, 32,
-     26,101,129,  0, 39,161,103,237,239,238,239,243,240,225,227,101,
-    128,255,  7,114,145,  0,114,161,153,162,157,162,168,162,215,163,
-     10,164, 27,164, 51,164,146,166,180,166,217,166,229,167, 27,167,
-     35,167,197,167,208,167,243,168, 87, 97, 11,161,177,161,188,161,
-    198,161,205,162, 14,162, 30,162, 55,162, 66,162, 91,162,114,162,
-    151,225,242,237,229,238,233,225,110,128,  5,124,226,229,238,231,
-    225,236,105,128,  9,176,227,245,244,101,128,  1, 85,100,  4,161,
-    215,161,221,161,235,162,  5,229,246, 97,128,  9, 48,233,227,225,
-    108,129, 34, 26,161,230,229,120,128,248,229,239,246,229,242,243,
-    243,241,245,225,242,101,129, 51,174,161,251,228,243,241,245,225,
-    242,101,128, 51,175,243,241,245,225,242,101,128, 51,173,230,101,
-    129,  5,191,162, 21,232,229,226,242,229,119,128,  5,191,231,117,
-      2,162, 37,162, 46,234,225,242,225,244,105,128, 10,176,242,237,
-    245,235,232,105,128, 10, 48,232,233,242,225,231,225,238, 97,128,
-     48,137,235,225,244,225,235,225,238, 97,129, 48,233,162, 79,232,
-    225,236,230,247,233,228,244,104,128,255,151,236,239,247,229,242,
-    228,233,225,231,239,238,225,236,226,229,238,231,225,236,105,128,
-      9,241,109,  2,162,120,162,143,233,228,228,236,229,228,233,225,
-    231,239,238,225,236,226,229,238,231,225,236,105,128,  9,240,243,
-    232,239,242,110,128,  2,100,244,233,111,128, 34, 54,226,239,240,
-    239,237,239,230,111,128, 49, 22, 99,  4,162,178,162,185,162,194,
-    162,202,225,242,239,110,128,  1, 89,229,228,233,236,236, 97,128,
-      1, 87,233,242,227,236,101,128, 36,225,239,237,237,225,225,227,
-    227,229,238,116,128,  1, 87,100,  2,162,221,162,231,226,236,231,
-    242,225,246,101,128,  2, 17,239,116,  2,162,238,162,247,225,227,
-    227,229,238,116,128, 30, 89,226,229,236,239,119,129, 30, 91,163,
-      1,237,225,227,242,239,110,128, 30, 93,101,  6,163, 24,163, 69,
-    163,104,163,159,163,184,163,217,102,  2,163, 30,163, 43,229,242,
-    229,238,227,229,237,225,242,107,128, 32, 59,236,229,248,243,117,
-      2,163, 53,163, 60,226,243,229,116,128, 34,134,240,229,242,243,
-    229,116,128, 34,135,231,233,243,244,229,114,  2,163, 80,163, 85,
-    229,100,128,  0,174,115,  2,163, 91,163, 97,225,238,115,128,248,
-    232,229,242,233,102,128,246,218,104,  3,163,112,163,135,163,149,
-    225,114,  2,163,119,163,126,225,226,233, 99,128,  6, 49,237,229,
-    238,233,225,110,128,  5,128,230,233,238,225,236,225,242,225,226,
-    233, 99,128,254,174,233,242,225,231,225,238, 97,128, 48,140,235,
-    225,244,225,235,225,238, 97,129, 48,236,163,172,232,225,236,230,
-    247,233,228,244,104,128,255,154,243,104,130,  5,232,163,193,163,
-    208,228,225,231,229,243,232,232,229,226,242,229,119,128,251, 72,
-    232,229,226,242,229,119,128,  5,232,118,  3,163,225,163,238,164,
-     14,229,242,243,229,228,244,233,236,228,101,128, 34, 61,233, 97,
-      2,163,245,163,254,232,229,226,242,229,119,128,  5,151,237,245,
-    231,242,225,243,232,232,229,226,242,229,119,128,  5,151,236,239,
-    231,233,227,225,236,238,239,116,128, 35, 16,230,233,243,232,232,
-    239,239,107,129,  2,126,164, 40,242,229,246,229,242,243,229,100,
-    128,  2,127,104,  2,164, 57,164, 80, 97,  2,164, 63,164, 73,226,
-    229,238,231,225,236,105,128,  9,221,228,229,246, 97,128,  9, 93,
-    111,131,  3,193,164, 90,164,119,164,133,239,107,129,  2,125,164,
-     97,244,245,242,238,229,100,129,  2,123,164,108,243,245,240,229,
-    242,233,239,114,128,  2,181,243,249,237,226,239,236,231,242,229,
-    229,107,128,  3,241,244,233,227,232,239,239,235,237,239,100,128,
-      2,222,105,  6,164,160,165,204,165,250,166,  5,166, 30,166,166,
-    229,245,108,  9,164,182,164,217,164,232,164,246,165, 36,165, 50,
-    165,136,165,149,165,184, 97,  2,164,188,164,203,227,233,242,227,
-    236,229,235,239,242,229,225,110,128, 50,113,240,225,242,229,238,
-    235,239,242,229,225,110,128, 50, 17,227,233,242,227,236,229,235,
-    239,242,229,225,110,128, 50, 99,232,233,229,245,232,235,239,242,
-    229,225,110,128, 49, 64,107,  2,164,252,165, 28,233,249,229,239,
-    107,  2,165,  6,165, 15,235,239,242,229,225,110,128, 49, 58,243,
-    233,239,243,235,239,242,229,225,110,128, 49,105,239,242,229,225,
-    110,128, 49, 57,237,233,229,245,237,235,239,242,229,225,110,128,
-     49, 59,112,  3,165, 58,165, 90,165,105, 97,  2,165, 64,165, 78,
-    238,243,233,239,243,235,239,242,229,225,110,128, 49,108,242,229,
-    238,235,239,242,229,225,110,128, 50,  3,232,233,229,245,240,232,
-    235,239,242,229,225,110,128, 49, 63,233,229,245,112,  2,165,114,
-    165,123,235,239,242,229,225,110,128, 49, 60,243,233,239,243,235,
-    239,242,229,225,110,128, 49,107,243,233,239,243,235,239,242,229,
-    225,110,128, 49, 61,116,  2,165,155,165,170,232,233,229,245,244,
-    232,235,239,242,229,225,110,128, 49, 62,233,235,229,245,244,235,
-    239,242,229,225,110,128, 49,106,249,229,239,242,233,238,232,233,
-    229,245,232,235,239,242,229,225,110,128, 49,109,231,232,116,  2,
-    165,212,165,220,225,238,231,236,101,128, 34, 31,116,  2,165,226,
-    165,240,225,227,235,226,229,236,239,247,227,237, 98,128,  3, 25,
-    242,233,225,238,231,236,101,128, 34,191,232,233,242,225,231,225,
-    238, 97,128, 48,138,235,225,244,225,235,225,238, 97,129, 48,234,
-    166, 18,232,225,236,230,247,233,228,244,104,128,255,152,110,  2,
-    166, 36,166,152,103,131,  2,218,166, 46,166, 57,166, 63,226,229,
-    236,239,247,227,237, 98,128,  3, 37,227,237, 98,128,  3, 10,232,
-    225,236,102,  2,166, 72,166,118,236,229,230,116,131,  2,191,166,
-     85,166, 96,166,107,225,242,237,229,238,233,225,110,128,  5, 89,
-    226,229,236,239,247,227,237, 98,128,  3, 28,227,229,238,244,229,
-    242,229,100,128,  2,211,242,233,231,232,116,130,  2,190,166,130,
-    166,141,226,229,236,239,247,227,237, 98,128,  3, 57,227,229,238,
-    244,229,242,229,100,128,  2,210,246,229,242,244,229,228,226,242,
-    229,246,101,128,  2, 19,244,244,239,242,245,243,241,245,225,242,
-    101,128, 51, 81,108,  2,166,186,166,197,233,238,229,226,229,236,
-    239,119,128, 30, 95,239,238,231,236,229,103,129,  2,124,166,208,
-    244,245,242,238,229,100,128,  2,122,237,239,238,239,243,240,225,
-    227,101,128,255, 82,111,  3,166,237,166,248,167, 17,232,233,242,
-    225,231,225,238, 97,128, 48,141,235,225,244,225,235,225,238, 97,
-    129, 48,237,167,  5,232,225,236,230,247,233,228,244,104,128,255,
-    155,242,245,225,244,232,225,105,128, 14, 35,240,225,242,229,110,
-    128, 36,173,114,  3,167, 43,167, 79,167,109, 97,  3,167, 51,167,
-     61,167, 68,226,229,238,231,225,236,105,128,  9,220,228,229,246,
-     97,128,  9, 49,231,245,242,237,245,235,232,105,128, 10, 92,229,
-    104,  2,167, 86,167, 95,225,242,225,226,233, 99,128,  6,145,230,
-    233,238,225,236,225,242,225,226,233, 99,128,251,141,246,239,227,
-    225,236,233, 99,  4,167,125,167,135,167,142,167,153,226,229,238,
-    231,225,236,105,128,  9,224,228,229,246, 97,128,  9, 96,231,245,
-    234,225,242,225,244,105,128, 10,224,246,239,247,229,236,243,233,
-    231,110,  3,167,169,167,179,167,186,226,229,238,231,225,236,105,
-    128,  9,196,228,229,246, 97,128,  9, 68,231,245,234,225,242,225,
-    244,105,128, 10,196,243,245,240,229,242,233,239,114,128,246,241,
-    116,  2,167,214,167,222,226,236,239,227,107,128, 37,144,245,242,
-    238,229,100,129,  2,121,167,232,243,245,240,229,242,233,239,114,
-    128,  2,180,117,  4,167,253,168,  8,168, 33,168, 80,232,233,242,
-    225,231,225,238, 97,128, 48,139,235,225,244,225,235,225,238, 97,
-    129, 48,235,168, 21,232,225,236,230,247,233,228,244,104,128,255,
-    153,112,  2,168, 39,168, 74,229,101,  2,168, 46,168, 60,237,225,
-    242,235,226,229,238,231,225,236,105,128,  9,242,243,233,231,238,
-    226,229,238,231,225,236,105,128,  9,243,233,225,104,128,246,221,
-    244,232,225,105,128, 14, 36,246,239,227,225,236,233, 99,  4,168,
-    103,168,113,168,120,168,131,226,229,238,231,225,236,105,128,  9,
-    139,228,229,246, 97,128,  9, 11,231,245,234,225,242,225,244,105,
-    128, 10,139,246,239,247,229,236,243,233,231,110,  3,168,147,168,
-    157,168,164,226,229,238,231,225,236,105,128,  9,195,228,229,246,
-     97,128,  9, 67,231,245,234,225,242,225,244,105,128, 10,195,115,
-    147,  0,115,168,217,170,187,170,198,171, 68,171,107,174, 49,174,
-     60,176,203,179, 85,179,131,179,158,180, 93,180,160,181,193,181,
-    203,182,133,182,206,183,120,183,130, 97,  9,168,237,168,247,169,
-     12,169, 84,169,109,169,120,169,145,169,177,169,217,226,229,238,
-    231,225,236,105,128,  9,184,227,245,244,101,129,  1, 91,169,  0,
-    228,239,244,225,227,227,229,238,116,128, 30,101,100,  5,169, 24,
-    169, 33,169, 39,169, 53,169, 69,225,242,225,226,233, 99,128,  6,
-     53,229,246, 97,128,  9, 56,230,233,238,225,236,225,242,225,226,
-    233, 99,128,254,186,233,238,233,244,233,225,236,225,242,225,226,
-    233, 99,128,254,187,237,229,228,233,225,236,225,242,225,226,233,
-     99,128,254,188,231,117,  2,169, 91,169,100,234,225,242,225,244,
-    105,128, 10,184,242,237,245,235,232,105,128, 10, 56,232,233,242,
-    225,231,225,238, 97,128, 48, 85,235,225,244,225,235,225,238, 97,
-    129, 48,181,169,133,232,225,236,230,247,233,228,244,104,128,255,
-    123,236,236,225,236,236,225,232,239,245,225,236,225,249,232,229,
-    247,225,243,225,236,236,225,237,225,242,225,226,233, 99,128,253,
-    250,237,229,235,104,130,  5,225,169,188,169,208,228,225,231,229,
-    243,104,129,251, 65,169,199,232,229,226,242,229,119,128,251, 65,
-    232,229,226,242,229,119,128,  5,225,242, 97,  5,169,230,170, 48,
-    170, 56,170,106,170,114, 97,  5,169,242,169,250,170,  2,170, 33,
-    170, 41,225,244,232,225,105,128, 14, 50,229,244,232,225,105,128,
-     14, 65,233,237,225,233,109,  2,170, 12,170, 23,225,236,225,233,
-    244,232,225,105,128, 14, 68,245,225,238,244,232,225,105,128, 14,
-     67,237,244,232,225,105,128, 14, 51,244,232,225,105,128, 14, 48,
-    229,244,232,225,105,128, 14, 64,105,  3,170, 64,170, 88,170, 99,
-    105,  2,170, 70,170, 81,236,229,230,244,244,232,225,105,128,248,
-    134,244,232,225,105,128, 14, 53,236,229,230,244,244,232,225,105,
-    128,248,133,244,232,225,105,128, 14, 52,239,244,232,225,105,128,
-     14, 66,117,  3,170,122,170,172,170,179,101,  3,170,130,170,154,
-    170,165,101,  2,170,136,170,147,236,229,230,244,244,232,225,105,
-    128,248,136,244,232,225,105,128, 14, 55,236,229,230,244,244,232,
-    225,105,128,248,135,244,232,225,105,128, 14, 54,244,232,225,105,
-    128, 14, 56,245,244,232,225,105,128, 14, 57,226,239,240,239,237,
-    239,230,111,128, 49, 25, 99,  5,170,210,170,231,170,240,171, 33,
-    171, 55,225,242,239,110,129,  1, 97,170,219,228,239,244,225,227,
-    227,229,238,116,128, 30,103,229,228,233,236,236, 97,128,  1, 95,
-    232,247, 97,131,  2, 89,170,252,171,  7,171, 26,227,249,242,233,
-    236,236,233, 99,128,  4,217,228,233,229,242,229,243,233,243,227,
-    249,242,233,236,236,233, 99,128,  4,219,232,239,239,107,128,  2,
-     90,233,242, 99,  2,171, 41,171, 46,236,101,128, 36,226,245,237,
-    230,236,229,120,128,  1, 93,239,237,237,225,225,227,227,229,238,
-    116,128,  2, 25,228,239,116,  2,171, 76,171, 85,225,227,227,229,
-    238,116,128, 30, 97,226,229,236,239,119,129, 30, 99,171, 95,228,
-    239,244,225,227,227,229,238,116,128, 30,105,101,  9,171,127,171,
-    143,171,178,171,243,172, 90,172,117,172,142,172,223,172,250,225,
-    231,245,236,236,226,229,236,239,247,227,237, 98,128,  3, 60, 99,
-      2,171,149,171,171,239,238,100,129, 32, 51,171,157,244,239,238,
-    229,227,232,233,238,229,243,101,128,  2,202,244,233,239,110,128,
-      0,167,229,110,  4,171,189,171,198,171,212,171,228,225,242,225,
-    226,233, 99,128,  6, 51,230,233,238,225,236,225,242,225,226,233,
-     99,128,254,178,233,238,233,244,233,225,236,225,242,225,226,233,
-     99,128,254,179,237,229,228,233,225,236,225,242,225,226,233, 99,
-    128,254,180,231,239,108,135,  5,182,172,  7,172, 21,172, 26,172,
-     35,172, 50,172, 66,172, 77, 49,  2,172, 13,172, 17, 51,128,  5,
-    182,102,128,  5,182,178, 99,128,  5,182,232,229,226,242,229,119,
-    128,  5,182,238,225,242,242,239,247,232,229,226,242,229,119,128,
-      5,182,241,245,225,242,244,229,242,232,229,226,242,229,119,128,
-      5,182,244,225,232,229,226,242,229,119,128,  5,146,247,233,228,
-    229,232,229,226,242,229,119,128,  5,182,104,  2,172, 96,172,107,
-    225,242,237,229,238,233,225,110,128,  5,125,233,242,225,231,225,
-    238, 97,128, 48, 91,235,225,244,225,235,225,238, 97,129, 48,187,
-    172,130,232,225,236,230,247,233,228,244,104,128,255,126,237,105,
-      2,172,149,172,192,227,239,236,239,110,131,  0, 59,172,163,172,
-    172,172,184,225,242,225,226,233, 99,128,  6, 27,237,239,238,239,
-    243,240,225,227,101,128,255, 27,243,237,225,236,108,128,254, 84,
-    246,239,233,227,229,228,237,225,242,235,235,225,238, 97,129, 48,
-    156,172,211,232,225,236,230,247,233,228,244,104,128,255,159,238,
-    116,  2,172,230,172,240,233,243,241,245,225,242,101,128, 51, 34,
-    239,243,241,245,225,242,101,128, 51, 35,246,229,110,142,  0, 55,
-    173, 28,173, 37,173, 47,173, 77,173, 84,173, 94,173,119,173,146,
-    173,180,173,192,173,203,173,236,173,244,173,255,225,242,225,226,
-    233, 99,128,  6,103,226,229,238,231,225,236,105,128,  9,237,227,
-    233,242,227,236,101,129, 36,102,173, 58,233,238,246,229,242,243,
-    229,243,225,238,243,243,229,242,233,102,128, 39,144,228,229,246,
-     97,128,  9,109,229,233,231,232,244,232,115,128, 33, 94,231,117,
-      2,173,101,173,110,234,225,242,225,244,105,128, 10,237,242,237,
-    245,235,232,105,128, 10,109,232, 97,  2,173,126,173,137,227,235,
-    225,242,225,226,233, 99,128,  6,103,238,231,250,232,239,117,128,
-     48, 39,105,  2,173,152,173,170,228,229,239,231,242,225,240,232,
-    233,227,240,225,242,229,110,128, 50, 38,238,230,229,242,233,239,
-    114,128, 32,135,237,239,238,239,243,240,225,227,101,128,255, 23,
-    239,236,228,243,244,249,236,101,128,247, 55,112,  2,173,209,173,
-    216,225,242,229,110,128, 36,122,229,114,  2,173,223,173,229,233,
-    239,100,128, 36,142,243,233,225,110,128,  6,247,242,239,237,225,
-    110,128, 33,118,243,245,240,229,242,233,239,114,128, 32,119,116,
-      2,174,  5,174, 43,229,229,110,  2,174, 13,174, 22,227,233,242,
-    227,236,101,128, 36,112,112,  2,174, 28,174, 35,225,242,229,110,
-    128, 36,132,229,242,233,239,100,128, 36,152,232,225,105,128, 14,
-     87,230,244,232,249,240,232,229,110,128,  0,173,104,  7,174, 76,
-    175, 50,175, 61,175, 75,176, 20,176, 33,176,197, 97,  6,174, 90,
-    174,101,174,111,174,122,175,  9,175, 34,225,242,237,229,238,233,
-    225,110,128,  5,119,226,229,238,231,225,236,105,128,  9,182,227,
-    249,242,233,236,236,233, 99,128,  4, 72,100,  2,174,128,174,224,
-    228, 97,  4,174,139,174,148,174,179,174,193,225,242,225,226,233,
-     99,128,  6, 81,228,225,237,237, 97,  2,174,158,174,167,225,242,
-    225,226,233, 99,128,252, 97,244,225,238,225,242,225,226,233, 99,
-    128,252, 94,230,225,244,232,225,225,242,225,226,233, 99,128,252,
-     96,235,225,243,242, 97,  2,174,203,174,212,225,242,225,226,233,
-     99,128,252, 98,244,225,238,225,242,225,226,233, 99,128,252, 95,
-    101,132, 37,146,174,236,174,243,174,251,175,  4,228,225,242,107,
-    128, 37,147,236,233,231,232,116,128, 37,145,237,229,228,233,245,
-    109,128, 37,146,246, 97,128,  9, 54,231,117,  2,175, 16,175, 25,
-    234,225,242,225,244,105,128, 10,182,242,237,245,235,232,105,128,
-     10, 54,236,243,232,229,236,229,244,232,229,226,242,229,119,128,
-      5,147,226,239,240,239,237,239,230,111,128, 49, 21,227,232,225,
-    227,249,242,233,236,236,233, 99,128,  4, 73,101,  4,175, 85,175,
-    150,175,160,175,177,229,110,  4,175, 96,175,105,175,119,175,135,
-    225,242,225,226,233, 99,128,  6, 52,230,233,238,225,236,225,242,
-    225,226,233, 99,128,254,182,233,238,233,244,233,225,236,225,242,
-    225,226,233, 99,128,254,183,237,229,228,233,225,236,225,242,225,
-    226,233, 99,128,254,184,233,227,239,240,244,233, 99,128,  3,227,
-    241,229,108,129, 32,170,175,168,232,229,226,242,229,119,128, 32,
-    170,246, 97,134,  5,176,175,194,175,209,175,223,175,232,175,247,
-    176,  7, 49,  2,175,200,175,205,177, 53,128,  5,176, 53,128,  5,
-    176, 50,  2,175,215,175,219, 50,128,  5,176,101,128,  5,176,232,
-    229,226,242,229,119,128,  5,176,238,225,242,242,239,247,232,229,
-    226,242,229,119,128,  5,176,241,245,225,242,244,229,242,232,229,
-    226,242,229,119,128,  5,176,247,233,228,229,232,229,226,242,229,
-    119,128,  5,176,232,225,227,249,242,233,236,236,233, 99,128,  4,
-    187,105,  2,176, 39,176, 50,237,225,227,239,240,244,233, 99,128,
-      3,237,110,131,  5,233,176, 60,176,143,176,152,100,  2,176, 66,
-    176,132,225,231,229,243,104,130,251, 73,176, 78,176, 87,232,229,
-    226,242,229,119,128,251, 73,115,  2,176, 93,176,113,232,233,238,
-    228,239,116,129,251, 44,176,104,232,229,226,242,229,119,128,251,
-     44,233,238,228,239,116,129,251, 45,176,123,232,229,226,242,229,
-    119,128,251, 45,239,244,232,229,226,242,229,119,128,  5,193,232,
-    229,226,242,229,119,128,  5,233,115,  2,176,158,176,178,232,233,
-    238,228,239,116,129,251, 42,176,169,232,229,226,242,229,119,128,
-    251, 42,233,238,228,239,116,129,251, 43,176,188,232,229,226,242,
-    229,119,128,251, 43,239,239,107,128,  2,130,105,  8,176,221,177,
-      9,177, 20,177, 45,177, 75,177, 83,177, 96,178, 11,231,237, 97,
-    131,  3,195,176,233,176,237,176,245, 49,128,  3,194,230,233,238,
-    225,108,128,  3,194,236,245,238,225,244,229,243,249,237,226,239,
-    236,231,242,229,229,107,128,  3,242,232,233,242,225,231,225,238,
-     97,128, 48, 87,235,225,244,225,235,225,238, 97,129, 48,183,177,
-     33,232,225,236,230,247,233,228,244,104,128,255,124,236,245,113,
-      2,177, 53,177, 62,232,229,226,242,229,119,128,  5,189,236,229,
-    230,244,232,229,226,242,229,119,128,  5,189,237,233,236,225,114,
-    128, 34, 60,238,228,239,244,232,229,226,242,229,119,128,  5,194,
-    239,115,  6,177,111,177,146,177,178,177,206,177,220,177,252, 97,
-      2,177,117,177,132,227,233,242,227,236,229,235,239,242,229,225,
-    110,128, 50,116,240,225,242,229,238,235,239,242,229,225,110,128,
-     50, 20,227,105,  2,177,153,177,165,229,245,227,235,239,242,229,
-    225,110,128, 49,126,242,227,236,229,235,239,242,229,225,110,128,
-     50,102,107,  2,177,184,177,198,233,249,229,239,235,235,239,242,
-    229,225,110,128, 49,122,239,242,229,225,110,128, 49, 69,238,233,
-    229,245,238,235,239,242,229,225,110,128, 49,123,112,  2,177,226,
-    177,239,225,242,229,238,235,239,242,229,225,110,128, 50,  6,233,
-    229,245,240,235,239,242,229,225,110,128, 49,125,244,233,235,229,
-    245,244,235,239,242,229,225,110,128, 49,124,120,141,  0, 54,178,
-     41,178, 50,178, 60,178, 90,178, 97,178,122,178,149,178,183,178,
-    195,178,206,178,239,178,247,179,  2,225,242,225,226,233, 99,128,
-      6,102,226,229,238,231,225,236,105,128,  9,236,227,233,242,227,
-    236,101,129, 36,101,178, 71,233,238,246,229,242,243,229,243,225,
-    238,243,243,229,242,233,102,128, 39,143,228,229,246, 97,128,  9,
-    108,231,117,  2,178,104,178,113,234,225,242,225,244,105,128, 10,
-    236,242,237,245,235,232,105,128, 10,108,232, 97,  2,178,129,178,
-    140,227,235,225,242,225,226,233, 99,128,  6,102,238,231,250,232,
-    239,117,128, 48, 38,105,  2,178,155,178,173,228,229,239,231,242,
-    225,240,232,233,227,240,225,242,229,110,128, 50, 37,238,230,229,
-    242,233,239,114,128, 32,134,237,239,238,239,243,240,225,227,101,
-    128,255, 22,239,236,228,243,244,249,236,101,128,247, 54,112,  2,
-    178,212,178,219,225,242,229,110,128, 36,121,229,114,  2,178,226,
-    178,232,233,239,100,128, 36,141,243,233,225,110,128,  6,246,242,
-    239,237,225,110,128, 33,117,243,245,240,229,242,233,239,114,128,
-     32,118,116,  2,179,  8,179, 79,229,229,110,  2,179, 16,179, 58,
-     99,  2,179, 22,179, 30,233,242,227,236,101,128, 36,111,245,242,
-    242,229,238,227,249,228,229,238,239,237,233,238,225,244,239,242,
-    226,229,238,231,225,236,105,128,  9,249,112,  2,179, 64,179, 71,
-    225,242,229,110,128, 36,131,229,242,233,239,100,128, 36,151,232,
-    225,105,128, 14, 86,108,  2,179, 91,179,111,225,243,104,129,  0,
-     47,179, 99,237,239,238,239,243,240,225,227,101,128,255, 15,239,
-    238,103,129,  1,127,179,119,228,239,244,225,227,227,229,238,116,
-    128, 30,155,109,  2,179,137,179,147,233,236,229,230,225,227,101,
-    128, 38, 58,239,238,239,243,240,225,227,101,128,255, 83,111,  6,
-    179,172,179,222,179,233,180,  2,180, 47,180, 58,102,  2,179,178,
-    179,192,240,225,243,245,241,232,229,226,242,229,119,128,  5,195,
-    116,  2,179,198,179,207,232,249,240,232,229,110,128,  0,173,243,
-    233,231,238,227,249,242,233,236,236,233, 99,128,  4, 76,232,233,
-    242,225,231,225,238, 97,128, 48, 93,235,225,244,225,235,225,238,
-     97,129, 48,189,179,246,232,225,236,230,247,233,228,244,104,128,
-    255,127,236,233,228,245,115,  2,180, 12,180, 29,236,239,238,231,
-    239,246,229,242,236,225,249,227,237, 98,128,  3, 56,243,232,239,
-    242,244,239,246,229,242,236,225,249,227,237, 98,128,  3, 55,242,
-    245,243,233,244,232,225,105,128, 14, 41,115,  3,180, 66,180, 76,
-    180, 84,225,236,225,244,232,225,105,128, 14, 40,239,244,232,225,
-    105,128, 14, 11,245,225,244,232,225,105,128, 14, 42,240, 97,  3,
-    180,102,180,122,180,154,227,101,129,  0, 32,180,109,232,225,227,
-    235,225,242,225,226,233, 99,128,  0, 32,228,101,129, 38, 96,180,
-    129,243,245,233,116,  2,180,138,180,146,226,236,225,227,107,128,
-     38, 96,247,232,233,244,101,128, 38,100,242,229,110,128, 36,174,
-    241,245,225,242,101, 11,180,188,180,199,180,213,180,238,180,255,
-    181, 25,181, 40,181, 73,181,100,181,156,181,171,226,229,236,239,
-    247,227,237, 98,128,  3, 59, 99,  2,180,205,180,209, 99,128, 51,
-    196,109,128, 51,157,228,233,225,231,239,238,225,236,227,242,239,
-    243,243,232,225,244,227,232,230,233,236,108,128, 37,169,232,239,
-    242,233,250,239,238,244,225,236,230,233,236,108,128, 37,164,107,
-      2,181,  5,181,  9,103,128, 51,143,109,129, 51,158,181, 15,227,
-    225,240,233,244,225,108,128, 51,206,108,  2,181, 31,181, 35,110,
-    128, 51,209,239,103,128, 51,210,109,  4,181, 50,181, 54,181, 59,
-    181, 63,103,128, 51,142,233,108,128, 51,213,109,128, 51,156,243,
-    241,245,225,242,229,100,128, 51,161,239,242,244,232,239,231,239,
-    238,225,236,227,242,239,243,243,232,225,244,227,232,230,233,236,
-    108,128, 37,166,245,240,240,229,114,  2,181,110,181,133,236,229,
-    230,244,244,239,236,239,247,229,242,242,233,231,232,244,230,233,
-    236,108,128, 37,167,242,233,231,232,244,244,239,236,239,247,229,
-    242,236,229,230,244,230,233,236,108,128, 37,168,246,229,242,244,
-    233,227,225,236,230,233,236,108,128, 37,165,247,232,233,244,229,
-    247,233,244,232,243,237,225,236,236,226,236,225,227,107,128, 37,
-    163,242,243,241,245,225,242,101,128, 51,219,115,  2,181,209,182,
-    123, 97,  4,181,219,181,229,181,236,181,247,226,229,238,231,225,
-    236,105,128,  9,183,228,229,246, 97,128,  9, 55,231,245,234,225,
-    242,225,244,105,128, 10,183,238,103,  8,182, 10,182, 24,182, 38,
-    182, 52,182, 67,182, 81,182, 95,182,108,227,233,229,245,227,235,
-    239,242,229,225,110,128, 49, 73,232,233,229,245,232,235,239,242,
-    229,225,110,128, 49,133,233,229,245,238,231,235,239,242,229,225,
-    110,128, 49,128,235,233,249,229,239,235,235,239,242,229,225,110,
-    128, 49, 50,238,233,229,245,238,235,239,242,229,225,110,128, 49,
-    101,240,233,229,245,240,235,239,242,229,225,110,128, 49, 67,243,
-    233,239,243,235,239,242,229,225,110,128, 49, 70,244,233,235,229,
-    245,244,235,239,242,229,225,110,128, 49, 56,245,240,229,242,233,
-    239,114,128,246,242,116,  2,182,139,182,162,229,242,236,233,238,
-    103,129,  0,163,182,150,237,239,238,239,243,240,225,227,101,128,
-    255,225,242,239,235,101,  2,182,171,182,188,236,239,238,231,239,
-    246,229,242,236,225,249,227,237, 98,128,  3, 54,243,232,239,242,
-    244,239,246,229,242,236,225,249,227,237, 98,128,  3, 53,117,  7,
-    182,222,182,254,183, 20,183, 31,183, 72,183, 82,183, 86,226,243,
-    229,116,130, 34,130,182,233,182,244,238,239,244,229,241,245,225,
-    108,128, 34,138,239,242,229,241,245,225,108,128, 34,134, 99,  2,
-    183,  4,183, 12,227,229,229,228,115,128, 34,123,232,244,232,225,
-    116,128, 34, 11,232,233,242,225,231,225,238, 97,128, 48, 89,107,
-      2,183, 37,183, 61,225,244,225,235,225,238, 97,129, 48,185,183,
-     49,232,225,236,230,247,233,228,244,104,128,255,125,245,238,225,
-    242,225,226,233, 99,128,  6, 82,237,237,225,244,233,239,110,128,
-     34, 17,110,128, 38, 60,240,229,242,243,229,116,130, 34,131,183,
-     99,183,110,238,239,244,229,241,245,225,108,128, 34,139,239,242,
-    229,241,245,225,108,128, 34,135,246,243,241,245,225,242,101,128,
-     51,220,249,239,245,247,225,229,242,225,243,241,245,225,242,101,
-    128, 51,124,116,144,  0,116,183,183,184,192,184,213,185,100,185,
-    140,187,188,191, 70,192,145,192,157,192,169,193,202,193,227,194,
-     57,194,237,195,165,195,255, 97, 10,183,205,183,215,183,236,183,
-    243,184, 12,184, 90,184,107,184,132,184,146,184,150,226,229,238,
-    231,225,236,105,128,  9,164,227,107,  2,183,222,183,229,228,239,
-    247,110,128, 34,164,236,229,230,116,128, 34,163,228,229,246, 97,
-    128,  9, 36,231,117,  2,183,250,184,  3,234,225,242,225,244,105,
-    128, 10,164,242,237,245,235,232,105,128, 10, 36,104,  4,184, 22,
-    184, 31,184, 45,184, 75,225,242,225,226,233, 99,128,  6, 55,230,
-    233,238,225,236,225,242,225,226,233, 99,128,254,194,105,  2,184,
-     51,184, 66,238,233,244,233,225,236,225,242,225,226,233, 99,128,
-    254,195,242,225,231,225,238, 97,128, 48, 95,237,229,228,233,225,
-    236,225,242,225,226,233, 99,128,254,196,233,243,249,239,245,229,
-    242,225,243,241,245,225,242,101,128, 51,125,235,225,244,225,235,
-    225,238, 97,129, 48,191,184,120,232,225,236,230,247,233,228,244,
-    104,128,255,128,244,247,229,229,236,225,242,225,226,233, 99,128,
-      6, 64,117,128,  3,196,118,130,  5,234,184,158,184,183,228,225,
-    231,229,115,129,251, 74,184,168,104,129,251, 74,184,174,232,229,
-    226,242,229,119,128,251, 74,232,229,226,242,229,119,128,  5,234,
-     98,  2,184,198,184,203,225,114,128,  1,103,239,240,239,237,239,
-    230,111,128, 49, 10, 99,  6,184,227,184,234,184,241,184,250,185,
-     60,185, 87,225,242,239,110,128,  1,101,227,245,242,108,128,  2,
-    168,229,228,233,236,236, 97,128,  1, 99,232,229,104,  4,185,  6,
-    185, 15,185, 29,185, 45,225,242,225,226,233, 99,128,  6,134,230,
-    233,238,225,236,225,242,225,226,233, 99,128,251,123,233,238,233,
-    244,233,225,236,225,242,225,226,233, 99,128,251,124,237,229,228,
-    233,225,236,225,242,225,226,233, 99,128,251,125,233,242, 99,  2,
-    185, 68,185, 73,236,101,128, 36,227,245,237,230,236,229,248,226,
-    229,236,239,119,128, 30,113,239,237,237,225,225,227,227,229,238,
-    116,128,  1, 99,100,  2,185,106,185,116,233,229,242,229,243,233,
-    115,128, 30,151,239,116,  2,185,123,185,132,225,227,227,229,238,
-    116,128, 30,107,226,229,236,239,119,128, 30,109,101,  9,185,160,
-    185,171,185,191,186,201,186,226,187, 34,187,101,187,106,187,158,
-    227,249,242,233,236,236,233, 99,128,  4, 66,228,229,243,227,229,
-    238,228,229,242,227,249,242,233,236,236,233, 99,128,  4,173,104,
-      7,185,207,185,216,185,230,186, 14,186, 44,186, 85,186,183,225,
-    242,225,226,233, 99,128,  6, 42,230,233,238,225,236,225,242,225,
-    226,233, 99,128,254,150,232,225,232,105,  2,185,239,185,254,238,
-    233,244,233,225,236,225,242,225,226,233, 99,128,252,162,243,239,
-    236,225,244,229,228,225,242,225,226,233, 99,128,252, 12,105,  2,
-    186, 20,186, 35,238,233,244,233,225,236,225,242,225,226,233, 99,
-    128,254,151,242,225,231,225,238, 97,128, 48,102,234,229,229,237,
-    105,  2,186, 54,186, 69,238,233,244,233,225,236,225,242,225,226,
-    233, 99,128,252,161,243,239,236,225,244,229,228,225,242,225,226,
-    233, 99,128,252, 11,109,  2,186, 91,186,125,225,242,226,245,244,
-     97,  2,186,102,186,111,225,242,225,226,233, 99,128,  6, 41,230,
-    233,238,225,236,225,242,225,226,233, 99,128,254,148,101,  2,186,
-    131,186,144,228,233,225,236,225,242,225,226,233, 99,128,254,152,
-    229,237,105,  2,186,152,186,167,238,233,244,233,225,236,225,242,
-    225,226,233, 99,128,252,164,243,239,236,225,244,229,228,225,242,
-    225,226,233, 99,128,252, 14,238,239,239,238,230,233,238,225,236,
-    225,242,225,226,233, 99,128,252,115,235,225,244,225,235,225,238,
-     97,129, 48,198,186,214,232,225,236,230,247,233,228,244,104,128,
-    255,131,108,  2,186,232,186,251,229,240,232,239,238,101,129, 33,
-     33,186,243,226,236,225,227,107,128, 38, 14,233,243,232, 97,  2,
-    187,  4,187, 19,231,229,228,239,236,225,232,229,226,242,229,119,
-    128,  5,160,241,229,244,225,238,225,232,229,226,242,229,119,128,
-      5,169,110,  4,187, 44,187, 53,187, 72,187, 93,227,233,242,227,
-    236,101,128, 36,105,233,228,229,239,231,242,225,240,232,233,227,
-    240,225,242,229,110,128, 50, 41,112,  2,187, 78,187, 85,225,242,
-    229,110,128, 36,125,229,242,233,239,100,128, 36,145,242,239,237,
-    225,110,128, 33,121,243,104,128,  2,167,116,131,  5,216,187,116,
-    187,136,187,145,228,225,231,229,243,104,129,251, 56,187,127,232,
-    229,226,242,229,119,128,251, 56,232,229,226,242,229,119,128,  5,
-    216,243,229,227,249,242,233,236,236,233, 99,128,  4,181,246,233,
-    114,  2,187,166,187,175,232,229,226,242,229,119,128,  5,155,236,
-    229,230,244,232,229,226,242,229,119,128,  5,155,104,  6,187,202,
-    188, 98,188,220,189, 96,190,  3,191, 60, 97,  5,187,214,187,224,
-    187,231,188,  0,188, 29,226,229,238,231,225,236,105,128,  9,165,
-    228,229,246, 97,128,  9, 37,231,117,  2,187,238,187,247,234,225,
-    242,225,244,105,128, 10,165,242,237,245,235,232,105,128, 10, 37,
-    108,  2,188,  6,188, 15,225,242,225,226,233, 99,128,  6, 48,230,
-    233,238,225,236,225,242,225,226,233, 99,128,254,172,238,244,232,
-    225,235,232,225,116,  3,188, 44,188, 75,188, 82,236,239,119,  2,
-    188, 52,188, 63,236,229,230,244,244,232,225,105,128,248,152,242,
-    233,231,232,244,244,232,225,105,128,248,151,244,232,225,105,128,
-     14, 76,245,240,240,229,242,236,229,230,244,244,232,225,105,128,
-    248,150,101,  3,188,106,188,170,188,193,104,  4,188,116,188,125,
-    188,139,188,155,225,242,225,226,233, 99,128,  6, 43,230,233,238,
-    225,236,225,242,225,226,233, 99,128,254,154,233,238,233,244,233,
-    225,236,225,242,225,226,233, 99,128,254,155,237,229,228,233,225,
-    236,225,242,225,226,233, 99,128,254,156,242,101,  2,188,177,188,
-    186,229,248,233,243,244,115,128, 34,  3,230,239,242,101,128, 34,
-     52,244, 97,130,  3,184,188,202,188,206, 49,128,  3,209,243,249,
-    237,226,239,236,231,242,229,229,107,128,  3,209,105,  2,188,226,
-    189, 56,229,245,244,104,  4,188,239,189, 18,189, 33,189, 42, 97,
-      2,188,245,189,  4,227,233,242,227,236,229,235,239,242,229,225,
-    110,128, 50,121,240,225,242,229,238,235,239,242,229,225,110,128,
-     50, 25,227,233,242,227,236,229,235,239,242,229,225,110,128, 50,
-    107,235,239,242,229,225,110,128, 49, 76,240,225,242,229,238,235,
-    239,242,229,225,110,128, 50, 11,242,244,229,229,110,  2,189, 66,
-    189, 75,227,233,242,227,236,101,128, 36,108,112,  2,189, 81,189,
-     88,225,242,229,110,128, 36,128,229,242,233,239,100,128, 36,148,
-    111,  6,189,110,189,127,189,132,189,146,189,151,189,204,238,225,
-    238,231,237,239,238,244,232,239,244,232,225,105,128, 14, 17,239,
-    107,128,  1,173,240,232,245,244,232,225,239,244,232,225,105,128,
-     14, 18,242,110,128,  0,254,244,104,  3,189,160,189,184,189,194,
-     97,  2,189,166,189,176,232,225,238,244,232,225,105,128, 14, 23,
-    238,244,232,225,105,128, 14, 16,239,238,231,244,232,225,105,128,
-     14, 24,245,238,231,244,232,225,105,128, 14, 22,245,243,225,238,
-    100,  2,189,214,189,225,227,249,242,233,236,236,233, 99,128,  4,
-    130,243,243,229,240,225,242,225,244,239,114,  2,189,240,189,249,
-    225,242,225,226,233, 99,128,  6,108,240,229,242,243,233,225,110,
-    128,  6,108,242,229,101,144,  0, 51,190, 41,190, 50,190, 60,190,
-     90,190, 97,190,107,190,132,190,159,190,193,190,205,190,224,190,
-    235,191, 12,191, 34,191, 42,191, 53,225,242,225,226,233, 99,128,
-      6, 99,226,229,238,231,225,236,105,128,  9,233,227,233,242,227,
-    236,101,129, 36, 98,190, 71,233,238,246,229,242,243,229,243,225,
-    238,243,243,229,242,233,102,128, 39,140,228,229,246, 97,128,  9,
-    105,229,233,231,232,244,232,115,128, 33, 92,231,117,  2,190,114,
-    190,123,234,225,242,225,244,105,128, 10,233,242,237,245,235,232,
-    105,128, 10,105,232, 97,  2,190,139,190,150,227,235,225,242,225,
-    226,233, 99,128,  6, 99,238,231,250,232,239,117,128, 48, 35,105,
-      2,190,165,190,183,228,229,239,231,242,225,240,232,233,227,240,
-    225,242,229,110,128, 50, 34,238,230,229,242,233,239,114,128, 32,
-    131,237,239,238,239,243,240,225,227,101,128,255, 19,238,245,237,
-    229,242,225,244,239,242,226,229,238,231,225,236,105,128,  9,246,
-    239,236,228,243,244,249,236,101,128,247, 51,112,  2,190,241,190,
-    248,225,242,229,110,128, 36,118,229,114,  2,190,255,191,  5,233,
-    239,100,128, 36,138,243,233,225,110,128,  6,243,241,245,225,242,
-    244,229,242,115,129,  0,190,191, 25,229,237,228,225,243,104,128,
-    246,222,242,239,237,225,110,128, 33,114,243,245,240,229,242,233,
-    239,114,128,  0,179,244,232,225,105,128, 14, 83,250,243,241,245,
-    225,242,101,128, 51,148,105,  7,191, 86,191, 97,191,212,192, 54,
-    192, 66,192,115,192,132,232,233,242,225,231,225,238, 97,128, 48,
-     97,107,  2,191,103,191,127,225,244,225,235,225,238, 97,129, 48,
-    193,191,115,232,225,236,230,247,233,228,244,104,128,255,129,229,
-    245,116,  4,191,139,191,174,191,189,191,198, 97,  2,191,145,191,
-    160,227,233,242,227,236,229,235,239,242,229,225,110,128, 50,112,
-    240,225,242,229,238,235,239,242,229,225,110,128, 50, 16,227,233,
-    242,227,236,229,235,239,242,229,225,110,128, 50, 98,235,239,242,
-    229,225,110,128, 49, 55,240,225,242,229,238,235,239,242,229,225,
-    110,128, 50,  2,236,228,101,133,  2,220,191,228,191,239,192,  0,
-    192, 12,192, 40,226,229,236,239,247,227,237, 98,128,  3, 48, 99,
-      2,191,245,191,250,237, 98,128,  3,  3,239,237, 98,128,  3,  3,
-    228,239,245,226,236,229,227,237, 98,128,  3, 96,111,  2,192, 18,
-    192, 28,240,229,242,225,244,239,114,128, 34, 60,246,229,242,236,
-    225,249,227,237, 98,128,  3, 52,246,229,242,244,233,227,225,236,
-    227,237, 98,128,  3, 62,237,229,243,227,233,242,227,236,101,128,
-     34,151,112,  2,192, 72,192,102,229,232, 97,  2,192, 80,192, 89,
-    232,229,226,242,229,119,128,  5,150,236,229,230,244,232,229,226,
-    242,229,119,128,  5,150,240,233,231,245,242,237,245,235,232,105,
-    128, 10,112,244,236,239,227,249,242,233,236,236,233,227,227,237,
-     98,128,  4,131,247,238,225,242,237,229,238,233,225,110,128,  5,
-    127,236,233,238,229,226,229,236,239,119,128, 30,111,237,239,238,
-    239,243,240,225,227,101,128,255, 84,111,  7,192,185,192,196,192,
-    207,192,232,193, 96,193,108,193,192,225,242,237,229,238,233,225,
-    110,128,  5,105,232,233,242,225,231,225,238, 97,128, 48,104,235,
-    225,244,225,235,225,238, 97,129, 48,200,192,220,232,225,236,230,
-    247,233,228,244,104,128,255,132,110,  3,192,240,193, 82,193, 87,
-    101,  4,192,250,193, 63,193, 70,193, 76,226,225,114,  4,193,  6,
-    193, 35,193, 45,193, 54,229,248,244,242, 97,  2,193, 16,193, 26,
-    232,233,231,232,237,239,100,128,  2,229,236,239,247,237,239,100,
-    128,  2,233,232,233,231,232,237,239,100,128,  2,230,236,239,247,
-    237,239,100,128,  2,232,237,233,228,237,239,100,128,  2,231,230,
-    233,246,101,128,  1,189,243,233,120,128,  1,133,244,247,111,128,
-      1,168,239,115,128,  3,132,243,241,245,225,242,101,128, 51, 39,
-    240,225,244,225,235,244,232,225,105,128, 14, 15,242,244,239,233,
-    243,229,243,232,229,236,236,226,242,225,227,235,229,116,  2,193,
-    131,193,161,236,229,230,116,130, 48, 20,193,142,193,150,243,237,
-    225,236,108,128,254, 93,246,229,242,244,233,227,225,108,128,254,
-     57,242,233,231,232,116,130, 48, 21,193,173,193,181,243,237,225,
-    236,108,128,254, 94,246,229,242,244,233,227,225,108,128,254, 58,
-    244,225,239,244,232,225,105,128, 14, 21,240, 97,  2,193,209,193,
-    221,236,225,244,225,236,232,239,239,107,128,  1,171,242,229,110,
-    128, 36,175,114,  3,193,235,194, 10,194, 25,225,228,229,237,225,
-    242,107,129, 33, 34,193,247,115,  2,193,253,194,  3,225,238,115,
-    128,248,234,229,242,233,102,128,246,219,229,244,242,239,230,236,
-    229,248,232,239,239,107,128,  2,136,233,225,103,  4,194, 37,194,
-     42,194, 47,194, 52,228,110,128, 37,188,236,102,128, 37,196,242,
-    116,128, 37,186,245,112,128, 37,178,115,132,  2,166,194, 69,194,
-    108,194,214,194,227,225,228,105,130,  5,230,194, 79,194, 99,228,
-    225,231,229,243,104,129,251, 70,194, 90,232,229,226,242,229,119,
-    128,251, 70,232,229,226,242,229,119,128,  5,230,101,  2,194,114,
-    194,125,227,249,242,233,236,236,233, 99,128,  4, 70,242,101,134,
-      5,181,194,142,194,156,194,161,194,170,194,185,194,201, 49,  2,
-    194,148,194,152, 50,128,  5,181,101,128,  5,181,178, 98,128,  5,
-    181,232,229,226,242,229,119,128,  5,181,238,225,242,242,239,247,
-    232,229,226,242,229,119,128,  5,181,241,245,225,242,244,229,242,
-    232,229,226,242,229,119,128,  5,181,247,233,228,229,232,229,226,
-    242,229,119,128,  5,181,232,229,227,249,242,233,236,236,233, 99,
-    128,  4, 91,245,240,229,242,233,239,114,128,246,243,116,  4,194,
-    247,195, 41,195,106,195,157, 97,  3,194,255,195,  9,195, 16,226,
-    229,238,231,225,236,105,128,  9,159,228,229,246, 97,128,  9, 31,
-    231,117,  2,195, 23,195, 32,234,225,242,225,244,105,128, 10,159,
-    242,237,245,235,232,105,128, 10, 31,229,104,  4,195, 52,195, 61,
-    195, 75,195, 91,225,242,225,226,233, 99,128,  6,121,230,233,238,
-    225,236,225,242,225,226,233, 99,128,251,103,233,238,233,244,233,
-    225,236,225,242,225,226,233, 99,128,251,104,237,229,228,233,225,
-    236,225,242,225,226,233, 99,128,251,105,232, 97,  3,195,115,195,
-    125,195,132,226,229,238,231,225,236,105,128,  9,160,228,229,246,
-     97,128,  9, 32,231,117,  2,195,139,195,148,234,225,242,225,244,
-    105,128, 10,160,242,237,245,235,232,105,128, 10, 32,245,242,238,
-    229,100,128,  2,135,117,  3,195,173,195,184,195,209,232,233,242,
-    225,231,225,238, 97,128, 48,100,235,225,244,225,235,225,238, 97,
-    129, 48,196,195,197,232,225,236,230,247,233,228,244,104,128,255,
-    130,243,237,225,236,108,  2,195,219,195,230,232,233,242,225,231,
-    225,238, 97,128, 48, 99,235,225,244,225,235,225,238, 97,129, 48,
-    195,195,243,232,225,236,230,247,233,228,244,104,128,255,111,119,
-      2,196,  5,196,110,101,  2,196, 11,196, 59,236,246,101,  3,196,
-     21,196, 30,196, 51,227,233,242,227,236,101,128, 36,107,112,  2,
-    196, 36,196, 43,225,242,229,110,128, 36,127,229,242,233,239,100,
-    128, 36,147,242,239,237,225,110,128, 33,123,238,244,121,  3,196,
-     69,196, 78,196, 89,227,233,242,227,236,101,128, 36,115,232,225,
-    238,231,250,232,239,117,128, 83, 68,112,  2,196, 95,196,102,225,
-    242,229,110,128, 36,135,229,242,233,239,100,128, 36,155,111,142,
-      0, 50,196,142,196,151,196,161,196,191,196,243,197, 12,197, 39,
-    197, 73,197, 85,197,104,197,115,197,148,197,156,197,180,225,242,
-    225,226,233, 99,128,  6, 98,226,229,238,231,225,236,105,128,  9,
-    232,227,233,242,227,236,101,129, 36, 97,196,172,233,238,246,229,
-    242,243,229,243,225,238,243,243,229,242,233,102,128, 39,139,100,
-      2,196,197,196,203,229,246, 97,128,  9,104,239,116,  2,196,210,
-    196,221,229,238,236,229,225,228,229,114,128, 32, 37,236,229,225,
-    228,229,114,129, 32, 37,196,232,246,229,242,244,233,227,225,108,
-    128,254, 48,231,117,  2,196,250,197,  3,234,225,242,225,244,105,
-    128, 10,232,242,237,245,235,232,105,128, 10,104,232, 97,  2,197,
-     19,197, 30,227,235,225,242,225,226,233, 99,128,  6, 98,238,231,
-    250,232,239,117,128, 48, 34,105,  2,197, 45,197, 63,228,229,239,
-    231,242,225,240,232,233,227,240,225,242,229,110,128, 50, 33,238,
-    230,229,242,233,239,114,128, 32,130,237,239,238,239,243,240,225,
-    227,101,128,255, 18,238,245,237,229,242,225,244,239,242,226,229,
-    238,231,225,236,105,128,  9,245,239,236,228,243,244,249,236,101,
-    128,247, 50,112,  2,197,121,197,128,225,242,229,110,128, 36,117,
-    229,114,  2,197,135,197,141,233,239,100,128, 36,137,243,233,225,
-    110,128,  6,242,242,239,237,225,110,128, 33,113,115,  2,197,162,
-    197,170,244,242,239,235,101,128,  1,187,245,240,229,242,233,239,
-    114,128,  0,178,244,104,  2,197,187,197,192,225,105,128, 14, 82,
-    233,242,228,115,128, 33, 84,117,145,  0,117,197,237,197,245,198,
-     30,198, 87,198,225,199,  6,199,129,199,145,199,196,200, 10,200,
-     91,200,100,200,219,200,243,201, 95,201,123,201,237,225,227,245,
-    244,101,128,  0,250, 98,  4,197,255,198,  4,198, 13,198, 23,225,
-    114,128,  2,137,229,238,231,225,236,105,128,  9,137,239,240,239,
-    237,239,230,111,128, 49, 40,242,229,246,101,128,  1,109, 99,  3,
-    198, 38,198, 45,198, 77,225,242,239,110,128,  1,212,233,242, 99,
-      2,198, 53,198, 58,236,101,128, 36,228,245,237,230,236,229,120,
-    129,  0,251,198, 69,226,229,236,239,119,128, 30,119,249,242,233,
-    236,236,233, 99,128,  4, 67,100,  5,198, 99,198,110,198,133,198,
-    139,198,215,225,244,244,225,228,229,246, 97,128,  9, 81,226,108,
-      2,198,117,198,125,225,227,245,244,101,128,  1,113,231,242,225,
-    246,101,128,  2, 21,229,246, 97,128,  9,  9,233,229,242,229,243,
-    233,115,133,  0,252,198,159,198,167,198,175,198,198,198,206,225,
-    227,245,244,101,128,  1,216,226,229,236,239,119,128, 30,115, 99,
-      2,198,181,198,188,225,242,239,110,128,  1,218,249,242,233,236,
-    236,233, 99,128,  4,241,231,242,225,246,101,128,  1,220,237,225,
-    227,242,239,110,128,  1,214,239,244,226,229,236,239,119,128, 30,
-    229,103,  2,198,231,198,238,242,225,246,101,128,  0,249,117,  2,
-    198,244,198,253,234,225,242,225,244,105,128, 10,137,242,237,245,
-    235,232,105,128, 10,  9,104,  3,199, 14,199, 24,199,102,233,242,
-    225,231,225,238, 97,128, 48, 70,111,  2,199, 30,199, 40,239,235,
-    225,226,239,246,101,128, 30,231,242,110,133,  1,176,199, 55,199,
-     63,199, 74,199, 82,199, 94,225,227,245,244,101,128, 30,233,228,
-    239,244,226,229,236,239,119,128, 30,241,231,242,225,246,101,128,
-     30,235,232,239,239,235,225,226,239,246,101,128, 30,237,244,233,
-    236,228,101,128, 30,239,245,238,231,225,242,245,237,236,225,245,
-    116,129,  1,113,199,118,227,249,242,233,236,236,233, 99,128,  4,
-    243,233,238,246,229,242,244,229,228,226,242,229,246,101,128,  2,
-     23,107,  3,199,153,199,177,199,188,225,244,225,235,225,238, 97,
-    129, 48,166,199,165,232,225,236,230,247,233,228,244,104,128,255,
-    115,227,249,242,233,236,236,233, 99,128,  4,121,239,242,229,225,
-    110,128, 49, 92,109,  2,199,202,199,255, 97,  2,199,208,199,241,
-    227,242,239,110,130,  1,107,199,219,199,230,227,249,242,233,236,
-    236,233, 99,128,  4,239,228,233,229,242,229,243,233,115,128, 30,
-    123,244,242,225,231,245,242,237,245,235,232,105,128, 10, 65,239,
-    238,239,243,240,225,227,101,128,255, 85,110,  2,200, 16,200, 71,
-    228,229,242,243,227,239,242,101,132,  0, 95,200, 35,200, 41,200,
-     53,200, 64,228,226,108,128, 32, 23,237,239,238,239,243,240,225,
-    227,101,128,255, 63,246,229,242,244,233,227,225,108,128,254, 51,
-    247,225,246,121,128,254, 79,105,  2,200, 77,200, 82,239,110,128,
-     34, 42,246,229,242,243,225,108,128, 34,  0,239,231,239,238,229,
-    107,128,  1,115,112,  5,200,112,200,119,200,127,200,142,200,193,
-    225,242,229,110,128, 36,176,226,236,239,227,107,128, 37,128,240,
-    229,242,228,239,244,232,229,226,242,229,119,128,  5,196,243,233,
-    236,239,110,131,  3,197,200,156,200,177,200,185,228,233,229,242,
-    229,243,233,115,129,  3,203,200,169,244,239,238,239,115,128,  3,
-    176,236,225,244,233,110,128,  2,138,244,239,238,239,115,128,  3,
-    205,244,225,227,107,  2,200,202,200,213,226,229,236,239,247,227,
-    237, 98,128,  3, 29,237,239,100,128,  2,212,114,  2,200,225,200,
-    237,225,231,245,242,237,245,235,232,105,128, 10,115,233,238,103,
-    128,  1,111,115,  3,200,251,201, 10,201, 55,232,239,242,244,227,
-    249,242,233,236,236,233, 99,128,  4, 94,237,225,236,108,  2,201,
-     19,201, 30,232,233,242,225,231,225,238, 97,128, 48, 69,235,225,
-    244,225,235,225,238, 97,129, 48,165,201, 43,232,225,236,230,247,
-    233,228,244,104,128,255,105,244,242,225,233,231,232,116,  2,201,
-     67,201, 78,227,249,242,233,236,236,233, 99,128,  4,175,243,244,
-    242,239,235,229,227,249,242,233,236,236,233, 99,128,  4,177,244,
-    233,236,228,101,130,  1,105,201,107,201,115,225,227,245,244,101,
-    128, 30,121,226,229,236,239,119,128, 30,117,117,  5,201,135,201,
-    145,201,152,201,177,201,193,226,229,238,231,225,236,105,128,  9,
-    138,228,229,246, 97,128,  9, 10,231,117,  2,201,159,201,168,234,
-    225,242,225,244,105,128, 10,138,242,237,245,235,232,105,128, 10,
-     10,237,225,244,242,225,231,245,242,237,245,235,232,105,128, 10,
-     66,246,239,247,229,236,243,233,231,110,  3,201,209,201,219,201,
-    226,226,229,238,231,225,236,105,128,  9,194,228,229,246, 97,128,
-      9, 66,231,245,234,225,242,225,244,105,128, 10,194,246,239,247,
-    229,236,243,233,231,110,  3,201,253,202,  7,202, 14,226,229,238,
-    231,225,236,105,128,  9,193,228,229,246, 97,128,  9, 65,231,245,
-    234,225,242,225,244,105,128, 10,193,118,139,  0,118,202, 51,202,
-    199,202,208,202,219,203,148,203,155,203,253,204,  9,204,109,204,
-    117,204,138, 97,  4,202, 61,202, 68,202, 93,202,104,228,229,246,
-     97,128,  9, 53,231,117,  2,202, 75,202, 84,234,225,242,225,244,
-    105,128, 10,181,242,237,245,235,232,105,128, 10, 53,235,225,244,
-    225,235,225,238, 97,128, 48,247,118,132,  5,213,202,116,202,143,
-    202,175,202,187,228,225,231,229,243,104,130,251, 53,202,129,202,
-    134,182, 53,128,251, 53,232,229,226,242,229,119,128,251, 53,104,
-      2,202,149,202,157,229,226,242,229,119,128,  5,213,239,236,225,
-    109,129,251, 75,202,166,232,229,226,242,229,119,128,251, 75,246,
-    225,246,232,229,226,242,229,119,128,  5,240,249,239,228,232,229,
-    226,242,229,119,128,  5,241,227,233,242,227,236,101,128, 36,229,
-    228,239,244,226,229,236,239,119,128, 30,127,101,  6,202,233,202,
-    244,203, 52,203, 63,203, 69,203,136,227,249,242,233,236,236,233,
-     99,128,  4, 50,104,  4,202,254,203,  7,203, 21,203, 37,225,242,
-    225,226,233, 99,128,  6,164,230,233,238,225,236,225,242,225,226,
-    233, 99,128,251,107,233,238,233,244,233,225,236,225,242,225,226,
-    233, 99,128,251,108,237,229,228,233,225,236,225,242,225,226,233,
-     99,128,251,109,235,225,244,225,235,225,238, 97,128, 48,249,238,
-    245,115,128, 38, 64,242,244,233,227,225,108,  2,203, 80,203, 86,
-    226,225,114,128,  0,124,236,233,238,101,  4,203, 99,203,110,203,
-    121,203,130,225,226,239,246,229,227,237, 98,128,  3, 13,226,229,
-    236,239,247,227,237, 98,128,  3, 41,236,239,247,237,239,100,128,
-      2,204,237,239,100,128,  2,200,247,225,242,237,229,238,233,225,
-    110,128,  5,126,232,239,239,107,128,  2,139,105,  3,203,163,203,
-    174,203,213,235,225,244,225,235,225,238, 97,128, 48,248,242,225,
-    237, 97,  3,203,185,203,195,203,202,226,229,238,231,225,236,105,
-    128,  9,205,228,229,246, 97,128,  9, 77,231,245,234,225,242,225,
-    244,105,128, 10,205,243,225,242,231, 97,  3,203,225,203,235,203,
-    242,226,229,238,231,225,236,105,128,  9,131,228,229,246, 97,128,
-      9,  3,231,245,234,225,242,225,244,105,128, 10,131,237,239,238,
-    239,243,240,225,227,101,128,255, 86,111,  3,204, 17,204, 28,204,
-     98,225,242,237,229,238,233,225,110,128,  5,120,233,227,229,100,
-      2,204, 37,204, 73,233,244,229,242,225,244,233,239,110,  2,204,
-     51,204, 62,232,233,242,225,231,225,238, 97,128, 48,158,235,225,
-    244,225,235,225,238, 97,128, 48,254,237,225,242,235,235,225,238,
-     97,129, 48,155,204, 86,232,225,236,230,247,233,228,244,104,128,
-    255,158,235,225,244,225,235,225,238, 97,128, 48,250,240,225,242,
-    229,110,128, 36,177,116,  2,204,123,204,130,233,236,228,101,128,
-     30,125,245,242,238,229,100,128,  2,140,117,  2,204,144,204,155,
-    232,233,242,225,231,225,238, 97,128, 48,148,235,225,244,225,235,
-    225,238, 97,128, 48,244,119,143,  0,119,204,200,205,177,205,187,
-    205,210,205,250,206, 61,206, 69,208, 40,208, 81,208, 93,208,168,
-    208,176,208,183,208,194,208,203, 97,  8,204,218,204,225,204,235,
-    204,246,205, 28,205, 60,205, 72,205,108,227,245,244,101,128, 30,
-    131,229,235,239,242,229,225,110,128, 49, 89,232,233,242,225,231,
-    225,238, 97,128, 48,143,107,  2,204,252,205, 20,225,244,225,235,
-    225,238, 97,129, 48,239,205,  8,232,225,236,230,247,233,228,244,
-    104,128,255,156,239,242,229,225,110,128, 49, 88,243,237,225,236,
-    108,  2,205, 38,205, 49,232,233,242,225,231,225,238, 97,128, 48,
-    142,235,225,244,225,235,225,238, 97,128, 48,238,244,244,239,243,
-    241,245,225,242,101,128, 51, 87,118,  2,205, 78,205, 86,229,228,
-    225,243,104,128, 48, 28,249,245,238,228,229,242,243,227,239,242,
-    229,246,229,242,244,233,227,225,108,128,254, 52,119,  3,205,116,
-    205,125,205,139,225,242,225,226,233, 99,128,  6, 72,230,233,238,
-    225,236,225,242,225,226,233, 99,128,254,238,232,225,237,250,225,
-    225,226,239,246,101,  2,205,154,205,163,225,242,225,226,233, 99,
-    128,  6, 36,230,233,238,225,236,225,242,225,226,233, 99,128,254,
-    134,226,243,241,245,225,242,101,128, 51,221,227,233,242, 99,  2,
-    205,196,205,201,236,101,128, 36,230,245,237,230,236,229,120,128,
-      1,117,100,  2,205,216,205,226,233,229,242,229,243,233,115,128,
-     30,133,239,116,  2,205,233,205,242,225,227,227,229,238,116,128,
-     30,135,226,229,236,239,119,128, 30,137,101,  4,206,  4,206, 15,
-    206, 27,206, 51,232,233,242,225,231,225,238, 97,128, 48,145,233,
-    229,242,243,244,242,225,243,115,128, 33, 24,107,  2,206, 33,206,
-     43,225,244,225,235,225,238, 97,128, 48,241,239,242,229,225,110,
-    128, 49, 94,239,235,239,242,229,225,110,128, 49, 93,231,242,225,
-    246,101,128, 30,129,232,233,244,101,  8,206, 90,206, 99,206,183,
-    207, 17,207,101,207,146,207,198,207,254,226,245,236,236,229,116,
-    128, 37,230, 99,  2,206,105,206,125,233,242,227,236,101,129, 37,
-    203,206,115,233,238,246,229,242,243,101,128, 37,217,239,242,238,
-    229,242,226,242,225,227,235,229,116,  2,206,142,206,162,236,229,
-    230,116,129, 48, 14,206,151,246,229,242,244,233,227,225,108,128,
-    254, 67,242,233,231,232,116,129, 48, 15,206,172,246,229,242,244,
-    233,227,225,108,128,254, 68,100,  2,206,189,206,230,233,225,237,
-    239,238,100,129, 37,199,206,200,227,239,238,244,225,233,238,233,
-    238,231,226,236,225,227,235,243,237,225,236,236,228,233,225,237,
-    239,238,100,128, 37,200,239,247,238,240,239,233,238,244,233,238,
-    103,  2,206,246,207,  6,243,237,225,236,236,244,242,233,225,238,
-    231,236,101,128, 37,191,244,242,233,225,238,231,236,101,128, 37,
-    189,236,101,  2,207, 24,207, 66,230,244,240,239,233,238,244,233,
-    238,103,  2,207, 39,207, 55,243,237,225,236,236,244,242,233,225,
-    238,231,236,101,128, 37,195,244,242,233,225,238,231,236,101,128,
-     37,193,238,244,233,227,245,236,225,242,226,242,225,227,235,229,
-    116,  2,207, 86,207, 93,236,229,230,116,128, 48, 22,242,233,231,
-    232,116,128, 48, 23,242,233,231,232,244,240,239,233,238,244,233,
-    238,103,  2,207,119,207,135,243,237,225,236,236,244,242,233,225,
-    238,231,236,101,128, 37,185,244,242,233,225,238,231,236,101,128,
-     37,183,115,  3,207,154,207,184,207,192,109,  2,207,160,207,172,
-    225,236,236,243,241,245,225,242,101,128, 37,171,233,236,233,238,
-    231,230,225,227,101,128, 38, 58,241,245,225,242,101,128, 37,161,
-    244,225,114,128, 38,  6,116,  2,207,204,207,215,229,236,229,240,
-    232,239,238,101,128, 38, 15,239,242,244,239,233,243,229,243,232,
-    229,236,236,226,242,225,227,235,229,116,  2,207,239,207,246,236,
-    229,230,116,128, 48, 24,242,233,231,232,116,128, 48, 25,245,240,
-    240,239,233,238,244,233,238,103,  2,208, 13,208, 29,243,237,225,
-    236,236,244,242,233,225,238,231,236,101,128, 37,181,244,242,233,
-    225,238,231,236,101,128, 37,179,105,  2,208, 46,208, 57,232,233,
-    242,225,231,225,238, 97,128, 48,144,107,  2,208, 63,208, 73,225,
-    244,225,235,225,238, 97,128, 48,240,239,242,229,225,110,128, 49,
-     95,237,239,238,239,243,240,225,227,101,128,255, 87,111,  4,208,
-    103,208,114,208,139,208,157,232,233,242,225,231,225,238, 97,128,
-     48,146,235,225,244,225,235,225,238, 97,129, 48,242,208,127,232,
-    225,236,230,247,233,228,244,104,128,255,102,110,129, 32,169,208,
-    145,237,239,238,239,243,240,225,227,101,128,255,230,247,225,229,
-    238,244,232,225,105,128, 14, 39,240,225,242,229,110,128, 36,178,
-    242,233,238,103,128, 30,152,243,245,240,229,242,233,239,114,128,
-      2,183,244,245,242,238,229,100,128,  2,141,249,238,110,128,  1,
-    191,120,137,  0,120,208,231,208,242,208,253,209,  6,209, 33,209,
-     46,209, 50,209, 62,209, 70,225,226,239,246,229,227,237, 98,128,
-      3, 61,226,239,240,239,237,239,230,111,128, 49, 18,227,233,242,
-    227,236,101,128, 36,231,100,  2,209, 12,209, 22,233,229,242,229,
-    243,233,115,128, 30,141,239,244,225,227,227,229,238,116,128, 30,
-    139,229,232,225,242,237,229,238,233,225,110,128,  5,109,105,128,
-      3,190,237,239,238,239,243,240,225,227,101,128,255, 88,240,225,
-    242,229,110,128, 36,179,243,245,240,229,242,233,239,114,128,  2,
-    227,121,143,  0,121,209,115,210, 74,210, 97,210,137,212,103,212,
-    111,212,128,212,192,212,204,213,201,213,241,213,253,214,  8,214,
-     29,215,  2, 97, 11,209,139,209,151,209,161,209,168,209,175,209,
-    185,209,210,209,221,210,  3,210, 16,210, 62,225,228,239,243,241,
-    245,225,242,101,128, 51, 78,226,229,238,231,225,236,105,128,  9,
-    175,227,245,244,101,128,  0,253,228,229,246, 97,128,  9, 47,229,
-    235,239,242,229,225,110,128, 49, 82,231,117,  2,209,192,209,201,
-    234,225,242,225,244,105,128, 10,175,242,237,245,235,232,105,128,
-     10, 47,232,233,242,225,231,225,238, 97,128, 48,132,107,  2,209,
-    227,209,251,225,244,225,235,225,238, 97,129, 48,228,209,239,232,
-    225,236,230,247,233,228,244,104,128,255,148,239,242,229,225,110,
-    128, 49, 81,237,225,235,235,225,238,244,232,225,105,128, 14, 78,
-    243,237,225,236,108,  2,210, 26,210, 37,232,233,242,225,231,225,
-    238, 97,128, 48,131,235,225,244,225,235,225,238, 97,129, 48,227,
-    210, 50,232,225,236,230,247,233,228,244,104,128,255,108,244,227,
-    249,242,233,236,236,233, 99,128,  4, 99,227,233,242, 99,  2,210,
-     83,210, 88,236,101,128, 36,232,245,237,230,236,229,120,128,  1,
-    119,100,  2,210,103,210,113,233,229,242,229,243,233,115,128,  0,
-    255,239,116,  2,210,120,210,129,225,227,227,229,238,116,128, 30,
-    143,226,229,236,239,119,128, 30,245,101,  7,210,153,211,161,211,
-    170,211,188,211,220,212, 40,212, 91,104,  8,210,171,210,180,210,
-    214,210,228,211, 45,211, 61,211,120,211,138,225,242,225,226,233,
-     99,128,  6, 74,226,225,242,242,229,101,  2,210,191,210,200,225,
-    242,225,226,233, 99,128,  6,210,230,233,238,225,236,225,242,225,
-    226,233, 99,128,251,175,230,233,238,225,236,225,242,225,226,233,
-     99,128,254,242,232,225,237,250,225,225,226,239,246,101,  4,210,
-    247,211,  0,211, 14,211, 30,225,242,225,226,233, 99,128,  6, 38,
-    230,233,238,225,236,225,242,225,226,233, 99,128,254,138,233,238,
-    233,244,233,225,236,225,242,225,226,233, 99,128,254,139,237,229,
-    228,233,225,236,225,242,225,226,233, 99,128,254,140,233,238,233,
-    244,233,225,236,225,242,225,226,233, 99,128,254,243,237,101,  2,
-    211, 68,211, 81,228,233,225,236,225,242,225,226,233, 99,128,254,
-    244,229,237,105,  2,211, 89,211,104,238,233,244,233,225,236,225,
-    242,225,226,233, 99,128,252,221,243,239,236,225,244,229,228,225,
-    242,225,226,233, 99,128,252, 88,238,239,239,238,230,233,238,225,
-    236,225,242,225,226,233, 99,128,252,148,244,232,242,229,229,228,
-    239,244,243,226,229,236,239,247,225,242,225,226,233, 99,128,  6,
-    209,235,239,242,229,225,110,128, 49, 86,110,129,  0,165,211,176,
-    237,239,238,239,243,240,225,227,101,128,255,229,111,  2,211,194,
-    211,203,235,239,242,229,225,110,128, 49, 85,242,233,238,232,233,
-    229,245,232,235,239,242,229,225,110,128, 49,134,114,  3,211,228,
-    212,  8,212, 20,225,232,226,229,238,249,239,237,111,  2,211,242,
-    211,251,232,229,226,242,229,119,128,  5,170,236,229,230,244,232,
-    229,226,242,229,119,128,  5,170,233,227,249,242,233,236,236,233,
-     99,128,  4, 75,245,228,233,229,242,229,243,233,243,227,249,242,
-    233,236,236,233, 99,128,  4,249,243,233,229,245,238,103,  3,212,
-     53,212, 62,212, 78,235,239,242,229,225,110,128, 49,129,240,225,
-    238,243,233,239,243,235,239,242,229,225,110,128, 49,131,243,233,
-    239,243,235,239,242,229,225,110,128, 49,130,244,233,246,232,229,
-    226,242,229,119,128,  5,154,231,242,225,246,101,128, 30,243,232,
-    239,239,107,129,  1,180,212,120,225,226,239,246,101,128, 30,247,
-    105,  5,212,140,212,151,212,162,212,171,212,179,225,242,237,229,
-    238,233,225,110,128,  5,117,227,249,242,233,236,236,233, 99,128,
-      4, 87,235,239,242,229,225,110,128, 49, 98,238,249,225,238,103,
-    128, 38, 47,247,238,225,242,237,229,238,233,225,110,128,  5,130,
-    237,239,238,239,243,240,225,227,101,128,255, 89,111,  7,212,220,
-    213, 34,213, 45,213, 55,213, 93,213,139,213,148,100,131,  5,217,
-    212,230,212,250,213,  3,228,225,231,229,243,104,129,251, 57,212,
-    241,232,229,226,242,229,119,128,251, 57,232,229,226,242,229,119,
-    128,  5,217,249,239,100,  2,213, 11,213, 20,232,229,226,242,229,
-    119,128,  5,242,240,225,244,225,232,232,229,226,242,229,119,128,
-    251, 31,232,233,242,225,231,225,238, 97,128, 48,136,233,235,239,
-    242,229,225,110,128, 49,137,107,  2,213, 61,213, 85,225,244,225,
-    235,225,238, 97,129, 48,232,213, 73,232,225,236,230,247,233,228,
-    244,104,128,255,150,239,242,229,225,110,128, 49, 91,243,237,225,
-    236,108,  2,213,103,213,114,232,233,242,225,231,225,238, 97,128,
-     48,135,235,225,244,225,235,225,238, 97,129, 48,231,213,127,232,
-    225,236,230,247,233,228,244,104,128,255,110,244,231,242,229,229,
-    107,128,  3,243,121,  2,213,154,213,191, 97,  2,213,160,213,170,
-    229,235,239,242,229,225,110,128, 49,136,107,  2,213,176,213,184,
-    239,242,229,225,110,128, 49,135,244,232,225,105,128, 14, 34,233,
-    238,231,244,232,225,105,128, 14, 13,112,  2,213,207,213,214,225,
-    242,229,110,128, 36,180,239,231,229,231,242,225,237,237,229,238,
-    105,129,  3,122,213,230,231,242,229,229,235,227,237, 98,128,  3,
-     69,114,129,  1,166,213,247,233,238,103,128, 30,153,243,245,240,
-    229,242,233,239,114,128,  2,184,116,  2,214, 14,214, 21,233,236,
-    228,101,128, 30,249,245,242,238,229,100,128,  2,142,117,  5,214,
-     41,214, 52,214, 62,214,100,214,232,232,233,242,225,231,225,238,
-     97,128, 48,134,233,235,239,242,229,225,110,128, 49,140,107,  2,
-    214, 68,214, 92,225,244,225,235,225,238, 97,129, 48,230,214, 80,
-    232,225,236,230,247,233,228,244,104,128,255,149,239,242,229,225,
-    110,128, 49, 96,115,  3,214,108,214,146,214,187,226,233,103,  2,
-    214,116,214,127,227,249,242,233,236,236,233, 99,128,  4,107,233,
-    239,244,233,230,233,229,228,227,249,242,233,236,236,233, 99,128,
-      4,109,236,233,244,244,236,101,  2,214,157,214,168,227,249,242,
-    233,236,236,233, 99,128,  4,103,233,239,244,233,230,233,229,228,
-    227,249,242,233,236,236,233, 99,128,  4,105,237,225,236,108,  2,
-    214,196,214,207,232,233,242,225,231,225,238, 97,128, 48,133,235,
-    225,244,225,235,225,238, 97,129, 48,229,214,220,232,225,236,230,
-    247,233,228,244,104,128,255,109,249,101,  2,214,239,214,248,235,
-    239,242,229,225,110,128, 49,139,239,235,239,242,229,225,110,128,
-     49,138,249, 97,  2,215,  9,215, 19,226,229,238,231,225,236,105,
-    128,  9,223,228,229,246, 97,128,  9, 95,122,142,  0,122,215, 58,
-    216, 66,216, 77,216,120,216,147,217,182,218, 34,218, 76,218, 88,
-    218,100,218,128,218,136,218,152,218,161, 97, 10,215, 80,215, 91,
-    215, 98,215,105,215,116,215,194,215,224,215,235,216, 15,216, 27,
-    225,242,237,229,238,233,225,110,128,  5,102,227,245,244,101,128,
-      1,122,228,229,246, 97,128,  9, 91,231,245,242,237,245,235,232,
-    105,128, 10, 91,104,  4,215,126,215,135,215,149,215,179,225,242,
-    225,226,233, 99,128,  6, 56,230,233,238,225,236,225,242,225,226,
-    233, 99,128,254,198,105,  2,215,155,215,170,238,233,244,233,225,
-    236,225,242,225,226,233, 99,128,254,199,242,225,231,225,238, 97,
-    128, 48, 86,237,229,228,233,225,236,225,242,225,226,233, 99,128,
-    254,200,233,110,  2,215,201,215,210,225,242,225,226,233, 99,128,
-      6, 50,230,233,238,225,236,225,242,225,226,233, 99,128,254,176,
-    235,225,244,225,235,225,238, 97,128, 48,182,241,229,102,  2,215,
-    243,216,  1,231,225,228,239,236,232,229,226,242,229,119,128,  5,
-    149,241,225,244,225,238,232,229,226,242,229,119,128,  5,148,242,
-    241,225,232,229,226,242,229,119,128,  5,152,249,233,110,130,  5,
-    214,216, 37,216, 57,228,225,231,229,243,104,129,251, 54,216, 48,
-    232,229,226,242,229,119,128,251, 54,232,229,226,242,229,119,128,
-      5,214,226,239,240,239,237,239,230,111,128, 49, 23, 99,  3,216,
-     85,216, 92,216,114,225,242,239,110,128,  1,126,233,242, 99,  2,
-    216,100,216,105,236,101,128, 36,233,245,237,230,236,229,120,128,
-     30,145,245,242,108,128,  2,145,228,239,116,130,  1,124,216,130,
-    216,139,225,227,227,229,238,116,128,  1,124,226,229,236,239,119,
-    128, 30,147,101,  6,216,161,216,172,216,215,216,226,216,237,217,
-    177,227,249,242,233,236,236,233, 99,128,  4, 55,100,  2,216,178,
-    216,197,229,243,227,229,238,228,229,242,227,249,242,233,236,236,
-    233, 99,128,  4,153,233,229,242,229,243,233,243,227,249,242,233,
-    236,236,233, 99,128,  4,223,232,233,242,225,231,225,238, 97,128,
-     48, 92,235,225,244,225,235,225,238, 97,128, 48,188,242,111,140,
-      0, 48,217, 10,217, 19,217, 29,217, 36,217, 61,217, 74,217, 85,
-    217, 97,217,108,217,118,217,129,217,136,225,242,225,226,233, 99,
-    128,  6, 96,226,229,238,231,225,236,105,128,  9,230,228,229,246,
-     97,128,  9,102,231,117,  2,217, 43,217, 52,234,225,242,225,244,
-    105,128, 10,230,242,237,245,235,232,105,128, 10,102,232,225,227,
-    235,225,242,225,226,233, 99,128,  6, 96,233,238,230,229,242,233,
-    239,114,128, 32,128,237,239,238,239,243,240,225,227,101,128,255,
-     16,239,236,228,243,244,249,236,101,128,247, 48,240,229,242,243,
-    233,225,110,128,  6,240,243,245,240,229,242,233,239,114,128, 32,
-    112,244,232,225,105,128, 14, 80,247,233,228,244,104,  3,217,148,
-    217,157,217,169,234,239,233,238,229,114,128,254,255,238,239,238,
-    234,239,233,238,229,114,128, 32, 12,243,240,225,227,101,128, 32,
-     11,244, 97,128,  3,182,104,  2,217,188,217,199,226,239,240,239,
-    237,239,230,111,128, 49, 19,101,  4,217,209,217,220,217,236,217,
-    247,225,242,237,229,238,233,225,110,128,  5,106,226,242,229,246,
-    229,227,249,242,233,236,236,233, 99,128,  4,194,227,249,242,233,
-    236,236,233, 99,128,  4, 54,100,  2,217,253,218, 16,229,243,227,
-    229,238,228,229,242,227,249,242,233,236,236,233, 99,128,  4,151,
-    233,229,242,229,243,233,243,227,249,242,233,236,236,233, 99,128,
-      4,221,105,  3,218, 42,218, 53,218, 64,232,233,242,225,231,225,
-    238, 97,128, 48, 88,235,225,244,225,235,225,238, 97,128, 48,184,
-    238,239,242,232,229,226,242,229,119,128,  5,174,236,233,238,229,
-    226,229,236,239,119,128, 30,149,237,239,238,239,243,240,225,227,
-    101,128,255, 90,111,  2,218,106,218,117,232,233,242,225,231,225,
-    238, 97,128, 48, 94,235,225,244,225,235,225,238, 97,128, 48,190,
-    240,225,242,229,110,128, 36,181,242,229,244,242,239,230,236,229,
-    248,232,239,239,107,128,  2,144,243,244,242,239,235,101,128,  1,
-    182,117,  2,218,167,218,178,232,233,242,225,231,225,238, 97,128,
-     48, 90,235,225,244,225,235,225,238, 97,128, 48,186
+    146,228,229,246, 97,128,  9,111,231,117,  2,140,175,140,184,234,
+    225,242,225,244,105,128, 10,239,242,237,245,235,232,105,128, 10,
+    111,232, 97,  2,140,200,140,211,227,235,225,242,225,226,233, 99,
+    128,  6,105,238,231,250,232,239,117,128, 48, 41,105,  2,140,226,
+    140,244,228,229,239,231,242,225,240,232,233,227,240,225,242,229,
+    110,128, 50, 40,238,230,229,242,233,239,114,128, 32,137,237,239,
+    238,239,243,240,225,227,101,128,255, 25,239,236,228,243,244,249,
+    236,101,128,247, 57,112,  2,141, 27,141, 34,225,242,229,110,128,
+     36,124,229,114,  2,141, 41,141, 47,233,239,100,128, 36,144,243,
+    233,225,110,128,  6,249,242,239,237,225,110,128, 33,120,243,245,
+    240,229,242,233,239,114,128, 32,121,116,  2,141, 79,141,117,229,
+    229,110,  2,141, 87,141, 96,227,233,242,227,236,101,128, 36,114,
+    112,  2,141,102,141,109,225,242,229,110,128, 36,134,229,242,233,
+    239,100,128, 36,154,232,225,105,128, 14, 89,106,129,  1,204,141,
+    129,229,227,249,242,233,236,236,233, 99,128,  4, 90,235,225,244,
+    225,235,225,238, 97,129, 48,243,141,154,232,225,236,230,247,233,
+    228,244,104,128,255,157,108,  2,141,172,141,186,229,231,242,233,
+    231,232,244,236,239,238,103,128,  1,158,233,238,229,226,229,236,
+    239,119,128, 30, 73,109,  2,141,203,141,214,239,238,239,243,240,
+    225,227,101,128,255, 78,243,241,245,225,242,101,128, 51,154,110,
+      2,141,229,142, 23, 97,  3,141,237,141,247,141,254,226,229,238,
+    231,225,236,105,128,  9,163,228,229,246, 97,128,  9, 35,231,117,
+      2,142,  5,142, 14,234,225,242,225,244,105,128, 10,163,242,237,
+    245,235,232,105,128, 10, 35,238,225,228,229,246, 97,128,  9, 41,
+    111,  6,142, 46,142, 57,142, 82,142,123,143, 96,144, 23,232,233,
+    242,225,231,225,238, 97,128, 48,110,235,225,244,225,235,225,238,
+     97,129, 48,206,142, 70,232,225,236,230,247,233,228,244,104,128,
+    255,137,110,  3,142, 90,142,106,142,115,226,242,229,225,235,233,
+    238,231,243,240,225,227,101,128,  0,160,229,238,244,232,225,105,
+    128, 14, 19,245,244,232,225,105,128, 14, 25,239,110,  8,142,142,
+    142,151,142,165,142,199,142,218,142,234,143, 19,143, 78,225,242,
+    225,226,233, 99,128,  6, 70,230,233,238,225,236,225,242,225,226,
+    233, 99,128,254,230,231,232,245,238,238, 97,  2,142,176,142,185,
+    225,242,225,226,233, 99,128,  6,186,230,233,238,225,236,225,242,
+    225,226,233, 99,128,251,159,232,229,232,233,238,233,244,233,225,
+    236,225,242,225,226,233, 99,128,216, 72,233,238,233,244,233,225,
+    236,225,242,225,226,233, 99,128,254,231,234,229,229,237,105,  2,
+    142,244,143,  3,238,233,244,233,225,236,225,242,225,226,233, 99,
+    128,252,210,243,239,236,225,244,229,228,225,242,225,226,233, 99,
+    128,252, 75,237,101,  2,143, 26,143, 39,228,233,225,236,225,242,
+    225,226,233, 99,128,254,232,229,237,105,  2,143, 47,143, 62,238,
+    233,244,233,225,236,225,242,225,226,233, 99,128,252,213,243,239,
+    236,225,244,229,228,225,242,225,226,233, 99,128,252, 78,238,239,
+    239,238,230,233,238,225,236,225,242,225,226,233, 99,128,252,141,
+    116,  7,143,112,143,123,143,152,143,187,143,199,143,219,143,245,
+    227,239,238,244,225,233,238,115,128, 34, 12,101,  2,143,129,143,
+    145,236,229,237,229,238,116,129, 34,  9,143,140,239,102,128, 34,
+      9,241,245,225,108,128, 34, 96,231,242,229,225,244,229,114,129,
+     34,111,143,164,238,239,114,  2,143,172,143,180,229,241,245,225,
+    108,128, 34,113,236,229,243,115,128, 34,121,233,228,229,238,244,
+    233,227,225,108,128, 34, 98,236,229,243,115,129, 34,110,143,208,
+    238,239,242,229,241,245,225,108,128, 34,112,112,  2,143,225,143,
+    235,225,242,225,236,236,229,108,128, 34, 38,242,229,227,229,228,
+    229,115,128, 34,128,243,117,  3,143,254,144,  5,144, 14,226,243,
+    229,116,128, 34,132,227,227,229,229,228,115,128, 34,129,240,229,
+    242,243,229,116,128, 34,133,247,225,242,237,229,238,233,225,110,
+    128,  5,118,240,225,242,229,110,128, 36,169,115,  2,144, 49,144,
+     58,243,241,245,225,242,101,128, 51,177,245,240,229,242,233,239,
+    114,128, 32,127,244,233,236,228,101,128,  0,241,117,132,  3,189,
+    144, 88,144, 99,144,180,145,  7,232,233,242,225,231,225,238, 97,
+    128, 48,108,107,  2,144,105,144,129,225,244,225,235,225,238, 97,
+    129, 48,204,144,117,232,225,236,230,247,233,228,244,104,128,255,
+    135,244, 97,  3,144,138,144,148,144,155,226,229,238,231,225,236,
+    105,128,  9,188,228,229,246, 97,128,  9, 60,231,117,  2,144,162,
+    144,171,234,225,242,225,244,105,128, 10,188,242,237,245,235,232,
+    105,128, 10, 60,109,  2,144,186,144,220,226,229,242,243,233,231,
+    110,130,  0, 35,144,200,144,212,237,239,238,239,243,240,225,227,
+    101,128,255,  3,243,237,225,236,108,128,254, 95,229,114,  2,144,
+    227,145,  3,225,236,243,233,231,110,  2,144,238,144,246,231,242,
+    229,229,107,128,  3,116,236,239,247,229,242,231,242,229,229,107,
+    128,  3,117,111,128, 33, 22,110,130,  5,224,145, 15,145, 35,228,
+    225,231,229,243,104,129,251, 64,145, 26,232,229,226,242,229,119,
+    128,251, 64,232,229,226,242,229,119,128,  5,224,246,243,241,245,
+    225,242,101,128, 51,181,247,243,241,245,225,242,101,128, 51,187,
+    249, 97,  3,145, 73,145, 83,145, 90,226,229,238,231,225,236,105,
+    128,  9,158,228,229,246, 97,128,  9, 30,231,117,  2,145, 97,145,
+    106,234,225,242,225,244,105,128, 10,158,242,237,245,235,232,105,
+    128, 10, 30,111,147,  0,111,145,157,145,179,146,  1,146,171,146,
+    243,147,  2,147, 42,147,165,147,186,147,224,147,235,148,157,149,
+    247,150, 55,150, 88,150,134,151,  7,151, 54,151, 66, 97,  2,145,
+    163,145,170,227,245,244,101,128,  0,243,238,231,244,232,225,105,
+    128, 14, 45, 98,  4,145,189,145,231,145,240,145,250,225,242,242,
+    229,100,130,  2,117,145,201,145,212,227,249,242,233,236,236,233,
+     99,128,  4,233,228,233,229,242,229,243,233,243,227,249,242,233,
+    236,236,233, 99,128,  4,235,229,238,231,225,236,105,128,  9,147,
+    239,240,239,237,239,230,111,128, 49, 27,242,229,246,101,128,  1,
+     79, 99,  3,146,  9,146, 82,146,161, 97,  2,146, 15,146, 76,238,
+    228,242, 97,  3,146, 26,146, 33,146, 44,228,229,246, 97,128,  9,
+     17,231,245,234,225,242,225,244,105,128, 10,145,246,239,247,229,
+    236,243,233,231,110,  2,146, 58,146, 65,228,229,246, 97,128,  9,
+     73,231,245,234,225,242,225,244,105,128, 10,201,242,239,110,128,
+      1,210,233,242, 99,  2,146, 90,146, 95,236,101,128, 36,222,245,
+    237,230,236,229,120,133,  0,244,146,114,146,122,146,133,146,141,
+    146,153,225,227,245,244,101,128, 30,209,228,239,244,226,229,236,
+    239,119,128, 30,217,231,242,225,246,101,128, 30,211,232,239,239,
+    235,225,226,239,246,101,128, 30,213,244,233,236,228,101,128, 30,
+    215,249,242,233,236,236,233, 99,128,  4, 62,100,  4,146,181,146,
+    204,146,210,146,233,226,108,  2,146,188,146,196,225,227,245,244,
+    101,128,  1, 81,231,242,225,246,101,128,  2, 13,229,246, 97,128,
+      9, 19,233,229,242,229,243,233,115,129,  0,246,146,222,227,249,
+    242,233,236,236,233, 99,128,  4,231,239,244,226,229,236,239,119,
+    128, 30,205,101,129,  1, 83,146,249,235,239,242,229,225,110,128,
+     49, 90,103,  3,147, 10,147, 25,147, 32,239,238,229,107,129,  2,
+    219,147, 19,227,237, 98,128,  3, 40,242,225,246,101,128,  0,242,
+    245,234,225,242,225,244,105,128, 10,147,104,  4,147, 52,147, 63,
+    147, 73,147,151,225,242,237,229,238,233,225,110,128,  5,133,233,
+    242,225,231,225,238, 97,128, 48, 74,111,  2,147, 79,147, 89,239,
+    235,225,226,239,246,101,128, 30,207,242,110,133,  1,161,147,104,
+    147,112,147,123,147,131,147,143,225,227,245,244,101,128, 30,219,
+    228,239,244,226,229,236,239,119,128, 30,227,231,242,225,246,101,
+    128, 30,221,232,239,239,235,225,226,239,246,101,128, 30,223,244,
+    233,236,228,101,128, 30,225,245,238,231,225,242,245,237,236,225,
+    245,116,128,  1, 81,105,129,  1,163,147,171,238,246,229,242,244,
+    229,228,226,242,229,246,101,128,  2, 15,107,  2,147,192,147,216,
+    225,244,225,235,225,238, 97,129, 48,170,147,204,232,225,236,230,
+    247,233,228,244,104,128,255,117,239,242,229,225,110,128, 49, 87,
+    236,229,232,229,226,242,229,119,128,  5,171,109,  6,147,249,148,
+     21,148, 28,148,117,148,128,148,146,225,227,242,239,110,130,  1,
+     77,148,  5,148, 13,225,227,245,244,101,128, 30, 83,231,242,225,
+    246,101,128, 30, 81,228,229,246, 97,128,  9, 80,229,231, 97,133,
+      3,201,148, 44,148, 48,148, 59,148, 73,148, 89, 49,128,  3,214,
+    227,249,242,233,236,236,233, 99,128,  4, 97,236,225,244,233,238,
+    227,236,239,243,229,100,128,  2,119,242,239,245,238,228,227,249,
+    242,233,236,236,233, 99,128,  4,123,116,  2,148, 95,148,110,233,
+    244,236,239,227,249,242,233,236,236,233, 99,128,  4,125,239,238,
+    239,115,128,  3,206,231,245,234,225,242,225,244,105,128, 10,208,
+    233,227,242,239,110,129,  3,191,148,138,244,239,238,239,115,128,
+      3,204,239,238,239,243,240,225,227,101,128,255, 79,238,101,145,
+      0, 49,148,196,148,205,148,215,148,245,149, 14,149, 23,149, 32,
+    149, 57,149, 91,149,125,149,137,149,156,149,167,149,200,149,210,
+    149,218,149,229,225,242,225,226,233, 99,128,  6, 97,226,229,238,
+    231,225,236,105,128,  9,231,227,233,242,227,236,101,129, 36, 96,
+    148,226,233,238,246,229,242,243,229,243,225,238,243,243,229,242,
+    233,102,128, 39,138,100,  2,148,251,149,  1,229,246, 97,128,  9,
+    103,239,244,229,238,236,229,225,228,229,114,128, 32, 36,229,233,
+    231,232,244,104,128, 33, 91,230,233,244,244,229,100,128,246,220,
+    231,117,  2,149, 39,149, 48,234,225,242,225,244,105,128, 10,231,
+    242,237,245,235,232,105,128, 10,103,232, 97,  3,149, 66,149, 77,
+    149, 82,227,235,225,242,225,226,233, 99,128,  6, 97,236,102,128,
+      0,189,238,231,250,232,239,117,128, 48, 33,105,  2,149, 97,149,
+    115,228,229,239,231,242,225,240,232,233,227,240,225,242,229,110,
+    128, 50, 32,238,230,229,242,233,239,114,128, 32,129,237,239,238,
+    239,243,240,225,227,101,128,255, 17,238,245,237,229,242,225,244,
+    239,242,226,229,238,231,225,236,105,128,  9,244,239,236,228,243,
+    244,249,236,101,128,247, 49,112,  2,149,173,149,180,225,242,229,
+    110,128, 36,116,229,114,  2,149,187,149,193,233,239,100,128, 36,
+    136,243,233,225,110,128,  6,241,241,245,225,242,244,229,114,128,
+      0,188,242,239,237,225,110,128, 33,112,243,245,240,229,242,233,
+    239,114,128,  0,185,244,104,  2,149,236,149,241,225,105,128, 14,
+     81,233,242,100,128, 33, 83,111,  3,149,255,150, 33,150, 49,103,
+      2,150,  5,150, 23,239,238,229,107,129,  1,235,150, 14,237,225,
+    227,242,239,110,128,  1,237,245,242,237,245,235,232,105,128, 10,
+     19,237,225,244,242,225,231,245,242,237,245,235,232,105,128, 10,
+     75,240,229,110,128,  2, 84,112,  3,150, 63,150, 70,150, 81,225,
+    242,229,110,128, 36,170,229,238,226,245,236,236,229,116,128, 37,
+    230,244,233,239,110,128, 35, 37,114,  2,150, 94,150,123,100,  2,
+    150,100,150,111,230,229,237,233,238,233,238,101,128,  0,170,237,
+    225,243,227,245,236,233,238,101,128,  0,186,244,232,239,231,239,
+    238,225,108,128, 34, 31,115,  5,150,146,150,178,150,195,150,240,
+    150,253,232,239,242,116,  2,150,155,150,162,228,229,246, 97,128,
+      9, 18,246,239,247,229,236,243,233,231,238,228,229,246, 97,128,
+      9, 74,236,225,243,104,129,  0,248,150,187,225,227,245,244,101,
+    128,  1,255,237,225,236,108,  2,150,204,150,215,232,233,242,225,
+    231,225,238, 97,128, 48, 73,235,225,244,225,235,225,238, 97,129,
+     48,169,150,228,232,225,236,230,247,233,228,244,104,128,255,107,
+    244,242,239,235,229,225,227,245,244,101,128,  1,255,245,240,229,
+    242,233,239,114,128,246,240,116,  2,151, 13,151, 24,227,249,242,
+    233,236,236,233, 99,128,  4,127,233,236,228,101,130,  0,245,151,
+     35,151, 43,225,227,245,244,101,128, 30, 77,228,233,229,242,229,
+    243,233,115,128, 30, 79,245,226,239,240,239,237,239,230,111,128,
+     49, 33,118,  2,151, 72,151,153,229,114,  2,151, 79,151,145,236,
+    233,238,101,131, 32, 62,151, 92,151,115,151,138, 99,  2,151, 98,
+    151,110,229,238,244,229,242,236,233,238,101,128,254, 74,237, 98,
+    128,  3,  5,100,  2,151,121,151,129,225,243,232,229,100,128,254,
+     73,226,236,247,225,246,121,128,254, 76,247,225,246,121,128,254,
+     75,243,227,239,242,101,128,  0,175,239,247,229,236,243,233,231,
+    110,  3,151,168,151,178,151,185,226,229,238,231,225,236,105,128,
+      9,203,228,229,246, 97,128,  9, 75,231,245,234,225,242,225,244,
+    105,128, 10,203,112,145,  0,112,151,234,154,106,154,117,154,126,
+    154,138,156, 63,156, 73,157, 65,158, 84,158,174,158,200,159, 75,
+    159, 83,159,241,160, 43,160, 71,160, 81, 97, 14,152,  8,152, 40,
+    152, 50,152, 57,152, 64,152,112,152,123,152,137,152,148,152,195,
+    152,209,153,221,154,  4,154, 94, 97,  2,152, 14,152, 26,237,240,
+    243,243,241,245,225,242,101,128, 51,128,243,229,238,244,239,243,
+    241,245,225,242,101,128, 51, 43,226,229,238,231,225,236,105,128,
+      9,170,227,245,244,101,128, 30, 85,228,229,246, 97,128,  9, 42,
+    103,  2,152, 70,152, 88,101,  2,152, 76,152, 83,228,239,247,110,
+    128, 33,223,245,112,128, 33,222,117,  2,152, 94,152,103,234,225,
+    242,225,244,105,128, 10,170,242,237,245,235,232,105,128, 10, 42,
+    232,233,242,225,231,225,238, 97,128, 48,113,233,249,225,238,238,
+    239,233,244,232,225,105,128, 14, 47,235,225,244,225,235,225,238,
+     97,128, 48,209,108,  2,152,154,152,179,225,244,225,236,233,250,
+    225,244,233,239,238,227,249,242,233,236,236,233,227,227,237, 98,
+    128,  4,132,239,227,232,235,225,227,249,242,233,236,236,233, 99,
+    128,  4,192,238,243,233,239,243,235,239,242,229,225,110,128, 49,
+    127,114,  3,152,217,152,238,153,210, 97,  2,152,223,152,231,231,
+    242,225,240,104,128,  0,182,236,236,229,108,128, 34, 37,229,110,
+      2,152,245,153, 99,236,229,230,116,136,  0, 40,153, 12,153, 27,
+    153, 32,153, 37,153, 48,153, 60,153, 83,153, 88,225,236,244,239,
+    238,229,225,242,225,226,233, 99,128,253, 62,226,116,128,248,237,
+    229,120,128,248,236,233,238,230,229,242,233,239,114,128, 32,141,
+    237,239,238,239,243,240,225,227,101,128,255,  8,115,  2,153, 66,
+    153, 73,237,225,236,108,128,254, 89,245,240,229,242,233,239,114,
+    128, 32,125,244,112,128,248,235,246,229,242,244,233,227,225,108,
+    128,254, 53,242,233,231,232,116,136,  0, 41,153,123,153,138,153,
+    143,153,148,153,159,153,171,153,194,153,199,225,236,244,239,238,
+    229,225,242,225,226,233, 99,128,253, 63,226,116,128,248,248,229,
+    120,128,248,247,233,238,230,229,242,233,239,114,128, 32,142,237,
+    239,238,239,243,240,225,227,101,128,255,  9,115,  2,153,177,153,
+    184,237,225,236,108,128,254, 90,245,240,229,242,233,239,114,128,
+     32,126,244,112,128,248,246,246,229,242,244,233,227,225,108,128,
+    254, 54,244,233,225,236,228,233,230,102,128, 34,  2,115,  3,153,
+    229,153,240,153,252,229,241,232,229,226,242,229,119,128,  5,192,
+    232,244,225,232,229,226,242,229,119,128,  5,153,241,245,225,242,
+    101,128, 51,169,244,225,104,134,  5,183,154, 22,154, 36,154, 41,
+    154, 50,154, 65,154, 81, 49,  2,154, 28,154, 32, 49,128,  5,183,
+    100,128,  5,183,178, 97,128,  5,183,232,229,226,242,229,119,128,
+      5,183,238,225,242,242,239,247,232,229,226,242,229,119,128,  5,
+    183,241,245,225,242,244,229,242,232,229,226,242,229,119,128,  5,
+    183,247,233,228,229,232,229,226,242,229,119,128,  5,183,250,229,
+    242,232,229,226,242,229,119,128,  5,161,226,239,240,239,237,239,
+    230,111,128, 49,  6,227,233,242,227,236,101,128, 36,223,228,239,
+    244,225,227,227,229,238,116,128, 30, 87,101,137,  5,228,154,160,
+    154,171,154,191,154,203,154,223,155, 69,155, 80,155,101,156, 56,
+    227,249,242,233,236,236,233, 99,128,  4, 63,228,225,231,229,243,
+    104,129,251, 68,154,182,232,229,226,242,229,119,128,251, 68,229,
+    250,233,243,241,245,225,242,101,128, 51, 59,230,233,238,225,236,
+    228,225,231,229,243,232,232,229,226,242,229,119,128,251, 67,104,
+      5,154,235,155,  2,155, 10,155, 24,155, 54,225,114,  2,154,242,
+    154,249,225,226,233, 99,128,  6,126,237,229,238,233,225,110,128,
+      5,122,229,226,242,229,119,128,  5,228,230,233,238,225,236,225,
+    242,225,226,233, 99,128,251, 87,105,  2,155, 30,155, 45,238,233,
+    244,233,225,236,225,242,225,226,233, 99,128,251, 88,242,225,231,
+    225,238, 97,128, 48,122,237,229,228,233,225,236,225,242,225,226,
+    233, 99,128,251, 89,235,225,244,225,235,225,238, 97,128, 48,218,
+    237,233,228,228,236,229,232,239,239,235,227,249,242,233,236,236,
+    233, 99,128,  4,167,114,  5,155,113,155,125,155,167,156, 32,156,
+     45,225,230,229,232,229,226,242,229,119,128,251, 78,227,229,238,
+    116,131,  0, 37,155,138,155,147,155,159,225,242,225,226,233, 99,
+    128,  6,106,237,239,238,239,243,240,225,227,101,128,255,  5,243,
+    237,225,236,108,128,254,106,105,  2,155,173,156, 14,239,100,134,
+      0, 46,155,190,155,201,155,212,155,224,155,235,155,247,225,242,
+    237,229,238,233,225,110,128,  5,137,227,229,238,244,229,242,229,
+    100,128,  0,183,232,225,236,230,247,233,228,244,104,128,255, 97,
+    233,238,230,229,242,233,239,114,128,246,231,237,239,238,239,243,
+    240,225,227,101,128,255, 14,115,  2,155,253,156,  4,237,225,236,
+    108,128,254, 82,245,240,229,242,233,239,114,128,246,232,243,240,
+    239,237,229,238,233,231,242,229,229,235,227,237, 98,128,  3, 66,
+    240,229,238,228,233,227,245,236,225,114,128, 34,165,244,232,239,
+    245,243,225,238,100,128, 32, 48,243,229,244, 97,128, 32,167,230,
+    243,241,245,225,242,101,128, 51,138,104,  3,156, 81,156,131,157,
+     12, 97,  3,156, 89,156, 99,156,106,226,229,238,231,225,236,105,
+    128,  9,171,228,229,246, 97,128,  9, 43,231,117,  2,156,113,156,
+    122,234,225,242,225,244,105,128, 10,171,242,237,245,235,232,105,
+    128, 10, 43,105,133,  3,198,156,145,156,149,156,235,156,243,156,
+    254, 49,128,  3,213,229,245,240,104,  4,156,162,156,197,156,212,
+    156,221, 97,  2,156,168,156,183,227,233,242,227,236,229,235,239,
+    242,229,225,110,128, 50,122,240,225,242,229,238,235,239,242,229,
+    225,110,128, 50, 26,227,233,242,227,236,229,235,239,242,229,225,
+    110,128, 50,108,235,239,242,229,225,110,128, 49, 77,240,225,242,
+    229,238,235,239,242,229,225,110,128, 50, 12,236,225,244,233,110,
+    128,  2,120,238,244,232,245,244,232,225,105,128, 14, 58,243,249,
+    237,226,239,236,231,242,229,229,107,128,  3,213,111,  3,157, 20,
+    157, 25,157, 51,239,107,128,  1,165,240,104,  2,157, 32,157, 41,
+    225,238,244,232,225,105,128, 14, 30,245,238,231,244,232,225,105,
+    128, 14, 28,243,225,237,240,232,225,239,244,232,225,105,128, 14,
+     32,105,133,  3,192,157, 79,158, 35,158, 46,158, 57,158, 71,229,
+    245,112,  6,157, 95,157,130,157,162,157,190,157,204,158,  0, 97,
+      2,157,101,157,116,227,233,242,227,236,229,235,239,242,229,225,
+    110,128, 50,115,240,225,242,229,238,235,239,242,229,225,110,128,
+     50, 19,227,105,  2,157,137,157,149,229,245,227,235,239,242,229,
+    225,110,128, 49,118,242,227,236,229,235,239,242,229,225,110,128,
+     50,101,107,  2,157,168,157,182,233,249,229,239,235,235,239,242,
+    229,225,110,128, 49,114,239,242,229,225,110,128, 49, 66,240,225,
+    242,229,238,235,239,242,229,225,110,128, 50,  5,243,233,239,115,
+      2,157,213,157,241,107,  2,157,219,157,233,233,249,229,239,235,
+    235,239,242,229,225,110,128, 49,116,239,242,229,225,110,128, 49,
+     68,244,233,235,229,245,244,235,239,242,229,225,110,128, 49,117,
+    116,  2,158,  6,158, 21,232,233,229,245,244,232,235,239,242,229,
+    225,110,128, 49,119,233,235,229,245,244,235,239,242,229,225,110,
+    128, 49,115,232,233,242,225,231,225,238, 97,128, 48,116,235,225,
+    244,225,235,225,238, 97,128, 48,212,243,249,237,226,239,236,231,
+    242,229,229,107,128,  3,214,247,242,225,242,237,229,238,233,225,
+    110,128,  5,131,236,245,115,132,  0, 43,158, 98,158,109,158,118,
+    158,151,226,229,236,239,247,227,237, 98,128,  3, 31,227,233,242,
+    227,236,101,128, 34,149,109,  2,158,124,158,131,233,238,245,115,
+    128,  0,177,111,  2,158,137,158,141,100,128,  2,214,238,239,243,
+    240,225,227,101,128,255, 11,115,  2,158,157,158,164,237,225,236,
+    108,128,254, 98,245,240,229,242,233,239,114,128, 32,122,109,  2,
+    158,180,158,191,239,238,239,243,240,225,227,101,128,255, 80,243,
+    241,245,225,242,101,128, 51,216,111,  5,158,212,158,223,159, 34,
+    159, 45,159, 55,232,233,242,225,231,225,238, 97,128, 48,125,233,
+    238,244,233,238,231,233,238,228,229,120,  4,158,243,158,255,159,
+     11,159, 24,228,239,247,238,247,232,233,244,101,128, 38, 31,236,
+    229,230,244,247,232,233,244,101,128, 38, 28,242,233,231,232,244,
+    247,232,233,244,101,128, 38, 30,245,240,247,232,233,244,101,128,
+     38, 29,235,225,244,225,235,225,238, 97,128, 48,221,240,236,225,
+    244,232,225,105,128, 14, 27,243,244,225,236,237,225,242,107,129,
+     48, 18,159, 68,230,225,227,101,128, 48, 32,240,225,242,229,110,
+    128, 36,171,114,  3,159, 91,159,117,159,142,101,  2,159, 97,159,
+    105,227,229,228,229,115,128, 34,122,243,227,242,233,240,244,233,
+    239,110,128, 33, 30,233,237,101,  2,159,125,159,131,237,239,100,
+    128,  2,185,242,229,246,229,242,243,229,100,128, 32, 53,111,  4,
+    159,152,159,159,159,169,159,182,228,245,227,116,128, 34, 15,234,
+    229,227,244,233,246,101,128, 35,  5,236,239,238,231,229,228,235,
+    225,238, 97,128, 48,252,112,  2,159,188,159,225,101,  2,159,194,
+    159,201,236,236,239,114,128, 35, 24,242,243,117,  2,159,209,159,
+    216,226,243,229,116,128, 34,130,240,229,242,243,229,116,128, 34,
+    131,239,242,244,233,239,110,129, 34, 55,159,236,225,108,128, 34,
+     29,115,  2,159,247,160, 34,105,130,  3,200,159,255,160, 10,227,
+    249,242,233,236,236,233, 99,128,  4,113,236,233,240,238,229,245,
+    237,225,244,225,227,249,242,233,236,236,233,227,227,237, 98,128,
+      4,134,243,241,245,225,242,101,128, 51,176,117,  2,160, 49,160,
+     60,232,233,242,225,231,225,238, 97,128, 48,119,235,225,244,225,
+    235,225,238, 97,128, 48,215,246,243,241,245,225,242,101,128, 51,
+    180,247,243,241,245,225,242,101,128, 51,186,113,136,  0,113,160,
+    111,161,160,161,171,161,180,161,187,161,199,162,205,162,213, 97,
+      4,160,121,160,144,160,208,161,143,100,  2,160,127,160,133,229,
+    246, 97,128,  9, 88,237,225,232,229,226,242,229,119,128,  5,168,
+    102,  4,160,154,160,163,160,177,160,193,225,242,225,226,233, 99,
+    128,  6, 66,230,233,238,225,236,225,242,225,226,233, 99,128,254,
+    214,233,238,233,244,233,225,236,225,242,225,226,233, 99,128,254,
+    215,237,229,228,233,225,236,225,242,225,226,233, 99,128,254,216,
+    237,225,244,115,136,  5,184,160,231,160,251,161,  9,161, 14,161,
+     19,161, 28,161, 43,161,130, 49,  3,160,239,160,243,160,247, 48,
+    128,  5,184, 97,128,  5,184, 99,128,  5,184, 50,  2,161,  1,161,
+      5, 55,128,  5,184, 57,128,  5,184,179, 51,128,  5,184,228,101,
+    128,  5,184,232,229,226,242,229,119,128,  5,184,238,225,242,242,
+    239,247,232,229,226,242,229,119,128,  5,184,113,  2,161, 49,161,
+    115,225,244,225,110,  4,161, 62,161, 71,161, 86,161,102,232,229,
+    226,242,229,119,128,  5,184,238,225,242,242,239,247,232,229,226,
+    242,229,119,128,  5,184,241,245,225,242,244,229,242,232,229,226,
+    242,229,119,128,  5,184,247,233,228,229,232,229,226,242,229,119,
+    128,  5,184,245,225,242,244,229,242,232,229,226,242,229,119,128,
+      5,184,247,233,228,229,232,229,226,242,229,119,128,  5,184,242,
+    238,229,249,240,225,242,225,232,229,226,242,229,119,128,  5,159,
+    226,239,240,239,237,239,230,111,128, 49, 17,227,233,242,227,236,
+    101,128, 36,224,232,239,239,107,128,  2,160,237,239,238,239,243,
+    240,225,227,101,128,255, 81,239,102,134,  5,231,161,216,161,236,
+    162, 81,162,100,162,144,162,186,228,225,231,229,243,104,129,251,
+     71,161,227,232,229,226,242,229,119,128,251, 71,104,  4,161,246,
+    162, 37,162, 45,162, 63,225,244,225,102,  2,161,255,162, 18,240,
+    225,244,225,104,129,216, 75,162,  9,232,229,226,242,229,119,128,
+    216, 75,243,229,231,239,108,129,216, 78,162, 28,232,229,226,242,
+    229,119,128,216, 78,229,226,242,229,119,128,  5,231,233,242,233,
+    113,129,216, 81,162, 54,232,229,226,242,229,119,128,216, 81,239,
+    236,225,109,129,216, 84,162, 72,232,229,226,242,229,119,128,216,
+     84,240,225,244,225,104,129,216, 87,162, 91,232,229,226,242,229,
+    119,128,216, 87,113,  2,162,106,162,125,225,237,225,244,115,129,
+    216, 90,162,116,232,229,226,242,229,119,128,216, 90,245,226,245,
+    244,115,129,216, 93,162,135,232,229,226,242,229,119,128,216, 93,
+    115,  2,162,150,162,168,229,231,239,108,129,216, 96,162,159,232,
+    229,226,242,229,119,128,216, 96,232,229,246, 97,129,216, 99,162,
+    177,232,229,226,242,229,119,128,216, 99,244,243,229,242,101,129,
+    216,102,162,196,232,229,226,242,229,119,128,216,102,240,225,242,
+    229,110,128, 36,172,117,  4,162,223,162,235,163, 68,163,155,225,
+    242,244,229,242,238,239,244,101,128, 38,105,226,245,244,115,135,
+      5,187,163,  0,163,  5,163, 10,163, 15,163, 24,163, 39,163, 55,
+    177, 56,128,  5,187,178, 53,128,  5,187,179, 49,128,  5,187,232,
+    229,226,242,229,119,128,  5,187,238,225,242,242,239,247,232,229,
+    226,242,229,119,128,  5,187,241,245,225,242,244,229,242,232,229,
+    226,242,229,119,128,  5,187,247,233,228,229,232,229,226,242,229,
+    119,128,  5,187,229,243,244,233,239,110,133,  0, 63,163, 87,163,
+    110,163,127,163,135,163,147,225,114,  2,163, 94,163,101,225,226,
+    233, 99,128,  6, 31,237,229,238,233,225,110,128,  5, 94,228,239,
+    247,110,129,  0,191,163,119,243,237,225,236,108,128,247,191,231,
+    242,229,229,107,128,  3,126,237,239,238,239,243,240,225,227,101,
+    128,255, 31,243,237,225,236,108,128,247, 63,239,244,101,  4,163,
+    167,163,238,164,  2,164, 31,228,226,108,133,  0, 34,163,183,163,
+    190,163,197,163,209,163,230,226,225,243,101,128, 32, 30,236,229,
+    230,116,128, 32, 28,237,239,238,239,243,240,225,227,101,128,255,
+      2,240,242,233,237,101,129, 48, 30,163,219,242,229,246,229,242,
+    243,229,100,128, 48, 29,242,233,231,232,116,128, 32, 29,236,229,
+    230,116,129, 32, 24,163,247,242,229,246,229,242,243,229,100,128,
+     32, 27,114,  2,164,  8,164, 18,229,246,229,242,243,229,100,128,
+     32, 27,233,231,232,116,129, 32, 25,164, 27,110,128,  1, 73,243,
+    233,238,231,108,  2,164, 41,164, 48,226,225,243,101,128, 32, 26,
+    101,129,  0, 39,164, 54,237,239,238,239,243,240,225,227,101,128,
+    255,  7,114,145,  0,114,164,104,165,108,165,119,165,166,165,217,
+    167,223,167,247,168, 86,170,120,170,157,170,169,170,223,170,231,
+    171,137,171,148,171,183,172, 27, 97, 11,164,128,164,139,164,149,
+    164,156,164,221,164,237,165,  6,165, 17,165, 42,165, 65,165,102,
+    225,242,237,229,238,233,225,110,128,  5,124,226,229,238,231,225,
+    236,105,128,  9,176,227,245,244,101,128,  1, 85,100,  4,164,166,
+    164,172,164,186,164,212,229,246, 97,128,  9, 48,233,227,225,108,
+    129, 34, 26,164,181,229,120,128,248,229,239,246,229,242,243,243,
+    241,245,225,242,101,129, 51,174,164,202,228,243,241,245,225,242,
+    101,128, 51,175,243,241,245,225,242,101,128, 51,173,230,101,129,
+      5,191,164,228,232,229,226,242,229,119,128,  5,191,231,117,  2,
+    164,244,164,253,234,225,242,225,244,105,128, 10,176,242,237,245,
+    235,232,105,128, 10, 48,232,233,242,225,231,225,238, 97,128, 48,
+    137,235,225,244,225,235,225,238, 97,129, 48,233,165, 30,232,225,
+    236,230,247,233,228,244,104,128,255,151,236,239,247,229,242,228,
+    233,225,231,239,238,225,236,226,229,238,231,225,236,105,128,  9,
+    241,109,  2,165, 71,165, 94,233,228,228,236,229,228,233,225,231,
+    239,238,225,236,226,229,238,231,225,236,105,128,  9,240,243,232,
+    239,242,110,128,  2,100,244,233,111,128, 34, 54,226,239,240,239,
+    237,239,230,111,128, 49, 22, 99,  4,165,129,165,136,165,145,165,
+    153,225,242,239,110,128,  1, 89,229,228,233,236,236, 97,128,  1,
+     87,233,242,227,236,101,128, 36,225,239,237,237,225,225,227,227,
+    229,238,116,128,  1, 87,100,  2,165,172,165,182,226,236,231,242,
+    225,246,101,128,  2, 17,239,116,  2,165,189,165,198,225,227,227,
+    229,238,116,128, 30, 89,226,229,236,239,119,129, 30, 91,165,208,
+    237,225,227,242,239,110,128, 30, 93,101,  6,165,231,166, 20,166,
+     55,166,131,166,156,167,157,102,  2,165,237,165,250,229,242,229,
+    238,227,229,237,225,242,107,128, 32, 59,236,229,248,243,117,  2,
+    166,  4,166, 11,226,243,229,116,128, 34,134,240,229,242,243,229,
+    116,128, 34,135,231,233,243,244,229,114,  2,166, 31,166, 36,229,
+    100,128,  0,174,115,  2,166, 42,166, 48,225,238,115,128,248,232,
+    229,242,233,102,128,246,218,104,  4,166, 65,166, 88,166,102,166,
+    112,225,114,  2,166, 72,166, 79,225,226,233, 99,128,  6, 49,237,
+    229,238,233,225,110,128,  5,128,230,233,238,225,236,225,242,225,
+    226,233, 99,128,254,174,233,242,225,231,225,238, 97,128, 48,140,
+    249,229,232,225,236,229,230,236,225,237,225,242,225,226,233, 99,
+    128,216,105,235,225,244,225,235,225,238, 97,129, 48,236,166,144,
+    232,225,236,230,247,233,228,244,104,128,255,154,243,104,134,  5,
+    232,166,173,166,188,167, 33,167, 52,167, 96,167,138,228,225,231,
+    229,243,232,232,229,226,242,229,119,128,251, 72,104,  4,166,198,
+    166,245,166,253,167, 15,225,244,225,102,  2,166,207,166,226,240,
+    225,244,225,104,129,216,110,166,217,232,229,226,242,229,119,128,
+    216,110,243,229,231,239,108,129,216,113,166,236,232,229,226,242,
+    229,119,128,216,113,229,226,242,229,119,128,  5,232,233,242,233,
+    113,129,216,116,167,  6,232,229,226,242,229,119,128,216,116,239,
+    236,225,109,129,216,119,167, 24,232,229,226,242,229,119,128,216,
+    119,240,225,244,225,104,129,216,122,167, 43,232,229,226,242,229,
+    119,128,216,122,113,  2,167, 58,167, 77,225,237,225,244,115,129,
+    216,125,167, 68,232,229,226,242,229,119,128,216,125,245,226,245,
+    244,115,129,216,128,167, 87,232,229,226,242,229,119,128,216,128,
+    115,  2,167,102,167,120,229,231,239,108,129,216,131,167,111,232,
+    229,226,242,229,119,128,216,131,232,229,246, 97,129,216,134,167,
+    129,232,229,226,242,229,119,128,216,134,244,243,229,242,101,129,
+    216,137,167,148,232,229,226,242,229,119,128,216,137,118,  3,167,
+    165,167,178,167,210,229,242,243,229,228,244,233,236,228,101,128,
+     34, 61,233, 97,  2,167,185,167,194,232,229,226,242,229,119,128,
+      5,151,237,245,231,242,225,243,232,232,229,226,242,229,119,128,
+      5,151,236,239,231,233,227,225,236,238,239,116,128, 35, 16,230,
+    233,243,232,232,239,239,107,129,  2,126,167,236,242,229,246,229,
+    242,243,229,100,128,  2,127,104,  2,167,253,168, 20, 97,  2,168,
+      3,168, 13,226,229,238,231,225,236,105,128,  9,221,228,229,246,
+     97,128,  9, 93,111,131,  3,193,168, 30,168, 59,168, 73,239,107,
+    129,  2,125,168, 37,244,245,242,238,229,100,129,  2,123,168, 48,
+    243,245,240,229,242,233,239,114,128,  2,181,243,249,237,226,239,
+    236,231,242,229,229,107,128,  3,241,244,233,227,232,239,239,235,
+    237,239,100,128,  2,222,105,  6,168,100,169,144,169,190,169,201,
+    169,226,170,106,229,245,108,  9,168,122,168,157,168,172,168,186,
+    168,232,168,246,169, 76,169, 89,169,124, 97,  2,168,128,168,143,
+    227,233,242,227,236,229,235,239,242,229,225,110,128, 50,113,240,
+    225,242,229,238,235,239,242,229,225,110,128, 50, 17,227,233,242,
+    227,236,229,235,239,242,229,225,110,128, 50, 99,232,233,229,245,
+    232,235,239,242,229,225,110,128, 49, 64,107,  2,168,192,168,224,
+    233,249,229,239,107,  2,168,202,168,211,235,239,242,229,225,110,
+    128, 49, 58,243,233,239,243,235,239,242,229,225,110,128, 49,105,
+    239,242,229,225,110,128, 49, 57,237,233,229,245,237,235,239,242,
+    229,225,110,128, 49, 59,112,  3,168,254,169, 30,169, 45, 97,  2,
+    169,  4,169, 18,238,243,233,239,243,235,239,242,229,225,110,128,
+     49,108,242,229,238,235,239,242,229,225,110,128, 50,  3,232,233,
+    229,245,240,232,235,239,242,229,225,110,128, 49, 63,233,229,245,
+    112,  2,169, 54,169, 63,235,239,242,229,225,110,128, 49, 60,243,
+    233,239,243,235,239,242,229,225,110,128, 49,107,243,233,239,243,
+    235,239,242,229,225,110,128, 49, 61,116,  2,169, 95,169,110,232,
+    233,229,245,244,232,235,239,242,229,225,110,128, 49, 62,233,235,
+    229,245,244,235,239,242,229,225,110,128, 49,106,249,229,239,242,
+    233,238,232,233,229,245,232,235,239,242,229,225,110,128, 49,109,
+    231,232,116,  2,169,152,169,160,225,238,231,236,101,128, 34, 31,
+    116,  2,169,166,169,180,225,227,235,226,229,236,239,247,227,237,
+     98,128,  3, 25,242,233,225,238,231,236,101,128, 34,191,232,233,
+    242,225,231,225,238, 97,128, 48,138,235,225,244,225,235,225,238,
+     97,129, 48,234,169,214,232,225,236,230,247,233,228,244,104,128,
+    255,152,110,  2,169,232,170, 92,103,131,  2,218,169,242,169,253,
+    170,  3,226,229,236,239,247,227,237, 98,128,  3, 37,227,237, 98,
+    128,  3, 10,232,225,236,102,  2,170, 12,170, 58,236,229,230,116,
+    131,  2,191,170, 25,170, 36,170, 47,225,242,237,229,238,233,225,
+    110,128,  5, 89,226,229,236,239,247,227,237, 98,128,  3, 28,227,
+    229,238,244,229,242,229,100,128,  2,211,242,233,231,232,116,130,
+      2,190,170, 70,170, 81,226,229,236,239,247,227,237, 98,128,  3,
+     57,227,229,238,244,229,242,229,100,128,  2,210,246,229,242,244,
+    229,228,226,242,229,246,101,128,  2, 19,244,244,239,242,245,243,
+    241,245,225,242,101,128, 51, 81,108,  2,170,126,170,137,233,238,
+    229,226,229,236,239,119,128, 30, 95,239,238,231,236,229,103,129,
+      2,124,170,148,244,245,242,238,229,100,128,  2,122,237,239,238,
+    239,243,240,225,227,101,128,255, 82,111,  3,170,177,170,188,170,
+    213,232,233,242,225,231,225,238, 97,128, 48,141,235,225,244,225,
+    235,225,238, 97,129, 48,237,170,201,232,225,236,230,247,233,228,
+    244,104,128,255,155,242,245,225,244,232,225,105,128, 14, 35,240,
+    225,242,229,110,128, 36,173,114,  3,170,239,171, 19,171, 49, 97,
+      3,170,247,171,  1,171,  8,226,229,238,231,225,236,105,128,  9,
+    220,228,229,246, 97,128,  9, 49,231,245,242,237,245,235,232,105,
+    128, 10, 92,229,104,  2,171, 26,171, 35,225,242,225,226,233, 99,
+    128,  6,145,230,233,238,225,236,225,242,225,226,233, 99,128,251,
+    141,246,239,227,225,236,233, 99,  4,171, 65,171, 75,171, 82,171,
+     93,226,229,238,231,225,236,105,128,  9,224,228,229,246, 97,128,
+      9, 96,231,245,234,225,242,225,244,105,128, 10,224,246,239,247,
+    229,236,243,233,231,110,  3,171,109,171,119,171,126,226,229,238,
+    231,225,236,105,128,  9,196,228,229,246, 97,128,  9, 68,231,245,
+    234,225,242,225,244,105,128, 10,196,243,245,240,229,242,233,239,
+    114,128,246,241,116,  2,171,154,171,162,226,236,239,227,107,128,
+     37,144,245,242,238,229,100,129,  2,121,171,172,243,245,240,229,
+    242,233,239,114,128,  2,180,117,  4,171,193,171,204,171,229,172,
+     20,232,233,242,225,231,225,238, 97,128, 48,139,235,225,244,225,
+    235,225,238, 97,129, 48,235,171,217,232,225,236,230,247,233,228,
+    244,104,128,255,153,112,  2,171,235,172, 14,229,101,  2,171,242,
+    172,  0,237,225,242,235,226,229,238,231,225,236,105,128,  9,242,
+    243,233,231,238,226,229,238,231,225,236,105,128,  9,243,233,225,
+    104,128,246,221,244,232,225,105,128, 14, 36,246,239,227,225,236,
+    233, 99,  4,172, 43,172, 53,172, 60,172, 71,226,229,238,231,225,
+    236,105,128,  9,139,228,229,246, 97,128,  9, 11,231,245,234,225,
+    242,225,244,105,128, 10,139,246,239,247,229,236,243,233,231,110,
+      3,172, 87,172, 97,172,104,226,229,238,231,225,236,105,128,  9,
+    195,228,229,246, 97,128,  9, 67,231,245,234,225,242,225,244,105,
+    128, 10,195,115,147,  0,115,172,157,174,127,174,138,175,  8,175,
+     47,177,245,178,  0,180,160,183, 42,183, 88,183,115,184, 50,184,
+    117,185,150,185,160,186, 90,186,163,187, 77,187, 87, 97,  9,172,
+    177,172,187,172,208,173, 24,173, 49,173, 60,173, 85,173,117,173,
+    157,226,229,238,231,225,236,105,128,  9,184,227,245,244,101,129,
+      1, 91,172,196,228,239,244,225,227,227,229,238,116,128, 30,101,
+    100,  5,172,220,172,229,172,235,172,249,173,  9,225,242,225,226,
+    233, 99,128,  6, 53,229,246, 97,128,  9, 56,230,233,238,225,236,
+    225,242,225,226,233, 99,128,254,186,233,238,233,244,233,225,236,
+    225,242,225,226,233, 99,128,254,187,237,229,228,233,225,236,225,
+    242,225,226,233, 99,128,254,188,231,117,  2,173, 31,173, 40,234,
+    225,242,225,244,105,128, 10,184,242,237,245,235,232,105,128, 10,
+     56,232,233,242,225,231,225,238, 97,128, 48, 85,235,225,244,225,
+    235,225,238, 97,129, 48,181,173, 73,232,225,236,230,247,233,228,
+    244,104,128,255,123,236,236,225,236,236,225,232,239,245,225,236,
+    225,249,232,229,247,225,243,225,236,236,225,237,225,242,225,226,
+    233, 99,128,253,250,237,229,235,104,130,  5,225,173,128,173,148,
+    228,225,231,229,243,104,129,251, 65,173,139,232,229,226,242,229,
+    119,128,251, 65,232,229,226,242,229,119,128,  5,225,242, 97,  5,
+    173,170,173,244,173,252,174, 46,174, 54, 97,  5,173,182,173,190,
+    173,198,173,229,173,237,225,244,232,225,105,128, 14, 50,229,244,
+    232,225,105,128, 14, 65,233,237,225,233,109,  2,173,208,173,219,
+    225,236,225,233,244,232,225,105,128, 14, 68,245,225,238,244,232,
+    225,105,128, 14, 67,237,244,232,225,105,128, 14, 51,244,232,225,
+    105,128, 14, 48,229,244,232,225,105,128, 14, 64,105,  3,174,  4,
+    174, 28,174, 39,105,  2,174, 10,174, 21,236,229,230,244,244,232,
+    225,105,128,248,134,244,232,225,105,128, 14, 53,236,229,230,244,
+    244,232,225,105,128,248,133,244,232,225,105,128, 14, 52,239,244,
+    232,225,105,128, 14, 66,117,  3,174, 62,174,112,174,119,101,  3,
+    174, 70,174, 94,174,105,101,  2,174, 76,174, 87,236,229,230,244,
+    244,232,225,105,128,248,136,244,232,225,105,128, 14, 55,236,229,
+    230,244,244,232,225,105,128,248,135,244,232,225,105,128, 14, 54,
+    244,232,225,105,128, 14, 56,245,244,232,225,105,128, 14, 57,226,
+    239,240,239,237,239,230,111,128, 49, 25, 99,  5,174,150,174,171,
+    174,180,174,229,174,251,225,242,239,110,129,  1, 97,174,159,228,
+    239,244,225,227,227,229,238,116,128, 30,103,229,228,233,236,236,
+     97,128,  1, 95,232,247, 97,131,  2, 89,174,192,174,203,174,222,
+    227,249,242,233,236,236,233, 99,128,  4,217,228,233,229,242,229,
+    243,233,243,227,249,242,233,236,236,233, 99,128,  4,219,232,239,
+    239,107,128,  2, 90,233,242, 99,  2,174,237,174,242,236,101,128,
+     36,226,245,237,230,236,229,120,128,  1, 93,239,237,237,225,225,
+    227,227,229,238,116,128,  2, 25,228,239,116,  2,175, 16,175, 25,
+    225,227,227,229,238,116,128, 30, 97,226,229,236,239,119,129, 30,
+     99,175, 35,228,239,244,225,227,227,229,238,116,128, 30,105,101,
+      9,175, 67,175, 83,175,118,175,183,176, 30,176, 57,176, 82,176,
+    163,176,190,225,231,245,236,236,226,229,236,239,247,227,237, 98,
+    128,  3, 60, 99,  2,175, 89,175,111,239,238,100,129, 32, 51,175,
+     97,244,239,238,229,227,232,233,238,229,243,101,128,  2,202,244,
+    233,239,110,128,  0,167,229,110,  4,175,129,175,138,175,152,175,
+    168,225,242,225,226,233, 99,128,  6, 51,230,233,238,225,236,225,
+    242,225,226,233, 99,128,254,178,233,238,233,244,233,225,236,225,
+    242,225,226,233, 99,128,254,179,237,229,228,233,225,236,225,242,
+    225,226,233, 99,128,254,180,231,239,108,135,  5,182,175,203,175,
+    217,175,222,175,231,175,246,176,  6,176, 17, 49,  2,175,209,175,
+    213, 51,128,  5,182,102,128,  5,182,178, 99,128,  5,182,232,229,
+    226,242,229,119,128,  5,182,238,225,242,242,239,247,232,229,226,
+    242,229,119,128,  5,182,241,245,225,242,244,229,242,232,229,226,
+    242,229,119,128,  5,182,244,225,232,229,226,242,229,119,128,  5,
+    146,247,233,228,229,232,229,226,242,229,119,128,  5,182,104,  2,
+    176, 36,176, 47,225,242,237,229,238,233,225,110,128,  5,125,233,
+    242,225,231,225,238, 97,128, 48, 91,235,225,244,225,235,225,238,
+     97,129, 48,187,176, 70,232,225,236,230,247,233,228,244,104,128,
+    255,126,237,105,  2,176, 89,176,132,227,239,236,239,110,131,  0,
+     59,176,103,176,112,176,124,225,242,225,226,233, 99,128,  6, 27,
+    237,239,238,239,243,240,225,227,101,128,255, 27,243,237,225,236,
+    108,128,254, 84,246,239,233,227,229,228,237,225,242,235,235,225,
+    238, 97,129, 48,156,176,151,232,225,236,230,247,233,228,244,104,
+    128,255,159,238,116,  2,176,170,176,180,233,243,241,245,225,242,
+    101,128, 51, 34,239,243,241,245,225,242,101,128, 51, 35,246,229,
+    110,142,  0, 55,176,224,176,233,176,243,177, 17,177, 24,177, 34,
+    177, 59,177, 86,177,120,177,132,177,143,177,176,177,184,177,195,
+    225,242,225,226,233, 99,128,  6,103,226,229,238,231,225,236,105,
+    128,  9,237,227,233,242,227,236,101,129, 36,102,176,254,233,238,
+    246,229,242,243,229,243,225,238,243,243,229,242,233,102,128, 39,
+    144,228,229,246, 97,128,  9,109,229,233,231,232,244,232,115,128,
+     33, 94,231,117,  2,177, 41,177, 50,234,225,242,225,244,105,128,
+     10,237,242,237,245,235,232,105,128, 10,109,232, 97,  2,177, 66,
+    177, 77,227,235,225,242,225,226,233, 99,128,  6,103,238,231,250,
+    232,239,117,128, 48, 39,105,  2,177, 92,177,110,228,229,239,231,
+    242,225,240,232,233,227,240,225,242,229,110,128, 50, 38,238,230,
+    229,242,233,239,114,128, 32,135,237,239,238,239,243,240,225,227,
+    101,128,255, 23,239,236,228,243,244,249,236,101,128,247, 55,112,
+      2,177,149,177,156,225,242,229,110,128, 36,122,229,114,  2,177,
+    163,177,169,233,239,100,128, 36,142,243,233,225,110,128,  6,247,
+    242,239,237,225,110,128, 33,118,243,245,240,229,242,233,239,114,
+    128, 32,119,116,  2,177,201,177,239,229,229,110,  2,177,209,177,
+    218,227,233,242,227,236,101,128, 36,112,112,  2,177,224,177,231,
+    225,242,229,110,128, 36,132,229,242,233,239,100,128, 36,152,232,
+    225,105,128, 14, 87,230,244,232,249,240,232,229,110,128,  0,173,
+    104,  7,178, 16,179,  7,179, 18,179, 32,179,233,179,246,180,154,
+     97,  6,178, 30,178, 41,178, 51,178, 62,178,222,178,247,225,242,
+    237,229,238,233,225,110,128,  5,119,226,229,238,231,225,236,105,
+    128,  9,182,227,249,242,233,236,236,233, 99,128,  4, 72,100,  2,
+    178, 68,178,181,228, 97,  4,178, 79,178, 88,178,119,178,150,225,
+    242,225,226,233, 99,128,  6, 81,228,225,237,237, 97,  2,178, 98,
+    178,107,225,242,225,226,233, 99,128,252, 97,244,225,238,225,242,
+    225,226,233, 99,128,252, 94,230,225,244,232, 97,  2,178,129,178,
+    138,225,242,225,226,233, 99,128,252, 96,244,225,238,225,242,225,
+    226,233, 99,128,216,140,235,225,243,242, 97,  2,178,160,178,169,
+    225,242,225,226,233, 99,128,252, 98,244,225,238,225,242,225,226,
+    233, 99,128,252, 95,101,132, 37,146,178,193,178,200,178,208,178,
+    217,228,225,242,107,128, 37,147,236,233,231,232,116,128, 37,145,
+    237,229,228,233,245,109,128, 37,146,246, 97,128,  9, 54,231,117,
+      2,178,229,178,238,234,225,242,225,244,105,128, 10,182,242,237,
+    245,235,232,105,128, 10, 54,236,243,232,229,236,229,244,232,229,
+    226,242,229,119,128,  5,147,226,239,240,239,237,239,230,111,128,
+     49, 21,227,232,225,227,249,242,233,236,236,233, 99,128,  4, 73,
+    101,  4,179, 42,179,107,179,117,179,134,229,110,  4,179, 53,179,
+     62,179, 76,179, 92,225,242,225,226,233, 99,128,  6, 52,230,233,
+    238,225,236,225,242,225,226,233, 99,128,254,182,233,238,233,244,
+    233,225,236,225,242,225,226,233, 99,128,254,183,237,229,228,233,
+    225,236,225,242,225,226,233, 99,128,254,184,233,227,239,240,244,
+    233, 99,128,  3,227,241,229,108,129, 32,170,179,125,232,229,226,
+    242,229,119,128, 32,170,246, 97,134,  5,176,179,151,179,166,179,
+    180,179,189,179,204,179,220, 49,  2,179,157,179,162,177, 53,128,
+      5,176, 53,128,  5,176, 50,  2,179,172,179,176, 50,128,  5,176,
+    101,128,  5,176,232,229,226,242,229,119,128,  5,176,238,225,242,
+    242,239,247,232,229,226,242,229,119,128,  5,176,241,245,225,242,
+    244,229,242,232,229,226,242,229,119,128,  5,176,247,233,228,229,
+    232,229,226,242,229,119,128,  5,176,232,225,227,249,242,233,236,
+    236,233, 99,128,  4,187,105,  2,179,252,180,  7,237,225,227,239,
+    240,244,233, 99,128,  3,237,110,131,  5,233,180, 17,180,100,180,
+    109,100,  2,180, 23,180, 89,225,231,229,243,104,130,251, 73,180,
+     35,180, 44,232,229,226,242,229,119,128,251, 73,115,  2,180, 50,
+    180, 70,232,233,238,228,239,116,129,251, 44,180, 61,232,229,226,
+    242,229,119,128,251, 44,233,238,228,239,116,129,251, 45,180, 80,
+    232,229,226,242,229,119,128,251, 45,239,244,232,229,226,242,229,
+    119,128,  5,193,232,229,226,242,229,119,128,  5,233,115,  2,180,
+    115,180,135,232,233,238,228,239,116,129,251, 42,180,126,232,229,
+    226,242,229,119,128,251, 42,233,238,228,239,116,129,251, 43,180,
+    145,232,229,226,242,229,119,128,251, 43,239,239,107,128,  2,130,
+    105,  8,180,178,180,222,180,233,181,  2,181, 32,181, 40,181, 53,
+    181,224,231,237, 97,131,  3,195,180,190,180,194,180,202, 49,128,
+      3,194,230,233,238,225,108,128,  3,194,236,245,238,225,244,229,
+    243,249,237,226,239,236,231,242,229,229,107,128,  3,242,232,233,
+    242,225,231,225,238, 97,128, 48, 87,235,225,244,225,235,225,238,
+     97,129, 48,183,180,246,232,225,236,230,247,233,228,244,104,128,
+    255,124,236,245,113,  2,181, 10,181, 19,232,229,226,242,229,119,
+    128,  5,189,236,229,230,244,232,229,226,242,229,119,128,  5,189,
+    237,233,236,225,114,128, 34, 60,238,228,239,244,232,229,226,242,
+    229,119,128,  5,194,239,115,  6,181, 68,181,103,181,135,181,163,
+    181,177,181,209, 97,  2,181, 74,181, 89,227,233,242,227,236,229,
+    235,239,242,229,225,110,128, 50,116,240,225,242,229,238,235,239,
+    242,229,225,110,128, 50, 20,227,105,  2,181,110,181,122,229,245,
+    227,235,239,242,229,225,110,128, 49,126,242,227,236,229,235,239,
+    242,229,225,110,128, 50,102,107,  2,181,141,181,155,233,249,229,
+    239,235,235,239,242,229,225,110,128, 49,122,239,242,229,225,110,
+    128, 49, 69,238,233,229,245,238,235,239,242,229,225,110,128, 49,
+    123,112,  2,181,183,181,196,225,242,229,238,235,239,242,229,225,
+    110,128, 50,  6,233,229,245,240,235,239,242,229,225,110,128, 49,
+    125,244,233,235,229,245,244,235,239,242,229,225,110,128, 49,124,
+    120,141,  0, 54,181,254,182,  7,182, 17,182, 47,182, 54,182, 79,
+    182,106,182,140,182,152,182,163,182,196,182,204,182,215,225,242,
+    225,226,233, 99,128,  6,102,226,229,238,231,225,236,105,128,  9,
+    236,227,233,242,227,236,101,129, 36,101,182, 28,233,238,246,229,
+    242,243,229,243,225,238,243,243,229,242,233,102,128, 39,143,228,
+    229,246, 97,128,  9,108,231,117,  2,182, 61,182, 70,234,225,242,
+    225,244,105,128, 10,236,242,237,245,235,232,105,128, 10,108,232,
+     97,  2,182, 86,182, 97,227,235,225,242,225,226,233, 99,128,  6,
+    102,238,231,250,232,239,117,128, 48, 38,105,  2,182,112,182,130,
+    228,229,239,231,242,225,240,232,233,227,240,225,242,229,110,128,
+     50, 37,238,230,229,242,233,239,114,128, 32,134,237,239,238,239,
+    243,240,225,227,101,128,255, 22,239,236,228,243,244,249,236,101,
+    128,247, 54,112,  2,182,169,182,176,225,242,229,110,128, 36,121,
+    229,114,  2,182,183,182,189,233,239,100,128, 36,141,243,233,225,
+    110,128,  6,246,242,239,237,225,110,128, 33,117,243,245,240,229,
+    242,233,239,114,128, 32,118,116,  2,182,221,183, 36,229,229,110,
+      2,182,229,183, 15, 99,  2,182,235,182,243,233,242,227,236,101,
+    128, 36,111,245,242,242,229,238,227,249,228,229,238,239,237,233,
+    238,225,244,239,242,226,229,238,231,225,236,105,128,  9,249,112,
+      2,183, 21,183, 28,225,242,229,110,128, 36,131,229,242,233,239,
+    100,128, 36,151,232,225,105,128, 14, 86,108,  2,183, 48,183, 68,
+    225,243,104,129,  0, 47,183, 56,237,239,238,239,243,240,225,227,
+    101,128,255, 15,239,238,103,129,  1,127,183, 76,228,239,244,225,
+    227,227,229,238,116,128, 30,155,109,  2,183, 94,183,104,233,236,
+    229,230,225,227,101,128, 38, 58,239,238,239,243,240,225,227,101,
+    128,255, 83,111,  6,183,129,183,179,183,190,183,215,184,  4,184,
+     15,102,  2,183,135,183,149,240,225,243,245,241,232,229,226,242,
+    229,119,128,  5,195,116,  2,183,155,183,164,232,249,240,232,229,
+    110,128,  0,173,243,233,231,238,227,249,242,233,236,236,233, 99,
+    128,  4, 76,232,233,242,225,231,225,238, 97,128, 48, 93,235,225,
+    244,225,235,225,238, 97,129, 48,189,183,203,232,225,236,230,247,
+    233,228,244,104,128,255,127,236,233,228,245,115,  2,183,225,183,
+    242,236,239,238,231,239,246,229,242,236,225,249,227,237, 98,128,
+      3, 56,243,232,239,242,244,239,246,229,242,236,225,249,227,237,
+     98,128,  3, 55,242,245,243,233,244,232,225,105,128, 14, 41,115,
+      3,184, 23,184, 33,184, 41,225,236,225,244,232,225,105,128, 14,
+     40,239,244,232,225,105,128, 14, 11,245,225,244,232,225,105,128,
+     14, 42,240, 97,  3,184, 59,184, 79,184,111,227,101,129,  0, 32,
+    184, 66,232,225,227,235,225,242,225,226,233, 99,128,  0, 32,228,
+    101,129, 38, 96,184, 86,243,245,233,116,  2,184, 95,184,103,226,
+    236,225,227,107,128, 38, 96,247,232,233,244,101,128, 38,100,242,
+    229,110,128, 36,174,241,245,225,242,101, 11,184,145,184,156,184,
+    170,184,195,184,212,184,238,184,253,185, 30,185, 57,185,113,185,
+    128,226,229,236,239,247,227,237, 98,128,  3, 59, 99,  2,184,162,
+    184,166, 99,128, 51,196,109,128, 51,157,228,233,225,231,239,238,
+    225,236,227,242,239,243,243,232,225,244,227,232,230,233,236,108,
+    128, 37,169,232,239,242,233,250,239,238,244,225,236,230,233,236,
+    108,128, 37,164,107,  2,184,218,184,222,103,128, 51,143,109,129,
+     51,158,184,228,227,225,240,233,244,225,108,128, 51,206,108,  2,
+    184,244,184,248,110,128, 51,209,239,103,128, 51,210,109,  4,185,
+      7,185, 11,185, 16,185, 20,103,128, 51,142,233,108,128, 51,213,
+    109,128, 51,156,243,241,245,225,242,229,100,128, 51,161,239,242,
+    244,232,239,231,239,238,225,236,227,242,239,243,243,232,225,244,
+    227,232,230,233,236,108,128, 37,166,245,240,240,229,114,  2,185,
+     67,185, 90,236,229,230,244,244,239,236,239,247,229,242,242,233,
+    231,232,244,230,233,236,108,128, 37,167,242,233,231,232,244,244,
+    239,236,239,247,229,242,236,229,230,244,230,233,236,108,128, 37,
+    168,246,229,242,244,233,227,225,236,230,233,236,108,128, 37,165,
+    247,232,233,244,229,247,233,244,232,243,237,225,236,236,226,236,
+    225,227,107,128, 37,163,242,243,241,245,225,242,101,128, 51,219,
+    115,  2,185,166,186, 80, 97,  4,185,176,185,186,185,193,185,204,
+    226,229,238,231,225,236,105,128,  9,183,228,229,246, 97,128,  9,
+     55,231,245,234,225,242,225,244,105,128, 10,183,238,103,  8,185,
+    223,185,237,185,251,186,  9,186, 24,186, 38,186, 52,186, 65,227,
+    233,229,245,227,235,239,242,229,225,110,128, 49, 73,232,233,229,
+    245,232,235,239,242,229,225,110,128, 49,133,233,229,245,238,231,
+    235,239,242,229,225,110,128, 49,128,235,233,249,229,239,235,235,
+    239,242,229,225,110,128, 49, 50,238,233,229,245,238,235,239,242,
+    229,225,110,128, 49,101,240,233,229,245,240,235,239,242,229,225,
+    110,128, 49, 67,243,233,239,243,235,239,242,229,225,110,128, 49,
+     70,244,233,235,229,245,244,235,239,242,229,225,110,128, 49, 56,
+    245,240,229,242,233,239,114,128,246,242,116,  2,186, 96,186,119,
+    229,242,236,233,238,103,129,  0,163,186,107,237,239,238,239,243,
+    240,225,227,101,128,255,225,242,239,235,101,  2,186,128,186,145,
+    236,239,238,231,239,246,229,242,236,225,249,227,237, 98,128,  3,
+     54,243,232,239,242,244,239,246,229,242,236,225,249,227,237, 98,
+    128,  3, 53,117,  7,186,179,186,211,186,233,186,244,187, 29,187,
+     39,187, 43,226,243,229,116,130, 34,130,186,190,186,201,238,239,
+    244,229,241,245,225,108,128, 34,138,239,242,229,241,245,225,108,
+    128, 34,134, 99,  2,186,217,186,225,227,229,229,228,115,128, 34,
+    123,232,244,232,225,116,128, 34, 11,232,233,242,225,231,225,238,
+     97,128, 48, 89,107,  2,186,250,187, 18,225,244,225,235,225,238,
+     97,129, 48,185,187,  6,232,225,236,230,247,233,228,244,104,128,
+    255,125,245,238,225,242,225,226,233, 99,128,  6, 82,237,237,225,
+    244,233,239,110,128, 34, 17,110,128, 38, 60,240,229,242,243,229,
+    116,130, 34,131,187, 56,187, 67,238,239,244,229,241,245,225,108,
+    128, 34,139,239,242,229,241,245,225,108,128, 34,135,246,243,241,
+    245,225,242,101,128, 51,220,249,239,245,247,225,229,242,225,243,
+    241,245,225,242,101,128, 51,124,116,144,  0,116,187,140,188,149,
+    188,170,189, 80,189,120,191,168,195, 50,196,125,196,137,196,149,
+    197,182,197,207,198, 37,198,217,199,145,199,235, 97, 10,187,162,
+    187,172,187,193,187,200,187,225,188, 47,188, 64,188, 89,188,103,
+    188,107,226,229,238,231,225,236,105,128,  9,164,227,107,  2,187,
+    179,187,186,228,239,247,110,128, 34,164,236,229,230,116,128, 34,
+    163,228,229,246, 97,128,  9, 36,231,117,  2,187,207,187,216,234,
+    225,242,225,244,105,128, 10,164,242,237,245,235,232,105,128, 10,
+     36,104,  4,187,235,187,244,188,  2,188, 32,225,242,225,226,233,
+     99,128,  6, 55,230,233,238,225,236,225,242,225,226,233, 99,128,
+    254,194,105,  2,188,  8,188, 23,238,233,244,233,225,236,225,242,
+    225,226,233, 99,128,254,195,242,225,231,225,238, 97,128, 48, 95,
+    237,229,228,233,225,236,225,242,225,226,233, 99,128,254,196,233,
+    243,249,239,245,229,242,225,243,241,245,225,242,101,128, 51,125,
+    235,225,244,225,235,225,238, 97,129, 48,191,188, 77,232,225,236,
+    230,247,233,228,244,104,128,255,128,244,247,229,229,236,225,242,
+    225,226,233, 99,128,  6, 64,117,128,  3,196,118,130,  5,234,188,
+    115,188,140,228,225,231,229,115,129,251, 74,188,125,104,129,251,
+     74,188,131,232,229,226,242,229,119,128,251, 74,232,229,226,242,
+    229,119,128,  5,234, 98,  2,188,155,188,160,225,114,128,  1,103,
+    239,240,239,237,239,230,111,128, 49, 10, 99,  6,188,184,188,191,
+    188,198,188,207,189, 40,189, 67,225,242,239,110,128,  1,101,227,
+    245,242,108,128,  2,168,229,228,233,236,236, 97,128,  1, 99,232,
+    229,104,  4,188,219,188,228,188,242,189,  2,225,242,225,226,233,
+     99,128,  6,134,230,233,238,225,236,225,242,225,226,233, 99,128,
+    251,123,233,238,233,244,233,225,236,225,242,225,226,233, 99,128,
+    251,124,237,101,  2,189,  9,189, 22,228,233,225,236,225,242,225,
+    226,233, 99,128,251,125,229,237,233,238,233,244,233,225,236,225,
+    242,225,226,233, 99,128,216,143,233,242, 99,  2,189, 48,189, 53,
+    236,101,128, 36,227,245,237,230,236,229,248,226,229,236,239,119,
+    128, 30,113,239,237,237,225,225,227,227,229,238,116,128,  1, 99,
+    100,  2,189, 86,189, 96,233,229,242,229,243,233,115,128, 30,151,
+    239,116,  2,189,103,189,112,225,227,227,229,238,116,128, 30,107,
+    226,229,236,239,119,128, 30,109,101,  9,189,140,189,151,189,171,
+    190,181,190,206,191, 14,191, 81,191, 86,191,138,227,249,242,233,
+    236,236,233, 99,128,  4, 66,228,229,243,227,229,238,228,229,242,
+    227,249,242,233,236,236,233, 99,128,  4,173,104,  7,189,187,189,
+    196,189,210,189,250,190, 24,190, 65,190,163,225,242,225,226,233,
+     99,128,  6, 42,230,233,238,225,236,225,242,225,226,233, 99,128,
+    254,150,232,225,232,105,  2,189,219,189,234,238,233,244,233,225,
+    236,225,242,225,226,233, 99,128,252,162,243,239,236,225,244,229,
+    228,225,242,225,226,233, 99,128,252, 12,105,  2,190,  0,190, 15,
+    238,233,244,233,225,236,225,242,225,226,233, 99,128,254,151,242,
+    225,231,225,238, 97,128, 48,102,234,229,229,237,105,  2,190, 34,
+    190, 49,238,233,244,233,225,236,225,242,225,226,233, 99,128,252,
+    161,243,239,236,225,244,229,228,225,242,225,226,233, 99,128,252,
+     11,109,  2,190, 71,190,105,225,242,226,245,244, 97,  2,190, 82,
+    190, 91,225,242,225,226,233, 99,128,  6, 41,230,233,238,225,236,
+    225,242,225,226,233, 99,128,254,148,101,  2,190,111,190,124,228,
+    233,225,236,225,242,225,226,233, 99,128,254,152,229,237,105,  2,
+    190,132,190,147,238,233,244,233,225,236,225,242,225,226,233, 99,
+    128,252,164,243,239,236,225,244,229,228,225,242,225,226,233, 99,
+    128,252, 14,238,239,239,238,230,233,238,225,236,225,242,225,226,
+    233, 99,128,252,115,235,225,244,225,235,225,238, 97,129, 48,198,
+    190,194,232,225,236,230,247,233,228,244,104,128,255,131,108,  2,
+    190,212,190,231,229,240,232,239,238,101,129, 33, 33,190,223,226,
+    236,225,227,107,128, 38, 14,233,243,232, 97,  2,190,240,190,255,
+    231,229,228,239,236,225,232,229,226,242,229,119,128,  5,160,241,
+    229,244,225,238,225,232,229,226,242,229,119,128,  5,169,110,  4,
+    191, 24,191, 33,191, 52,191, 73,227,233,242,227,236,101,128, 36,
+    105,233,228,229,239,231,242,225,240,232,233,227,240,225,242,229,
+    110,128, 50, 41,112,  2,191, 58,191, 65,225,242,229,110,128, 36,
+    125,229,242,233,239,100,128, 36,145,242,239,237,225,110,128, 33,
+    121,243,104,128,  2,167,116,131,  5,216,191, 96,191,116,191,125,
+    228,225,231,229,243,104,129,251, 56,191,107,232,229,226,242,229,
+    119,128,251, 56,232,229,226,242,229,119,128,  5,216,243,229,227,
+    249,242,233,236,236,233, 99,128,  4,181,246,233,114,  2,191,146,
+    191,155,232,229,226,242,229,119,128,  5,155,236,229,230,244,232,
+    229,226,242,229,119,128,  5,155,104,  6,191,182,192, 78,192,200,
+    193, 76,193,239,195, 40, 97,  5,191,194,191,204,191,211,191,236,
+    192,  9,226,229,238,231,225,236,105,128,  9,165,228,229,246, 97,
+    128,  9, 37,231,117,  2,191,218,191,227,234,225,242,225,244,105,
+    128, 10,165,242,237,245,235,232,105,128, 10, 37,108,  2,191,242,
+    191,251,225,242,225,226,233, 99,128,  6, 48,230,233,238,225,236,
+    225,242,225,226,233, 99,128,254,172,238,244,232,225,235,232,225,
+    116,  3,192, 24,192, 55,192, 62,236,239,119,  2,192, 32,192, 43,
+    236,229,230,244,244,232,225,105,128,248,152,242,233,231,232,244,
+    244,232,225,105,128,248,151,244,232,225,105,128, 14, 76,245,240,
+    240,229,242,236,229,230,244,244,232,225,105,128,248,150,101,  3,
+    192, 86,192,150,192,173,104,  4,192, 96,192,105,192,119,192,135,
+    225,242,225,226,233, 99,128,  6, 43,230,233,238,225,236,225,242,
+    225,226,233, 99,128,254,154,233,238,233,244,233,225,236,225,242,
+    225,226,233, 99,128,254,155,237,229,228,233,225,236,225,242,225,
+    226,233, 99,128,254,156,242,101,  2,192,157,192,166,229,248,233,
+    243,244,115,128, 34,  3,230,239,242,101,128, 34, 52,244, 97,130,
+      3,184,192,182,192,186, 49,128,  3,209,243,249,237,226,239,236,
+    231,242,229,229,107,128,  3,209,105,  2,192,206,193, 36,229,245,
+    244,104,  4,192,219,192,254,193, 13,193, 22, 97,  2,192,225,192,
+    240,227,233,242,227,236,229,235,239,242,229,225,110,128, 50,121,
+    240,225,242,229,238,235,239,242,229,225,110,128, 50, 25,227,233,
+    242,227,236,229,235,239,242,229,225,110,128, 50,107,235,239,242,
+    229,225,110,128, 49, 76,240,225,242,229,238,235,239,242,229,225,
+    110,128, 50, 11,242,244,229,229,110,  2,193, 46,193, 55,227,233,
+    242,227,236,101,128, 36,108,112,  2,193, 61,193, 68,225,242,229,
+    110,128, 36,128,229,242,233,239,100,128, 36,148,111,  6,193, 90,
+    193,107,193,112,193,126,193,131,193,184,238,225,238,231,237,239,
+    238,244,232,239,244,232,225,105,128, 14, 17,239,107,128,  1,173,
+    240,232,245,244,232,225,239,244,232,225,105,128, 14, 18,242,110,
+    128,  0,254,244,104,  3,193,140,193,164,193,174, 97,  2,193,146,
+    193,156,232,225,238,244,232,225,105,128, 14, 23,238,244,232,225,
+    105,128, 14, 16,239,238,231,244,232,225,105,128, 14, 24,245,238,
+    231,244,232,225,105,128, 14, 22,245,243,225,238,100,  2,193,194,
+    193,205,227,249,242,233,236,236,233, 99,128,  4,130,243,243,229,
+    240,225,242,225,244,239,114,  2,193,220,193,229,225,242,225,226,
+    233, 99,128,  6,108,240,229,242,243,233,225,110,128,  6,108,242,
+    229,101,144,  0, 51,194, 21,194, 30,194, 40,194, 70,194, 77,194,
+     87,194,112,194,139,194,173,194,185,194,204,194,215,194,248,195,
+     14,195, 22,195, 33,225,242,225,226,233, 99,128,  6, 99,226,229,
+    238,231,225,236,105,128,  9,233,227,233,242,227,236,101,129, 36,
+     98,194, 51,233,238,246,229,242,243,229,243,225,238,243,243,229,
+    242,233,102,128, 39,140,228,229,246, 97,128,  9,105,229,233,231,
+    232,244,232,115,128, 33, 92,231,117,  2,194, 94,194,103,234,225,
+    242,225,244,105,128, 10,233,242,237,245,235,232,105,128, 10,105,
+    232, 97,  2,194,119,194,130,227,235,225,242,225,226,233, 99,128,
+      6, 99,238,231,250,232,239,117,128, 48, 35,105,  2,194,145,194,
+    163,228,229,239,231,242,225,240,232,233,227,240,225,242,229,110,
+    128, 50, 34,238,230,229,242,233,239,114,128, 32,131,237,239,238,
+    239,243,240,225,227,101,128,255, 19,238,245,237,229,242,225,244,
+    239,242,226,229,238,231,225,236,105,128,  9,246,239,236,228,243,
+    244,249,236,101,128,247, 51,112,  2,194,221,194,228,225,242,229,
+    110,128, 36,118,229,114,  2,194,235,194,241,233,239,100,128, 36,
+    138,243,233,225,110,128,  6,243,241,245,225,242,244,229,242,115,
+    129,  0,190,195,  5,229,237,228,225,243,104,128,246,222,242,239,
+    237,225,110,128, 33,114,243,245,240,229,242,233,239,114,128,  0,
+    179,244,232,225,105,128, 14, 83,250,243,241,245,225,242,101,128,
+     51,148,105,  7,195, 66,195, 77,195,192,196, 34,196, 46,196, 95,
+    196,112,232,233,242,225,231,225,238, 97,128, 48, 97,107,  2,195,
+     83,195,107,225,244,225,235,225,238, 97,129, 48,193,195, 95,232,
+    225,236,230,247,233,228,244,104,128,255,129,229,245,116,  4,195,
+    119,195,154,195,169,195,178, 97,  2,195,125,195,140,227,233,242,
+    227,236,229,235,239,242,229,225,110,128, 50,112,240,225,242,229,
+    238,235,239,242,229,225,110,128, 50, 16,227,233,242,227,236,229,
+    235,239,242,229,225,110,128, 50, 98,235,239,242,229,225,110,128,
+     49, 55,240,225,242,229,238,235,239,242,229,225,110,128, 50,  2,
+    236,228,101,133,  2,220,195,208,195,219,195,236,195,248,196, 20,
+    226,229,236,239,247,227,237, 98,128,  3, 48, 99,  2,195,225,195,
+    230,237, 98,128,  3,  3,239,237, 98,128,  3,  3,228,239,245,226,
+    236,229,227,237, 98,128,  3, 96,111,  2,195,254,196,  8,240,229,
+    242,225,244,239,114,128, 34, 60,246,229,242,236,225,249,227,237,
+     98,128,  3, 52,246,229,242,244,233,227,225,236,227,237, 98,128,
+      3, 62,237,229,243,227,233,242,227,236,101,128, 34,151,112,  2,
+    196, 52,196, 82,229,232, 97,  2,196, 60,196, 69,232,229,226,242,
+    229,119,128,  5,150,236,229,230,244,232,229,226,242,229,119,128,
+      5,150,240,233,231,245,242,237,245,235,232,105,128, 10,112,244,
+    236,239,227,249,242,233,236,236,233,227,227,237, 98,128,  4,131,
+    247,238,225,242,237,229,238,233,225,110,128,  5,127,236,233,238,
+    229,226,229,236,239,119,128, 30,111,237,239,238,239,243,240,225,
+    227,101,128,255, 84,111,  7,196,165,196,176,196,187,196,212,197,
+     76,197, 88,197,172,225,242,237,229,238,233,225,110,128,  5,105,
+    232,233,242,225,231,225,238, 97,128, 48,104,235,225,244,225,235,
+    225,238, 97,129, 48,200,196,200,232,225,236,230,247,233,228,244,
+    104,128,255,132,110,  3,196,220,197, 62,197, 67,101,  4,196,230,
+    197, 43,197, 50,197, 56,226,225,114,  4,196,242,197, 15,197, 25,
+    197, 34,229,248,244,242, 97,  2,196,252,197,  6,232,233,231,232,
+    237,239,100,128,  2,229,236,239,247,237,239,100,128,  2,233,232,
+    233,231,232,237,239,100,128,  2,230,236,239,247,237,239,100,128,
+      2,232,237,233,228,237,239,100,128,  2,231,230,233,246,101,128,
+      1,189,243,233,120,128,  1,133,244,247,111,128,  1,168,239,115,
+    128,  3,132,243,241,245,225,242,101,128, 51, 39,240,225,244,225,
+    235,244,232,225,105,128, 14, 15,242,244,239,233,243,229,243,232,
+    229,236,236,226,242,225,227,235,229,116,  2,197,111,197,141,236,
+    229,230,116,130, 48, 20,197,122,197,130,243,237,225,236,108,128,
+    254, 93,246,229,242,244,233,227,225,108,128,254, 57,242,233,231,
+    232,116,130, 48, 21,197,153,197,161,243,237,225,236,108,128,254,
+     94,246,229,242,244,233,227,225,108,128,254, 58,244,225,239,244,
+    232,225,105,128, 14, 21,240, 97,  2,197,189,197,201,236,225,244,
+    225,236,232,239,239,107,128,  1,171,242,229,110,128, 36,175,114,
+      3,197,215,197,246,198,  5,225,228,229,237,225,242,107,129, 33,
+     34,197,227,115,  2,197,233,197,239,225,238,115,128,248,234,229,
+    242,233,102,128,246,219,229,244,242,239,230,236,229,248,232,239,
+    239,107,128,  2,136,233,225,103,  4,198, 17,198, 22,198, 27,198,
+     32,228,110,128, 37,188,236,102,128, 37,196,242,116,128, 37,186,
+    245,112,128, 37,178,115,132,  2,166,198, 49,198, 88,198,194,198,
+    207,225,228,105,130,  5,230,198, 59,198, 79,228,225,231,229,243,
+    104,129,251, 70,198, 70,232,229,226,242,229,119,128,251, 70,232,
+    229,226,242,229,119,128,  5,230,101,  2,198, 94,198,105,227,249,
+    242,233,236,236,233, 99,128,  4, 70,242,101,134,  5,181,198,122,
+    198,136,198,141,198,150,198,165,198,181, 49,  2,198,128,198,132,
+     50,128,  5,181,101,128,  5,181,178, 98,128,  5,181,232,229,226,
+    242,229,119,128,  5,181,238,225,242,242,239,247,232,229,226,242,
+    229,119,128,  5,181,241,245,225,242,244,229,242,232,229,226,242,
+    229,119,128,  5,181,247,233,228,229,232,229,226,242,229,119,128,
+      5,181,232,229,227,249,242,233,236,236,233, 99,128,  4, 91,245,
+    240,229,242,233,239,114,128,246,243,116,  4,198,227,199, 21,199,
+     86,199,137, 97,  3,198,235,198,245,198,252,226,229,238,231,225,
+    236,105,128,  9,159,228,229,246, 97,128,  9, 31,231,117,  2,199,
+      3,199, 12,234,225,242,225,244,105,128, 10,159,242,237,245,235,
+    232,105,128, 10, 31,229,104,  4,199, 32,199, 41,199, 55,199, 71,
+    225,242,225,226,233, 99,128,  6,121,230,233,238,225,236,225,242,
+    225,226,233, 99,128,251,103,233,238,233,244,233,225,236,225,242,
+    225,226,233, 99,128,251,104,237,229,228,233,225,236,225,242,225,
+    226,233, 99,128,251,105,232, 97,  3,199, 95,199,105,199,112,226,
+    229,238,231,225,236,105,128,  9,160,228,229,246, 97,128,  9, 32,
+    231,117,  2,199,119,199,128,234,225,242,225,244,105,128, 10,160,
+    242,237,245,235,232,105,128, 10, 32,245,242,238,229,100,128,  2,
+    135,117,  3,199,153,199,164,199,189,232,233,242,225,231,225,238,
+     97,128, 48,100,235,225,244,225,235,225,238, 97,129, 48,196,199,
+    177,232,225,236,230,247,233,228,244,104,128,255,130,243,237,225,
+    236,108,  2,199,199,199,210,232,233,242,225,231,225,238, 97,128,
+     48, 99,235,225,244,225,235,225,238, 97,129, 48,195,199,223,232,
+    225,236,230,247,233,228,244,104,128,255,111,119,  2,199,241,200,
+     90,101,  2,199,247,200, 39,236,246,101,  3,200,  1,200, 10,200,
+     31,227,233,242,227,236,101,128, 36,107,112,  2,200, 16,200, 23,
+    225,242,229,110,128, 36,127,229,242,233,239,100,128, 36,147,242,
+    239,237,225,110,128, 33,123,238,244,121,  3,200, 49,200, 58,200,
+     69,227,233,242,227,236,101,128, 36,115,232,225,238,231,250,232,
+    239,117,128, 83, 68,112,  2,200, 75,200, 82,225,242,229,110,128,
+     36,135,229,242,233,239,100,128, 36,155,111,142,  0, 50,200,122,
+    200,131,200,141,200,171,200,223,200,248,201, 19,201, 53,201, 65,
+    201, 84,201, 95,201,128,201,136,201,160,225,242,225,226,233, 99,
+    128,  6, 98,226,229,238,231,225,236,105,128,  9,232,227,233,242,
+    227,236,101,129, 36, 97,200,152,233,238,246,229,242,243,229,243,
+    225,238,243,243,229,242,233,102,128, 39,139,100,  2,200,177,200,
+    183,229,246, 97,128,  9,104,239,116,  2,200,190,200,201,229,238,
+    236,229,225,228,229,114,128, 32, 37,236,229,225,228,229,114,129,
+     32, 37,200,212,246,229,242,244,233,227,225,108,128,254, 48,231,
+    117,  2,200,230,200,239,234,225,242,225,244,105,128, 10,232,242,
+    237,245,235,232,105,128, 10,104,232, 97,  2,200,255,201, 10,227,
+    235,225,242,225,226,233, 99,128,  6, 98,238,231,250,232,239,117,
+    128, 48, 34,105,  2,201, 25,201, 43,228,229,239,231,242,225,240,
+    232,233,227,240,225,242,229,110,128, 50, 33,238,230,229,242,233,
+    239,114,128, 32,130,237,239,238,239,243,240,225,227,101,128,255,
+     18,238,245,237,229,242,225,244,239,242,226,229,238,231,225,236,
+    105,128,  9,245,239,236,228,243,244,249,236,101,128,247, 50,112,
+      2,201,101,201,108,225,242,229,110,128, 36,117,229,114,  2,201,
+    115,201,121,233,239,100,128, 36,137,243,233,225,110,128,  6,242,
+    242,239,237,225,110,128, 33,113,115,  2,201,142,201,150,244,242,
+    239,235,101,128,  1,187,245,240,229,242,233,239,114,128,  0,178,
+    244,104,  2,201,167,201,172,225,105,128, 14, 82,233,242,228,115,
+    128, 33, 84,117,145,  0,117,201,217,201,225,202, 10,202, 67,202,
+    205,202,242,203,109,203,125,203,176,203,246,204, 71,204, 80,204,
+    199,204,223,205, 75,205,103,205,217,225,227,245,244,101,128,  0,
+    250, 98,  4,201,235,201,240,201,249,202,  3,225,114,128,  2,137,
+    229,238,231,225,236,105,128,  9,137,239,240,239,237,239,230,111,
+    128, 49, 40,242,229,246,101,128,  1,109, 99,  3,202, 18,202, 25,
+    202, 57,225,242,239,110,128,  1,212,233,242, 99,  2,202, 33,202,
+     38,236,101,128, 36,228,245,237,230,236,229,120,129,  0,251,202,
+     49,226,229,236,239,119,128, 30,119,249,242,233,236,236,233, 99,
+    128,  4, 67,100,  5,202, 79,202, 90,202,113,202,119,202,195,225,
+    244,244,225,228,229,246, 97,128,  9, 81,226,108,  2,202, 97,202,
+    105,225,227,245,244,101,128,  1,113,231,242,225,246,101,128,  2,
+     21,229,246, 97,128,  9,  9,233,229,242,229,243,233,115,133,  0,
+    252,202,139,202,147,202,155,202,178,202,186,225,227,245,244,101,
+    128,  1,216,226,229,236,239,119,128, 30,115, 99,  2,202,161,202,
+    168,225,242,239,110,128,  1,218,249,242,233,236,236,233, 99,128,
+      4,241,231,242,225,246,101,128,  1,220,237,225,227,242,239,110,
+    128,  1,214,239,244,226,229,236,239,119,128, 30,229,103,  2,202,
+    211,202,218,242,225,246,101,128,  0,249,117,  2,202,224,202,233,
+    234,225,242,225,244,105,128, 10,137,242,237,245,235,232,105,128,
+     10,  9,104,  3,202,250,203,  4,203, 82,233,242,225,231,225,238,
+     97,128, 48, 70,111,  2,203, 10,203, 20,239,235,225,226,239,246,
+    101,128, 30,231,242,110,133,  1,176,203, 35,203, 43,203, 54,203,
+     62,203, 74,225,227,245,244,101,128, 30,233,228,239,244,226,229,
+    236,239,119,128, 30,241,231,242,225,246,101,128, 30,235,232,239,
+    239,235,225,226,239,246,101,128, 30,237,244,233,236,228,101,128,
+     30,239,245,238,231,225,242,245,237,236,225,245,116,129,  1,113,
+    203, 98,227,249,242,233,236,236,233, 99,128,  4,243,233,238,246,
+    229,242,244,229,228,226,242,229,246,101,128,  2, 23,107,  3,203,
+    133,203,157,203,168,225,244,225,235,225,238, 97,129, 48,166,203,
+    145,232,225,236,230,247,233,228,244,104,128,255,115,227,249,242,
+    233,236,236,233, 99,128,  4,121,239,242,229,225,110,128, 49, 92,
+    109,  2,203,182,203,235, 97,  2,203,188,203,221,227,242,239,110,
+    130,  1,107,203,199,203,210,227,249,242,233,236,236,233, 99,128,
+      4,239,228,233,229,242,229,243,233,115,128, 30,123,244,242,225,
+    231,245,242,237,245,235,232,105,128, 10, 65,239,238,239,243,240,
+    225,227,101,128,255, 85,110,  2,203,252,204, 51,228,229,242,243,
+    227,239,242,101,132,  0, 95,204, 15,204, 21,204, 33,204, 44,228,
+    226,108,128, 32, 23,237,239,238,239,243,240,225,227,101,128,255,
+     63,246,229,242,244,233,227,225,108,128,254, 51,247,225,246,121,
+    128,254, 79,105,  2,204, 57,204, 62,239,110,128, 34, 42,246,229,
+    242,243,225,108,128, 34,  0,239,231,239,238,229,107,128,  1,115,
+    112,  5,204, 92,204, 99,204,107,204,122,204,173,225,242,229,110,
+    128, 36,176,226,236,239,227,107,128, 37,128,240,229,242,228,239,
+    244,232,229,226,242,229,119,128,  5,196,243,233,236,239,110,131,
+      3,197,204,136,204,157,204,165,228,233,229,242,229,243,233,115,
+    129,  3,203,204,149,244,239,238,239,115,128,  3,176,236,225,244,
+    233,110,128,  2,138,244,239,238,239,115,128,  3,205,244,225,227,
+    107,  2,204,182,204,193,226,229,236,239,247,227,237, 98,128,  3,
+     29,237,239,100,128,  2,212,114,  2,204,205,204,217,225,231,245,
+    242,237,245,235,232,105,128, 10,115,233,238,103,128,  1,111,115,
+      3,204,231,204,246,205, 35,232,239,242,244,227,249,242,233,236,
+    236,233, 99,128,  4, 94,237,225,236,108,  2,204,255,205, 10,232,
+    233,242,225,231,225,238, 97,128, 48, 69,235,225,244,225,235,225,
+    238, 97,129, 48,165,205, 23,232,225,236,230,247,233,228,244,104,
+    128,255,105,244,242,225,233,231,232,116,  2,205, 47,205, 58,227,
+    249,242,233,236,236,233, 99,128,  4,175,243,244,242,239,235,229,
+    227,249,242,233,236,236,233, 99,128,  4,177,244,233,236,228,101,
+    130,  1,105,205, 87,205, 95,225,227,245,244,101,128, 30,121,226,
+    229,236,239,119,128, 30,117,117,  5,205,115,205,125,205,132,205,
+    157,205,173,226,229,238,231,225,236,105,128,  9,138,228,229,246,
+     97,128,  9, 10,231,117,  2,205,139,205,148,234,225,242,225,244,
+    105,128, 10,138,242,237,245,235,232,105,128, 10, 10,237,225,244,
+    242,225,231,245,242,237,245,235,232,105,128, 10, 66,246,239,247,
+    229,236,243,233,231,110,  3,205,189,205,199,205,206,226,229,238,
+    231,225,236,105,128,  9,194,228,229,246, 97,128,  9, 66,231,245,
+    234,225,242,225,244,105,128, 10,194,246,239,247,229,236,243,233,
+    231,110,  3,205,233,205,243,205,250,226,229,238,231,225,236,105,
+    128,  9,193,228,229,246, 97,128,  9, 65,231,245,234,225,242,225,
+    244,105,128, 10,193,118,139,  0,118,206, 31,206,179,206,188,206,
+    199,207,128,207,135,207,233,207,245,208, 89,208, 97,208,118, 97,
+      4,206, 41,206, 48,206, 73,206, 84,228,229,246, 97,128,  9, 53,
+    231,117,  2,206, 55,206, 64,234,225,242,225,244,105,128, 10,181,
+    242,237,245,235,232,105,128, 10, 53,235,225,244,225,235,225,238,
+     97,128, 48,247,118,132,  5,213,206, 96,206,123,206,155,206,167,
+    228,225,231,229,243,104,130,251, 53,206,109,206,114,182, 53,128,
+    251, 53,232,229,226,242,229,119,128,251, 53,104,  2,206,129,206,
+    137,229,226,242,229,119,128,  5,213,239,236,225,109,129,251, 75,
+    206,146,232,229,226,242,229,119,128,251, 75,246,225,246,232,229,
+    226,242,229,119,128,  5,240,249,239,228,232,229,226,242,229,119,
+    128,  5,241,227,233,242,227,236,101,128, 36,229,228,239,244,226,
+    229,236,239,119,128, 30,127,101,  6,206,213,206,224,207, 32,207,
+     43,207, 49,207,116,227,249,242,233,236,236,233, 99,128,  4, 50,
+    104,  4,206,234,206,243,207,  1,207, 17,225,242,225,226,233, 99,
+    128,  6,164,230,233,238,225,236,225,242,225,226,233, 99,128,251,
+    107,233,238,233,244,233,225,236,225,242,225,226,233, 99,128,251,
+    108,237,229,228,233,225,236,225,242,225,226,233, 99,128,251,109,
+    235,225,244,225,235,225,238, 97,128, 48,249,238,245,115,128, 38,
+     64,242,244,233,227,225,108,  2,207, 60,207, 66,226,225,114,128,
+      0,124,236,233,238,101,  4,207, 79,207, 90,207,101,207,110,225,
+    226,239,246,229,227,237, 98,128,  3, 13,226,229,236,239,247,227,
+    237, 98,128,  3, 41,236,239,247,237,239,100,128,  2,204,237,239,
+    100,128,  2,200,247,225,242,237,229,238,233,225,110,128,  5,126,
+    232,239,239,107,128,  2,139,105,  3,207,143,207,154,207,193,235,
+    225,244,225,235,225,238, 97,128, 48,248,242,225,237, 97,  3,207,
+    165,207,175,207,182,226,229,238,231,225,236,105,128,  9,205,228,
+    229,246, 97,128,  9, 77,231,245,234,225,242,225,244,105,128, 10,
+    205,243,225,242,231, 97,  3,207,205,207,215,207,222,226,229,238,
+    231,225,236,105,128,  9,131,228,229,246, 97,128,  9,  3,231,245,
+    234,225,242,225,244,105,128, 10,131,237,239,238,239,243,240,225,
+    227,101,128,255, 86,111,  3,207,253,208,  8,208, 78,225,242,237,
+    229,238,233,225,110,128,  5,120,233,227,229,100,  2,208, 17,208,
+     53,233,244,229,242,225,244,233,239,110,  2,208, 31,208, 42,232,
+    233,242,225,231,225,238, 97,128, 48,158,235,225,244,225,235,225,
+    238, 97,128, 48,254,237,225,242,235,235,225,238, 97,129, 48,155,
+    208, 66,232,225,236,230,247,233,228,244,104,128,255,158,235,225,
+    244,225,235,225,238, 97,128, 48,250,240,225,242,229,110,128, 36,
+    177,116,  2,208,103,208,110,233,236,228,101,128, 30,125,245,242,
+    238,229,100,128,  2,140,117,  2,208,124,208,135,232,233,242,225,
+    231,225,238, 97,128, 48,148,235,225,244,225,235,225,238, 97,128,
+     48,244,119,143,  0,119,208,180,209,157,209,167,209,190,209,230,
+    210, 41,210, 49,212, 20,212, 61,212, 73,212,148,212,156,212,163,
+    212,174,212,183, 97,  8,208,198,208,205,208,215,208,226,209,  8,
+    209, 40,209, 52,209, 88,227,245,244,101,128, 30,131,229,235,239,
+    242,229,225,110,128, 49, 89,232,233,242,225,231,225,238, 97,128,
+     48,143,107,  2,208,232,209,  0,225,244,225,235,225,238, 97,129,
+     48,239,208,244,232,225,236,230,247,233,228,244,104,128,255,156,
+    239,242,229,225,110,128, 49, 88,243,237,225,236,108,  2,209, 18,
+    209, 29,232,233,242,225,231,225,238, 97,128, 48,142,235,225,244,
+    225,235,225,238, 97,128, 48,238,244,244,239,243,241,245,225,242,
+    101,128, 51, 87,118,  2,209, 58,209, 66,229,228,225,243,104,128,
+     48, 28,249,245,238,228,229,242,243,227,239,242,229,246,229,242,
+    244,233,227,225,108,128,254, 52,119,  3,209, 96,209,105,209,119,
+    225,242,225,226,233, 99,128,  6, 72,230,233,238,225,236,225,242,
+    225,226,233, 99,128,254,238,232,225,237,250,225,225,226,239,246,
+    101,  2,209,134,209,143,225,242,225,226,233, 99,128,  6, 36,230,
+    233,238,225,236,225,242,225,226,233, 99,128,254,134,226,243,241,
+    245,225,242,101,128, 51,221,227,233,242, 99,  2,209,176,209,181,
+    236,101,128, 36,230,245,237,230,236,229,120,128,  1,117,100,  2,
+    209,196,209,206,233,229,242,229,243,233,115,128, 30,133,239,116,
+      2,209,213,209,222,225,227,227,229,238,116,128, 30,135,226,229,
+    236,239,119,128, 30,137,101,  4,209,240,209,251,210,  7,210, 31,
+    232,233,242,225,231,225,238, 97,128, 48,145,233,229,242,243,244,
+    242,225,243,115,128, 33, 24,107,  2,210, 13,210, 23,225,244,225,
+    235,225,238, 97,128, 48,241,239,242,229,225,110,128, 49, 94,239,
+    235,239,242,229,225,110,128, 49, 93,231,242,225,246,101,128, 30,
+    129,232,233,244,101,  8,210, 70,210, 79,210,163,210,253,211, 81,
+    211,126,211,178,211,234,226,245,236,236,229,116,128, 37,230, 99,
+      2,210, 85,210,105,233,242,227,236,101,129, 37,203,210, 95,233,
+    238,246,229,242,243,101,128, 37,217,239,242,238,229,242,226,242,
+    225,227,235,229,116,  2,210,122,210,142,236,229,230,116,129, 48,
+     14,210,131,246,229,242,244,233,227,225,108,128,254, 67,242,233,
+    231,232,116,129, 48, 15,210,152,246,229,242,244,233,227,225,108,
+    128,254, 68,100,  2,210,169,210,210,233,225,237,239,238,100,129,
+     37,199,210,180,227,239,238,244,225,233,238,233,238,231,226,236,
+    225,227,235,243,237,225,236,236,228,233,225,237,239,238,100,128,
+     37,200,239,247,238,240,239,233,238,244,233,238,103,  2,210,226,
+    210,242,243,237,225,236,236,244,242,233,225,238,231,236,101,128,
+     37,191,244,242,233,225,238,231,236,101,128, 37,189,236,101,  2,
+    211,  4,211, 46,230,244,240,239,233,238,244,233,238,103,  2,211,
+     19,211, 35,243,237,225,236,236,244,242,233,225,238,231,236,101,
+    128, 37,195,244,242,233,225,238,231,236,101,128, 37,193,238,244,
+    233,227,245,236,225,242,226,242,225,227,235,229,116,  2,211, 66,
+    211, 73,236,229,230,116,128, 48, 22,242,233,231,232,116,128, 48,
+     23,242,233,231,232,244,240,239,233,238,244,233,238,103,  2,211,
+     99,211,115,243,237,225,236,236,244,242,233,225,238,231,236,101,
+    128, 37,185,244,242,233,225,238,231,236,101,128, 37,183,115,  3,
+    211,134,211,164,211,172,109,  2,211,140,211,152,225,236,236,243,
+    241,245,225,242,101,128, 37,171,233,236,233,238,231,230,225,227,
+    101,128, 38, 58,241,245,225,242,101,128, 37,161,244,225,114,128,
+     38,  6,116,  2,211,184,211,195,229,236,229,240,232,239,238,101,
+    128, 38, 15,239,242,244,239,233,243,229,243,232,229,236,236,226,
+    242,225,227,235,229,116,  2,211,219,211,226,236,229,230,116,128,
+     48, 24,242,233,231,232,116,128, 48, 25,245,240,240,239,233,238,
+    244,233,238,103,  2,211,249,212,  9,243,237,225,236,236,244,242,
+    233,225,238,231,236,101,128, 37,181,244,242,233,225,238,231,236,
+    101,128, 37,179,105,  2,212, 26,212, 37,232,233,242,225,231,225,
+    238, 97,128, 48,144,107,  2,212, 43,212, 53,225,244,225,235,225,
+    238, 97,128, 48,240,239,242,229,225,110,128, 49, 95,237,239,238,
+    239,243,240,225,227,101,128,255, 87,111,  4,212, 83,212, 94,212,
+    119,212,137,232,233,242,225,231,225,238, 97,128, 48,146,235,225,
+    244,225,235,225,238, 97,129, 48,242,212,107,232,225,236,230,247,
+    233,228,244,104,128,255,102,110,129, 32,169,212,125,237,239,238,
+    239,243,240,225,227,101,128,255,230,247,225,229,238,244,232,225,
+    105,128, 14, 39,240,225,242,229,110,128, 36,178,242,233,238,103,
+    128, 30,152,243,245,240,229,242,233,239,114,128,  2,183,244,245,
+    242,238,229,100,128,  2,141,249,238,110,128,  1,191,120,137,  0,
+    120,212,211,212,222,212,233,212,242,213, 13,213, 26,213, 30,213,
+     42,213, 50,225,226,239,246,229,227,237, 98,128,  3, 61,226,239,
+    240,239,237,239,230,111,128, 49, 18,227,233,242,227,236,101,128,
+     36,231,100,  2,212,248,213,  2,233,229,242,229,243,233,115,128,
+     30,141,239,244,225,227,227,229,238,116,128, 30,139,229,232,225,
+    242,237,229,238,233,225,110,128,  5,109,105,128,  3,190,237,239,
+    238,239,243,240,225,227,101,128,255, 88,240,225,242,229,110,128,
+     36,179,243,245,240,229,242,233,239,114,128,  2,227,121,143,  0,
+    121,213, 95,214, 54,214, 77,214,117,216, 83,216, 91,216,108,216,
+    172,216,184,217,181,217,221,217,233,217,244,218,  9,218,238, 97,
+     11,213,119,213,131,213,141,213,148,213,155,213,165,213,190,213,
+    201,213,239,213,252,214, 42,225,228,239,243,241,245,225,242,101,
+    128, 51, 78,226,229,238,231,225,236,105,128,  9,175,227,245,244,
+    101,128,  0,253,228,229,246, 97,128,  9, 47,229,235,239,242,229,
+    225,110,128, 49, 82,231,117,  2,213,172,213,181,234,225,242,225,
+    244,105,128, 10,175,242,237,245,235,232,105,128, 10, 47,232,233,
+    242,225,231,225,238, 97,128, 48,132,107,  2,213,207,213,231,225,
+    244,225,235,225,238, 97,129, 48,228,213,219,232,225,236,230,247,
+    233,228,244,104,128,255,148,239,242,229,225,110,128, 49, 81,237,
+    225,235,235,225,238,244,232,225,105,128, 14, 78,243,237,225,236,
+    108,  2,214,  6,214, 17,232,233,242,225,231,225,238, 97,128, 48,
+    131,235,225,244,225,235,225,238, 97,129, 48,227,214, 30,232,225,
+    236,230,247,233,228,244,104,128,255,108,244,227,249,242,233,236,
+    236,233, 99,128,  4, 99,227,233,242, 99,  2,214, 63,214, 68,236,
+    101,128, 36,232,245,237,230,236,229,120,128,  1,119,100,  2,214,
+     83,214, 93,233,229,242,229,243,233,115,128,  0,255,239,116,  2,
+    214,100,214,109,225,227,227,229,238,116,128, 30,143,226,229,236,
+    239,119,128, 30,245,101,  7,214,133,215,141,215,150,215,168,215,
+    200,216, 20,216, 71,104,  8,214,151,214,160,214,194,214,208,215,
+     25,215, 41,215,100,215,118,225,242,225,226,233, 99,128,  6, 74,
+    226,225,242,242,229,101,  2,214,171,214,180,225,242,225,226,233,
+     99,128,  6,210,230,233,238,225,236,225,242,225,226,233, 99,128,
+    251,175,230,233,238,225,236,225,242,225,226,233, 99,128,254,242,
+    232,225,237,250,225,225,226,239,246,101,  4,214,227,214,236,214,
+    250,215, 10,225,242,225,226,233, 99,128,  6, 38,230,233,238,225,
+    236,225,242,225,226,233, 99,128,254,138,233,238,233,244,233,225,
+    236,225,242,225,226,233, 99,128,254,139,237,229,228,233,225,236,
+    225,242,225,226,233, 99,128,254,140,233,238,233,244,233,225,236,
+    225,242,225,226,233, 99,128,254,243,237,101,  2,215, 48,215, 61,
+    228,233,225,236,225,242,225,226,233, 99,128,254,244,229,237,105,
+      2,215, 69,215, 84,238,233,244,233,225,236,225,242,225,226,233,
+     99,128,252,221,243,239,236,225,244,229,228,225,242,225,226,233,
+     99,128,252, 88,238,239,239,238,230,233,238,225,236,225,242,225,
+    226,233, 99,128,252,148,244,232,242,229,229,228,239,244,243,226,
+    229,236,239,247,225,242,225,226,233, 99,128,  6,209,235,239,242,
+    229,225,110,128, 49, 86,110,129,  0,165,215,156,237,239,238,239,
+    243,240,225,227,101,128,255,229,111,  2,215,174,215,183,235,239,
+    242,229,225,110,128, 49, 85,242,233,238,232,233,229,245,232,235,
+    239,242,229,225,110,128, 49,134,114,  3,215,208,215,244,216,  0,
+    225,232,226,229,238,249,239,237,111,  2,215,222,215,231,232,229,
+    226,242,229,119,128,  5,170,236,229,230,244,232,229,226,242,229,
+    119,128,  5,170,233,227,249,242,233,236,236,233, 99,128,  4, 75,
+    245,228,233,229,242,229,243,233,243,227,249,242,233,236,236,233,
+     99,128,  4,249,243,233,229,245,238,103,  3,216, 33,216, 42,216,
+     58,235,239,242,229,225,110,128, 49,129,240,225,238,243,233,239,
+    243,235,239,242,229,225,110,128, 49,131,243,233,239,243,235,239,
+    242,229,225,110,128, 49,130,244,233,246,232,229,226,242,229,119,
+    128,  5,154,231,242,225,246,101,128, 30,243,232,239,239,107,129,
+      1,180,216,100,225,226,239,246,101,128, 30,247,105,  5,216,120,
+    216,131,216,142,216,151,216,159,225,242,237,229,238,233,225,110,
+    128,  5,117,227,249,242,233,236,236,233, 99,128,  4, 87,235,239,
+    242,229,225,110,128, 49, 98,238,249,225,238,103,128, 38, 47,247,
+    238,225,242,237,229,238,233,225,110,128,  5,130,237,239,238,239,
+    243,240,225,227,101,128,255, 89,111,  7,216,200,217, 14,217, 25,
+    217, 35,217, 73,217,119,217,128,100,131,  5,217,216,210,216,230,
+    216,239,228,225,231,229,243,104,129,251, 57,216,221,232,229,226,
+    242,229,119,128,251, 57,232,229,226,242,229,119,128,  5,217,249,
+    239,100,  2,216,247,217,  0,232,229,226,242,229,119,128,  5,242,
+    240,225,244,225,232,232,229,226,242,229,119,128,251, 31,232,233,
+    242,225,231,225,238, 97,128, 48,136,233,235,239,242,229,225,110,
+    128, 49,137,107,  2,217, 41,217, 65,225,244,225,235,225,238, 97,
+    129, 48,232,217, 53,232,225,236,230,247,233,228,244,104,128,255,
+    150,239,242,229,225,110,128, 49, 91,243,237,225,236,108,  2,217,
+     83,217, 94,232,233,242,225,231,225,238, 97,128, 48,135,235,225,
+    244,225,235,225,238, 97,129, 48,231,217,107,232,225,236,230,247,
+    233,228,244,104,128,255,110,244,231,242,229,229,107,128,  3,243,
+    121,  2,217,134,217,171, 97,  2,217,140,217,150,229,235,239,242,
+    229,225,110,128, 49,136,107,  2,217,156,217,164,239,242,229,225,
+    110,128, 49,135,244,232,225,105,128, 14, 34,233,238,231,244,232,
+    225,105,128, 14, 13,112,  2,217,187,217,194,225,242,229,110,128,
+     36,180,239,231,229,231,242,225,237,237,229,238,105,129,  3,122,
+    217,210,231,242,229,229,235,227,237, 98,128,  3, 69,114,129,  1,
+    166,217,227,233,238,103,128, 30,153,243,245,240,229,242,233,239,
+    114,128,  2,184,116,  2,217,250,218,  1,233,236,228,101,128, 30,
+    249,245,242,238,229,100,128,  2,142,117,  5,218, 21,218, 32,218,
+     42,218, 80,218,212,232,233,242,225,231,225,238, 97,128, 48,134,
+    233,235,239,242,229,225,110,128, 49,140,107,  2,218, 48,218, 72,
+    225,244,225,235,225,238, 97,129, 48,230,218, 60,232,225,236,230,
+    247,233,228,244,104,128,255,149,239,242,229,225,110,128, 49, 96,
+    115,  3,218, 88,218,126,218,167,226,233,103,  2,218, 96,218,107,
+    227,249,242,233,236,236,233, 99,128,  4,107,233,239,244,233,230,
+    233,229,228,227,249,242,233,236,236,233, 99,128,  4,109,236,233,
+    244,244,236,101,  2,218,137,218,148,227,249,242,233,236,236,233,
+     99,128,  4,103,233,239,244,233,230,233,229,228,227,249,242,233,
+    236,236,233, 99,128,  4,105,237,225,236,108,  2,218,176,218,187,
+    232,233,242,225,231,225,238, 97,128, 48,133,235,225,244,225,235,
+    225,238, 97,129, 48,229,218,200,232,225,236,230,247,233,228,244,
+    104,128,255,109,249,101,  2,218,219,218,228,235,239,242,229,225,
+    110,128, 49,139,239,235,239,242,229,225,110,128, 49,138,249, 97,
+      2,218,245,218,255,226,229,238,231,225,236,105,128,  9,223,228,
+    229,246, 97,128,  9, 95,122,142,  0,122,219, 38,220, 46,220, 57,
+    220,100,220,127,221,162,222, 14,222, 56,222, 68,222, 80,222,108,
+    222,116,222,132,222,141, 97, 10,219, 60,219, 71,219, 78,219, 85,
+    219, 96,219,174,219,204,219,215,219,251,220,  7,225,242,237,229,
+    238,233,225,110,128,  5,102,227,245,244,101,128,  1,122,228,229,
+    246, 97,128,  9, 91,231,245,242,237,245,235,232,105,128, 10, 91,
+    104,  4,219,106,219,115,219,129,219,159,225,242,225,226,233, 99,
+    128,  6, 56,230,233,238,225,236,225,242,225,226,233, 99,128,254,
+    198,105,  2,219,135,219,150,238,233,244,233,225,236,225,242,225,
+    226,233, 99,128,254,199,242,225,231,225,238, 97,128, 48, 86,237,
+    229,228,233,225,236,225,242,225,226,233, 99,128,254,200,233,110,
+      2,219,181,219,190,225,242,225,226,233, 99,128,  6, 50,230,233,
+    238,225,236,225,242,225,226,233, 99,128,254,176,235,225,244,225,
+    235,225,238, 97,128, 48,182,241,229,102,  2,219,223,219,237,231,
+    225,228,239,236,232,229,226,242,229,119,128,  5,149,241,225,244,
+    225,238,232,229,226,242,229,119,128,  5,148,242,241,225,232,229,
+    226,242,229,119,128,  5,152,249,233,110,130,  5,214,220, 17,220,
+     37,228,225,231,229,243,104,129,251, 54,220, 28,232,229,226,242,
+    229,119,128,251, 54,232,229,226,242,229,119,128,  5,214,226,239,
+    240,239,237,239,230,111,128, 49, 23, 99,  3,220, 65,220, 72,220,
+     94,225,242,239,110,128,  1,126,233,242, 99,  2,220, 80,220, 85,
+    236,101,128, 36,233,245,237,230,236,229,120,128, 30,145,245,242,
+    108,128,  2,145,228,239,116,130,  1,124,220,110,220,119,225,227,
+    227,229,238,116,128,  1,124,226,229,236,239,119,128, 30,147,101,
+      6,220,141,220,152,220,195,220,206,220,217,221,157,227,249,242,
+    233,236,236,233, 99,128,  4, 55,100,  2,220,158,220,177,229,243,
+    227,229,238,228,229,242,227,249,242,233,236,236,233, 99,128,  4,
+    153,233,229,242,229,243,233,243,227,249,242,233,236,236,233, 99,
+    128,  4,223,232,233,242,225,231,225,238, 97,128, 48, 92,235,225,
+    244,225,235,225,238, 97,128, 48,188,242,111,140,  0, 48,220,246,
+    220,255,221,  9,221, 16,221, 41,221, 54,221, 65,221, 77,221, 88,
+    221, 98,221,109,221,116,225,242,225,226,233, 99,128,  6, 96,226,
+    229,238,231,225,236,105,128,  9,230,228,229,246, 97,128,  9,102,
+    231,117,  2,221, 23,221, 32,234,225,242,225,244,105,128, 10,230,
+    242,237,245,235,232,105,128, 10,102,232,225,227,235,225,242,225,
+    226,233, 99,128,  6, 96,233,238,230,229,242,233,239,114,128, 32,
+    128,237,239,238,239,243,240,225,227,101,128,255, 16,239,236,228,
+    243,244,249,236,101,128,247, 48,240,229,242,243,233,225,110,128,
+      6,240,243,245,240,229,242,233,239,114,128, 32,112,244,232,225,
+    105,128, 14, 80,247,233,228,244,104,  3,221,128,221,137,221,149,
+    234,239,233,238,229,114,128,254,255,238,239,238,234,239,233,238,
+    229,114,128, 32, 12,243,240,225,227,101,128, 32, 11,244, 97,128,
+      3,182,104,  2,221,168,221,179,226,239,240,239,237,239,230,111,
+    128, 49, 19,101,  4,221,189,221,200,221,216,221,227,225,242,237,
+    229,238,233,225,110,128,  5,106,226,242,229,246,229,227,249,242,
+    233,236,236,233, 99,128,  4,194,227,249,242,233,236,236,233, 99,
+    128,  4, 54,100,  2,221,233,221,252,229,243,227,229,238,228,229,
+    242,227,249,242,233,236,236,233, 99,128,  4,151,233,229,242,229,
+    243,233,243,227,249,242,233,236,236,233, 99,128,  4,221,105,  3,
+    222, 22,222, 33,222, 44,232,233,242,225,231,225,238, 97,128, 48,
+     88,235,225,244,225,235,225,238, 97,128, 48,184,238,239,242,232,
+    229,226,242,229,119,128,  5,174,236,233,238,229,226,229,236,239,
+    119,128, 30,149,237,239,238,239,243,240,225,227,101,128,255, 90,
+    111,  2,222, 86,222, 97,232,233,242,225,231,225,238, 97,128, 48,
+     94,235,225,244,225,235,225,238, 97,128, 48,190,240,225,242,229,
+    110,128, 36,181,242,229,244,242,239,230,236,229,248,232,239,239,
+    107,128,  2,144,243,244,242,239,235,101,128,  1,182,117,  2,222,
+    147,222,158,232,233,242,225,231,225,238, 97,128, 48, 90,235,225,
+    244,225,235,225,238, 97,128, 48,186
+  }
+#endif /* DEFINE_PS_TABLES_DATA */
+  ;
+
+
+  /*
+   * AGL entries mapping to more than one character have a trie value
+   * of 0xD800 plus an offset into this table, which holds the sequence
+   * length followed by the code points.
+   */
+
+#ifndef  DEFINE_PS_TABLES_DATA
+#ifdef  __cplusplus
+  extern "C"
+#else
+  extern
+#endif
+#endif
+  const unsigned short  ft_adobe_glyph_sequences[146]
+#ifdef  DEFINE_PS_TABLES_DATA
+  =
+  {
+        2, 1491, 1458,    2, 1491, 1457,    2, 1491, 1460,    2, 1491, 1465,
+        2, 1491, 1463,    2, 1491, 1464,    2, 1491, 1467,    2, 1491, 1462,
+        2, 1491, 1456,    2, 1491, 1461,    2, 1498, 1464,    2, 1498, 1456,
+        2, 1569, 1615,    2, 1569, 1612,    2, 1569, 1614,    2, 1569, 1611,
+        2, 1569, 1616,    2, 1569, 1613,    2, 1569, 1618,    2, 1500, 1465,
+        3, 1500, 1465, 1468,    3,65247,65252,65184,    3,65247,65252,65192,
+        2,65255,65260,    2, 1511, 1458,    2, 1511, 1457,    2, 1511, 1460,
+        2, 1511, 1465,    2, 1511, 1463,    2, 1511, 1464,    2, 1511, 1467,
+        2, 1511, 1462,    2, 1511, 1456,    2, 1511, 1461,    4, 1585,65267,
+    65166, 1604,    2, 1512, 1458,    2, 1512, 1457,    2, 1512, 1460,    2,
+     1512, 1465,    2, 1512, 1463,    2, 1512, 1464,    2, 1512, 1467,    2,
+     1512, 1462,    2, 1512, 1456,    2, 1512, 1461,    2, 1617, 1611,    2,
+    64380,65252
+  }
+#endif /* DEFINE_PS_TABLES_DATA */
+  ;
+
+
+#define FT_NUM_STANDARD_UNICODES  405
+
+  /*
+   * Unicode values of standard glyph names, in increasing order.
+   */
+
+#ifndef  DEFINE_PS_TABLES_DATA
+#ifdef  __cplusplus
+  extern "C"
+#else
+  extern
+#endif
+#endif
+  const unsigned short  ft_standard_unicodes[FT_NUM_STANDARD_UNICODES]
+#ifdef  DEFINE_PS_TABLES_DATA
+  =
+  {
+       32,   33,   34,   35,   36,   37,   38,   39,   40,   41,   42,   43,
+       44,   45,   46,   47,   48,   49,   50,   51,   52,   53,   54,   55,
+       56,   57,   58,   59,   60,   61,   62,   63,   64,   65,   66,   67,
+       68,   69,   70,   71,   72,   73,   74,   75,   76,   77,   78,   79,
+       80,   81,   82,   83,   84,   85,   86,   87,   88,   89,   90,   91,
+       92,   93,   94,   95,   96,   97,   98,   99,  100,  101,  102,  103,
+      104,  105,  106,  107,  108,  109,  110,  111,  112,  113,  114,  115,
+      116,  117,  118,  119,  120,  121,  122,  123,  124,  125,  126,  160,
+      161,  162,  163,  164,  165,  166,  167,  168,  169,  170,  171,  172,
+      174,  175,  176,  177,  178,  179,  180,  181,  182,  183,  184,  185,
+      186,  187,  188,  189,  190,  191,  192,  193,  194,  195,  196,  197,
+      198,  199,  200,  201,  202,  203,  204,  205,  206,  207,  208,  209,
+      210,  211,  212,  213,  214,  215,  216,  217,  218,  219,  220,  221,
+      222,  223,  224,  225,  226,  227,  228,  229,  230,  231,  232,  233,
+      234,  235,  236,  237,  238,  239,  240,  241,  242,  243,  244,  245,
+      246,  247,  248,  249,  250,  251,  252,  253,  254,  255,  262,  263,
+      268,  269,  273,  286,  287,  304,  305,  321,  322,  338,  339,  350,
+      351,  352,  353,  376,  381,  382,  402,  710,  711,  728,  729,  730,
+      731,  732,  733,  960, 8210, 8211, 8212, 8216, 8217, 8218, 8220, 8221,
+     8222, 8224, 8225, 8226, 8228, 8229, 8230, 8240, 8249, 8250, 8260, 8304,
+     8308, 8309, 8310, 8311, 8312, 8313, 8317, 8318, 8319, 8320, 8321, 8322,
+     8323, 8324, 8325, 8326, 8327, 8328, 8329, 8333, 8334, 8353, 8355, 8482,
+     8486, 8531, 8532, 8539, 8540, 8541, 8542, 8706, 8710, 8719, 8721, 8722,
+     8730, 8734, 8747, 8776, 8800, 8804, 8805, 9674,63196,63197,63198,63199,
+    63200,63201,63202,63203,63204,63205,63206,63207,63208,63209,63210,63211,
+    63212,63213,63214,63215,63216,63217,63218,63219,63220,63221,63222,63223,
+    63224,63225,63226,63227,63228,63229,63230,63231,63265,63268,63270,63280,
+    63281,63282,63283,63284,63285,63286,63287,63288,63289,63295,63328,63329,
+    63330,63331,63332,63333,63334,63335,63336,63337,63338,63339,63340,63341,
+    63342,63343,63344,63345,63346,63347,63348,63349,63350,63351,63352,63353,
+    63354,63393,63394,63400,63407,63412,63416,63423,63456,63457,63458,63459,
+    63460,63461,63462,63463,63464,63465,63466,63467,63468,63469,63470,63471,
+    63472,63473,63474,63475,63476,63477,63478,63480,63481,63482,63483,63484,
+    63485,63486,63487,63743,64256,64257,64258,64259,64260
+  }
+#endif /* DEFINE_PS_TABLES_DATA */
+  ;
+
+
+  /*
+   * Offsets into the `ft_standard_glyph_names' table,
+   * one for each entry in `ft_standard_unicodes'.
+   */
+
+#ifndef  DEFINE_PS_TABLES_DATA
+#ifdef  __cplusplus
+  extern "C"
+#else
+  extern
+#endif
+#endif
+  const short  ft_standard_unicode_names[FT_NUM_STANDARD_UNICODES]
+#ifdef  DEFINE_PS_TABLES_DATA
+  =
+  {
+      149,  261,  268,  277,  288,  295,  303,  677,  324,  334,  345,  354,
+      359,  365,  372,  935,  379,  384,  388,  392,  398,  403,  408,  412,
+      418,  929,  428,  424,  434,   58,  439,  447,  250,  456,  458,  460,
+      462,  920,  464,  466,  468,  470,  472,  474,  476,  478,  480,  482,
+      484,  486,  488,  490,  492,  494,  496,  498,  500,  502,  504,  506,
+      518,  528,  541,  553, 1213,  110,  574,  173,  782,  965,  259,  638,
+     2377, 2088,  576, 3395,  118,  266, 3432,  382,  578,  580, 1094, 2662,
+      251, 1028,  582,  584, 1200,  675,  586,  588, 1092,  598,  609,  138,
+      620,  195,  631,  668,  649, 1086,  660, 1203, 1173,  922,  702, 1016,
+     1135,  892, 1096, 1052, 1123, 1159, 1184, 1027,  784,  769, 1233, 1004,
+      951,  843, 1068, 1044, 1109,  879, 1212, 1183, 1190, 1225, 1202, 1219,
+      919, 1232, 1270, 1241, 1248, 1260, 1306, 1277, 1284, 1296, 1040, 1313,
+     1349, 1320, 1327, 1356, 1339, 1150,  941, 1399, 1370, 1377, 1389, 1406,
+     1062,  993, 1459, 1430, 1437, 1472, 1449, 1466,  964, 1479, 1517, 1488,
+     1495, 1507, 1553, 1524, 1531, 1543, 1146, 1560, 1596, 1567, 1574, 1603,
+     1586, 1079,  983, 1646, 1617, 1624, 1636, 1653, 1103, 1660,  218,  225,
+      232,  239,  246,  175,  182,  189,  967,  934,  976,  948,  990,  200,
+      209, 1363, 1610, 1413, 1423, 1670,  653, 1191,  233,  176,  190, 1220,
+      912, 1226,  899,   94, 2518,  745, 1987,  564,  313,  801,  689,  829,
+      816,  752,  759,  794, 1815, 1800,  858,  867,  716,  730,  640, 2664,
+     2677, 2690, 2703, 2715, 2729, 2743, 1763, 1781, 2152, 2756, 2769, 2781,
+     2793, 2807, 2820, 2833, 2845, 2859, 2873, 2094, 2112, 2348,  169, 1030,
+      106, 2645, 2654, 2597, 2607, 2620, 2632,   64,  132,   86,   76, 1056,
+      112,   32,   97,  120,   23,   41,   51,  155, 2362, 2372, 1974, 2886,
+     2033, 2929, 1960, 2899, 1722, 2529, 2147, 2914, 1994, 1964, 2023, 1999,
+     1163, 2046, 2056, 2066, 2667, 1727, 2076, 1771, 2469, 2480, 2131, 2491,
+     1689, 2419, 3245, 2544, 2556, 2431, 2379, 2443, 1677, 1707, 1737, 1830,
+     1843, 1855, 1867, 1881, 1894, 1907, 1919, 1933, 1947, 2009, 2162, 2173,
+     2180, 2187, 2194, 3023, 2201, 2208, 2215, 2222, 2229, 2236, 2243, 2250,
+     2257, 2264, 2271, 2278, 2285, 2292, 2299, 2306, 2313, 2320, 2327, 2334,
+     2341, 2390, 2406, 2455, 2506, 1752, 2566, 2579, 2943, 2955, 2967, 2984,
+     2996, 3011, 3022, 3030, 3044, 3056, 3068, 3085, 3100, 3112, 3124, 3141,
+     3156, 3165, 3177, 3189, 3201, 3218, 3230, 3253, 3265, 3277, 3289, 3306,
+     3321, 3333, 3344,  163,   73, 2087, 2091, 2086, 2090
+  }
+#endif /* DEFINE_PS_TABLES_DATA */
+  ;
+
+
+  /*
+   * Indices into `ft_standard_unicode_names', sorted by the
+   * name offsets.
+   */
+
+#ifndef  DEFINE_PS_TABLES_DATA
+#ifdef  __cplusplus
+  extern "C"
+#else
+  extern
+#endif
+#endif
+  const unsigned short  ft_standard_name_ranks[FT_NUM_STANDARD_UNICODES]
+#ifdef  DEFINE_PS_TABLES_DATA
+  =
+  {
+      280,  277,  281,  282,   29,  271,  400,  274,  273,  219,  278,  264,
+       65,  276,   76,  279,  272,   95,    0,  283,  399,  262,   67,  195,
+      213,  196,  197,  214,   97,  203,  204,  190,  191,  192,  212,  193,
+      194,   32,   84,   70,    1,   77,    2,    3,    4,    5,    6,  224,
+        8,    9,   10,   11,   12,   13,   14,   16,   79,   17,   18,   19,
+       20,   21,   22,   23,   24,   27,   26,   28,   30,   31,   33,   34,
+       35,   36,   38,   39,   40,   41,   42,   43,   44,   45,   46,   47,
+       48,   49,   50,   51,   52,   53,   54,   55,   56,   57,   58,   59,
+       60,   61,   62,   63,  223,   66,   74,   80,   81,   86,   87,   90,
+       91,   93,   94,   96,   98,   71,  238,  100,  210,  102,   99,   89,
+        7,  226,  106,  236,  237,  221,  229,  230,  117,   68,  116,  231,
+      225,  228,  227,  121,  234,  235,  125,  109,  218,  216,  132,   37,
+      105,   25,  199,   15,  150,  201,  120,  164,   69,  198,  200,  182,
+      202,  157,  119,  107,  115,   85,  263,  142,  123,  111,  275,  156,
+      122,  181,  101,   92,   82,  110,  188,  124,  112,  108,  174,  149,
+      113,  300,  104,  127,  114,  128,  211,   88,  130,  103,  126,   64,
+      131,  215,  129,  217,  133,  118,  135,  136,  137,  134,  139,  140,
+      141,  138,  143,  145,  146,  148,  144,  147,  205,  152,  153,  154,
+      151,  155,  207,  208,  159,  160,  162,  158,  163,  161,  165,  167,
+      168,  169,  166,  171,  172,  173,  170,  175,  177,  178,  180,  176,
+      179,  206,  184,  185,  186,  183,  187,  189,  209,  320,  312,  321,
+      292,  305,  322,  365,  246,  307,  247,  233,  232,  323,  324,  325,
+      326,  327,  328,  329,  330,  331,  332,  290,  297,  286,  222,  296,
+      299,  333,  298,  288,  301,  302,  303,  306,  403,  401,   73,  404,
+      402,  259,  260,  310,  294,  248,  334,  335,  336,  337,  338,  340,
+      341,  342,  343,  344,  345,  346,  347,  348,  349,  350,  351,  352,
+      353,  354,  355,  356,  357,  358,  359,  360,  261,  284,  285,   72,
+      318,  361,  362,  313,  317,  319,  363,  308,  309,  311,  364,  220,
+      293,  315,  316,  366,  367,  267,  268,  269,  270,  265,  266,   83,
+      239,  304,  240,  241,  242,  243,  244,  245,  249,  250,  251,  252,
+      253,  254,  255,  256,  257,  258,  287,  291,  295,  289,  368,  369,
+      370,  371,  372,  373,  374,  339,  375,  376,  377,  378,  379,  380,
+      381,  382,  383,  384,  385,  386,  387,  388,  389,  390,  314,  391,
+      392,  393,  394,  395,  396,  397,  398,   75,   78
   }
 #endif /* DEFINE_PS_TABLES_DATA */
   ;
 
 
 #ifdef  DEFINE_PS_TABLES
+  /*
+   * Children offsets in `ft_adobe_glyph_list' are 2 bytes long,
+   * values are 2 bytes long.
+   */
+#define FT_ADOBE_GLYPH_LIST_OFFSET_SIZE  2
+#define FT_ADOBE_GLYPH_LIST_OFFSET( p )  \
+          ( ( (unsigned long)(p)[0] << 8 ) | \
+            (unsigned long)(p)[1] )
+#define FT_ADOBE_GLYPH_LIST_VALUE_SIZE  2
+#define FT_ADOBE_GLYPH_LIST_VALUE( p )  \
+          ( ( (unsigned long)(p)[0] << 8 ) | \
+            (unsigned long)(p)[1] )
+
   /*
    * This function searches the compressed table efficiently.
    */
   static unsigned long
-  ft_get_adobe_glyph_index( const char*  name,
-                            const char*  limit )
+  ft_adobe_glyph_list_value( const char*  name,
+                             const char*  limit )
   {
     int                   c = 0;
     int                   count, min, max;
@@ -4161,11 +4387,11 @@
     while ( min < max )
     {
       int                   mid = ( min + max ) >> 1;
-      const unsigned char*  q   = p + mid * 2;
+      const unsigned char*  q   = p + mid * FT_ADOBE_GLYPH_LIST_OFFSET_SIZE;
       int                   c2;
 
 
-      q = ft_adobe_glyph_list + ( ( (int)q[0] << 8 ) | q[1] );
+      q = ft_adobe_glyph_list + FT_ADOBE_GLYPH_LIST_OFFSET( q );
 
       c2 = q[0] & 127;
       if ( c2 == c )
@@ -4189,7 +4415,7 @@
       {
         if ( (p[0] & 128) == 0 &&
              (p[1] & 128) != 0 )
-          return (unsigned long)( ( (int)p[2] << 8 ) | p[3] );
+          return FT_ADOBE_GLYPH_LIST_VALUE( p + 2 );
 
         goto NotFound;
       }
@@ -4206,13 +4432,13 @@
       p++;
       count = p[0] & 127;
       if ( p[0] & 128 )
-        p += 2;
+        p += FT_ADOBE_GLYPH_LIST_VALUE_SIZE;
 
       p++;
 
-      for ( ; count > 0; count--, p += 2 )
+      for ( ; count > 0; count--, p += FT_ADOBE_GLYPH_LIST_OFFSET_SIZE )
       {
-        int                   offset = ( (int)p[0] << 8 ) | p[1];
+        unsigned long         offset = FT_ADOBE_GLYPH_LIST_OFFSET( p );
         const unsigned char*  q      = ft_adobe_glyph_list + offset;
 
         if ( c == ( q[0] & 127 ) )
@@ -4230,6 +4456,213 @@
   NotFound:
     return 0;
   }
+
+
+  /*
+   * Get the Unicode values for a given glyph name.  This function stores
+   * up to `max_values' values in `values' and returns their total
+   * number, or 0 if the name is not in the AGL.
+   */
+  static int
+  ft_get_adobe_glyph_sequence( const char*     name,
+                               const char*     limit,
+                               unsigned long*  values,
+                               int             max_values )
+  {
+    unsigned long          value = ft_adobe_glyph_list_value( name, limit );
+    const unsigned short*  seq;
+    int                    len, n;
+
+
+    if ( value == 0 )
+      return 0;
+
+    if ( value < 0xD800UL || value >= 0xE000UL )
+    {
+      if ( max_values > 0 )
+        values[0] = value;
+      return 1;
+    }
+
+    seq = ft_adobe_glyph_sequences + ( value - 0xD800UL );
+    len = seq[0];
+    for ( n = 0; n < len && n < max_values; n++ )
+      values[n] = seq[n + 1];
+
+    return len;
+  }
+
+
+  /*
+   * Return the Unicode value for a given glyph name, or 0 if the name is
+   * not in the AGL or maps to more than one character.
+   */
+  static unsigned long
+  ft_get_adobe_glyph_index( const char*  name,
+                            const char*  limit )
+  {
+    unsigned long  value;
+
+
+    if ( ft_get_adobe_glyph_sequence( name, limit, &value, 1 ) == 1 )
+      return value;
+
+    return 0;
+  }
+
+#ifdef  DEFINE_PS_TABLES_BULK
+
+#define FT_ADOBE_GLYPH_LIST_MAX_LENGTH  39
+
+  /*
+   * Look up `count' null-terminated names and store their values (or 0)
+   * in `values'.  The search for a name resumes after the prefix it
+   * shares with the previous one, so sorted names are looked up faster.
+   */
+  static void
+  ft_adobe_glyph_list_values( const char* const*  names,
+                              unsigned int        count,
+                              unsigned long*      values )
+  {
+    /* path[k] points to the letter matched by the k-th character */
+    const unsigned char*  path[FT_ADOBE_GLYPH_LIST_MAX_LENGTH + 1];
+    const char*           previous = "";
+    unsigned int          depth    = 0;
+    unsigned int          i;
+
+
+    for ( i = 0; i < count; i++ )
+    {
+      const char*           name = names[i];
+      const unsigned char*  p;
+      unsigned int          k = 0;
+      int                   c;
+
+
+      while ( k < depth && name[k] && name[k] == previous[k] )
+        k++;
+
+      values[i] = 0;
+      previous  = name;
+      depth     = k;
+
+      if ( k == 0 )
+      {
+        int  num, min, max;
+
+
+        c = (unsigned char)name[0];
+        if ( c == 0 )
+          continue;
+
+        p   = ft_adobe_glyph_list;
+        num = p[1];
+        p  += 2;
+
+        min = 0;
+        max = num;
+
+        while ( min < max )
+        {
+          int                   mid = ( min + max ) >> 1;
+          const unsigned char*  q   = p + mid * FT_ADOBE_GLYPH_LIST_OFFSET_SIZE;
+          int                   c2;
+
+
+          q = ft_adobe_glyph_list + FT_ADOBE_GLYPH_LIST_OFFSET( q );
+
+          c2 = q[0] & 127;
+          if ( c2 == c )
+          {
+            path[1] = q;
+            depth   = k = 1;
+            break;
+          }
+          if ( c2 < c )
+            min = mid + 1;
+          else
+            max = mid;
+        }
+
+        if ( k == 0 )
+          continue;
+      }
+
+      for ( p = path[k]; name[k]; k++ )
+      {
+        /* no name in the table is longer */
+        if ( k == FT_ADOBE_GLYPH_LIST_MAX_LENGTH )
+          goto NextName;
+
+        c = (unsigned char)name[k];
+        if ( p[0] & 128 )
+        {
+          p++;
+          if ( c != ( p[0] & 127 ) )
+            goto NextName;
+        }
+        else
+        {
+          const unsigned char*  q   = p + 1;
+          int                   num = q[0] & 127;
+
+
+          if ( q[0] & 128 )
+            q += FT_ADOBE_GLYPH_LIST_VALUE_SIZE;
+          q++;
+
+          for ( ; num > 0; num--, q += FT_ADOBE_GLYPH_LIST_OFFSET_SIZE )
+          {
+            p = ft_adobe_glyph_list + FT_ADOBE_GLYPH_LIST_OFFSET( q );
+            if ( c == ( p[0] & 127 ) )
+              break;
+          }
+          if ( num == 0 )
+            goto NextName;
+        }
+
+        path[k + 1] = p;
+        depth       = k + 1;
+      }
+
+      if ( ( p[0] & 128 ) == 0 && ( p[1] & 128 ) != 0 )
+        values[i] = FT_ADOBE_GLYPH_LIST_VALUE( p + 2 );
+
+    NextName:
+      ;
+    }
+  }
+
+
+  /*
+   * Get the Unicode values for `count' glyph names, as
+   * `ft_get_adobe_glyph_index' does for a single one.  Sort the names to
+   * make this faster.
+   */
+  static void
+  ft_get_adobe_glyph_indices( const char* const*  names,
+                              unsigned int        count,
+                              unsigned long*      values )
+  {
+    unsigned int  i;
+
+
+    ft_adobe_glyph_list_values( names, count, values );
+
+    for ( i = 0; i < count; i++ )
+    {
+      if ( values[i] >= 0xD800UL && values[i] < 0xE000UL )
+      {
+        const unsigned short*  seq = ft_adobe_glyph_sequences +
+                                       ( values[i] - 0xD800UL );
+
+
+        values[i] = seq[0] == 1 ? seq[1] : 0;
+      }
+    }
+  }
+
+#endif /* DEFINE_PS_TABLES_BULK */
 #endif /* DEFINE_PS_TABLES */
 
 #endif /* FT_CONFIG_OPTION_ADOBE_GLYPH_LIST */
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+
+#
+# FreeType 2 BDF property table builder
+#
+# Copyright (C) 2023 by
+# David Turner, Robert Wilhelm, and Werner Lemberg.
+#
+# This file is part of the FreeType project, and may only be used, modified,
+# and distributed under the terms of the FreeType project license,
+# LICENSE.TXT.  By continuing to use, modify, or distribute this file you
+# indicate that you have read the license and understand and accept it
+# fully.
+
+
+"""
+usage: %s [--check] <output-file>
+
+  This python script generates the table of builtin BDF font properties
+  used by the `bdf' module, together with a perfect hash to look them up
+  without building a hash table at runtime.
+
+  Its argument is the name of the header file to be created, normally
+  `src/bdf/bdfprops.h'.  The file is only rewritten if its contents
+  change, so that an unchanged table does not cause recompilation.
+
+  With option `--check', the file is not written; instead, the script
+  exits with status 1 if it doesn't match the generated table.
+"""
+
+import io
+import os.path
+import sys
+
+from dictcomp import dump_array, update_file
+
+# List of most properties that might appear in a font.  Doesn't include the
+# RAW_* and AXIS_* properties in X11R6 polymorphic fonts.  Property IDs are
+# indices into this list.
+#
+bdf_properties = [
+    ("ADD_STYLE_NAME",          "BDF_ATOM"),
+    ("AVERAGE_WIDTH",           "BDF_INTEGER"),
+    ("AVG_CAPITAL_WIDTH",       "BDF_INTEGER"),
+    ("AVG_LOWERCASE_WIDTH",     "BDF_INTEGER"),
+    ("CAP_HEIGHT",              "BDF_INTEGER"),
+    ("CHARSET_COLLECTIONS",     "BDF_ATOM"),
+    ("CHARSET_ENCODING",        "BDF_ATOM"),
+    ("CHARSET_REGISTRY",        "BDF_ATOM"),
+    ("COMMENT",                 "BDF_ATOM"),
+    ("COPYRIGHT",               "BDF_ATOM"),
+    ("DEFAULT_CHAR",            "BDF_CARDINAL"),
+    ("DESTINATION",             "BDF_CARDINAL"),
+    ("DEVICE_FONT_NAME",        "BDF_ATOM"),
+    ("END_SPACE",               "BDF_INTEGER"),
+    ("FACE_NAME",               "BDF_ATOM"),
+    ("FAMILY_NAME",             "BDF_ATOM"),
+    ("FIGURE_WIDTH",            "BDF_INTEGER"),
+    ("FONT",                    "BDF_ATOM"),
+    ("FONTNAME_REGISTRY",       "BDF_ATOM"),
+    ("FONT_ASCENT",             "BDF_INTEGER"),
+    ("FONT_DESCENT",            "BDF_INTEGER"),
+    ("FOUNDRY",                 "BDF_ATOM"),
+    ("FULL_NAME",               "BDF_ATOM"),
+    ("ITALIC_ANGLE",            "BDF_INTEGER"),
+    ("MAX_SPACE",               "BDF_INTEGER"),
+    ("MIN_SPACE",               "BDF_INTEGER"),
+    ("NORM_SPACE",              "BDF_INTEGER"),
+    ("NOTICE",                  "BDF_ATOM"),
+    ("PIXEL_SIZE",              "BDF_INTEGER"),
+    ("POINT_SIZE",              "BDF_INTEGER"),
+    ("QUAD_WIDTH",              "BDF_INTEGER"),
+    ("RAW_ASCENT",              "BDF_INTEGER"),
+    ("RAW_AVERAGE_WIDTH",       "BDF_INTEGER"),
+    ("RAW_AVG_CAPITAL_WIDTH",   "BDF_INTEGER"),
+    ("RAW_AVG_LOWERCASE_WIDTH", "BDF_INTEGER"),
+    ("RAW_CAP_HEIGHT",          "BDF_INTEGER"),
+    ("RAW_DESCENT",             "BDF_INTEGER"),
+    ("RAW_END_SPACE",           "BDF_INTEGER"),
+    ("RAW_FIGURE_WIDTH",        "BDF_INTEGER"),
+    ("RAW_MAX_SPACE",           "BDF_INTEGER"),
+    ("RAW_MIN_SPACE",           "BDF_INTEGER"),
+    ("RAW_NORM_SPACE",          "BDF_INTEGER"),
+    ("RAW_PIXEL_SIZE",          "BDF_INTEGER"),
+    ("RAW_POINT_SIZE",          "BDF_INTEGER"),
+    ("RAW_PIXELSIZE",           "BDF_INTEGER"),
+    ("RAW_POINTSIZE",           "BDF_INTEGER"),
+    ("RAW_QUAD_WIDTH",          "BDF_INTEGER"),
+    ("RAW_SMALL_CAP_SIZE",      "BDF_INTEGER"),
+    ("RAW_STRIKEOUT_ASCENT",    "BDF_INTEGER"),
+    ("RAW_STRIKEOUT_DESCENT",   "BDF_INTEGER"),
+    ("RAW_SUBSCRIPT_SIZE",      "BDF_INTEGER"),
+    ("RAW_SUBSCRIPT_X",         "BDF_INTEGER"),
+    ("RAW_SUBSCRIPT_Y",         "BDF_INTEGER"),
+    ("RAW_SUPERSCRIPT_SIZE",    "BDF_INTEGER"),
+    ("RAW_SUPERSCRIPT_X",       "BDF_INTEGER"),
+    ("RAW_SUPERSCRIPT_Y",       "BDF_INTEGER"),
+    ("RAW_UNDERLINE_POSITION",  "BDF_INTEGER"),
+    ("RAW_UNDERLINE_THICKNESS", "BDF_INTEGER"),
+    ("RAW_X_HEIGHT",            "BDF_INTEGER"),
+    ("RELATIVE_SETWIDTH",       "BDF_CARDINAL"),
+    ("RELATIVE_WEIGHT",         "BDF_CARDINAL"),
+    ("RESOLUTION",              "BDF_INTEGER"),
+    ("RESOLUTION_X",            "BDF_CARDINAL"),
+    ("RESOLUTION_Y",            "BDF_CARDINAL"),
+    ("SETWIDTH_NAME",           "BDF_ATOM"),
+    ("SLANT",                   "BDF_ATOM"),
+    ("SMALL_CAP_SIZE",          "BDF_INTEGER"),
+    ("SPACING",                 "BDF_ATOM"),
+    ("STRIKEOUT_ASCENT",        "BDF_INTEGER"),
+    ("STRIKEOUT_DESCENT",       "BDF_INTEGER"),
+    ("SUBSCRIPT_SIZE",          "BDF_INTEGER"),
+    ("SUBSCRIPT_X",             "BDF_INTEGER"),
+    ("SUBSCRIPT_Y",             "BDF_INTEGER"),
+    ("SUPERSCRIPT_SIZE",        "BDF_INTEGER"),
+    ("SUPERSCRIPT_X",           "BDF_INTEGER"),
+    ("SUPERSCRIPT_Y",           "BDF_INTEGER"),
+    ("UNDERLINE_POSITION",      "BDF_INTEGER"),
+    ("UNDERLINE_THICKNESS",     "BDF_INTEGER"),
+    ("WEIGHT",                  "BDF_CARDINAL"),
+    ("WEIGHT_NAME",             "BDF_ATOM"),
+    ("X_HEIGHT",                "BDF_INTEGER"),
+    ("_MULE_BASELINE_OFFSET",   "BDF_INTEGER"),
+    ("_MULE_RELATIVE_COMPOSE",  "BDF_INTEGER"),
+]
+
+
+# We use a `hash and displace' perfect hash.  The 32-bit FNV-1a hash `h' of
+# a name selects a bucket with its low bits; the slot of the name is
+#
+#   ( ( h >> 16 ) + displacement[bucket] ) % size
+#
+# The generator finds a displacement for each bucket (the largest buckets
+# first) so that no two names share a slot.  A lookup thus needs one hash
+# computation and one string comparison.
+#
+def fnv1a(name):
+    h = 2166136261
+    for c in name.encode("ascii"):
+        h = ((h ^ c) * 16777619) & 0xFFFFFFFF
+    return h
+
+
+def perfect_hash(names, num_buckets, size):
+    """return displacements and slots, or None if there is no solution"""
+
+    buckets = [[] for _ in range(num_buckets)]
+    for index, name in enumerate(names):
+        h = fnv1a(name)
+        buckets[h % num_buckets].append((index, h >> 16))
+
+    displacements = [0] * num_buckets
+    slots = [None] * size
+
+    order = sorted(range(num_buckets), key=lambda b: -len(buckets[b]))
+    for b in order:
+        for d in range(min(size, 256)):
+            positions = [(h2 + d) % size for _, h2 in buckets[b]]
+            if (len(set(positions)) == len(positions) and
+                    all(slots[p] is None for p in positions)):
+                break
+        else:
+            return None
+
+        displacements[b] = d
+        for (index, _), p in zip(buckets[b], positions):
+            slots[p] = index
+
+    return displacements, slots
+
+
+def main():
+    """main program body"""
+
+    args = sys.argv[1:]
+    check = "--check" in args
+    if check:
+        args.remove("--check")
+
+    if len(args) != 1:
+        print(__doc__ % sys.argv[0])
+        sys.exit(1)
+
+    output_file = args[0]
+
+    names = [name for name, _ in bdf_properties]
+    if len(names) > 254:
+        sys.stderr.write("too many BDF properties\n")
+        sys.exit(1)
+
+    # find the smallest table (powers of two make `%' cheap), then the
+    # smallest number of buckets that avoids collisions within a bucket
+    result = None
+    size = 64
+    while result is None:
+        size *= 2
+        for num_buckets in range(size // 8, size // 2 + 1):
+            result = perfect_hash(names, num_buckets, size)
+            if result is not None:
+                break
+
+    displacements, slots = result
+
+    # render everything into memory first; see `update_file'
+    file = io.StringIO()
+    write = file.write
+
+    write("/*\n")
+    write(" *\n")
+    write(" * %s\n" % os.path.basename(output_file))
+    write(" *\n")
+    write(" *   Builtin BDF font properties.\n")
+    write(" *\n")
+    write(" * Copyright (C) 2023 by\n")
+    write(" * David Turner, Robert Wilhelm, and Werner Lemberg.\n")
+    write(" *\n")
+    write(" * This file is part of the FreeType project, and may only be "
+          "used,\n")
+    write(" * modified, and distributed under the terms of the FreeType "
+          "project\n")
+    write(" * license, LICENSE.TXT.  By continuing to use, modify, or "
+          "distribute\n")
+    write(" * this file you indicate that you have read the license and\n")
+    write(" * understand and accept it fully.\n")
+    write(" *\n")
+    write(" */\n")
+    write("\n")
+    write("\n")
+    write("  /* This file has been generated automatically -- do not edit! */"
+          "\n")
+    write("\n")
+    write("\n")
+
+    write("  /* List of most properties that might appear in a font.  "
+          "Doesn't include */\n")
+    write("  /* the RAW_* and AXIS_* properties in X11R6 polymorphic "
+          "fonts.           */\n")
+    write("\n")
+    write("  static const bdf_property_t  bdf_properties_[] =\n")
+    write("  {\n")
+
+    width = max(len(name) for name in names) + 3
+    for name, format in bdf_properties:
+        write("    { %-*s %-13s 1, { 0 } },\n"
+              % (width, '"' + name + '",', format + ","))
+
+    write("  };\n\n\n")
+
+    write("  /*\n")
+    write("   * A perfect hash of the names in `bdf_properties_', generated\n")
+    write("   * by `src/tools/bdfprops.py'.  Empty slots contain 255.\n")
+    write("   */\n")
+    write("\n")
+    write("#define BDF_PROPERTY_HASH_BUCKETS  %d\n" % len(displacements))
+    write("#define BDF_PROPERTY_HASH_SIZE     %d\n" % len(slots))
+    write("\n")
+
+    dump_array(write, "unsigned char", "bdf_property_displacements_",
+               "BDF_PROPERTY_HASH_BUCKETS", displacements)
+    dump_array(write, "unsigned char", "bdf_property_slots_",
+               "BDF_PROPERTY_HASH_SIZE",
+               [255 if s is None else s for s in slots])
+
+    write("""\
+  /* Return the index of `name' in `bdf_properties_', or -1. */
+  static long
+  bdf_builtin_property_index_( const char*  name )
+  {
+    const unsigned char*  p = (const unsigned char*)name;
+    unsigned long         h = 2166136261UL;
+    unsigned int          slot;
+
+
+    for ( ; *p; p++ )
+      h = ( ( h ^ *p ) * 16777619UL ) & 0xFFFFFFFFUL;
+
+    slot = ( ( h >> 16 ) +
+             bdf_property_displacements_[h % BDF_PROPERTY_HASH_BUCKETS] ) %
+           BDF_PROPERTY_HASH_SIZE;
+    slot = bdf_property_slots_[slot];
+
+    if ( slot == 255 || ft_strcmp( bdf_properties_[slot].name, name ) )
+      return -1;
+
+    return (long)slot;
+  }
+
+
+/* END */
+""")
+
+    if not update_file(output_file, file.getvalue(), check):
+        if check:
+            sys.stderr.write("%s is out of date; run `%s %s'\n"
+                             % (output_file, sys.argv[0], output_file))
+            sys.exit(1)
+
+
+# Now run the main routine
+#
+if __name__ == "__main__":
+    main()
+
+# END
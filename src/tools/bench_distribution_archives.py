@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Compare the two ways of `make_distribution_archives.py` to create the
+release archives: the tar/gzip/xz/zip pipeline and the Python writer.
+
+The source files known to git are hard-linked into a temporary directory,
+and each archiver runs twice on it.  For each run, the wall time and the
+archive sizes are printed, together with whether both runs created
+byte-identical archives.
+"""
+
+from __future__ import print_function
+
+import argparse
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import make_distribution_archives as mda
+
+
+def file_digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def run(archiver, src_dir, work_dir, freetype_dir, ftwinversion, mtime):
+    """Create the archives of |src_dir| in a fresh directory below
+    |work_dir|; return the elapsed time and `{name: (size, digest)}'."""
+    build_dir = tempfile.mkdtemp(dir=work_dir)
+    os.symlink(src_dir, os.path.join(build_dir, freetype_dir))
+
+    start = time.time()
+    if archiver == "python":
+        names = mda.write_reproducible_archives(
+            build_dir, freetype_dir, ftwinversion, mtime
+        )
+    else:
+        names = mda.make_archives(build_dir, freetype_dir, ftwinversion)
+    elapsed = time.time() - start
+
+    results = {}
+    for name in names:
+        path = os.path.join(build_dir, name)
+        results[name] = (os.path.getsize(path), file_digest(path))
+
+    return elapsed, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+
+    parser.add_argument(
+        "--source_dir", default=mda._TOP_DIR, help="Source directory path."
+    )
+
+    parser.add_argument(
+        "--version", default="0.0.0", help="Version for the archive names."
+    )
+
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="freetype-bench-")
+    try:
+        freetype_dir = "freetype-" + args.version
+        ftwinversion = "ft" + "".join(args.version.split("."))
+        src_dir = os.path.join(work_dir, freetype_dir)
+
+        source_files = [
+            f
+            for f in mda.get_cmd_output(
+                ["git", "ls-files"], cwd=args.source_dir
+            ).split("\n")
+            if os.path.basename(f) not in mda._EXCLUDED_FILES
+        ]
+        mda.stage_files(args.source_dir, source_files, src_dir, "link")
+        mtime = mda.source_date_epoch(args.source_dir)
+
+        for archiver in ("tools", "python"):
+            runs = [
+                run(
+                    archiver,
+                    src_dir,
+                    work_dir,
+                    freetype_dir,
+                    ftwinversion,
+                    mtime,
+                )
+                for _ in range(2)
+            ]
+
+            print()
+            for i, (elapsed, results) in enumerate(runs):
+                print("%s run %d: %.2f s" % (archiver, i + 1, elapsed))
+            for name in sorted(runs[0][1]):
+                size, digest = runs[0][1][name]
+                print(
+                    "  %-30s %10d bytes  %s"
+                    % (
+                        name,
+                        size,
+                        "reproducible"
+                        if digest == runs[1][1][name][1]
+                        else "differs between runs",
+                    )
+                )
+    finally:
+        shutil.rmtree(work_dir)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,17 +5,36 @@
 #
 # This code is explicitly into the public domain.
 
-import sys
+import csv
+import fnmatch
+import json
+import multiprocessing
 import os
 import re
-
-SRC_FILE_LIST = []
-USED_COMPONENT = {}
-KNOWN_COMPONENT = {}
+import sys
 
 SRC_FILE_DIRS = ["src"]
 TRACE_DEF_FILES = ["include/freetype/internal/fttrace.h"]
 
+c_pathname_pat = re.compile(r'^.*\.[ch]$', re.IGNORECASE)
+# A pattern starting with a literal is much faster than one anchored at
+# each line start; `scan_source_file' checks that only blanks precede it.
+trace_use_pat = re.compile(r'#define[ \t]+FT_COMPONENT[ \t]+([^\n]*)')
+
+# `FT_TRACE0( ... )' to `FT_TRACE7( ... )' and `FT_TRACE( level, ... )'.
+trace_call_pat = re.compile(r'\bFT_TRACE([0-7]?)[ \t]*\([ \t]*([^,)\n]*)')
+
+# Trace call counts are kept per level; the last slot is for calls whose
+# level is not a literal.
+TRACE_LEVELS = 8
+
+trace_def_pat_opn = re.compile(r'^.*FT_TRACE_DEF[ \t]*\([ \t]*')
+trace_def_pat_cls = re.compile(r'[ \t\)].*$')
+
+# Below this number of files, starting worker processes costs more than
+# it saves.
+MIN_FILES_PER_JOB = 64
+
 
 def usage():
     print("Usage: %s [option]" % sys.argv[0])
@@ -32,88 +51,327 @@ def usage():
     print("        Specify the header files including FT_TRACE_DEF()")
     print("        Default is %s" % ":".join(TRACE_DEF_FILES))
     print("")
+    print("  --include=glob1:glob2:...")
+    print("        Only check source files whose path matches a glob")
+    print("        (e.g., `src/truetype/*')")
+    print("")
+    print("  --exclude=glob1:glob2:...")
+    print("        Skip source files whose path matches a glob")
+    print("        (e.g., `*/ftzopen.c:src/tools/*')")
+    print("")
+    print("  --jobs=N")
+    print("        Scan the source files with N worker processes")
+    print("        Default is the number of CPUs")
+    print("")
+    print("  --format=text|json|csv")
+    print("        Print the above report as text (default), or an index of")
+    print("        all components with their definition, the locations of")
+    print("        `#define FT_COMPONENT', and the FT_TRACE* calls per level")
+    print("        following each of them")
+    print("")
+    print("  --trace-levels=\"component1:level1 component2:level2 ...\"")
+    print("        Instead of the report, print a header for")
+    print("        FT_CONFIG_TRACE_LEVELS_H that limits the trace levels of")
+    print("        the components at compile time; the syntax is that of")
+    print("        FT2_DEBUG, and `any' gives the default (otherwise 7)")
+    print("")
+    print("The exit status is 1 if a trace component is used but not")
+    print("defined, and 0 otherwise.")
+    print("")
 
 
-# --------------------------------------------------------------
-# Parse command line options
-#
-for i in range(1, len(sys.argv)):
-    if sys.argv[i].startswith("--help"):
-        usage()
-        exit(0)
-    if sys.argv[i].startswith("--src-dirs="):
-        SRC_FILE_DIRS = sys.argv[i].replace("--src-dirs=", "", 1).split(":")
-    elif sys.argv[i].startswith("--def-files="):
-        TRACE_DEF_FILES = sys.argv[i].replace("--def-files=", "", 1).split(":")
-
-# --------------------------------------------------------------
-# Scan C source and header files using trace macros.
-#
+def match_globs(pathname, globs):
+    """Return whether `pathname' matches one of the shell-style globs."""
+    return any(fnmatch.fnmatch(pathname, glob) for glob in globs)
+
+
+def list_source_files(src_dirs, includes=(), excludes=()):
+    """Return the C source and header files in `src_dirs', filtered by the
+    include and exclude globs, in a stable order."""
+    src_pathnames = []
 
-c_pathname_pat = re.compile('^.*\.[ch]$', re.IGNORECASE)
-trace_use_pat = re.compile('^[ \t]*#define[ \t]+FT_COMPONENT[ \t]+')
+    for d in src_dirs:
+        for (p, dlst, flst) in os.walk(d):
+            dlst.sort()
+            for f in sorted(flst):
+                if c_pathname_pat.match(f) is None:
+                    continue
 
-for d in SRC_FILE_DIRS:
-    for (p, dlst, flst) in os.walk(d):
-        for f in flst:
-            if c_pathname_pat.match(f) is not None:
                 src_pathname = os.path.join(p, f)
+                if includes and not match_globs(src_pathname, includes):
+                    continue
+                if excludes and match_globs(src_pathname, excludes):
+                    continue
 
-                line_num = 0
-                for src_line in open(src_pathname, 'r'):
-                    line_num = line_num + 1
-                    src_line = src_line.strip()
-                    if trace_use_pat.match(src_line) is not None:
-                        component_name = trace_use_pat.sub('', src_line)
-                        if component_name in USED_COMPONENT:
-                            USED_COMPONENT[component_name]\
-                                .append("%s:%d" % (src_pathname, line_num))
-                        else:
-                            USED_COMPONENT[component_name] =\
-                                ["%s:%d" % (src_pathname, line_num)]
-
-# --------------------------------------------------------------
-# Scan header file(s) defining trace macros.
-#
+                src_pathnames.append(src_pathname)
+
+    return src_pathnames
+
+
+def scan_source_file(src_pathname):
+    """Return a list of (component, location, levels) triples for each
+    definition of `FT_COMPONENT' in a source file, where `levels' counts
+    the trace calls per level up to the next definition."""
+    with open(src_pathname, 'r', errors='replace') as f:
+        src_text = f.read()
+
+    uses = []
+    line_num = 1
+    pos = 0
+
+    for m in trace_use_pat.finditer(src_text):
+        line_start = src_text.rfind("\n", 0, m.start()) + 1
+        if src_text[line_start:m.start()].strip(" \t"):
+            continue
+
+        line_num += src_text.count("\n", pos, line_start)
+        pos = line_start
+        uses.append((m.group(1).strip(), "%s:%d" % (src_pathname, line_num),
+                     m.start(), [0] * (TRACE_LEVELS + 1)))
+
+    if not uses:
+        return []
+
+    # assign each trace call to the preceding component definition
+    n = 0
+    for m in trace_call_pat.finditer(src_text, uses[0][2]):
+        while n + 1 < len(uses) and uses[n + 1][2] < m.start():
+            n += 1
+
+        line_start = src_text.rfind("\n", 0, m.start()) + 1
+        if "#define" in src_text[line_start:m.start()]:
+            continue
+
+        level = m.group(1) or m.group(2).strip()
+        if level.isdigit() and int(level) < TRACE_LEVELS:
+            uses[n][3][int(level)] += 1
+        else:
+            uses[n][3][TRACE_LEVELS] += 1
+
+    return [(c, location, levels) for (c, location, _, levels) in uses]
+
+
+def scan_source_files(src_pathnames, jobs=None):
+    """Return a dictionary mapping trace components to lists of the
+    locations where they are used and the trace calls per level there,
+    scanning the files with `jobs' worker processes."""
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(src_pathnames) // MIN_FILES_PER_JOB)
+
+    if jobs > 1:
+        with multiprocessing.Pool(jobs) as pool:
+            results = pool.map(scan_source_file, src_pathnames,
+                               chunksize=MIN_FILES_PER_JOB // 4)
+    else:
+        results = map(scan_source_file, src_pathnames)
+
+    used_component = {}
+    for uses in results:
+        for (component_name, location, levels) in uses:
+            used_component.setdefault(component_name, []).append(
+                (location, levels))
+
+    return used_component
+
+
+def scan_trace_def_files(trace_def_files):
+    """Return a dictionary mapping the trace components defined with
+    `FT_TRACE_DEF' to their locations."""
+    known_component = {}
+
+    for f in trace_def_files:
+        line_num = 0
+        for hdr_line in open(f, 'r'):
+            line_num = line_num + 1
+            hdr_line = hdr_line.strip()
+            if trace_def_pat_opn.match(hdr_line) is not None:
+                component_name = trace_def_pat_opn.sub('', hdr_line)
+                component_name = trace_def_pat_cls.sub('', component_name)
+                if component_name in known_component:
+                    print("trace component %s is defined twice,"
+                          " see %s and fttrace.h:%d" %
+                          (component_name, known_component[component_name],
+                           line_num))
+                else:
+                    known_component[component_name] =\
+                        "%s:%d" % (os.path.basename(f), line_num)
+
+    return known_component
+
+
+def report(used_component, known_component):
+    """Print the used-but-undefined and defined-but-unused components;
+    return the number of undefined ones."""
+    num_undefined = 0
+
+    print("# Trace component used in the implementations but not defined in "
+          "fttrace.h.")
+    for c in sorted(used_component):
+        if c not in known_component:
+            print("Trace component %s (used in %s) is not defined." %
+                  (c, ", ".join(loc for (loc, _) in used_component[c])))
+            num_undefined += 1
+
+    print("# Trace component is defined but not used in the implementations.")
+    for c in sorted(known_component):
+        if c not in used_component:
+            if c != "any":
+                print("Trace component %s (defined in %s) is not used." %
+                      (c, known_component[c]))
+
+    return num_undefined
+
+
+def make_index(used_component, known_component):
+    """Return a list of dictionaries, one per trace component, with its
+    definition, its uses, and the number of trace calls per level."""
+    index = []
+
+    for c in sorted(set(used_component) | set(known_component)):
+        uses = [{"location": location, "levels": levels}
+                for (location, levels) in used_component.get(c, [])]
+        levels = [sum(use["levels"][n] for use in uses)
+                  for n in range(TRACE_LEVELS + 1)]
+
+        index.append({"component": c,
+                      "defined": known_component.get(c),
+                      "uses": uses,
+                      "calls": sum(levels),
+                      "levels": levels})
+
+    return index
+
+
+def write_json(index, out):
+    """Write the index as JSON; the last entry of each `levels' array
+    counts calls with a non-literal level."""
+    json.dump({"levels": TRACE_LEVELS, "components": index}, out, indent=1)
+    out.write("\n")
+
+
+def write_csv(index, out):
+    """Write the index as CSV, one row per use of a component (or one row
+    with an empty location if it is unused)."""
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(["component", "defined", "location", "calls"] +
+                    ["level%d" % n for n in range(TRACE_LEVELS)] +
+                    ["level_other"])
+
+    for entry in index:
+        uses = entry["uses"] or [{"location": "",
+                                  "levels": [0] * (TRACE_LEVELS + 1)}]
+        for use in uses:
+            writer.writerow([entry["component"], entry["defined"] or "",
+                             use["location"], sum(use["levels"])] +
+                            use["levels"])
+
+
+def parse_trace_levels(spec, known_component):
+    """Parse a string in the syntax of FT2_DEBUG into a dictionary mapping
+    all known components to their maximum trace levels."""
+    default = TRACE_LEVELS - 1
+    levels = {}
+
+    for item in spec.replace(",", " ").split():
+        component_name, _, level = item.partition(":")
+        if not level.isdigit() or int(level) >= TRACE_LEVELS:
+            raise ValueError("invalid trace level in `%s'" % item)
+        if component_name == "any":
+            default = int(level)
+        elif component_name in known_component:
+            levels[component_name] = int(level)
+        else:
+            raise ValueError("unknown trace component `%s'" % component_name)
+
+    return {c: levels.get(c, default) for c in known_component}
+
+
+def write_trace_levels(spec, max_levels, out):
+    """Write a header defining `ft_trace_max_level_<component>'."""
+    out.write("/*\n"
+              " * Maximum trace levels of FreeType components, generated"
+              " with\n"
+              " *\n"
+              " *   src/tools/chktrcmp.py --trace-levels=\"%s\"\n"
+              " *\n"
+              " * See `FT_CONFIG_TRACE_LEVELS_H` in `ftoption.h`.\n"
+              " */\n"
+              "\n"
+              "#ifndef FT_TRACE_LEVELS_H_\n"
+              "#define FT_TRACE_LEVELS_H_\n"
+              "\n" % spec)
+
+    width = max(len(c) for c in max_levels)
+    for c in sorted(max_levels):
+        out.write("#define ft_trace_max_level_%-*s  %d\n"
+                  % (width, c, max_levels[c]))
+
+    out.write("\n"
+              "#endif /* FT_TRACE_LEVELS_H_ */\n"
+              "\n"
+              "\n"
+              "/* END */\n")
+
+
+def main():
+    src_file_dirs = SRC_FILE_DIRS
+    trace_def_files = TRACE_DEF_FILES
+    includes = []
+    excludes = []
+    jobs = None
+    output_format = "text"
+    trace_levels = None
+
+    for arg in sys.argv[1:]:
+        if arg.startswith("--help"):
+            usage()
+            return 0
+        if arg.startswith("--src-dirs="):
+            src_file_dirs = arg.replace("--src-dirs=", "", 1).split(":")
+        elif arg.startswith("--def-files="):
+            trace_def_files = arg.replace("--def-files=", "", 1).split(":")
+        elif arg.startswith("--include="):
+            includes += arg.replace("--include=", "", 1).split(":")
+        elif arg.startswith("--exclude="):
+            excludes += arg.replace("--exclude=", "", 1).split(":")
+        elif arg.startswith("--jobs="):
+            jobs = int(arg.replace("--jobs=", "", 1))
+        elif arg.startswith("--trace-levels="):
+            trace_levels = arg.replace("--trace-levels=", "", 1)
+        elif arg.startswith("--format="):
+            output_format = arg.replace("--format=", "", 1)
+            if output_format not in ("text", "json", "csv"):
+                usage()
+                return 2
+
+    if trace_levels is not None:
+        known_component = scan_trace_def_files(trace_def_files)
+        try:
+            max_levels = parse_trace_levels(trace_levels, known_component)
+        except ValueError as e:
+            sys.stderr.write("%s\n" % e)
+            return 2
+
+        write_trace_levels(trace_levels, max_levels, sys.stdout)
+        return 0
+
+    src_pathnames = list_source_files(src_file_dirs, includes, excludes)
+    used_component = scan_source_files(src_pathnames, jobs)
+    known_component = scan_trace_def_files(trace_def_files)
+
+    if output_format == "json":
+        write_json(make_index(used_component, known_component), sys.stdout)
+    elif output_format == "csv":
+        write_csv(make_index(used_component, known_component), sys.stdout)
+    elif report(used_component, known_component):
+        return 1
+
+    if any(c not in known_component for c in used_component):
+        return 1
+
+    return 0
 
-trace_def_pat_opn = re.compile('^.*FT_TRACE_DEF[ \t]*\([ \t]*')
-trace_def_pat_cls = re.compile('[ \t\)].*$')
-
-for f in TRACE_DEF_FILES:
-    line_num = 0
-    for hdr_line in open(f, 'r'):
-        line_num = line_num + 1
-        hdr_line = hdr_line.strip()
-        if trace_def_pat_opn.match(hdr_line) is not None:
-            component_name = trace_def_pat_opn.sub('', hdr_line)
-            component_name = trace_def_pat_cls.sub('', component_name)
-            if component_name in KNOWN_COMPONENT:
-                print("trace component %s is defined twice,"
-                      " see %s and fttrace.h:%d" %
-                      (component_name, KNOWN_COMPONENT[component_name],
-                       line_num))
-            else:
-                KNOWN_COMPONENT[component_name] =\
-                    "%s:%d" % (os.path.basename(f), line_num)
-
-# --------------------------------------------------------------
-# Compare the used and defined trace macros.
-#
 
-print("# Trace component used in the implementations but not defined in "
-      "fttrace.h.")
-cmpnt = list(USED_COMPONENT.keys())
-cmpnt.sort()
-for c in cmpnt:
-    if c not in KNOWN_COMPONENT:
-        print("Trace component %s (used in %s) is not defined." %
-              (c, ", ".join(USED_COMPONENT[c])))
-
-print("# Trace component is defined but not used in the implementations.")
-cmpnt = list(KNOWN_COMPONENT.keys())
-cmpnt.sort()
-for c in cmpnt:
-    if c not in USED_COMPONENT:
-        if c != "any":
-            print("Trace component %s (defined in %s) is not used." %
-                  (c, KNOWN_COMPONENT[c]))
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,32 +1,333 @@
 #!/usr/bin/env python3
 
-# compute arctangent table for CORDIC computations in fttrigon.c
+"""
+  This python script generates the constants and the arctangent table for
+  the CORDIC computations in `src/base/fttrigon.c'.  The C code is written
+  to standard output; it replaces the block starting with `FT_TRIG_SCALE'
+  up to the end of `ft_trig_arctan_table'.
+
+  `--units' gives the value of `FT_ANGLE_PI' in angle units (default:
+  180 << 16, i.e., 16.16 degrees); it must match `fttrigon.h'.
+  `--iterations' sets `FT_TRIG_MAX_ITERS' (default: one more than the
+  number of arctangents that don't round to zero).
+
+  With `--sweep', the fixed-point `FT_Vector_Rotate' and `FT_Atan2' are
+  modelled with `trigmodel.py' for the given number of random samples,
+  and their errors are reported on standard error.  NumPy is only needed
+  for this.
+
+  With `--sin-table', the sine table used by `FT_Sin', `FT_Cos', `FT_Tan',
+  and `FT_Vector_Unit' if `FT_CONFIG_OPTION_TRIG_TABLE' is defined is
+  written instead; it replaces the block from the comment above
+  `FT_TRIG_SIN_ENTRIES' up to the end of `ft_trig_sin_table'.  The
+  number of entries must divide PI/2 in angle units.
+  `--sin-table-report' shows the maximum error of the interpolated sine
+  for various table sizes on standard error, compared to the CORDIC code
+  (NumPy is needed).
+"""
+
+import argparse
 import math
+import sys
+
+DEGREES = 180 << 16
+
+
+def arctan_table(units, iterations=None):
+    """return the table of arctan(2^-n) for n = 1, 2, ... in angle units
+
+    Without `iterations', the table ends before the first value that
+    rounds to zero."""
+
+    scale = units / math.pi
+    table = []
+    n = 1
+
+    while iterations is None or n < iterations:
+        angle = round(math.atan(0.5 ** n) * scale)
+        if angle <= 0 and iterations is None:
+            break
+
+        table.append(angle)
+        n += 1
+
+    return table
+
+
+def shrink_factor(iterations):
+    """return the CORDIC gain of `iterations' - 1 pseudo-rotations"""
+
+    shrink = 1.0
+    for n in range(1, iterations):
+        shrink /= math.sqrt(1 + 0.25 ** n)
+
+    return shrink
+
+
+def trig_constants(units=DEGREES, iterations=None):
+    """return a dictionary with the values of the `FT_TRIG_*' macros"""
+
+    table = arctan_table(units, iterations)
+    iterations = len(table) + 1
+    shrink = shrink_factor(iterations)
+
+    # After prenormalization, vector components are below
+    # 2^(safe_msb + 1).  The rotation into [-PI/4,PI/4] and the CORDIC
+    # gain of 1/shrink may enlarge them by sqrt(2)/shrink; the result must
+    # still fit into 31 bits.
+    safe_msb = math.floor(math.log2(shrink * math.sqrt(0.5) * 2 ** 30))
+
+    # all angles seen by the pseudo-rotations must fit into 32 bits
+    if 2 * units + sum(table) >= 1 << 31:
+        raise ValueError("angle unit %d is too large" % units)
+
+    return {
+        "units": units,
+        "iterations": iterations,
+        "table": table,
+        "shrink": shrink,
+        "scale": int(shrink * 2 ** 32),
+        "safe_msb": safe_msb,
+    }
+
+
+def dump_constants(write, constants):
+    """write the C code for `fttrigon.c'"""
+
+    units = constants["units"]
+    if units == DEGREES:
+        unit_name = "180L << 16, i.e. degrees"
+    else:
+        unit_name = "%dL" % units
+
+    write("  /* the Cordic shrink factor %.15f * 2^32 */\n"
+          % constants["shrink"])
+    write("#define FT_TRIG_SCALE      0x%XUL\n" % constants["scale"])
+    write("\n")
+    write("  /* the highest bit in overflow-safe vector components, */\n")
+    write("  /* MSB of %.15f * sqrt(0.5) * 2^30         */\n"
+          % constants["shrink"])
+    write("#define FT_TRIG_SAFE_MSB   %d\n" % constants["safe_msb"])
+    write("\n")
+    write("  /* this table was generated for FT_PI = %s */\n" % unit_name)
+    write("#define FT_TRIG_MAX_ITERS  %d\n" % constants["iterations"])
+    write("\n")
+    write("  static const FT_Angle\n")
+    write("  ft_trig_arctan_table[] =\n")
+    write("  {\n")
+
+    line = "   "
+    for n, angle in enumerate(constants["table"]):
+        item = " %dL" % angle
+        if n < len(constants["table"]) - 1:
+            item += ","
+        if len(line) + len(item) > 72:
+            write(line + "\n")
+            line = "   "
+        line += item
+
+    write(line + "\n")
+    write("  };\n")
+
+
+def sin_table(units, entries):
+    """return a dictionary with the sine table for `FT_Sin' and friends
+
+    The table holds sin(n * step) for n = 0, ..., `entries', where the
+    step is (PI/2) / `entries' in angle units.  Its precision is the
+    largest number of fractional bits that lets the linear interpolation
+    `(table[n + 1] - table[n]) * frac' fit into 32 unsigned bits."""
+
+    quarter = units // 2
+    if quarter % entries:
+        raise ValueError("PI/2 is not a multiple of %d angle units" % entries)
+
+    step = quarter // entries
+
+    for bits in range(30, 15, -1):
+        table = [round(math.sin(n * math.pi / (2 * entries)) * 2 ** bits)
+                 for n in range(entries + 1)]
+        delta = max(b - a for a, b in zip(table, table[1:]))
+
+        if delta * (step - 1) + step // 2 < 1 << 32:
+            return {
+                "entries": entries,
+                "step": step,
+                "bits": bits,
+                "table": table,
+            }
+
+    raise ValueError("%d sine table entries are too few" % entries)
+
+
+def dump_sin_table(write, sin_constants):
+    """write the C code of the sine table for `fttrigon.c'"""
+
+    write("  /* sin(n * FT_TRIG_SIN_STEP) * 2^FT_TRIG_SIN_BITS */\n")
+    write("#define FT_TRIG_SIN_ENTRIES  %d\n" % sin_constants["entries"])
+    write("#define FT_TRIG_SIN_STEP     %dUL\n" % sin_constants["step"])
+    write("#define FT_TRIG_SIN_BITS     %d\n" % sin_constants["bits"])
+    write("\n")
+    write("  static const FT_UInt32\n")
+    write("  ft_trig_sin_table[FT_TRIG_SIN_ENTRIES + 1] =\n")
+    write("  {\n")
+
+    line = "   "
+    table = sin_constants["table"]
+    for n, value in enumerate(table):
+        item = " %dUL" % value
+        if n < len(table) - 1:
+            item += ","
+        if len(line) + len(item) > 72:
+            write(line + "\n")
+            line = "   "
+        line += item
+
+    write(line + "\n")
+    write("  };\n")
+
+
+def error_sweep(constants, samples, seed=0):
+    """report the errors of `FT_Vector_Rotate' and `FT_Atan2'"""
+
+    try:
+        import numpy as np
+        import trigmodel
+    except ImportError:
+        sys.stderr.write("the error sweep needs NumPy\n")
+        sys.exit(1)
+
+    units = constants["units"]
+    rng = np.random.default_rng(seed)
+    report = sys.stderr.write
+
+    report("%d iterations, %d samples\n"
+           % (constants["iterations"], samples))
+
+    # vectors with lengths between 2^6 and 2^24 (in 26.6 or 16.16
+    # format, as typically passed by the stroker and the glyph loader)
+    length = np.exp2(rng.uniform(6, 24, samples))
+    phi = rng.uniform(-math.pi, math.pi, samples)
+    x = np.rint(length * np.cos(phi)).astype(np.int64)
+    y = np.rint(length * np.sin(phi)).astype(np.int64)
+
+    nonzero = (x != 0) | (y != 0)
+    x = x[nonzero]
+    y = y[nonzero]
+
+    angle = rng.integers(-units, units, x.size, dtype=np.int64)
+    angle[angle == 0] = 1
+
+    rx, ry = trigmodel.vector_rotate(x, y, angle, constants)
+
+    alpha = angle * (math.pi / units)
+    ex = x * np.cos(alpha) - y * np.sin(alpha)
+    ey = x * np.sin(alpha) + y * np.cos(alpha)
+    error = np.hypot(rx - ex, ry - ey)
+
+    report("  FT_Vector_Rotate: max error %.3f, rms error %.3f"
+           " (in vector units)\n"
+           % (error.max(), math.sqrt(np.mean(error * error))))
+
+    theta = trigmodel.atan2(x, y, constants)
+    exact = np.arctan2(y, x) * (units / math.pi)
+    error = theta - exact
+
+    # angles near PI and -PI are the same
+    error = np.where(error > units, error - 2 * units, error)
+    error = np.where(error < -units, error + 2 * units, error)
+    error = np.abs(error)
+
+    report("  FT_Atan2:         max error %.3f, rms error %.3f"
+           " (in angle units)\n"
+           % (error.max(), math.sqrt(np.mean(error * error))))
+
+
+def sin_table_report(units):
+    """report the sine table size against the maximum error"""
+
+    try:
+        import numpy as np
+        import trigmodel
+    except ImportError:
+        sys.stderr.write("the sine table report needs NumPy\n")
+        sys.exit(1)
+
+    report = sys.stderr.write
+
+    # the first quadrant is enough; a stride of 7 (coprime to the table
+    # steps) still samples all positions between table entries
+    angle = np.arange(0, units // 2 + 1, 7, dtype=np.int64)
+    exact = np.sin(angle * (math.pi / units)) * 65536
+
+    cordic = trigmodel.vector_unit(angle, trig_constants(units))[1]
+    report("CORDIC: max error %.3f, rms error %.3f (in 16.16 units)\n"
+           % (np.abs(cordic - exact).max(),
+              math.sqrt(np.mean((cordic - exact) ** 2))))
+
+    report("entries  bytes  bits  linear  quadratic\n")
+
+    entries = 32
+    while (units // 2) % entries == 0 and entries <= 4096:
+        try:
+            sin_constants = sin_table(units, entries)
+        except ValueError:
+            entries *= 2
+            continue
+
+        errors = []
+        for quadratic in (False, True):
+            value = trigmodel.table_sin(angle, sin_constants, quadratic)
+            errors.append(np.abs(value - exact).max())
+
+        report("%7d  %5d  %4d  %6.3f  %9.3f\n"
+               % (entries, 4 * (entries + 1), sin_constants["bits"],
+                  errors[0], errors[1]))
+        entries *= 2
+
+
+def main():
+    """main program body"""
+
+    parser = argparse.ArgumentParser(
+        usage="%(prog)s [--units=<pi>] [--iterations=<n>] "
+              "[--sweep=<samples>]\n"
+              "       [--sin-table=<entries>] [--sin-table-report]",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--units", type=int, default=DEGREES)
+    parser.add_argument("--iterations", type=int)
+    parser.add_argument("--sweep", type=int, default=0)
+    parser.add_argument("--sin-table", type=int, default=0)
+    parser.add_argument("--sin-table-report", action="store_true")
+
+    args = parser.parse_args()
 
-# units  = 64*65536.0   # don't change !!
-units = 180 * 2 ** 16
-scale = units / math.pi
-shrink = 1.0
-angles2 = []
+    if args.iterations is not None and args.iterations < 2:
+        parser.error("at least two iterations are needed")
 
-print("")
-print("table of arctan( 1/2^n ) for PI = " + repr(units / 65536.0) + " units")
+    try:
+        constants = trig_constants(args.units, args.iterations)
+    except ValueError as e:
+        parser.error(str(e))
 
-for n in range(1, 32):
+    if args.sin_table > 0:
+        try:
+            dump_sin_table(sys.stdout.write,
+                           sin_table(args.units, args.sin_table))
+        except ValueError as e:
+            parser.error(str(e))
+    else:
+        dump_constants(sys.stdout.write, constants)
 
-    x = 0.5 ** n  # tangent value
+    if args.sweep > 0:
+        error_sweep(constants, args.sweep)
 
-    angle = math.atan(x)  # arctangent
-    angle2 = round(angle * scale)  # arctangent in FT_Angle units
+    if args.sin_table_report:
+        sin_table_report(args.units)
 
-    if angle2 <= 0:
-        break
 
-    angles2.append(repr(int(angle2)))
-    shrink /= math.sqrt(1 + x * x)
+if __name__ == "__main__":
+    main()
 
-print(", ".join(angles2))
-print("shrink factor    = " + repr(shrink))
-print("shrink factor 2  = " + repr(int(shrink * (2 ** 32))))
-print("expansion factor = " + repr(1 / shrink))
-print("")
+# END
@@ -0,0 +1,1137 @@
+#!/usr/bin/env python3
+
+#
+# FreeType 2 compressed dictionary compiler
+#
+# Copyright (C) 1996-2023 by
+# David Turner, Robert Wilhelm, and Werner Lemberg.
+#
+# This file is part of the FreeType project, and may only be used, modified,
+# and distributed under the terms of the FreeType project license,
+# LICENSE.TXT.  By continuing to use, modify, or distribute this file you
+# indicate that you have read the license and understand and accept it
+# fully.
+
+
+"""
+usage: %s [--test] [--encoding=<encoding>] [--profile=<file>]
+          <input-file> <output-file> <table-name> <function-name>
+
+  This python script compiles a dictionary that maps ASCII names to
+  positive integers into a compressed trie.  It writes a C header file
+  with the table and a lookup function
+
+    static unsigned long
+    <function-name>( const char*  name,
+                     const char*  limit );
+
+  which returns the value of the name in the range [name,limit), or 0
+  if it is not in the dictionary.
+
+  Each non-empty line of the input file holds a name and its value,
+  separated by a semicolon; the value is decimal, or hexadecimal with a
+  `0x' prefix.  Lines starting with `#' are ignored.
+
+  Option `--encoding' selects how the table is written: `decimal' (the
+  default), `hex', or `string'; see `ARRAY_ENCODINGS' below.
+
+  Option `--profile' takes a file in the same format as the input file
+  that maps names to lookup frequencies; the children of inner trie
+  nodes are then ordered by decreasing frequency.
+
+  With option `--test', a `main' function guarded by `TEST' is appended
+  that checks and times all lookups; compile it with
+
+    cc -O2 -DTEST -x c <output-file>
+
+  The module can also be imported; `glnames.py' uses it to build the
+  tables of the `psnames' module.
+"""
+
+import hashlib
+import io
+import os.path
+import struct
+import sys
+
+
+# string table management
+#
+#
+# Names which are a suffix of another name (for example, `acute' in
+# `Aacute') are not stored separately; their index points into the
+# longer entry instead.  To find them, we sort the names by their
+# reversed string: a name is then a suffix of another one if and only if
+# its reversed form is a prefix of the next entry in the sorted list.
+#
+class StringTable:
+    def __init__(self, name_list, master_table_name, guard=None,
+                 encoding="decimal"):
+        self.master_table = master_table_name
+        self.guard = guard
+        self.encoding = encoding
+        self.indices = {}
+
+        unique = list(dict.fromkeys(name_list))
+        rev_names = sorted(name[::-1] for name in unique)
+
+        # map each name to the (longer) name it is stored in
+        host = {}
+        for n in range(len(rev_names) - 1, -1, -1):
+            name = rev_names[n][::-1]
+            if (n + 1 < len(rev_names) and
+                    rev_names[n + 1].startswith(rev_names[n])):
+                host[name] = host[rev_names[n + 1][::-1]]
+            else:
+                host[name] = name
+
+        # lay out the remaining names in their original order
+        self.names = [name for name in unique if host[name] == name]
+        index = 0
+
+        for name in self.names:
+            self.indices[name] = index
+            index += len(name) + 1
+
+        self.total = index
+
+        for name in unique:
+            outer = host[name]
+            self.indices[name] = (self.indices[outer] +
+                                  len(outer) - len(name))
+
+    def dump(self, file):
+        write = file.write
+
+        if self.encoding != "decimal":
+            data = "".join(name + "\0" for name in self.names)
+            dump_array(write, "char", self.master_table, repr(self.total),
+                       data.encode("ascii"), self.guard,
+                       encoding=self.encoding)
+            return
+
+        dump_declaration(write, "char", self.master_table,
+                         repr(self.total), self.guard)
+        write_rows(write, ("    '" + "','".join(name) + "', 0,\n"
+                           for name in self.names))
+        dump_declaration_end(write, self.guard)
+
+    def dump_sublist(self, file, table_name, macro_name, sublist):
+        write = file.write
+        write("#define " + macro_name + "  " + repr(len(sublist)) + "\n\n")
+
+        write("  /* Values are offsets into the `" +
+              self.master_table + "' table */\n\n")
+        dump_array(write, "short", table_name, macro_name,
+                   [self.indices[name] for name in sublist],
+                   self.guard, 4, 14, self.encoding)
+
+
+# We store a dictionary in compressed form.  The dictionary is put into a
+# data structure called `trie' (because it has a tree-like appearance).
+# Consider, for example, that you want to store the following name
+# mapping:
+#
+#   A        => 1
+#   Aacute   => 6
+#   Abalon   => 2
+#   Abstract => 4
+#
+# It is possible to store the entries as follows.
+#
+#   A => 1
+#   |
+#   +-acute => 6
+#   |
+#   +-b
+#     |
+#     +-alon => 2
+#     |
+#     +-stract => 4
+#
+# We see that each node in the trie has:
+#
+# - one or more `letters'
+# - an optional value
+# - zero or more child nodes
+#
+# The first step is to call
+#
+#   root = StringNode( "", 0 )
+#   for word in map.values():
+#     root.add( word, map[word] )
+#
+# which creates a large trie where each node has only one children.
+#
+# Executing
+#
+#   root = root.optimize()
+#
+# optimizes the trie by merging the letters of successive nodes whenever
+# possible.
+#
+# Each node of the trie is stored as follows.
+#
+# - First the node's letter, according to the following scheme.  We
+#   use the fact that no name contains character codes > 127.
+#
+#     name         bitsize     description
+#     ----------------------------------------------------------------
+#     notlast            1     Set to 1 if this is not the last letter
+#                              in the word.
+#     ascii              7     The letter's ASCII value.
+#
+# - The letter is followed by a children count and the value of the
+#   current key (if any).  No node may have more than 127 children.
+#
+#     name         bitsize     description
+#     -----------------------------------------
+#     hasvalue           1     Set to 1 if a value follows.
+#     num_children       7     Number of children.  Can be 0 only if
+#                              `hasvalue' is set to 1.
+#     value            var     Optional value.
+#
+#   All values of a table have the same size, which is the smallest of
+#   16, 24, or 32 bits that can hold the largest value.  For the AGL,
+#   16 bits are enough since all entries are from the BMP.
+#
+# - A node is finished by a list of absolute offsets to the children.
+#   The lookup function does a binary search at the root node, whose
+#   children must thus be sorted in increasing order of their first
+#   letter.  Inner nodes are scanned linearly; their children are sorted
+#   alphabetically, too, unless a profile of lookup frequencies is given
+#   (see `weigh'): the most frequently visited children then come first.
+#   All offsets of a table have the same size, which is the smallest of 16,
+#   24, or 32 bits that can address the whole table (see `layout').  For
+#   the AGL, 16 bits are enough.
+#
+# For simplicity, all multi-byte quantities are stored in big-endian order.
+#
+# The root node has first letter = 0, and no value.
+#
+class StringNode:
+    def __init__(self, letter, value):
+        self.letter = letter
+        self.value = value
+        self.children = {}
+        self.weight = 0
+
+    def __cmp__(self, other):
+        return ord(self.letter[0]) - ord(other.letter[0])
+
+    def __lt__(self, other):
+        return self.letter[0] < other.letter[0]
+
+    def add(self, word, value):
+        if len(word) == 0:
+            self.value = value
+            return
+
+        letter = word[0]
+        word = word[1:]
+
+        if letter in self.children:
+            child = self.children[letter]
+        else:
+            child = StringNode(letter, 0)
+            self.children[letter] = child
+
+        child.add(word, value)
+
+    def optimize(self):
+        # optimize all children first
+        children = list(self.children.values())
+        self.children = {}
+
+        for child in children:
+            self.children[child.letter[0]] = child.optimize()
+
+        # don't optimize if there's a value,
+        # if we don't have any child or if we
+        # have more than one child
+        if (self.value != 0) or (not children) or len(children) > 1:
+            return self
+
+        child = children[0]
+
+        self.letter += child.letter
+        self.value = child.value
+        self.children = child.children
+
+        return self
+
+    def weigh(self, name, count):
+        """add `count' to the weight of all nodes visited by a lookup"""
+
+        node = self
+        n = 0
+        while n < len(name):
+            node = node.children.get(name[n])
+            if node is None or not name.startswith(node.letter, n):
+                break
+
+            node.weight += count
+            n += len(node.letter)
+
+    def sorted_children(self):
+        children = sorted(self.children.values())
+
+        # only inner nodes may be reordered
+        if self.letter:
+            children.sort(key=lambda child: -child.weight)
+
+        return children
+
+    def dump_debug(self, write, margin):
+        # this is used during debugging
+        line = margin + "+-"
+        if len(self.letter) == 0:
+            line += "<NOLETTER>"
+        else:
+            line += self.letter
+
+        if self.value:
+            line += " => " + repr(self.value)
+
+        write(line + "\n")
+
+        if self.children:
+            margin += "| "
+            for child in self.children.values():
+                child.dump_debug(write, margin)
+
+    def locate(self, index, offset_size=2, value_size=2):
+        self.index = index
+        if len(self.letter) > 0:
+            index += len(self.letter) + 1
+        else:
+            index += 2
+
+        if self.value != 0:
+            index += value_size
+
+        children = self.sorted_children()
+
+        index += offset_size * len(children)
+        for child in children:
+            index = child.locate(index, offset_size, value_size)
+
+        return index
+
+    def max_value(self):
+        return max([self.value] +
+                   [child.max_value() for child in self.children.values()])
+
+    def layout(self, value_size=2):
+        """locate all nodes and return the offset size in bytes"""
+
+        for offset_size in (2, 3, 4):
+            size = self.locate(0, offset_size, value_size)
+            # all offsets point to nodes, which start before the end
+            if size <= 1 << (8 * offset_size):
+                return offset_size
+
+        raise ValueError("trie too large (%d bytes)" % size)
+
+    def store(self, storage, offset_size=2, value_size=2):
+        # write the letters
+        length = len(self.letter)
+        if length == 0:
+            storage += struct.pack("B", 0)
+        else:
+            for n in range(length):
+                val = ord(self.letter[n])
+                if n < length - 1:
+                    val += 128
+                storage += struct.pack("B", val)
+
+        # write the count
+        children = self.sorted_children()
+
+        count = len(children)
+        if count > 127:
+            raise ValueError("node `%s' has too many children" % self.letter)
+
+        if self.value != 0:
+            storage += struct.pack("B", count + 128)
+            storage += struct.pack("!I", self.value)[4 - value_size:]
+        else:
+            storage += struct.pack("B", count)
+
+        for child in children:
+            if child.index >= 1 << (8 * offset_size):
+                raise ValueError("offset %d does not fit into %d bytes"
+                                 % (child.index, offset_size))
+            storage += struct.pack("!I", child.index)[4 - offset_size:]
+
+        for child in children:
+            storage = child.store(storage, offset_size, value_size)
+
+        return storage
+
+
+class Dictionary:
+    """a compressed dictionary mapping ASCII names to positive integers"""
+
+    def __init__(self, mapping, table_name, macro_prefix=None,
+                 profile=None):
+        self.table_name = table_name
+        self.macro_prefix = macro_prefix or table_name.upper()
+        self.mapping = mapping
+
+        root = StringNode("", 0)
+        for name, value in mapping.items():
+            if not name or not all(0 < ord(c) < 128 for c in name):
+                raise ValueError("invalid name `%s'" % name)
+            if not 0 < value < 1 << 32:
+                raise ValueError("invalid value %d for `%s'" % (value, name))
+            root.add(name, value)
+
+        self.root = root.optimize()
+
+        # `profile' maps names to lookup counts
+        if profile:
+            for name, count in profile.items():
+                self.root.weigh(name, count)
+
+        self.value_size = 2
+        while self.root.max_value() >= 1 << (8 * self.value_size):
+            self.value_size += 1
+
+        self.offset_size = self.root.layout(self.value_size)
+        self.data = self.root.store(bytearray(),
+                                    self.offset_size, self.value_size)
+
+    def read(self, p, size):
+        return int.from_bytes(self.data[p:p + size], "big")
+
+    def root_child(self, c):
+        """return the root's child for letter `c' (or None) and the number
+        of probes; the C code uses a binary search"""
+
+        data = self.data
+        probes = 0
+        low = 0
+        high = data[1]
+
+        while low < high:
+            mid = (low + high) >> 1
+            q = self.read(2 + mid * self.offset_size, self.offset_size)
+            probes += 1
+
+            if data[q] & 127 == c:
+                return q, probes
+            if data[q] & 127 < c:
+                low = mid + 1
+            else:
+                high = mid
+
+        return None, probes
+
+    def next_state(self, p, c):
+        """return the state after letter `c' (or None) and the number of
+        probes; `p' points to the letter matched last"""
+
+        data = self.data
+
+        if data[p] & 128:
+            p += 1
+            return (p if data[p] & 127 == c else None), 0
+
+        p += 1
+        count = data[p] & 127
+        if data[p] & 128:
+            p += self.value_size
+        p += 1
+
+        for n in range(count):
+            q = self.read(p + n * self.offset_size, self.offset_size)
+            if data[q] & 127 == c:
+                return q, n + 1
+
+        return None, count
+
+    def final_value(self, p):
+        """return the value of a name that ends at state `p'"""
+
+        if self.data[p] & 128 == 0 and self.data[p + 1] & 128:
+            return self.read(p + 2, self.value_size)
+
+        return 0
+
+    def lookup(self, name):
+        """return the value of `name' and the number of child probes
+
+        This is a reference implementation of the C lookup function; a
+        probe is the comparison of one child's first letter."""
+
+        if not name:
+            return 0, 0
+
+        p, probes = self.root_child(ord(name[0]))
+
+        for c in name[1:]:
+            if p is None:
+                break
+            p, n = self.next_state(p, ord(c))
+            probes += n
+
+        if p is None:
+            return 0, probes
+
+        return self.final_value(p), probes
+
+    def lookup_bulk(self, names):
+        """return the values of `names' and the total number of probes
+
+        This is a reference implementation of the C bulk lookup function.
+        It keeps the states along the path of the previous name and
+        resumes the search after the prefix shared with it."""
+
+        values = []
+        probes = 0
+        previous = ""
+        path = [None]  # path[k] is the state after k letters
+
+        for name in names:
+            k = 0
+            while (k < len(path) - 1 and k < len(name) and
+                   name[k] == previous[k]):
+                k += 1
+            del path[k + 1:]
+
+            if k == 0 and name:
+                p, n = self.root_child(ord(name[0]))
+                probes += n
+                if p is not None:
+                    path.append(p)
+                    k = 1
+
+            while 0 < k < len(name) and len(path) == k + 1:
+                p, n = self.next_state(path[k], ord(name[k]))
+                probes += n
+                if p is None:
+                    break
+                path.append(p)
+                k += 1
+
+            if len(path) == len(name) + 1 and name:
+                values.append(self.final_value(path[-1]))
+            else:
+                values.append(0)
+
+            previous = name
+
+        return values, probes
+
+    def average_probes(self, profile):
+        """return the average number of probes for the lookups of a
+        profile"""
+
+        total = 0
+        count = 0
+        for name, n in profile.items():
+            total += n * self.lookup(name)[1]
+            count += n
+
+        return total / count if count else 0.0
+
+    def dump_table(self, write, guard=None, encoding="decimal"):
+        data = self.data
+        if encoding == "string" and data[-1]:
+            # lookups never read past the trie, so a trailing null byte
+            # for the string literal's terminator doesn't hurt
+            data = data + b"\0"
+
+        dump_array(write, "unsigned char", self.table_name,
+                   repr(len(data)) + "L", data, guard,
+                   encoding=encoding)
+
+    def dump_lookup(self, write, function_name):
+        """write the lookup routine for the table"""
+
+        prefix = self.macro_prefix
+
+        write("  /*\n")
+        write("   * Children offsets in `%s' are %d bytes long,\n"
+              % (self.table_name, self.offset_size))
+        write("   * values are %d bytes long.\n" % self.value_size)
+        write("   */\n")
+        write("#define %s_OFFSET_SIZE  %d\n" % (prefix, self.offset_size))
+        write(read_macro(prefix + "_OFFSET", self.offset_size))
+        write("#define %s_VALUE_SIZE  %d\n" % (prefix, self.value_size))
+        write(read_macro(prefix + "_VALUE", self.value_size))
+        write("\n")
+
+        write(LOOKUP_FUNCTION % {"function": function_name,
+                                 "table": self.table_name,
+                                 "prefix": prefix,
+                                 "indent": " " * len(function_name)})
+
+    def dump_bulk_lookup(self, write, function_name):
+        """write a routine looking up many names at once
+
+        It needs the macros written by `dump_lookup'."""
+
+        write("#define %s_MAX_LENGTH  %d\n\n"
+              % (self.macro_prefix, max(len(name) for name in self.mapping)))
+
+        write(BULK_LOOKUP_FUNCTION % {"function": function_name,
+                                      "table": self.table_name,
+                                      "prefix": self.macro_prefix,
+                                      "indent": " " * len(function_name)})
+
+
+BULK_LOOKUP_FUNCTION = """\
+  /*
+   * Look up `count' null-terminated names and store their values (or 0)
+   * in `values'.  The search for a name resumes after the prefix it
+   * shares with the previous one, so sorted names are looked up faster.
+   */
+  static void
+  %(function)s( const char* const*  names,
+  %(indent)s  unsigned int        count,
+  %(indent)s  unsigned long*      values )
+  {
+    /* path[k] points to the letter matched by the k-th character */
+    const unsigned char*  path[%(prefix)s_MAX_LENGTH + 1];
+    const char*           previous = "";
+    unsigned int          depth    = 0;
+    unsigned int          i;
+
+
+    for ( i = 0; i < count; i++ )
+    {
+      const char*           name = names[i];
+      const unsigned char*  p;
+      unsigned int          k = 0;
+      int                   c;
+
+
+      while ( k < depth && name[k] && name[k] == previous[k] )
+        k++;
+
+      values[i] = 0;
+      previous  = name;
+      depth     = k;
+
+      if ( k == 0 )
+      {
+        int  num, min, max;
+
+
+        c = (unsigned char)name[0];
+        if ( c == 0 )
+          continue;
+
+        p   = %(table)s;
+        num = p[1];
+        p  += 2;
+
+        min = 0;
+        max = num;
+
+        while ( min < max )
+        {
+          int                   mid = ( min + max ) >> 1;
+          const unsigned char*  q   = p + mid * %(prefix)s_OFFSET_SIZE;
+          int                   c2;
+
+
+          q = %(table)s + %(prefix)s_OFFSET( q );
+
+          c2 = q[0] & 127;
+          if ( c2 == c )
+          {
+            path[1] = q;
+            depth   = k = 1;
+            break;
+          }
+          if ( c2 < c )
+            min = mid + 1;
+          else
+            max = mid;
+        }
+
+        if ( k == 0 )
+          continue;
+      }
+
+      for ( p = path[k]; name[k]; k++ )
+      {
+        /* no name in the table is longer */
+        if ( k == %(prefix)s_MAX_LENGTH )
+          goto NextName;
+
+        c = (unsigned char)name[k];
+        if ( p[0] & 128 )
+        {
+          p++;
+          if ( c != ( p[0] & 127 ) )
+            goto NextName;
+        }
+        else
+        {
+          const unsigned char*  q   = p + 1;
+          int                   num = q[0] & 127;
+
+
+          if ( q[0] & 128 )
+            q += %(prefix)s_VALUE_SIZE;
+          q++;
+
+          for ( ; num > 0; num--, q += %(prefix)s_OFFSET_SIZE )
+          {
+            p = %(table)s + %(prefix)s_OFFSET( q );
+            if ( c == ( p[0] & 127 ) )
+              break;
+          }
+          if ( num == 0 )
+            goto NextName;
+        }
+
+        path[k + 1] = p;
+        depth       = k + 1;
+      }
+
+      if ( ( p[0] & 128 ) == 0 && ( p[1] & 128 ) != 0 )
+        values[i] = %(prefix)s_VALUE( p + 2 );
+
+    NextName:
+      ;
+    }
+  }
+"""
+
+
+LOOKUP_FUNCTION = """\
+  /*
+   * This function searches the compressed table efficiently.
+   */
+  static unsigned long
+  %(function)s( const char*  name,
+  %(indent)s  const char*  limit )
+  {
+    int                   c = 0;
+    int                   count, min, max;
+    const unsigned char*  p = %(table)s;
+
+
+    if ( name == 0 || name >= limit )
+      goto NotFound;
+
+    c     = *name++;
+    count = p[1];
+    p    += 2;
+
+    min = 0;
+    max = count;
+
+    while ( min < max )
+    {
+      int                   mid = ( min + max ) >> 1;
+      const unsigned char*  q   = p + mid * %(prefix)s_OFFSET_SIZE;
+      int                   c2;
+
+
+      q = %(table)s + %(prefix)s_OFFSET( q );
+
+      c2 = q[0] & 127;
+      if ( c2 == c )
+      {
+        p = q;
+        goto Found;
+      }
+      if ( c2 < c )
+        min = mid + 1;
+      else
+        max = mid;
+    }
+    goto NotFound;
+
+  Found:
+    for (;;)
+    {
+      /* assert (*p & 127) == c */
+
+      if ( name >= limit )
+      {
+        if ( (p[0] & 128) == 0 &&
+             (p[1] & 128) != 0 )
+          return %(prefix)s_VALUE( p + 2 );
+
+        goto NotFound;
+      }
+      c = *name++;
+      if ( p[0] & 128 )
+      {
+        p++;
+        if ( c != (p[0] & 127) )
+          goto NotFound;
+
+        continue;
+      }
+
+      p++;
+      count = p[0] & 127;
+      if ( p[0] & 128 )
+        p += %(prefix)s_VALUE_SIZE;
+
+      p++;
+
+      for ( ; count > 0; count--, p += %(prefix)s_OFFSET_SIZE )
+      {
+        unsigned long         offset = %(prefix)s_OFFSET( p );
+        const unsigned char*  q      = %(table)s + offset;
+
+        if ( c == ( q[0] & 127 ) )
+        {
+          p = q;
+          goto NextIter;
+        }
+      }
+      goto NotFound;
+
+    NextIter:
+      ;
+    }
+
+  NotFound:
+    return 0;
+  }
+"""
+
+
+def read_macro(macro_name, size):
+    """return a C macro reading a big-endian value of `size' bytes"""
+
+    shifts = ["( (unsigned long)(p)[%d] << %d )" % (n, 8 * (size - 1 - n))
+              for n in range(size - 1)]
+    shifts.append("(unsigned long)(p)[%d]" % (size - 1))
+
+    return ("#define " + macro_name + "( p )  \\\n          ( " +
+            " | \\\n            ".join(shifts) + " )\n")
+
+
+def declaration_lines(qualifiers, array_name, size, suffix=""):
+    """return the declaration of an array, split after the type (like in
+    `fttrigon.c') if it doesn't fit into 80 columns"""
+
+    declarator = array_name + "[" + size + "]" + suffix
+    line = "  " + qualifiers + "  " + declarator
+    if len(line) < 80:
+        return line + "\n"
+
+    return "  " + qualifiers + "\n  " + declarator + "\n"
+
+
+def dump_declaration(write, c_type, array_name, size, guard=None):
+    """start the definition of a constant array
+
+    If `guard' is set, the array is declared `extern', and its data is only
+    emitted if the macro `guard' is defined.
+    """
+
+    if guard:
+        write("#ifndef  " + guard + "\n")
+        write("#ifdef  __cplusplus\n")
+        write('  extern "C"\n')
+        write("#else\n")
+        write("  extern\n")
+        write("#endif\n")
+        write("#endif\n")
+        write(declaration_lines("const " + c_type, array_name, size))
+        write("#ifdef  " + guard + "\n")
+        write("  =\n")
+    else:
+        write(declaration_lines("static const " + c_type, array_name, size,
+                                " ="))
+    write("  {\n")
+
+
+def dump_declaration_end(write, guard=None):
+    """end the definition of a constant array"""
+
+    if guard:
+        write("  }\n")
+        write("#endif /* " + guard + " */\n")
+        write("  ;\n\n\n")
+    else:
+        write("  };\n\n\n")
+
+
+# Arrays are written with one of the following encodings.
+#
+#   decimal  Right-aligned decimal numbers; the default.
+#   hex      Hexadecimal numbers with a `0x' prefix.
+#   string   String literals, one byte per character; only possible for
+#            arrays of (unsigned) char whose last element is zero, since
+#            C++ needs room for the literal's terminating null byte.
+#            Other arrays fall back to `hex'.
+#
+# Compilers parse long string literals much faster than a list of
+# thousands of numbers.
+#
+ARRAY_ENCODINGS = ("decimal", "hex", "string")
+
+# The output is written in chunks of at least this many characters.
+#
+CHUNK_SIZE = 65536
+
+# String literal spelling of each byte.  Octal escapes have at most three
+# digits and thus cannot swallow a following digit.  `?' is escaped to
+# avoid trigraphs.
+#
+string_escapes = ["\\%03o" % c if c < 32 or c > 126 or chr(c) in '"\\?'
+                  else chr(c) for c in range(256)]
+
+
+def write_rows(write, rows, separator=""):
+    """write the strings in `rows', joined by `separator', in chunks"""
+
+    chunk = []
+    size = 0
+    pending = ""
+
+    for row in rows:
+        chunk.append(row)
+        size += len(row)
+
+        if size >= CHUNK_SIZE:
+            write(pending + separator.join(chunk))
+            pending = separator
+            chunk = []
+            size = 0
+
+    if chunk:
+        write(pending + separator.join(chunk))
+
+
+def format_rows(values, item_format, columns):
+    """yield the rows of a number list, formatted in bulk"""
+
+    row_format = ",".join([item_format] * columns)
+    full = len(values) - len(values) % columns
+
+    for n in range(0, full, columns):
+        yield row_format % tuple(values[n:n + columns])
+
+    if full < len(values):
+        rest = values[full:]
+        yield ",".join([item_format] * len(rest)) % tuple(rest)
+
+
+def dump_array(write, c_type, array_name, size, values, guard=None,
+               width=3, columns=16, encoding="decimal"):
+    """dump a constant array of integers"""
+
+    if encoding not in ARRAY_ENCODINGS:
+        raise ValueError("unknown array encoding `%s'" % encoding)
+
+    if encoding == "string" and (c_type not in ("char", "unsigned char") or
+                                 not values or values[-1]):
+        encoding = "hex"
+
+    dump_declaration(write, c_type, array_name, size, guard)
+
+    if encoding == "string":
+        # the terminating null byte of the literal is the last element
+        data = bytes(values[:-1])
+        write('    "')
+        write_rows(write, ("".join([string_escapes[c]
+                                    for c in data[n:n + 64]])
+                           for n in range(0, len(data), 64)),
+                   '"\n    "')
+        write('"\n')
+
+    else:
+        if encoding == "hex":
+            digits = 2
+            while max(values, default=0) >= 1 << (4 * digits):
+                digits += 2
+            item_format = "0x%%0%dX" % digits
+        else:
+            item_format = "%%%dd" % width
+
+        write("    ")
+        write_rows(write, format_rows(values, item_format, columns),
+                   ",\n    ")
+        write("\n")
+
+    dump_declaration_end(write, guard)
+
+
+def dump_test(write, function_name, mapping, rounds=1000):
+    """write a test program for a lookup function, guarded by `TEST'"""
+
+    write("#ifdef TEST\n\n")
+    write("#include <stdio.h>\n")
+    write("#include <string.h>\n")
+    write("#include <time.h>\n\n")
+
+    write("  static const char* const  the_names[] =\n")
+    write("  {\n")
+    for name in mapping:
+        write('    "' + name + '",\n')
+    write("    0\n")
+    write("  };\n\n")
+
+    write("  static const unsigned long  the_values[] =\n")
+    write("  {\n")
+    for name in mapping:
+        write("    0x%XUL,\n" % mapping[name])
+    write("    0\n")
+    write("  };\n\n")
+
+    write("""\
+  int
+  main( void )
+  {
+    int                   result = 0;
+    const char* const*    names;
+    const unsigned long*  values;
+    unsigned long         sum    = 0;
+    long                  count  = 0;
+    clock_t               start;
+    int                   round;
+
+
+    for ( names = the_names, values = the_values; *names; names++, values++ )
+    {
+      const char*    name      = *names;
+      unsigned long  reference = *values;
+      unsigned long  value;
+
+
+      value = %(function)s( name, name + strlen( name ) );
+      if ( value != reference )
+      {
+        result = 1;
+        fprintf( stderr, "name '%%s' => %%04lx instead of %%04lx\\n",
+                         name, value, reference );
+      }
+    }
+
+    start = clock();
+    for ( round = 0; round < %(rounds)d; round++ )
+    {
+      for ( names = the_names; *names; names++, count++ )
+        sum += %(function)s( *names, *names + strlen( *names ) );
+    }
+
+    printf( "%(function)s: %%.1f ns/lookup (checksum %%lu)\\n",
+            1e9 * (double)( clock() - start ) / CLOCKS_PER_SEC / count,
+            sum );
+
+    return result;
+  }
+
+#endif /* TEST */
+""" % {"function": function_name, "rounds": rounds})
+
+
+def read_mapping(filename):
+    """read a `name;value' list"""
+
+    mapping = {}
+
+    with open(filename) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            name, value = line.split(";")
+            mapping[name.strip()] = int(value.strip(), 0)
+
+    return mapping
+
+
+def update_file(filename, text, check=False):
+    """write `text' to `filename' unless the file already holds it
+
+    The contents are compared by their SHA-256 digests.  An unchanged
+    file is left alone so that its modification time does not trigger
+    recompilation.  With `check' set, nothing is written.  Return False
+    if the file was (or, with `check', would have been) out of date."""
+
+    data = text.encode("ascii")
+    digest = hashlib.sha256(data).digest()
+
+    try:
+        with open(filename, "rb") as f:
+            if hashlib.sha256(f.read()).digest() == digest:
+                return True
+    except FileNotFoundError:
+        pass
+
+    if not check:
+        with open(filename, "wb") as f:
+            f.write(data)
+
+    return False
+
+
+def main():
+    """main program body"""
+
+    args = sys.argv[1:]
+    test = "--test" in args
+    if test:
+        args.remove("--test")
+
+    encoding = "decimal"
+    profile = None
+    for arg in args[:]:
+        if arg.startswith("--encoding="):
+            encoding = arg[len("--encoding="):]
+            args.remove(arg)
+        elif arg.startswith("--profile="):
+            profile = read_mapping(arg[len("--profile="):])
+            args.remove(arg)
+
+    if len(args) != 4 or encoding not in ARRAY_ENCODINGS:
+        print(__doc__ % sys.argv[0])
+        sys.exit(1)
+
+    input_file, output_file, table_name, function_name = args
+
+    try:
+        dictionary = Dictionary(read_mapping(input_file), table_name, None,
+                                profile)
+    except ValueError as e:
+        sys.stderr.write("%s: %s\n" % (input_file, e))
+        sys.exit(1)
+
+    file = io.StringIO()
+    write = file.write
+
+    write("/*\n")
+    write(" * %s\n" % os.path.basename(output_file))
+    write(" *\n")
+    write(" *   Compressed dictionary generated from `%s'.\n"
+          % os.path.basename(input_file))
+    write(" */\n")
+    write("\n")
+    write("\n")
+    write("  /* This file has been generated automatically -- "
+          "do not edit! */\n")
+    write("\n")
+    write("\n")
+
+    dictionary.dump_table(write, encoding=encoding)
+    dictionary.dump_lookup(write, function_name)
+
+    if test:
+        write("\n\n")
+        dump_test(write, function_name, dictionary.mapping)
+
+    write("\n/* END */\n")
+
+    update_file(output_file, file.getvalue())
+
+
+if __name__ == "__main__":
+    main()
+
+# END
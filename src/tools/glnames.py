@@ -14,18 +14,39 @@
 
 
 """
-usage: %s <output-file>
+usage: %s [--check] [--encoding=<encoding>] [--profile=<file>]
+          <output-file>
 
   This python script generates the glyph names tables defined in the
   `psnames' module.
 
-  Its single argument is the name of the header file to be created.
+  Its argument is the name of the header file to be created.  The file
+  is only rewritten if its contents change, so that an unchanged table
+  does not cause recompilation.
+
+  With option `--check', the file is not written; instead, the script
+  exits with status 1 if it doesn't match the generated tables.
+
+  Option `--encoding' selects how the arrays are written: `decimal' (the
+  default), `hex', or `string' (see `dictcomp.py').  The last one makes
+  the header compile faster.
+
+  Option `--profile' takes a file with glyph name frequencies, one
+  `name;count' entry per line (for example, collected from a corpus of
+  PDF files and Type 1 fonts).  As in `ps_unicode_value', suffixes like
+  `.sc' are ignored, and so are `uniXXXX' names.  The children of inner
+  nodes of the AGL trie are then ordered by decreasing frequency so that
+  the linear searches in `ft_get_adobe_glyph_index' end earlier, and the
+  average number of probes per lookup is reported.
 """
 
+import io
 import os.path
-import struct
 import sys
 
+from dictcomp import ARRAY_ENCODINGS, Dictionary, StringTable, dump_array, \
+                     dump_test, read_mapping, update_file
+
 # This table lists the glyphs according to the Macintosh specification.
 # It is used by the TrueType Postscript names table.
 #
@@ -4891,400 +4912,205 @@ a9;2720
 """
 
 
-# string table management
-#
-class StringTable:
-    def __init__(self, name_list, master_table_name):
-        self.names = name_list
-        self.master_table = master_table_name
-        self.indices = {}
-        index = 0
-
-        for name in name_list:
-            self.indices[name] = index
-            index += len(name) + 1
-
-        self.total = index
-
-    def dump(self, file):
-        write = file.write
-        write("#ifndef  DEFINE_PS_TABLES_DATA\n")
-        write("#ifdef  __cplusplus\n")
-        write('  extern "C"\n')
-        write("#else\n")
-        write("  extern\n")
-        write("#endif\n")
-        write("#endif\n")
-        write("  const char  " + self.master_table +
-              "[" + repr(self.total) + "]\n")
-        write("#ifdef  DEFINE_PS_TABLES_DATA\n")
-        write("  =\n")
-        write("  {\n")
-
-        line = ""
-        for name in self.names:
-            line += "    '"
-            line += "','".join(list(name))
-            line += "', 0,\n"
-
-        write(line)
-        write("  }\n")
-        write("#endif /* DEFINE_PS_TABLES_DATA */\n")
-        write("  ;\n\n\n")
-
-    def dump_sublist(self, file, table_name, macro_name, sublist):
-        write = file.write
-        write("#define " + macro_name + "  " + repr(len(sublist)) + "\n\n")
-
-        write("  /* Values are offsets into the `" +
-              self.master_table + "' table */\n\n")
-        write("#ifndef  DEFINE_PS_TABLES_DATA\n")
-        write("#ifdef  __cplusplus\n")
-        write('  extern "C"\n')
-        write("#else\n")
-        write("  extern\n")
-        write("#endif\n")
-        write("#endif\n")
-        write("  const short  " + table_name +
-              "[" + macro_name + "]\n")
-        write("#ifdef  DEFINE_PS_TABLES_DATA\n")
-        write("  =\n")
-        write("  {\n")
-
-        line = "    "
-        comma = ""
-        col = 0
-
-        for name in sublist:
-            line += comma
-            line += "%4d" % self.indices[name]
-            col += 1
-            comma = ","
-            if col == 14:
-                col = 0
-                comma = ",\n    "
-
-        write(line)
-        write("\n")
-        write("  }\n")
-        write("#endif /* DEFINE_PS_TABLES_DATA */\n")
-        write("  ;\n\n\n")
-
-
-# We now store the Adobe Glyph List in compressed form.  The list is put
-# into a data structure called `trie' (because it has a tree-like
-# appearance).  Consider, for example, that you want to store the
-# following name mapping:
-#
-#   A        => 1
-#   Aacute   => 6
-#   Abalon   => 2
-#   Abstract => 4
-#
-# It is possible to store the entries as follows.
-#
-#   A => 1
-#   |
-#   +-acute => 6
-#   |
-#   +-b
-#     |
-#     +-alon => 2
-#     |
-#     +-stract => 4
-#
-# We see that each node in the trie has:
-#
-# - one or more `letters'
-# - an optional value
-# - zero or more child nodes
-#
-# The first step is to call
-#
-#   root = StringNode( "", 0 )
-#   for word in map.values():
-#     root.add( word, map[word] )
-#
-# which creates a large trie where each node has only one children.
-#
-# Executing
-#
-#   root = root.optimize()
-#
-# optimizes the trie by merging the letters of successive nodes whenever
-# possible.
-#
-# Each node of the trie is stored as follows.
-#
-# - First the node's letter, according to the following scheme.  We
-#   use the fact that in the AGL no name contains character codes > 127.
-#
-#     name         bitsize     description
-#     ----------------------------------------------------------------
-#     notlast            1     Set to 1 if this is not the last letter
-#                              in the word.
-#     ascii              7     The letter's ASCII value.
-#
-# - The letter is followed by a children count and the value of the
-#   current key (if any).  Again we can do some optimization because all
-#   AGL entries are from the BMP; this means that 16 bits are sufficient
-#   to store its Unicode values.  Additionally, no node has more than
-#   127 children.
-#
-#     name         bitsize     description
-#     -----------------------------------------
-#     hasvalue           1     Set to 1 if a 16-bit Unicode value follows.
-#     num_children       7     Number of children.  Can be 0 only if
-#                              `hasvalue' is set to 1.
-#     value             16     Optional Unicode value.
-#
-# - A node is finished by a list of 16bit absolute offsets to the
-#   children, which must be sorted in increasing order of their first
-#   letter.
-#
-# For simplicity, all 16bit quantities are stored in big-endian order.
-#
-# The root node has first letter = 0, and no value.
-#
-class StringNode:
-    def __init__(self, letter, value):
-        self.letter = letter
-        self.value = value
-        self.children = {}
-
-    def __cmp__(self, other):
-        return ord(self.letter[0]) - ord(other.letter[0])
+def adobe_glyph_values():
+    """return the list of glyph names and their unicode values"""
 
-    def __lt__(self, other):
-        return self.letter[0] < other.letter[0]
+    lines = adobe_glyph_list.split("\n")
+    glyphs = []
+    values = []
 
-    def add(self, word, value):
-        if len(word) == 0:
-            self.value = value
-            return
+    for line in lines:
+        if line:
+            fields = line.split(';')
+            #     print fields[1] + ' - ' + fields[0]
+            subfields = fields[1].split(' ')
+            if len(subfields) == 1:
+                glyphs.append(fields[0])
+                values.append(fields[1])
 
-        letter = word[0]
-        word = word[1:]
+    return glyphs, values
 
-        if letter in self.children:
-            child = self.children[letter]
-        else:
-            child = StringNode(letter, 0)
-            self.children[letter] = child
 
-        child.add(word, value)
+def adobe_glyph_sequences():
+    """return the glyph names mapping to more than one unicode value"""
 
-    def optimize(self):
-        # optimize all children first
-        children = list(self.children.values())
-        self.children = {}
+    lines = adobe_glyph_list.split("\n")
+    glyphs = []
+    sequences = []
 
-        for child in children:
-            self.children[child.letter[0]] = child.optimize()
+    for line in lines:
+        if line:
+            fields = line.split(';')
+            subfields = fields[1].split(' ')
+            if len(subfields) > 1:
+                glyphs.append(fields[0])
+                sequences.append([int(v, 16) for v in subfields])
 
-        # don't optimize if there's a value,
-        # if we don't have any child or if we
-        # have more than one child
-        if (self.value != 0) or (not children) or len(children) > 1:
-            return self
+    return glyphs, sequences
 
-        child = children[0]
 
-        self.letter += child.letter
-        self.value = child.value
-        self.children = child.children
+class SequenceTable:
+    """a side table for glyph names mapping to several characters"""
 
-        return self
+    # Trie values in the surrogate area cannot be valid AGL values; we use
+    # them to store `SEQUENCE_BASE' plus an offset into this table.  Each
+    # entry is a length followed by that many code points.
+    SEQUENCE_BASE = 0xD800
+    SEQUENCE_LIMIT = 0xE000
 
-    def dump_debug(self, write, margin):
-        # this is used during debugging
-        line = margin + "+-"
-        if len(self.letter) == 0:
-            line += "<NOLETTER>"
-        else:
-            line += self.letter
+    def __init__(self):
+        self.table = []
+        self.offsets = {}
 
-        if self.value:
-            line += " => " + repr(self.value)
+    def add(self, sequence):
+        """return the trie value to be used for `sequence'"""
 
-        write(line + "\n")
+        key = tuple(sequence)
+        if key not in self.offsets:
+            self.offsets[key] = len(self.table)
+            self.table.append(len(sequence))
+            self.table.extend(sequence)
 
-        if self.children:
-            margin += "| "
-            for child in self.children.values():
-                child.dump_debug(write, margin)
+        value = self.SEQUENCE_BASE + self.offsets[key]
+        if value >= self.SEQUENCE_LIMIT:
+            sys.stderr.write("too many AGL sequences\n")
+            sys.exit(1)
 
-    def locate(self, index):
-        self.index = index
-        if len(self.letter) > 0:
-            index += len(self.letter) + 1
-        else:
-            index += 2
+        return value
 
-        if self.value != 0:
-            index += 2
 
-        children = list(self.children.values())
-        children.sort()
+def filter_glyph_names(alist, filter):
+    """filter `alist' by taking _out_ all glyph names that are in `filter'"""
 
-        index += 2 * len(children)
-        for child in children:
-            index = child.locate(index)
+    count = 0
+    extras = []
 
-        return index
+    for name in alist:
+        try:
+            filtered_index = filter.index(name)
+        except:
+            extras.append(name)
 
-    def store(self, storage):
-        # write the letters
-        length = len(self.letter)
-        if length == 0:
-            storage += struct.pack("B", 0)
-        else:
-            for n in range(length):
-                val = ord(self.letter[n])
-                if n < length - 1:
-                    val += 128
-                storage += struct.pack("B", val)
+    return extras
 
-        # write the count
-        children = list(self.children.values())
-        children.sort()
 
-        count = len(children)
+def read_profile(filename):
+    """read a glyph name frequency profile"""
 
-        if self.value != 0:
-            storage += struct.pack("!BH", count + 128, self.value)
-        else:
-            storage += struct.pack("B", count)
+    hex_digits = "0123456789ABCDEF"
+    profile = {}
 
-        for child in children:
-            storage += struct.pack("!H", child.index)
+    for name, count in read_mapping(filename).items():
+        # `ps_unicode_value' handles `uniXXXX' and `uXXXX' names without
+        # the AGL, skips names starting with a dot, and looks up `a' for
+        # `a.sc'
+        base = name.split(".")[0]
+        if not base:
+            continue
+        if (base.startswith("uni") and len(base) == 7 and
+                all(c in hex_digits for c in base[3:])):
+            continue
+        if (base.startswith("u") and 5 <= len(base) <= 7 and
+                all(c in hex_digits for c in base[1:])):
+            continue
 
-        for child in children:
-            storage = child.store(storage)
+        profile[base] = profile.get(base, 0) + count
 
-        return storage
+    return profile
 
 
-def adobe_glyph_values():
-    """return the list of glyph names and their unicode values"""
+def dump_encoding(file, encoding_name, encoding_list, array_encoding):
+    """dump a given encoding"""
 
-    lines = adobe_glyph_list.split("\n")
-    glyphs = []
-    values = []
+    write = file.write
+    write("  /* the following are indices into the SID name table */\n")
+    dump_array(write, "unsigned short", encoding_name,
+               repr(len(encoding_list)), encoding_list,
+               "DEFINE_PS_TABLES_DATA", encoding=array_encoding)
 
-    for line in lines:
-        if line:
-            fields = line.split(';')
-            #     print fields[1] + ' - ' + fields[0]
-            subfields = fields[1].split(' ')
-            if len(subfields) == 1:
-                glyphs.append(fields[0])
-                values.append(fields[1])
 
-    return glyphs, values
+def standard_unicode_values(names, agl_glyphs, agl_values):
+    """return the Unicode value of each name, as `ps_unicode_value' does"""
 
+    agl = dict(zip(agl_glyphs, agl_values))
+    values = []
 
-def filter_glyph_names(alist, filter):
-    """filter `alist' by taking _out_ all glyph names that are in `filter'"""
+    for name in names:
+        # `ps_unicode_value' handles `uniXXXX' and `uXXXX[XX]' names and
+        # glyph variants specially; make sure that no standard name needs
+        # this so that a plain AGL lookup gives the same result
+        assert not (name.startswith("u") and
+                    name[1:2] in "0123456789ABCDEF" and
+                    name[1:2] != ""), name
+        assert "." not in name[1:] or name.split(".")[0] not in agl, name
+
+        if name in agl:
+            values.append(int(agl[name], 16))
+        else:
+            values.append(0)
 
-    count = 0
-    extras = []
+    return values
 
-    for name in alist:
-        try:
-            filtered_index = filter.index(name)
-        except:
-            extras.append(name)
 
-    return extras
+def dump_unicode_map(file, string_table, names, values, array_encoding):
+    """dump the Unicode to standard glyph name mapping"""
 
+    # only names with a Unicode value are stored, sorted by that value;
+    # ties are sorted by name offset to make the result deterministic
+    entries = sorted((value, string_table.indices[name])
+                     for name, value in zip(names, values) if value)
+    count = len(entries)
 
-def dump_encoding(file, encoding_name, encoding_list):
-    """dump a given encoding"""
+    # `ranks' lists positions in `entries', sorted by name offset
+    ranks = sorted(range(count), key=lambda n: entries[n][1])
 
     write = file.write
-    write("  /* the following are indices into the SID name table */\n")
-    write("#ifndef  DEFINE_PS_TABLES_DATA\n")
-    write("#ifdef  __cplusplus\n")
-    write('  extern "C"\n')
-    write("#else\n")
-    write("  extern\n")
-    write("#endif\n")
-    write("#endif\n")
-    write("  const unsigned short  " + encoding_name +
-          "[" + repr(len(encoding_list)) + "]\n")
-    write("#ifdef  DEFINE_PS_TABLES_DATA\n")
-    write("  =\n")
-    write("  {\n")
-
-    line = "    "
-    comma = ""
-    col = 0
-    for value in encoding_list:
-        line += comma
-        line += "%3d" % value
-        comma = ","
-        col += 1
-        if col == 16:
-            col = 0
-            comma = ",\n    "
-
-    write(line)
-    write("\n")
-    write("  }\n")
-    write("#endif /* DEFINE_PS_TABLES_DATA */\n")
-    write("  ;\n\n\n")
-
-
-def dump_array(the_array, write, array_name):
-    """dumps a given encoding"""
-
-    write("#ifndef  DEFINE_PS_TABLES_DATA\n")
-    write("#ifdef  __cplusplus\n")
-    write('  extern "C"\n')
-    write("#else\n")
-    write("  extern\n")
-    write("#endif\n")
-    write("#endif\n")
-    write("  const unsigned char  " + array_name +
-          "[" + repr(len(the_array)) + "L]\n")
-    write("#ifdef  DEFINE_PS_TABLES_DATA\n")
-    write("  =\n")
-    write("  {\n")
-
-    line = ""
-    comma = "    "
-    col = 0
-
-    for value in the_array:
-        line += comma
-        line += "%3d" % value
-        comma = ","
-        col += 1
-
-        if col == 16:
-            col = 0
-            comma = ",\n    "
-
-        if len(line) > 1024:
-            write(line)
-            line = ""
-
-    write(line)
-    write("\n")
-    write("  }\n")
-    write("#endif /* DEFINE_PS_TABLES_DATA */\n")
-    write("  ;\n\n\n")
+    write("#define FT_NUM_STANDARD_UNICODES  " + repr(count) + "\n\n")
+
+    tables = [("unsigned short", "ft_standard_unicodes",
+               "Unicode values of standard glyph names, in increasing order",
+               [e[0] for e in entries]),
+              ("short", "ft_standard_unicode_names",
+               "Offsets into the `" + string_table.master_table +
+               "' table,\n   * one for each entry in `ft_standard_unicodes'",
+               [e[1] for e in entries]),
+              ("unsigned short", "ft_standard_name_ranks",
+               "Indices into `ft_standard_unicode_names', sorted by the\n"
+               "   * name offsets",
+               ranks)]
+
+    for c_type, table_name, comment, table in tables:
+        write("  /*\n   * " + comment + ".\n   */\n\n")
+        dump_array(write, c_type, table_name, "FT_NUM_STANDARD_UNICODES",
+                   table, "DEFINE_PS_TABLES_DATA", 5, 12, array_encoding)
 
 
 def main():
     """main program body"""
 
-    if len(sys.argv) != 2:
+    args = sys.argv[1:]
+    check = "--check" in args
+    if check:
+        args.remove("--check")
+
+    array_encoding = "decimal"
+    profile = None
+    for arg in args[:]:
+        if arg.startswith("--encoding="):
+            array_encoding = arg[len("--encoding="):]
+            args.remove(arg)
+        elif arg.startswith("--profile="):
+            profile = read_profile(arg[len("--profile="):])
+            args.remove(arg)
+
+    if len(args) != 1 or array_encoding not in ARRAY_ENCODINGS:
         print(__doc__ % sys.argv[0])
         sys.exit(1)
 
-    file = open(sys.argv[1], "w")
+    output_file = args[0]
+
+    # render everything into memory first; see `update_file'
+    file = io.StringIO()
     write = file.write
 
     count_sid = len(sid_standard_names)
@@ -5301,13 +5127,13 @@ def main():
     mac_extras_count = len(mac_extras)
     base_list = mac_extras + sid_standard_names
 
-    write("/*\n")
+    write("/" + "*" * 76 + "\n")
     write(" *\n")
-    write(" * %-71s\n" % os.path.basename(sys.argv[1]))
+    write(" * %s\n" % os.path.basename(output_file))
     write(" *\n")
     write(" *   PostScript glyph names.\n")
     write(" *\n")
-    write(" * Copyright 2005-2022 by\n")
+    write(" * Copyright (C) 2005-2023 by\n")
     write(" * David Turner, Robert Wilhelm, and Werner Lemberg.\n")
     write(" *\n")
     write(" * This file is part of the FreeType project, and may only be "
@@ -5329,7 +5155,8 @@ def main():
 
     # dump final glyph list (mac extras + sid standard names)
     #
-    st = StringTable(base_list, "ft_standard_glyph_names")
+    st = StringTable(base_list, "ft_standard_glyph_names",
+                     "DEFINE_PS_TABLES_DATA", array_encoding)
 
     st.dump(file)
     st.dump_sublist(file, "ft_mac_names",
@@ -5337,20 +5164,30 @@ def main():
     st.dump_sublist(file, "ft_sid_names",
                     "FT_NUM_SID_NAMES", sid_standard_names)
 
-    dump_encoding(file, "t1_standard_encoding", t1_standard_encoding)
-    dump_encoding(file, "t1_expert_encoding", t1_expert_encoding)
+    dump_encoding(file, "t1_standard_encoding", t1_standard_encoding,
+                  array_encoding)
+    dump_encoding(file, "t1_expert_encoding", t1_expert_encoding,
+                  array_encoding)
 
     # dump the AGL in its compressed form
     #
     agl_glyphs, agl_values = adobe_glyph_values()
-    dictionary = StringNode("", 0)
+    mapping = {}
 
     for g in range(len(agl_glyphs)):
-        dictionary.add(agl_glyphs[g], eval("0x" + agl_values[g]))
+        mapping[agl_glyphs[g]] = int(agl_values[g], 16)
+
+    sequences = SequenceTable()
+    for glyph, sequence in zip(*adobe_glyph_sequences()):
+        mapping[glyph] = sequences.add(sequence)
+
+    dictionary = Dictionary(mapping, "ft_adobe_glyph_list", None, profile)
 
-    dictionary = dictionary.optimize()
-    dict_len = dictionary.locate(0)
-    dict_array = dictionary.store(b"")
+    if profile:
+        unsorted = Dictionary(mapping, "ft_adobe_glyph_list")
+        print("average probes per AGL lookup: %.2f (alphabetical: %.2f)"
+              % (dictionary.average_probes(profile),
+                 unsorted.average_probes(profile)))
 
     write("""\
   /*
@@ -5366,168 +5203,148 @@ def main():
 
 """)
 
-    dump_array(dict_array, write, "ft_adobe_glyph_list")
+    dictionary.dump_table(write, "DEFINE_PS_TABLES_DATA", array_encoding)
 
-    # write the lookup routine now
-    #
     write("""\
-#ifdef  DEFINE_PS_TABLES
   /*
-   * This function searches the compressed table efficiently.
+   * AGL entries mapping to more than one character have a trie value
+   * of 0xD800 plus an offset into this table, which holds the sequence
+   * length followed by the code points.
    */
-  static unsigned long
-  ft_get_adobe_glyph_index( const char*  name,
-                            const char*  limit )
-  {
-    int                   c = 0;
-    int                   count, min, max;
-    const unsigned char*  p = ft_adobe_glyph_list;
 
+""")
 
-    if ( name == 0 || name >= limit )
-      goto NotFound;
+    dump_array(write, "unsigned short", "ft_adobe_glyph_sequences",
+               repr(len(sequences.table)), sequences.table,
+               "DEFINE_PS_TABLES_DATA", 5, 12, array_encoding)
 
-    c     = *name++;
-    count = p[1];
-    p    += 2;
+    # dump the reverse mapping for the standard glyph names
+    #
+    dump_unicode_map(file, st, base_list,
+                     standard_unicode_values(base_list,
+                                             agl_glyphs, agl_values),
+                     array_encoding)
 
-    min = 0;
-    max = count;
+    # write the lookup routine now
+    #
+    write("#ifdef  DEFINE_PS_TABLES\n")
+    dictionary.dump_lookup(write, "ft_adobe_glyph_list_value")
+    write("""\
 
-    while ( min < max )
-    {
-      int                   mid = ( min + max ) >> 1;
-      const unsigned char*  q   = p + mid * 2;
-      int                   c2;
 
+  /*
+   * Get the Unicode values for a given glyph name.  This function stores
+   * up to `max_values' values in `values' and returns their total
+   * number, or 0 if the name is not in the AGL.
+   */
+  static int
+  ft_get_adobe_glyph_sequence( const char*     name,
+                               const char*     limit,
+                               unsigned long*  values,
+                               int             max_values )
+  {
+    unsigned long          value = ft_adobe_glyph_list_value( name, limit );
+    const unsigned short*  seq;
+    int                    len, n;
 
-      q = ft_adobe_glyph_list + ( ( (int)q[0] << 8 ) | q[1] );
 
-      c2 = q[0] & 127;
-      if ( c2 == c )
-      {
-        p = q;
-        goto Found;
-      }
-      if ( c2 < c )
-        min = mid + 1;
-      else
-        max = mid;
-    }
-    goto NotFound;
+    if ( value == 0 )
+      return 0;
 
-  Found:
-    for (;;)
+    if ( value < 0xD800UL || value >= 0xE000UL )
     {
-      /* assert (*p & 127) == c */
-
-      if ( name >= limit )
-      {
-        if ( (p[0] & 128) == 0 &&
-             (p[1] & 128) != 0 )
-          return (unsigned long)( ( (int)p[2] << 8 ) | p[3] );
+      if ( max_values > 0 )
+        values[0] = value;
+      return 1;
+    }
 
-        goto NotFound;
-      }
-      c = *name++;
-      if ( p[0] & 128 )
-      {
-        p++;
-        if ( c != (p[0] & 127) )
-          goto NotFound;
+    seq = ft_adobe_glyph_sequences + ( value - 0xD800UL );
+    len = seq[0];
+    for ( n = 0; n < len && n < max_values; n++ )
+      values[n] = seq[n + 1];
 
-        continue;
-      }
+    return len;
+  }
 
-      p++;
-      count = p[0] & 127;
-      if ( p[0] & 128 )
-        p += 2;
 
-      p++;
+  /*
+   * Return the Unicode value for a given glyph name, or 0 if the name is
+   * not in the AGL or maps to more than one character.
+   */
+  static unsigned long
+  ft_get_adobe_glyph_index( const char*  name,
+                            const char*  limit )
+  {
+    unsigned long  value;
 
-      for ( ; count > 0; count--, p += 2 )
-      {
-        int                   offset = ( (int)p[0] << 8 ) | p[1];
-        const unsigned char*  q      = ft_adobe_glyph_list + offset;
-
-        if ( c == ( q[0] & 127 ) )
-        {
-          p = q;
-          goto NextIter;
-        }
-      }
-      goto NotFound;
 
-    NextIter:
-      ;
-    }
+    if ( ft_get_adobe_glyph_sequence( name, limit, &value, 1 ) == 1 )
+      return value;
 
-  NotFound:
     return 0;
   }
-#endif /* DEFINE_PS_TABLES */
-
-#endif /* FT_CONFIG_OPTION_ADOBE_GLYPH_LIST */
 
 """)
 
-    if 0:  # generate unit test, or don't
-        #
-        # now write the unit test to check that everything works OK
-        #
-        write("#ifdef TEST\n\n")
+    # the bulk lookup is only compiled on request to avoid warnings about
+    # unused functions
+    write("#ifdef  DEFINE_PS_TABLES_BULK\n\n")
+    dictionary.dump_bulk_lookup(write, "ft_adobe_glyph_list_values")
+    write("""
 
-        write("static const char* const  the_names[] = {\n")
-        for name in agl_glyphs:
-            write('  "' + name + '",\n')
-        write("  0\n};\n")
+  /*
+   * Get the Unicode values for `count' glyph names, as
+   * `ft_get_adobe_glyph_index' does for a single one.  Sort the names to
+   * make this faster.
+   */
+  static void
+  ft_get_adobe_glyph_indices( const char* const*  names,
+                              unsigned int        count,
+                              unsigned long*      values )
+  {
+    unsigned int  i;
 
-        write("static const unsigned long  the_values[] = {\n")
-        for val in agl_values:
-            write('  0x' + val + ',\n')
-        write("  0\n};\n")
 
-        write("""
-#include <stdlib.h>
-#include <stdio.h>
-#include <string.h>
+    ft_adobe_glyph_list_values( names, count, values );
 
-int
-main( void )
-{
-int                   result = 0;
-const char* const*    names  = the_names;
-const unsigned long*  values = the_values;
+    for ( i = 0; i < count; i++ )
+    {
+      if ( values[i] >= 0xD800UL && values[i] < 0xE000UL )
+      {
+        const unsigned short*  seq = ft_adobe_glyph_sequences +
+                                       ( values[i] - 0xD800UL );
 
 
-for ( ; *names; names++, values++ )
-{
-  const char*    name      = *names;
-  unsigned long  reference = *values;
-  unsigned long  value;
+        values[i] = seq[0] == 1 ? seq[1] : 0;
+      }
+    }
+  }
 
+#endif /* DEFINE_PS_TABLES_BULK */
+#endif /* DEFINE_PS_TABLES */
 
-  value = ft_get_adobe_glyph_index( name, name + strlen( name ) );
-  if ( value != reference )
-  {
-    result = 1;
-    fprintf( stderr, "name '%s' => %04x instead of %04x\\n",
-                     name, value, reference );
-  }
-}
+#endif /* FT_CONFIG_OPTION_ADOBE_GLYPH_LIST */
 
-return result;
-}
 """)
 
-        write("#endif /* TEST */\n")
+    if 0:  # generate unit test, or don't
+        #
+        # now write the unit test to check that everything works OK
+        #
+        dump_test(write, "ft_adobe_glyph_list_value", mapping)
 
     write("\n/* END */\n")
 
+    if not update_file(output_file, file.getvalue(), check):
+        if check:
+            sys.stderr.write("%s is out of date; run `%s %s'\n"
+                             % (output_file, sys.argv[0], output_file))
+            sys.exit(1)
+
 
 # Now run the main routine
 #
-main()
+if __name__ == "__main__":
+    main()
 
 # END
@@ -5,11 +5,28 @@ from __future__ import print_function
 
 import argparse
 import atexit
+import concurrent.futures
+import errno
+import gzip
+import io
+import lzma
 import os
+import queue
+import re
 import shutil
+import stat
 import subprocess
 import sys
+import tarfile
 import tempfile
+import threading
+import time
+import zipfile
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 _TOP_DIR = os.path.abspath(os.path.join(__file__, "..", "..", ".."))
 _SCRIPT_DIR = os.path.dirname(os.path.join(_TOP_DIR, "builds", "meson", ""))
@@ -30,6 +47,369 @@ def is_git_dir_clean(git_dir):
     return len(out) == 0
 
 
+# Files that are not distributed.
+_EXCLUDED_FILES = (".gitignore", ".mailmap")
+
+# The Linux `FICLONE' ioctl, which makes a copy-on-write clone of a file.
+_FICLONE = 0x40049409
+
+# Set to False after the first clone that the file system rejects.
+_reflink_supported = fcntl is not None and sys.platform.startswith("linux")
+
+
+def reflink_or_copy(src, dst):
+    """Clone |src| to |dst| if the file system supports it, otherwise copy
+    it."""
+    global _reflink_supported
+
+    with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+        cloned = False
+        if _reflink_supported:
+            try:
+                fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+                cloned = True
+            except OSError as e:
+                if e.errno not in (
+                    errno.EBADF,
+                    errno.EINVAL,
+                    errno.ENOTTY,
+                    errno.EOPNOTSUPP,
+                    errno.EXDEV,
+                ):
+                    raise
+                _reflink_supported = False
+        if not cloned:
+            shutil.copyfileobj(src_file, dst_file)
+    shutil.copymode(src, dst)
+
+
+def link_or_copy(src, dst):
+    """Hard-link |src| to |dst|, or copy it if that is not possible."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)
+
+
+def stage_files(git_dir, source_files, dst_dir, mode):
+    """Put |source_files| from |git_dir| into |dst_dir|.  |mode| is one of
+    `copy', `link' (hard links), or `reflink' (copy-on-write clones)."""
+    stage = {
+        "copy": shutil.copy,
+        "link": link_or_copy,
+        "reflink": reflink_or_copy,
+    }[mode]
+
+    created_dirs = set()
+    for src in source_files:
+        dst = os.path.join(dst_dir, src)
+        dst_subdir = os.path.dirname(dst)
+        if dst_subdir not in created_dirs:
+            os.makedirs(dst_subdir, exist_ok=True)
+            created_dirs.add(dst_subdir)
+        stage(os.path.join(git_dir, src), dst)
+
+
+def stage_git_archive(git_dir, dst_dir):
+    """Extract the files of the HEAD commit in |git_dir| into |dst_dir|,
+    streaming the output of `git archive'.  Unlike the other staging modes,
+    this ignores changes in the index and the working tree."""
+    proc = subprocess.Popen(
+        ["git", "archive", "--format=tar", "HEAD"],
+        cwd=git_dir,
+        stdout=subprocess.PIPE,
+    )
+    # The archive comes from our own repository and can be trusted, but
+    # select the `tar' extraction filter explicitly where it exists (Python
+    # 3.12 and security backports) since the default changes in 3.14.
+    extract_args = {"filter": "tar"} if hasattr(tarfile, "tar_filter") else {}
+    with tarfile.open(fileobj=proc.stdout, mode="r|") as tar:
+        for member in tar:
+            if os.path.basename(member.name) in _EXCLUDED_FILES:
+                continue
+            tar.extract(member, dst_dir, **extract_args)
+    proc.stdout.close()
+    if proc.wait() != 0:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
+
+def xz_supports_threads(xz):
+    """Return True iff the |xz| program accepts the --threads option."""
+    return "--threads" in get_cmd_output([xz, "--help"])
+
+
+def compress_gzip(tar_path):
+    """Create |tar_path|.gz, with pigz or gzip if available."""
+    gzip_prog = shutil.which("pigz") or shutil.which("gzip")
+    if gzip_prog:
+        subprocess.check_call([gzip_prog, "-9", "--keep", tar_path])
+        return
+
+    with open(tar_path, "rb") as src:
+        with gzip.GzipFile(
+            tar_path + ".gz",
+            "wb",
+            compresslevel=9,
+            mtime=os.path.getmtime(tar_path),
+        ) as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
+
+
+def compress_xz(tar_path):
+    """Create |tar_path|.xz, with (multithreaded) xz if available."""
+    xz = shutil.which("xz")
+    if xz:
+        cmd = [xz, "--keep"]
+        if xz_supports_threads(xz):
+            cmd.append("--threads=0")
+        subprocess.check_call(cmd + [tar_path])
+        return
+
+    # Both `lzma` and `zlib` release the GIL while compressing, so this
+    # runs in parallel with the other archive jobs.
+    with open(tar_path, "rb") as src:
+        with lzma.open(tar_path + ".xz", "wb", preset=6) as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
+
+
+def make_tar(build_dir, tar_name, src_dir):
+    """Create |tar_name| in |build_dir| from |src_dir|."""
+    subprocess.check_call(
+        ["tar", "-H", "ustar", "-chf", tar_name, src_dir], cwd=build_dir
+    )
+
+
+def make_zip(build_dir, zip_name, src_dir):
+    """Create |zip_name| in |build_dir| from |src_dir|."""
+    subprocess.check_call(["zip", "-qlr9", zip_name, src_dir], cwd=build_dir)
+
+
+def timed(func, *args):
+    """Call |func| with |args| and return the elapsed time in seconds."""
+    start = time.time()
+    func(*args)
+    return time.time() - start
+
+
+def source_date_epoch(git_dir):
+    """Return the time stamp for reproducible archives: $SOURCE_DATE_EPOCH
+    if set, otherwise the commit time of HEAD in |git_dir|."""
+    if os.environ.get("SOURCE_DATE_EPOCH"):
+        return int(os.environ["SOURCE_DATE_EPOCH"])
+    return int(get_cmd_output(["git", "log", "-1", "--format=%ct"], git_dir))
+
+
+def walk_sorted(top):
+    """Yield `(path, is_dir)' for |top| (as the empty path) and all
+    directories and files below it, with `/'-separated relative paths in
+    sorted order."""
+    for root, dirs, files in os.walk(top):
+        dirs.sort()
+        rel_root = os.path.relpath(root, top).replace(os.sep, "/")
+        prefix = "" if rel_root == "." else rel_root + "/"
+        yield prefix.rstrip("/"), True
+        for f in sorted(files):
+            yield prefix + f, False
+
+
+def _tar_entry(name, is_dir, mode, mtime, size):
+    info = tarfile.TarInfo(name + "/" if is_dir else name)
+    info.type = tarfile.DIRTYPE if is_dir else tarfile.REGTYPE
+    info.mode = mode
+    info.mtime = mtime
+    info.uid = info.gid = 0
+    info.uname = info.gname = ""
+    info.size = size
+    return info
+
+
+def _zip_entry(name, is_dir, mode, mtime):
+    # ZIP time stamps have no time zone and cannot predate 1980; using UTC
+    # keeps them independent of the host.
+    date_time = max(time.gmtime(mtime)[:6], (1980, 1, 1, 0, 0, 0))
+    info = zipfile.ZipInfo(name + "/" if is_dir else name, date_time)
+    info.create_system = 3  # Unix, for the permission bits
+    file_type = stat.S_IFDIR if is_dir else stat.S_IFREG
+    info.external_attr = (file_type | mode) << 16
+    if is_dir:
+        info.external_attr |= 0x10  # MS-DOS directory flag
+    return info
+
+
+def _is_text(data):
+    return b"\0" not in data
+
+
+def _tar_writer(fileobj, mtime):
+    """A generator that writes the entries sent to it to a tar stream,
+    until it receives None."""
+    with tarfile.open(
+        fileobj=fileobj, mode="w|", format=tarfile.USTAR_FORMAT
+    ) as tar:
+        while True:
+            entry = yield
+            if entry is None:
+                break
+            name, is_dir, mode, data = entry
+            info = _tar_entry(name, is_dir, mode, mtime, len(data))
+            tar.addfile(info, None if is_dir else io.BytesIO(data))
+
+
+def _tar_gz_writer(path, tar_name, mtime):
+    with open(path, "wb") as raw:
+        with gzip.GzipFile(tar_name, "wb", 9, fileobj=raw, mtime=mtime) as gz:
+            yield from _tar_writer(gz, mtime)
+
+
+def _tar_xz_writer(path, mtime):
+    with lzma.open(path, "wb", check=lzma.CHECK_CRC64, preset=6) as xz:
+        yield from _tar_writer(xz, mtime)
+
+
+def _zip_writer(path, mtime):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        while True:
+            entry = yield
+            if entry is None:
+                break
+            name, is_dir, mode, data = entry
+            if is_dir:
+                archive.writestr(
+                    _zip_entry(name, is_dir, mode, mtime),
+                    b"",
+                    compress_type=zipfile.ZIP_STORED,
+                )
+            else:
+                info = _zip_entry(name, is_dir, mode, mtime)
+                # Convert LF to CR LF in text files, like `zip -l'.
+                if _is_text(data):
+                    data = re.sub(b"(?<!\r)\n", b"\r\n", data)
+                    info.internal_attr = 1
+                archive.writestr(
+                    info,
+                    data,
+                    compress_type=zipfile.ZIP_DEFLATED,
+                    compresslevel=9,
+                )
+
+
+def _run_writer(writer, entries, errors):
+    """Feed |writer| from the |entries| queue until None arrives.  After an
+    error, keep draining the queue so that the reader never blocks, unless
+    the error happened while the writer was closing its archive, that is,
+    after None has already been taken from the queue."""
+    done = False
+    try:
+        next(writer)
+        while True:
+            entry = entries.get()
+            if entry is None:
+                done = True
+            try:
+                writer.send(entry)
+            except StopIteration:
+                break
+    except Exception as e:
+        errors.append(e)
+        if not done:
+            while entries.get() is not None:
+                pass
+
+
+def write_reproducible_archives(
+    build_dir, freetype_dir, ftwinversion, mtime
+):
+    """Create the .tar.gz, .tar.xz, and .zip archives of |freetype_dir| in
+    |build_dir| with Python's archive and compression modules and return
+    their file names.
+
+    Each file is read once and fed to three writer threads, which compress
+    concurrently since `zlib' and `lzma' release the GIL.  Entries are
+    sorted by name and have |mtime| as their time stamp, root as their
+    owner, and mode 0755 or 0644, so the archives depend only on the file
+    names and contents."""
+    freetype_tar = freetype_dir + ".tar"
+    names = [
+        freetype_tar + ".gz",
+        freetype_tar + ".xz",
+        ftwinversion + ".zip",
+    ]
+    gz_path, xz_path, zip_path = [os.path.join(build_dir, n) for n in names]
+
+    writers = (
+        _tar_gz_writer(gz_path, freetype_tar, mtime),
+        _tar_xz_writer(xz_path, mtime),
+        _zip_writer(zip_path, mtime),
+    )
+    queues = [queue.Queue(maxsize=64) for _ in writers]
+    errors = []
+    threads = [
+        threading.Thread(target=_run_writer, args=(w, q, errors))
+        for w, q in zip(writers, queues)
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        src_dir = os.path.join(build_dir, freetype_dir)
+        for rel, is_dir in walk_sorted(src_dir):
+            name = freetype_dir + "/" + rel if rel else freetype_dir
+            if is_dir:
+                entry = (name, True, 0o755, b"")
+            else:
+                # Like `tar -h', follow symbolic links.
+                path = os.path.join(src_dir, rel)
+                with open(path, "rb") as f:
+                    data = f.read()
+                executable = os.stat(path).st_mode & stat.S_IXUSR
+                entry = (name, False, 0o755 if executable else 0o644, data)
+            for q in queues:
+                q.put(entry)
+    finally:
+        for q in queues:
+            q.put(None)
+        for thread in threads:
+            thread.join()
+
+    if errors:
+        raise errors[0]
+
+    return names
+
+
+def make_archives(build_dir, freetype_dir, ftwinversion):
+    """Create the .tar.gz, .tar.xz, and .zip archives of |freetype_dir| in
+    |build_dir| and return their file names.  The archives are compressed
+    concurrently; the time spent on each one is printed."""
+    freetype_tar = freetype_dir + ".tar"
+    tar_path = os.path.join(build_dir, freetype_tar)
+
+    elapsed = timed(make_tar, build_dir, freetype_tar, freetype_dir)
+    print("%-30s %7.2f s" % (freetype_tar, elapsed))
+
+    jobs = [
+        (freetype_tar + ".gz", compress_gzip, (tar_path,)),
+        (freetype_tar + ".xz", compress_xz, (tar_path,)),
+        (
+            ftwinversion + ".zip",
+            make_zip,
+            (build_dir, ftwinversion + ".zip", freetype_dir),
+        ),
+    ]
+
+    start = time.time()
+    with concurrent.futures.ThreadPoolExecutor(len(jobs)) as executor:
+        futures = [
+            (name, executor.submit(timed, func, *args))
+            for name, func, args in jobs
+        ]
+        for name, future in futures:
+            print("%-30s %7.2f s" % (name, future.result()))
+    print("%-30s %7.2f s" % ("all archives", time.time() - start))
+
+    return [name for name, _, _ in jobs]
+
+
 def main():
     parser = argparse.ArgumentParser(description=__doc__)
 
@@ -67,6 +447,33 @@ def main():
         ),
     )
 
+    parser.add_argument(
+        "--staging",
+        choices=("copy", "link", "reflink", "git-archive"),
+        default="copy",
+        help=(
+            "How to put the source files into the build directory: copy"
+            " them (the default), hard-link them, clone them (copy-on-write"
+            " where the file system supports it), or extract them from"
+            " `git archive HEAD'.  The first three modes take the files"
+            " listed by `git ls-files' from the working tree, while"
+            " `git-archive' uses the last commit; the results only differ"
+            " with uncommitted changes, that is, with --ignore-clean-check."
+        ),
+    )
+
+    parser.add_argument(
+        "--archiver",
+        choices=("tools", "python"),
+        default="tools",
+        help=(
+            "Create the archives with tar, gzip, xz, and zip (the default),"
+            " or with Python's modules, which makes them reproducible:"
+            " sorted entries, normalized owners and modes, and"
+            " $SOURCE_DATE_EPOCH or the commit time as the time stamp."
+        ),
+    )
+
     parser.add_argument(
         "output_dir", help="Output directory for generated archives."
     )
@@ -74,12 +481,18 @@ def main():
     args = parser.parse_args()
 
     git_dir = args.source_dir if args.source_dir else _TOP_DIR
-    if not args.ignore_clean_check and not is_git_dir_clean(git_dir):
-        sys.stderr.write(
-            "ERROR: Your git repository is not in a clean state: %s\n"
-            % git_dir
-        )
-        return 1
+    if not is_git_dir_clean(git_dir):
+        if not args.ignore_clean_check:
+            sys.stderr.write(
+                "ERROR: Your git repository is not in a clean state: %s\n"
+                % git_dir
+            )
+            return 1
+        if args.staging == "git-archive":
+            sys.stderr.write(
+                "WARNING: Uncommitted changes are not included with"
+                " --staging=git-archive: %s\n" % git_dir
+            )
 
     if args.version:
         version = args.version
@@ -118,24 +531,28 @@ def main():
 
         atexit.register(clean_build_dir)
 
-    # Copy all source files known to git into $BUILD_DIR/freetype-$VERSION
+    # Put all source files known to git into $BUILD_DIR/freetype-$VERSION
     # with the exception of .gitignore and .mailmap files.
-    source_files = [
-        f
-        for f in get_cmd_output(["git", "ls-files"], cwd=git_dir).split("\n")
-        if os.path.basename(f) not in (".gitignore", ".mailmap")
-    ]
-
     freetype_dir = "freetype-" + version
     tmp_src_dir = os.path.join(build_dir, freetype_dir)
     os.makedirs(tmp_src_dir)
 
-    for src in source_files:
-        dst = os.path.join(tmp_src_dir, src)
-        dst_dir = os.path.dirname(dst)
-        if not os.path.exists(dst_dir):
-            os.makedirs(dst_dir)
-        shutil.copy(os.path.join(git_dir, src), dst)
+    start = time.time()
+    if args.staging == "git-archive":
+        stage_git_archive(git_dir, tmp_src_dir)
+    else:
+        source_files = [
+            f
+            for f in get_cmd_output(["git", "ls-files"], cwd=git_dir).split(
+                "\n"
+            )
+            if os.path.basename(f) not in _EXCLUDED_FILES
+        ]
+        stage_files(git_dir, source_files, tmp_src_dir, args.staging)
+    print(
+        "%-30s %7.2f s"
+        % ("staging (%s)" % args.staging, time.time() - start)
+    )
 
     # Run autogen.sh in directory.
     subprocess.check_call(["/bin/sh", "autogen.sh"], cwd=tmp_src_dir)
@@ -146,10 +563,11 @@ def main():
     # Copy config.guess and config.sub if possible!
     if args.gnu_config_dir:
         for f in ("config.guess", "config.sub"):
-            shutil.copy(
-                os.path.join(args.gnu_config_dir, f),
-                os.path.join(tmp_src_dir, "builds", "unix", f),
-            )
+            dst = os.path.join(tmp_src_dir, "builds", "unix", f)
+            # Never write through a hard link into the source tree.
+            if os.path.exists(dst):
+                os.unlink(dst)
+            shutil.copy(os.path.join(args.gnu_config_dir, f), dst)
 
     # Generate reference documentation under docs/
     subprocess.check_call(
@@ -168,34 +586,35 @@ def main():
     shutil.rmtree(os.path.join(tmp_src_dir, "docs", "markdown"))
     os.unlink(os.path.join(tmp_src_dir, "docs", "mkdocs.yml"))
 
-    # Generate our archives
-    freetype_tar = freetype_dir + ".tar"
-
-    subprocess.check_call(
-        ["tar", "-H", "ustar", "-chf", freetype_tar, freetype_dir],
-        cwd=build_dir,
-    )
-
-    subprocess.check_call(
-        ["gzip", "-9", "--keep", freetype_tar], cwd=build_dir
-    )
-
-    subprocess.check_call(["xz", "--keep", freetype_tar], cwd=build_dir)
+    # With hard links, a build step that rewrites a staged file in place
+    # would also change the source tree; catch this.
+    if (
+        args.staging == "link"
+        and not args.ignore_clean_check
+        and not is_git_dir_clean(git_dir)
+    ):
+        sys.stderr.write(
+            "ERROR: Staging with hard links modified the source tree: %s\n"
+            % git_dir
+        )
+        return 1
 
+    # Generate our archives
     ftwinversion = "ft" + "".join(version.split("."))
-    subprocess.check_call(
-        ["zip", "-qlr9", ftwinversion + ".zip", freetype_dir], cwd=build_dir
-    )
+    if args.archiver == "python":
+        start = time.time()
+        archives = write_reproducible_archives(
+            build_dir, freetype_dir, ftwinversion, source_date_epoch(git_dir)
+        )
+        print("%-30s %7.2f s" % ("all archives", time.time() - start))
+    else:
+        archives = make_archives(build_dir, freetype_dir, ftwinversion)
 
     # Copy file to output directory now.
     if not os.path.exists(args.output_dir):
         os.makedirs(args.output_dir)
 
-    for f in (
-        freetype_tar + ".gz",
-        freetype_tar + ".xz",
-        ftwinversion + ".zip",
-    ):
+    for f in archives:
         shutil.copy(
             os.path.join(build_dir, f), os.path.join(args.output_dir, f)
         )
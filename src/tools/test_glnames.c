@@ -0,0 +1,175 @@
+/*
+ * Check and time the lookup functions generated by `glnames.py'.
+ *
+ * Compile with
+ *
+ *   cc -O2 -I../psnames -o test_glnames test_glnames.c
+ */
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#define  FT_CONFIG_OPTION_ADOBE_GLYPH_LIST
+#define  DEFINE_PS_TABLES
+#define  DEFINE_PS_TABLES_DATA
+#define  DEFINE_PS_TABLES_BULK
+#include "pstables.h"
+
+#define  ROUNDS  20000
+
+  static int  error = 0;
+
+  static const char*    sid_names[FT_NUM_SID_NAMES];
+  static const char*    sorted_names[FT_NUM_SID_NAMES];
+  static unsigned long  values[FT_NUM_SID_NAMES];
+
+
+  static int
+  compare_names( const void*  a,
+                 const void*  b )
+  {
+    return strcmp( *(const char* const*)a, *(const char* const*)b );
+  }
+
+
+  static void
+  check_sequence( const char*    name,
+                  int            len,
+                  unsigned long  first )
+  {
+    unsigned long  values[4];
+    int            n;
+
+
+    values[0] = 0;
+    n = ft_get_adobe_glyph_sequence( name, name + strlen( name ),
+                                     values, 4 );
+    if ( n != len || values[0] != first )
+    {
+      error = 1;
+      printf( "sequence `%s' has %d values starting with %04lx\n",
+              name, n, n > 0 ? values[0] : 0 );
+    }
+
+    if ( len > 1 && ft_get_adobe_glyph_index( name,
+                                              name + strlen( name ) ) )
+    {
+      error = 1;
+      printf( "`%s' must not map to a single value\n", name );
+    }
+  }
+
+
+  static void
+  check_bulk( const char**  names )
+  {
+    int  n;
+
+
+    ft_get_adobe_glyph_indices( names, FT_NUM_SID_NAMES, values );
+
+    for ( n = 0; n < FT_NUM_SID_NAMES; n++ )
+    {
+      const char*    name      = names[n];
+      unsigned long  reference = ft_get_adobe_glyph_index(
+                                   name, name + strlen( name ) );
+
+
+      if ( values[n] != reference )
+      {
+        error = 1;
+        printf( "bulk lookup of `%s' gives %04lx instead of %04lx\n",
+                name, values[n], reference );
+      }
+    }
+  }
+
+
+  static void
+  time_bulk_lookups( const char**  names,
+                     const char*   title )
+  {
+    clock_t        start;
+    double         elapsed;
+    unsigned long  sum = 0;
+    int            round, n;
+
+
+    start = clock();
+
+    for ( round = 0; round < ROUNDS; round++ )
+    {
+      ft_get_adobe_glyph_indices( names, FT_NUM_SID_NAMES, values );
+      for ( n = 0; n < FT_NUM_SID_NAMES; n++ )
+        sum += values[n];
+    }
+
+    elapsed = (double)( clock() - start ) / CLOCKS_PER_SEC;
+
+    printf( "ft_get_adobe_glyph_indices (%s): %.1f ns/lookup"
+            " (checksum %lu)\n",
+            title, 1e9 * elapsed / ROUNDS / FT_NUM_SID_NAMES, sum );
+  }
+
+
+  static void
+  time_lookups( void )
+  {
+    clock_t        start;
+    double         elapsed;
+    unsigned long  sum = 0;
+    int            round, n;
+
+
+    start = clock();
+
+    for ( round = 0; round < ROUNDS; round++ )
+    {
+      for ( n = 0; n < FT_NUM_SID_NAMES; n++ )
+      {
+        const char*  name = ft_standard_glyph_names + ft_sid_names[n];
+
+
+        sum += ft_get_adobe_glyph_index( name, name + strlen( name ) );
+      }
+    }
+
+    elapsed = (double)( clock() - start ) / CLOCKS_PER_SEC;
+
+    printf( "ft_get_adobe_glyph_index: %.1f ns/lookup (checksum %lu)\n",
+            1e9 * elapsed / ROUNDS / FT_NUM_SID_NAMES, sum );
+  }
+
+
+  int
+  main( void )
+  {
+    int  n;
+
+
+    check_sequence( "A", 1, 0x0041 );
+    check_sequence( "dalethatafpatah", 2, 0x05D3 );
+    check_sequence( "lamedholamdageshhebrew", 3, 0x05DC );
+    check_sequence( "rehyehaleflamarabic", 4, 0x0631 );
+    check_sequence( "notaglyphname", 0, 0 );
+
+    for ( n = 0; n < FT_NUM_SID_NAMES; n++ )
+      sid_names[n] = ft_standard_glyph_names + ft_sid_names[n];
+
+    memcpy( sorted_names, sid_names, sizeof ( sid_names ) );
+    qsort( sorted_names, FT_NUM_SID_NAMES, sizeof ( sorted_names[0] ),
+           compare_names );
+
+    check_bulk( sid_names );
+    check_bulk( sorted_names );
+
+    time_lookups();
+    time_bulk_lookups( sid_names, "SID order" );
+    time_bulk_lookups( sorted_names, "sorted" );
+
+    return error;
+  }
+
+/* END */
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Tests for the Python archiver of `make_distribution_archives.py'.
+
+Run with
+
+  python3 -m unittest test_make_distribution_archives
+
+in this directory.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import make_distribution_archives as mda
+
+
+def _failing_zip_writer(path, mtime):
+    """A writer that accepts all entries but fails while closing, like a
+    writer flushing to a full disk."""
+    while True:
+        entry = yield
+        if entry is None:
+            raise OSError("no space left on device")
+
+
+class ReproducibleArchivesTest(unittest.TestCase):
+    def setUp(self):
+        self.build_dir = tempfile.mkdtemp(prefix="freetype-test-")
+        self.addCleanup(shutil.rmtree, self.build_dir)
+
+        src_dir = os.path.join(self.build_dir, "freetype-0.0.0")
+        os.makedirs(os.path.join(src_dir, "src"))
+        with open(os.path.join(src_dir, "README"), "w") as f:
+            f.write("FreeType\n")
+        with open(os.path.join(src_dir, "src", "ftbase.c"), "w") as f:
+            f.write("int  x;\n")
+
+    def write_archives(self):
+        """Run `write_reproducible_archives' in a thread, failing the test
+        instead of hanging if it does not finish."""
+        result = {}
+
+        def target():
+            try:
+                result["names"] = mda.write_reproducible_archives(
+                    self.build_dir, "freetype-0.0.0", "ft000", 0
+                )
+            except Exception as e:
+                result["error"] = e
+
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        thread.join(30)
+        self.assertFalse(thread.is_alive(), "archiver did not finish")
+        return result
+
+    def test_archives(self):
+        result = self.write_archives()
+        self.assertNotIn("error", result)
+        for name in result["names"]:
+            path = os.path.join(self.build_dir, name)
+            self.assertGreater(os.path.getsize(path), 0)
+
+    def test_error_on_close(self):
+        with mock.patch.object(mda, "_zip_writer", _failing_zip_writer):
+            result = self.write_archives()
+        self.assertIsInstance(result.get("error"), OSError)
+        self.assertIn("no space left", str(result["error"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,8 @@
 
 #include <math.h>
 #include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
 
 #define  PI   3.14159265358979323846
 #define  SPI  (PI/FT_ANGLE_PI)
@@ -240,8 +242,105 @@
   }
 
 
-  int main( void )
+  /* `--dump' mode: print random calls of the vector functions and */
+  /* their results, to be checked with `trigmodel.py --compare'     */
+
+  static unsigned long  seed = 1;
+
+
+  /* xorshift32 */
+  static unsigned long
+  random_bits( void )
+  {
+    seed ^= ( seed << 13 ) & 0xFFFFFFFFUL;
+    seed ^= seed >> 17;
+    seed ^= ( seed << 5 ) & 0xFFFFFFFFUL;
+
+    return seed;
+  }
+
+
+  /* a random component with a random magnitude below 2^30 */
+  static void
+  random_vector( FT_Vector*  v )
+  {
+    unsigned long  mask = ( 1UL << ( 1 + random_bits() % 30 ) ) - 1;
+
+
+    v->x = (FT_Pos)( random_bits() & mask );
+    v->y = (FT_Pos)( random_bits() & mask );
+
+    if ( random_bits() & 1 )
+      v->x = -v->x;
+    if ( random_bits() & 1 )
+      v->y = -v->y;
+  }
+
+
+  static FT_Angle
+  random_angle( void )
   {
+    return (FT_Angle)( random_bits() % FT_ANGLE_2PI ) - FT_ANGLE_PI;
+  }
+
+
+  static void
+  dump( long  count )
+  {
+    long  i;
+
+
+    for ( i = 0; i < count; i++ )
+    {
+      FT_Vector  v, r;
+      FT_Angle   angle = random_angle();
+      FT_Fixed   length;
+
+
+      random_vector( &v );
+
+      r = v;
+      FT_Vector_Rotate( &r, angle );
+      printf( "rotate %ld %ld %ld %ld %ld\n",
+              v.x, v.y, angle, r.x, r.y );
+
+      printf( "atan2 %ld %ld %ld\n",
+              v.x, v.y, FT_Atan2( v.x, v.y ) );
+
+      printf( "length %ld %ld %ld\n",
+              v.x, v.y, FT_Vector_Length( &v ) );
+
+      if ( v.x || v.y )
+      {
+        FT_Vector_Polarize( &v, &length, &angle );
+        printf( "polarize %ld %ld %ld %ld\n",
+                v.x, v.y, length, angle );
+      }
+
+      angle = random_angle();
+      FT_Vector_Unit( &r, angle );
+      printf( "unit %ld %ld %ld\n",
+              angle, r.x, r.y );
+
+      printf( "cos %ld %ld\n", angle, FT_Cos( angle ) );
+      printf( "sin %ld %ld\n", angle, FT_Sin( angle ) );
+
+      /* avoid angles near +/-PI/2 */
+      angle /= 3;
+      printf( "tan %ld %ld\n", angle, FT_Tan( angle ) );
+    }
+  }
+
+
+  int main( int     argc,
+            char**  argv )
+  {
+    if ( argc > 1 && strcmp( argv[1], "--dump" ) == 0 )
+    {
+      dump( argc > 2 ? atol( argv[2] ) : 100000L );
+      return 0;
+    }
+
     test_cos();
     test_sin();
     test_tan();
@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+
+"""
+  This python script is a bit-exact model of the fixed-point CORDIC code
+  in `src/base/fttrigon.c', evaluated with NumPy on whole arrays of
+  vectors and angles.  The constants are taken from `cordic.py', so
+  changes of the angle unit or the iteration count can be studied before
+  touching the C code.
+
+  By default, it prints error histograms of `ft_trig_downscale',
+  `ft_trig_pseudo_rotate', and `ft_trig_pseudo_polarize' for random
+  inputs across their domains.
+
+  With `--compare', it reads the output of `test_trig --dump' and checks
+  that the public functions of the compiled library give the same
+  results as the model, for example
+
+    cc -I../../include -o test_trig test_trig.c -lfreetype -lm
+    ./test_trig --dump 1000000 | ./trigmodel.py --compare -
+
+  If the library is compiled with `FT_CONFIG_OPTION_TRIG_TABLE', the
+  number of sine table entries must be given with `--sin-table'.
+"""
+
+import argparse
+import math
+import sys
+
+import numpy as np
+
+from cordic import DEGREES, sin_table, trig_constants
+
+
+# Signed right shifts are arithmetic in both C (for all supported
+# compilers) and NumPy.  All values are `int64', which is enough for the
+# 32-bit arithmetic of `fttrigon.c'.
+#
+def msb(values):
+    """return the index of the highest set bit, like `FT_MSB'"""
+
+    return np.frexp(values.astype(np.float64))[1].astype(np.int64) - 1
+
+
+def trig_prenorm(x, y, constants):
+    """model `ft_trig_prenorm'; return the vector and the shift"""
+
+    safe_msb = constants["safe_msb"]
+    shift = msb((np.abs(x) | np.abs(y)) & 0xFFFFFFFF)
+
+    up = shift <= safe_msb
+    left = np.where(up, safe_msb - shift, 0)
+    right = np.where(up, 0, shift - safe_msb)
+
+    x = (x << left) >> right
+    y = (y << left) >> right
+
+    return x, y, np.where(up, left, -right)
+
+
+def trig_downscale(values, constants):
+    """model `ft_trig_downscale'"""
+
+    sign = np.where(values < 0, -1, 1)
+    magnitude = np.abs(values).astype(np.uint64)
+    magnitude = ((magnitude * np.uint64(constants["scale"]) +
+                  np.uint64(0x40000000)) >> np.uint64(32))
+
+    return sign * magnitude.astype(np.int64)
+
+
+def trig_pseudo_rotate(x, y, theta, constants):
+    """model `ft_trig_pseudo_rotate'"""
+
+    pi2 = constants["units"] // 2
+    pi4 = constants["units"] // 4
+
+    # rotate inside [-PI/4,PI/4] sector; angles are in [-2PI,2PI]
+    for _ in range(4):
+        low = theta < -pi4
+        x, y = np.where(low, y, x), np.where(low, -x, y)
+        theta = np.where(low, theta + pi2, theta)
+
+        high = theta > pi4
+        x, y = np.where(high, -y, x), np.where(high, x, y)
+        theta = np.where(high, theta - pi2, theta)
+
+    b = 1
+    for i, angle in enumerate(constants["table"], 1):
+        negative = theta < 0
+        dx = (y + b) >> i
+        dy = (x + b) >> i
+        x, y = (np.where(negative, x + dx, x - dx),
+                np.where(negative, y - dy, y + dy))
+        theta = np.where(negative, theta + angle, theta - angle)
+        b <<= 1
+
+    return x, y
+
+
+def trig_pseudo_polarize(x, y, constants):
+    """model `ft_trig_pseudo_polarize'; return the length and the angle"""
+
+    pi = constants["units"]
+
+    # get the vector into [-PI/4,PI/4] sector
+    above = y > x
+    left = y > -x
+    right = y < -x
+
+    case1 = above & left
+    case2 = above & ~left
+    case3 = ~above & right
+
+    theta = np.zeros_like(x)
+    theta = np.where(case1, pi // 2, theta)
+    theta = np.where(case2, np.where(y > 0, pi, -pi), theta)
+    theta = np.where(case3, -(pi // 2), theta)
+
+    x, y = (np.where(case1, y, np.where(case2, -x,
+                                        np.where(case3, -y, x))),
+            np.where(case1, -x, np.where(case2, -y,
+                                         np.where(case3, x, y))))
+
+    b = 1
+    for i, angle in enumerate(constants["table"], 1):
+        positive = y > 0
+        dx = (y + b) >> i
+        dy = (x + b) >> i
+        x, y = (np.where(positive, x + dx, x - dx),
+                np.where(positive, y - dy, y + dy))
+        theta = np.where(positive, theta + angle, theta - angle)
+        b <<= 1
+
+    # round theta like `FT_PAD_ROUND( theta, 16 )'
+    rounded = (np.abs(theta) + 8) & ~15
+    theta = np.where(theta >= 0, rounded, -rounded)
+
+    return x, theta
+
+
+def vector_rotate(x, y, angle, constants):
+    """model `FT_Vector_Rotate'"""
+
+    vx, vy, shift = trig_prenorm(x, y, constants)
+    vx, vy = trig_pseudo_rotate(vx, vy, angle, constants)
+    vx = trig_downscale(vx, constants)
+    vy = trig_downscale(vy, constants)
+
+    down = np.maximum(shift, 0)
+    half = np.where(shift > 0, np.int64(1) << np.maximum(down - 1, 0), 0)
+    up = np.maximum(-shift, 0)
+
+    vx = np.where(shift > 0, (vx + half - (vx < 0)) >> down, vx << up)
+    vy = np.where(shift > 0, (vy + half - (vy < 0)) >> down, vy << up)
+
+    # zero angles and vectors are returned unchanged
+    same = (angle == 0) | ((x == 0) & (y == 0))
+
+    return np.where(same, x, vx), np.where(same, y, vy)
+
+
+def atan2(dx, dy, constants):
+    """model `FT_Atan2'"""
+
+    x, y, _ = trig_prenorm(dx, dy, constants)
+    _, theta = trig_pseudo_polarize(x, y, constants)
+
+    return np.where((dx == 0) & (dy == 0), 0, theta)
+
+
+def vector_length(x, y, constants):
+    """model `FT_Vector_Length'"""
+
+    vx, vy, shift = trig_prenorm(x, y, constants)
+    vx, _ = trig_pseudo_polarize(vx, vy, constants)
+    vx = trig_downscale(vx, constants)
+
+    down = np.maximum(shift, 0)
+    half = np.where(shift > 0, np.int64(1) << np.maximum(down - 1, 0), 0)
+    up = np.maximum(-shift, 0)
+
+    length = np.where(shift > 0, (vx + half) >> down,
+                      (vx << up) & 0xFFFFFFFF)
+
+    return np.where(x == 0, np.abs(y), np.where(y == 0, np.abs(x), length))
+
+
+def vector_polarize(x, y, constants):
+    """model `FT_Vector_Polarize' for non-zero vectors"""
+
+    vx, vy, shift = trig_prenorm(x, y, constants)
+    vx, theta = trig_pseudo_polarize(vx, vy, constants)
+    vx = trig_downscale(vx, constants)
+
+    length = np.where(shift >= 0, vx >> np.maximum(shift, 0),
+                      (vx << np.maximum(-shift, 0)) & 0xFFFFFFFF)
+
+    return length, theta
+
+
+def vector_unit(angle, constants):
+    """model `FT_Vector_Unit'"""
+
+    sin_constants = constants.get("sin_table")
+    if sin_constants:
+        return (table_sin(table_cos_angle(angle, constants), sin_constants),
+                table_sin(angle, sin_constants))
+
+    x = np.full_like(angle, constants["scale"] >> 8)
+    y = np.zeros_like(angle)
+    x, y = trig_pseudo_rotate(x, y, angle, constants)
+
+    return (x + 0x80) >> 8, (y + 0x80) >> 8
+
+
+def table_sin_bits(angle, sin_constants, quadratic=False):
+    """model `ft_trig_sin_table_lookup'
+
+    With `quadratic', a correction term for the curvature of the sine is
+    added to the linear interpolation (not implemented in C)."""
+
+    units = sin_constants["step"] * sin_constants["entries"] * 2
+    step = sin_constants["step"]
+    table = np.array(sin_constants["table"], dtype=np.int64)
+
+    # `%' of C truncates
+    angle = np.fmod(angle, 2 * units)
+    angle = np.where(angle < 0, angle + 2 * units, angle)
+
+    negative = angle >= units
+    angle = np.where(negative, angle - units, angle)
+    angle = np.where(angle > units // 2, units - angle, angle)
+
+    n = angle // step
+    frac = angle % step
+    s0 = table[n]
+    s1 = table[np.minimum(n + 1, len(table) - 1)]
+    s = s0 + ((s1 - s0) * frac + step // 2) // step
+
+    if quadratic:
+        h = math.pi / (2 * sin_constants["entries"])
+        f = frac / step
+        s = s + np.rint(s * f * (1 - f) * h * h / 2).astype(np.int64)
+
+    return np.where(negative, -s, s)
+
+
+def table_round(s, sin_constants):
+    """model `ft_trig_sin_round'"""
+
+    shift = sin_constants["bits"] - 16
+    rounded = (np.abs(s) + (1 << (shift - 1))) >> shift
+
+    return np.where(s < 0, -rounded, rounded)
+
+
+def table_sin(angle, sin_constants, quadratic=False):
+    """return the sine in 16.16 format from the sine table"""
+
+    return table_round(table_sin_bits(angle, sin_constants, quadratic),
+                       sin_constants)
+
+
+def table_cos_angle(angle, constants):
+    """return the angle passed to the sine for a cosine in C"""
+
+    return constants["units"] // 2 - np.fmod(angle, 2 * constants["units"])
+
+
+def div_fix(a, b):
+    """model `FT_DivFix' (64-bit version)"""
+
+    negative = (a < 0) ^ (b < 0)
+    a = np.abs(a)
+    b = np.abs(b)
+    q = np.where(b > 0, ((a << 16) + (b >> 1)) // np.maximum(b, 1),
+                 0x7FFFFFFF)
+
+    return np.where(negative, -q, q)
+
+
+def ft_cos(angle, constants):
+    """model `FT_Cos'"""
+
+    sin_constants = constants.get("sin_table")
+    if sin_constants:
+        return table_sin(table_cos_angle(angle, constants), sin_constants)
+
+    return vector_unit(angle, constants)[0]
+
+
+def ft_sin(angle, constants):
+    """model `FT_Sin'"""
+
+    sin_constants = constants.get("sin_table")
+    if sin_constants:
+        return table_sin(angle, sin_constants)
+
+    return vector_unit(angle, constants)[1]
+
+
+def ft_tan(angle, constants):
+    """model `FT_Tan'"""
+
+    sin_constants = constants.get("sin_table")
+    if sin_constants:
+        return div_fix(table_sin_bits(angle, sin_constants),
+                       table_sin_bits(table_cos_angle(angle, constants),
+                                      sin_constants))
+
+    x, y = trig_pseudo_rotate(np.full_like(angle, 1 << 24),
+                              np.zeros_like(angle), angle, constants)
+
+    return div_fix(y, x)
+
+
+def print_histogram(title, errors, bins):
+    """print a text histogram of `errors'"""
+
+    counts, edges = np.histogram(errors, bins)
+    peak = max(counts.max(), 1)
+
+    print("%s: max |error| %.3f, rms %.3f"
+          % (title, np.abs(errors).max(), math.sqrt(np.mean(errors ** 2))))
+
+    for count, low, high in zip(counts, edges, edges[1:]):
+        print("  [%9.3f, %9.3f)  %9d  %s"
+              % (low, high, count, "#" * int(round(40 * count / peak))))
+
+    print("")
+
+
+def histograms(constants, samples, bins, seed=0):
+    """print error histograms of the CORDIC primitives"""
+
+    units = constants["units"]
+    gain = 1 / constants["shrink"]
+    rng = np.random.default_rng(seed)
+
+    print("%d iterations, %d samples\n" % (constants["iterations"], samples))
+
+    # `ft_trig_downscale' gets values up to 2^31
+    values = rng.integers(-(1 << 31) + 1, 1 << 31, samples, dtype=np.int64)
+    errors = (trig_downscale(values, constants) -
+              values * constants["shrink"])
+    print_histogram("ft_trig_downscale (in units)", errors, bins)
+
+    # the other primitives get prenormalized vectors
+    phi = rng.uniform(-math.pi, math.pi, samples)
+    radius = (1 << constants["safe_msb"]) * rng.uniform(1, 2, samples)
+    x = np.rint(radius * np.cos(phi)).astype(np.int64)
+    y = np.rint(radius * np.sin(phi)).astype(np.int64)
+    x, y, _ = trig_prenorm(x, y, constants)
+
+    angle = rng.integers(-units, units, samples, dtype=np.int64)
+    alpha = angle * (math.pi / units)
+    rx, ry = trig_pseudo_rotate(x, y, angle, constants)
+    errors = np.hypot(rx - gain * (x * np.cos(alpha) - y * np.sin(alpha)),
+                      ry - gain * (x * np.sin(alpha) + y * np.cos(alpha)))
+
+    # the components are near 2^29, so the distance is shown relative to
+    # the vector length, i.e., as an angle
+    errors *= units / math.pi / (gain * np.hypot(x, y))
+    print_histogram("ft_trig_pseudo_rotate (distance in angle units)",
+                    errors, bins)
+
+    length, theta = trig_pseudo_polarize(x, y, constants)
+    errors = length - gain * np.hypot(x, y)
+    print_histogram("ft_trig_pseudo_polarize (length in units)",
+                    errors, bins)
+
+    errors = theta - np.arctan2(y, x) * (units / math.pi)
+    errors = np.where(errors > units, errors - 2 * units, errors)
+    errors = np.where(errors < -units, errors + 2 * units, errors)
+    print_histogram("ft_trig_pseudo_polarize (angle in angle units)",
+                    errors, bins)
+
+
+# Each line of `test_trig --dump' holds a function name, its arguments,
+# and its results.
+#
+DUMP_FUNCTIONS = {
+    "rotate": (3, lambda a, c: vector_rotate(a[0], a[1], a[2], c)),
+    "atan2": (2, lambda a, c: (atan2(a[0], a[1], c),)),
+    "length": (2, lambda a, c: (vector_length(a[0], a[1], c),)),
+    "polarize": (2, lambda a, c: vector_polarize(a[0], a[1], c)),
+    "unit": (1, lambda a, c: vector_unit(a[0], c)),
+    "cos": (1, lambda a, c: (ft_cos(a[0], c),)),
+    "sin": (1, lambda a, c: (ft_sin(a[0], c),)),
+    "tan": (1, lambda a, c: (ft_tan(a[0], c),)),
+}
+
+
+def read_dump(file):
+    """return a dictionary of the dumped function calls as 2D arrays"""
+
+    rows = {}
+    for line in file:
+        name, _, numbers = line.partition(" ")
+        rows.setdefault(name, []).append(numbers)
+
+    return {name: np.array(" ".join(lines).split(),
+                           dtype=np.int64).reshape(len(lines), -1)
+            for name, lines in rows.items()}
+
+
+def compare(constants, file):
+    """compare a `test_trig --dump' file with the model"""
+
+    result = 0
+
+    for name, data in read_dump(file).items():
+        if name not in DUMP_FUNCTIONS:
+            sys.stderr.write("unknown function `%s'\n" % name)
+            return 1
+
+        num_args, function = DUMP_FUNCTIONS[name]
+        args = data[:, :num_args].T
+        expected = data[:, num_args:].T
+        model = np.array(function(args, constants))
+
+        bad = np.any(model != expected, axis=0)
+        print("%-8s %9d calls, %d mismatches" % (name, len(data), bad.sum()))
+
+        for n in np.flatnonzero(bad)[:5]:
+            print("  %s%s: library %s, model %s"
+                  % (name, tuple(args[:, n].tolist()),
+                     tuple(expected[:, n].tolist()),
+                     tuple(model[:, n].tolist())))
+
+        if bad.any():
+            result = 1
+
+    return result
+
+
+def main():
+    """main program body"""
+
+    parser = argparse.ArgumentParser(
+        usage="%(prog)s [--iterations=<n>] [--samples=<n>] [--bins=<n>]\n"
+              "       %(prog)s [--sin-table=<entries>] --compare <dump-file>",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int)
+    parser.add_argument("--samples", type=int, default=1000000)
+    parser.add_argument("--bins", type=int, default=16)
+    parser.add_argument("--compare", metavar="DUMP-FILE")
+    parser.add_argument("--sin-table", type=int, default=0)
+
+    args = parser.parse_args()
+    constants = trig_constants(DEGREES, args.iterations)
+
+    if args.sin_table > 0:
+        constants["sin_table"] = sin_table(DEGREES, args.sin_table)
+
+    if args.compare:
+        if args.compare == "-":
+            return compare(constants, sys.stdin)
+
+        with open(args.compare) as f:
+            return compare(constants, f)
+
+    histograms(constants, args.samples, args.bins)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# END
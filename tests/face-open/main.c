@@ -0,0 +1,137 @@
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#include <freetype/freetype.h>
+#include <freetype/ftfntfmt.h>
+#include <ft2build.h>
+
+
+  /*
+   * Measure the cost of `FT_New_Face' and `FT_Done_Face' for the font
+   * files given on the command line, for example
+   *
+   *   face-open -n 2000 fonts/a.cff fonts/b.cff
+   *
+   * The files are also counted by font format (as returned by
+   * `FT_Get_Font_Format'); this is the histogram that
+   * `builds/meson/parse_modules_cfg.py --histogram' uses to order the
+   * font drivers, which `FT_Open_Face' tries one after another.
+   *
+   * Without font arguments the benchmark is skipped.
+   */
+
+#define SKIP_EXIT_CODE  77
+#define MAX_FORMATS     16
+
+
+  typedef struct  FormatStats_
+  {
+    const char*  name;
+    int          files;
+    double       elapsed;
+
+  } FormatStats;
+
+
+int
+main( int     argc,
+      char**  argv )
+{
+  FT_Library  library;
+  int         iterations = 1000;
+  int         first      = 1;
+  int         i;
+  int         num_files = 0;
+  double      total     = 0.0;
+
+  FormatStats  formats[MAX_FORMATS];
+  int          num_formats = 0;
+
+
+  if ( argc > 2 && argv[1][0] == '-' && argv[1][1] == 'n' )
+  {
+    iterations = atoi( argv[2] );
+    first      = 3;
+  }
+
+  if ( first >= argc || iterations <= 0 )
+  {
+    fprintf( stderr, "usage: %s [-n iterations] font ...\n", argv[0] );
+    return SKIP_EXIT_CODE;
+  }
+
+  if ( FT_Init_FreeType( &library ) )
+  {
+    fprintf( stderr, "Could not initialize FreeType\n" );
+    return 1;
+  }
+
+  for ( i = first; i < argc; i++ )
+  {
+    FT_Face  face;
+    clock_t  start;
+    double   elapsed;
+    int      n, f;
+
+    const char*  format;
+
+
+    if ( FT_New_Face( library, argv[i], 0, &face ) )
+    {
+      fprintf( stderr, "Could not open file: %s\n", argv[i] );
+      continue;
+    }
+    format = FT_Get_Font_Format( face );
+    FT_Done_Face( face );
+
+    start = clock();
+    for ( n = 0; n < iterations; n++ )
+    {
+      if ( FT_New_Face( library, argv[i], 0, &face ) == 0 )
+        FT_Done_Face( face );
+    }
+    elapsed    = (double)( clock() - start ) / CLOCKS_PER_SEC;
+    total     += elapsed;
+    num_files += 1;
+
+    printf( "%-40s %10.2f us/open\n",
+            argv[i], 1e6 * elapsed / iterations );
+
+    for ( f = 0; f < num_formats; f++ )
+      if ( strcmp( formats[f].name, format ) == 0 )
+        break;
+
+    if ( f == num_formats )
+    {
+      if ( num_formats == MAX_FORMATS )
+        continue;
+
+      formats[f].name    = format;
+      formats[f].files   = 0;
+      formats[f].elapsed = 0.0;
+      num_formats++;
+    }
+
+    formats[f].files++;
+    formats[f].elapsed += elapsed;
+  }
+
+  for ( i = 0; i < num_formats; i++ )
+    printf( "format %-33s %10.2f us/open  %5d files\n",
+            formats[i].name,
+            1e6 * formats[i].elapsed / iterations / formats[i].files,
+            formats[i].files );
+
+  /* only count the files that could be opened */
+  if ( num_files )
+    printf( "%-40s %10.2f us/open\n",
+            "average", 1e6 * total / iterations / num_files );
+
+  FT_Done_FreeType( library );
+
+  return 0;
+}
+
+/* EOF */
@@ -0,0 +1,108 @@
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+
+#include <freetype/freetype.h>
+#include <ft2build.h>
+
+
+  /*
+   * Measure the throughput of `FT_Load_Glyph` (with hinting and
+   * rendering) for all glyphs of the font files given on the command line,
+   * for example
+   *
+   *   glyph-load -n 20 Roboto-Regular.ttf NotoSans-Regular.ttf
+   *
+   * This is mainly useful to compare builds in trace mode, with and
+   * without trace levels limited at compile time (see
+   * `FT_CONFIG_TRACE_LEVELS_H` in `ftoption.h`).
+   *
+   * Without font arguments the benchmark is skipped.
+   */
+
+#define SKIP_EXIT_CODE  77
+
+
+int
+main( int     argc,
+      char**  argv )
+{
+  FT_Library  library;
+  int         iterations = 10;
+  int         first      = 1;
+  int         i;
+  long        total_glyphs = 0;
+  double      total        = 0.0;
+
+
+  if ( argc > 2 && argv[1][0] == '-' && argv[1][1] == 'n' )
+  {
+    iterations = atoi( argv[2] );
+    first      = 3;
+  }
+
+  if ( first >= argc || iterations <= 0 )
+  {
+    fprintf( stderr, "usage: %s [-n iterations] font ...\n", argv[0] );
+    return SKIP_EXIT_CODE;
+  }
+
+  if ( FT_Init_FreeType( &library ) )
+  {
+    fprintf( stderr, "Could not initialize FreeType\n" );
+    return 1;
+  }
+
+  for ( i = first; i < argc; i++ )
+  {
+    FT_Face  face;
+    clock_t  start;
+    double   elapsed;
+    long     glyphs;
+    int      n;
+
+
+    if ( FT_New_Face( library, argv[i], 0, &face ) )
+    {
+      fprintf( stderr, "Could not open file: %s\n", argv[i] );
+      continue;
+    }
+
+    if ( FT_Set_Char_Size( face, 0, 16 * 64, 96, 96 ) )
+    {
+      fprintf( stderr, "Could not set size: %s\n", argv[i] );
+      FT_Done_Face( face );
+      continue;
+    }
+
+    glyphs = (long)iterations * face->num_glyphs;
+
+    start = clock();
+    for ( n = 0; n < iterations; n++ )
+    {
+      FT_UInt  gindex;
+
+
+      for ( gindex = 0; gindex < (FT_UInt)face->num_glyphs; gindex++ )
+        FT_Load_Glyph( face, gindex, FT_LOAD_RENDER );
+    }
+    elapsed = (double)( clock() - start ) / CLOCKS_PER_SEC;
+
+    total        += elapsed;
+    total_glyphs += glyphs;
+
+    printf( "%-40s %10.0f glyphs/s\n",
+            argv[i], elapsed > 0 ? glyphs / elapsed : 0.0 );
+
+    FT_Done_Face( face );
+  }
+
+  printf( "%-40s %10.0f glyphs/s\n",
+          "total", total > 0 ? total_glyphs / total : 0.0 );
+
+  FT_Done_FreeType( library );
+
+  return 0;
+}
+
+/* EOF */
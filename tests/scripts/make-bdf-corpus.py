@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+
+"""Write a corpus of small BDF fonts for the `face-open' benchmark.
+
+The fonts mimic the X11 `misc' fonts: a full XLFD name, the usual set of
+standard properties, a few non-standard ones, and a handful of glyphs, so
+that opening them is dominated by header and property parsing.  Note that
+the `bdf' module must be enabled in `ftmodule.h' to open them."""
+
+import argparse
+import os
+import sys
+
+# Properties found in typical X11 bitmap fonts, as (name, value) pairs.
+_PROPERTIES = [
+    ("FOUNDRY", '"Misc"'),
+    ("FAMILY_NAME", '"Fixed"'),
+    ("WEIGHT_NAME", '"Medium"'),
+    ("SLANT", '"R"'),
+    ("SETWIDTH_NAME", '"Normal"'),
+    ("ADD_STYLE_NAME", '""'),
+    ("PIXEL_SIZE", "%(pixel_size)d"),
+    ("POINT_SIZE", "%(point_size)d"),
+    ("RESOLUTION_X", "75"),
+    ("RESOLUTION_Y", "75"),
+    ("SPACING", '"C"'),
+    ("AVERAGE_WIDTH", "%(average_width)d"),
+    ("CHARSET_REGISTRY", '"ISO10646"'),
+    ("CHARSET_ENCODING", '"1"'),
+    ("DEFAULT_CHAR", "0"),
+    ("FONT_ASCENT", "%(ascent)d"),
+    ("FONT_DESCENT", "%(descent)d"),
+    ("CAP_HEIGHT", "%(cap_height)d"),
+    ("X_HEIGHT", "%(x_height)d"),
+    ("UNDERLINE_POSITION", "-1"),
+    ("UNDERLINE_THICKNESS", "1"),
+    ("COPYRIGHT", '"Public domain font.  Share and enjoy."'),
+    ("_XMBDFED_INFO", '"Edited with xmbdfed 4.5."'),
+    ("_GBDFED_INFO", '"Edited with gbdfed 1.6."'),
+]
+
+
+def bdf_font(pixel_size: int, num_glyphs: int) -> str:
+    """Return the text of a monospaced BDF font with |num_glyphs| glyphs."""
+    width = (pixel_size + 1) // 2
+    ascent = pixel_size - pixel_size // 4
+    values = {
+        "pixel_size": pixel_size,
+        "point_size": pixel_size * 10,
+        "average_width": width * 10,
+        "ascent": ascent,
+        "descent": pixel_size - ascent,
+        "cap_height": ascent - 1,
+        "x_height": ascent * 2 // 3,
+    }
+
+    lines = [
+        "STARTFONT 2.1",
+        "FONT -Misc-Fixed-Medium-R-Normal--%d-%d-75-75-C-%d-ISO10646-1"
+        % (pixel_size, pixel_size * 10, width * 10),
+        "SIZE %d 75 75" % pixel_size,
+        "FONTBOUNDINGBOX %d %d 0 %d" % (width, pixel_size, ascent - pixel_size),
+        "STARTPROPERTIES %d" % len(_PROPERTIES),
+    ]
+    lines += ["%s %s" % (name, value % values) for name, value in _PROPERTIES]
+    lines += ["ENDPROPERTIES", "CHARS %d" % num_glyphs]
+
+    row_bytes = (width + 7) // 8
+    for i in range(num_glyphs):
+        lines += [
+            "STARTCHAR U+%04X" % (0x20 + i),
+            "ENCODING %d" % (0x20 + i),
+            "SWIDTH %d 0" % (width * 72000 // (pixel_size * 75)),
+            "DWIDTH %d 0" % width,
+            "BBX %d %d 0 %d" % (width, pixel_size, ascent - pixel_size),
+            "BITMAP",
+        ]
+        for row in range(pixel_size):
+            bits = (i * 37 + row * 11) & ((1 << (row_bytes * 8)) - 1)
+            lines.append("%0*X" % (row_bytes * 2, bits))
+        lines.append("ENDCHAR")
+
+    lines.append("ENDFONT")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=100,
+        help="Number of fonts to write [100]",
+    )
+
+    parser.add_argument(
+        "--glyphs",
+        type=int,
+        default=16,
+        help="Number of glyphs per font [16]",
+    )
+
+    parser.add_argument("output_dir", help="Output directory")
+
+    args = parser.parse_args()
+
+    if not os.path.exists(args.output_dir):
+        os.makedirs(args.output_dir)
+
+    for n in range(args.count):
+        pixel_size = 6 + n % 24
+        path = os.path.join(args.output_dir, "font%04d.bdf" % n)
+        with open(path, "w") as f:
+            f.write(bdf_font(pixel_size, args.glyphs))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# EOF